@@ -0,0 +1,44 @@
+"""add shared SAM search cache
+
+Revision ID: a2b3c4d5e6f8
+Revises: d4e5f6a7b9c0
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a2b3c4d5e6f8"
+down_revision = "d4e5f6a7b9c0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sam_search_cache_entries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("request_params", sa.JSON(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_accessed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cache_key", name="uq_sam_search_cache_key"),
+    )
+    op.create_index("ix_sam_search_cache_expires_at", "sam_search_cache_entries", ["expires_at"], unique=False)
+    op.create_index(
+        "ix_sam_search_cache_last_accessed_at",
+        "sam_search_cache_entries",
+        ["last_accessed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sam_search_cache_last_accessed_at", table_name="sam_search_cache_entries")
+    op.drop_index("ix_sam_search_cache_expires_at", table_name="sam_search_cache_entries")
+    op.drop_table("sam_search_cache_entries")
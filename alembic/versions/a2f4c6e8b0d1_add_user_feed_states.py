@@ -0,0 +1,69 @@
+"""add user feed states
+
+Revision ID: a2f4c6e8b0d1
+Revises: b8c9d0e1f2a4
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a2f4c6e8b0d1"
+down_revision = "b8c9d0e1f2a4"
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of bidlens.feed_state.rebuild_feed_states as of this revision.
+BACKFILL_SQL = """
+INSERT INTO user_feed_states (organization_id, user_id, opportunity_id, vote, watched, updated_at)
+SELECT feed_keys.organization_id, feed_keys.user_id, feed_keys.opportunity_id, votes.vote,
+       COALESCE(user_opportunities.watched, false), CURRENT_TIMESTAMP
+FROM (
+    SELECT org_id AS organization_id, user_id, opp_id AS opportunity_id
+    FROM votes WHERE vote IN ('PURSUE', 'PASS')
+    UNION
+    SELECT organization_id, user_id, opportunity_id
+    FROM user_opportunities WHERE watched = true
+) AS feed_keys
+LEFT OUTER JOIN votes
+    ON votes.org_id = feed_keys.organization_id
+    AND votes.user_id = feed_keys.user_id
+    AND votes.opp_id = feed_keys.opportunity_id
+    AND votes.vote IN ('PURSUE', 'PASS')
+LEFT OUTER JOIN user_opportunities
+    ON user_opportunities.organization_id = feed_keys.organization_id
+    AND user_opportunities.user_id = feed_keys.user_id
+    AND user_opportunities.opportunity_id = feed_keys.opportunity_id
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_feed_states",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("organization_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("opportunity_id", sa.Integer(), nullable=False),
+        sa.Column("vote", sa.String(), nullable=True),
+        sa.Column("watched", sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["opportunity_id"], ["opportunities.id"]),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("organization_id", "user_id", "opportunity_id", name="uq_user_feed_state"),
+    )
+    op.create_index(
+        "ix_user_feed_states_user_vote",
+        "user_feed_states",
+        ["organization_id", "user_id", "vote", "opportunity_id"],
+    )
+    op.create_index("ix_user_feed_states_opportunity_id", "user_feed_states", ["opportunity_id"])
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_feed_states_opportunity_id", table_name="user_feed_states")
+    op.drop_index("ix_user_feed_states_user_vote", table_name="user_feed_states")
+    op.drop_table("user_feed_states")
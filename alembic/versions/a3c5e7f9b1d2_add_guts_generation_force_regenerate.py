@@ -0,0 +1,28 @@
+"""add force_regenerate to GUTS generations
+
+Revision ID: a3c5e7f9b1d2
+Revises: e2a4c6b8d0f1
+
+Queued Get Up to Speed generations are run later by the GUTS worker, so the
+request's force_regenerate choice is stored on the pending generation.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a3c5e7f9b1d2"
+down_revision = "e2a4c6b8d0f1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "opportunity_knowledge_brief_generations",
+        sa.Column("force_regenerate", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("opportunity_knowledge_brief_generations", "force_regenerate")
@@ -0,0 +1,112 @@
+"""add opportunity content fingerprint
+
+Revision ID: a7b8c9d0e1f3
+Revises: d6e7f8a9b0c1
+"""
+
+import datetime as dt
+import hashlib
+import json
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a7b8c9d0e1f3"
+down_revision = "d6e7f8a9b0c1"
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of services.opportunity_monitor.source_fingerprint as of this
+# revision. Rows whose seeded fingerprint does not match the next observation
+# simply take the field-by-field compare once and are rewritten then.
+MONITORED_FIELDS = (
+    "solicitation_number",
+    "source_url",
+    "title",
+    "agency",
+    "opportunity_type",
+    "canonical_type",
+    "source_stage",
+    "posted_date",
+    "response_deadline",
+    "naics",
+    "naics_title",
+    "set_aside",
+    "eligibility",
+    "account_type",
+    "account_type_confidence",
+    "account_type_source",
+    "description",
+    "description_url",
+    "description_text",
+    "sam_url",
+)
+LONG_TEXT_FIELDS = {"description", "description_text", "eligibility"}
+URL_FIELDS = {"source_url", "description_url", "sam_url"}
+BATCH_SIZE = 500
+
+
+def _normalize_text(value):
+    text = re.sub(r"\s+", " ", str(value)).strip()
+    return text or None
+
+
+def _normalize(field_name, value):
+    if isinstance(value, dt.datetime):
+        return value.date().isoformat() if field_name.endswith("_date") else value.isoformat()
+    if isinstance(value, dt.date):
+        return value.isoformat()
+    if field_name in LONG_TEXT_FIELDS:
+        return _normalize_text(value)
+    if isinstance(value, str):
+        text = _normalize_text(value)
+        if text is not None and field_name in URL_FIELDS:
+            return text.rstrip("/")
+        return text
+    return value
+
+
+def _fingerprint(row):
+    normalized = {
+        field_name: _normalize(field_name, row[field_name])
+        for field_name in MONITORED_FIELDS
+        if row[field_name] is not None
+    }
+    encoded = json.dumps(normalized, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column("opportunities", sa.Column("content_fingerprint", sa.String(length=64), nullable=True))
+
+    bind = op.get_bind()
+    opportunities = sa.table(
+        "opportunities",
+        sa.column("id", sa.Integer()),
+        sa.column("content_fingerprint", sa.String()),
+        *(sa.column(field_name) for field_name in MONITORED_FIELDS),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(opportunities.c.id, *(opportunities.c[field_name] for field_name in MONITORED_FIELDS))
+            .where(opportunities.c.id > last_id)
+            .order_by(opportunities.c.id)
+            .limit(BATCH_SIZE)
+        ).mappings().all()
+        if not rows:
+            break
+        bind.execute(
+            opportunities.update()
+            .where(opportunities.c.id == sa.bindparam("row_id"))
+            .values(content_fingerprint=sa.bindparam("fingerprint")),
+            [{"row_id": row["id"], "fingerprint": _fingerprint(row)} for row in rows],
+        )
+        last_id = rows[-1]["id"]
+
+
+def downgrade() -> None:
+    op.drop_column("opportunities", "content_fingerprint")
@@ -0,0 +1,64 @@
+"""add source pull job queue
+
+Revision ID: b3c4d5e6f7a9
+Revises: a2b3c4d5e6f8
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b3c4d5e6f7a9"
+down_revision = "a2b3c4d5e6f8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "source_pull_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("organization_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("params_json", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False, server_default="queued"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="3"),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("lease_owner", sa.String(), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("ingestion_run_id", sa.Integer(), nullable=True),
+        sa.Column("response_status_code", sa.Integer(), nullable=True),
+        sa.Column("result_json", sa.JSON(), nullable=True),
+        sa.Column("error_type", sa.String(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["ingestion_run_id"], ["ingestion_runs.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_source_pull_jobs_organization_id", "source_pull_jobs", ["organization_id"], unique=False)
+    op.create_index(
+        "ix_source_pull_jobs_status_available_at",
+        "source_pull_jobs",
+        ["status", "available_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_source_pull_jobs_org_source_status",
+        "source_pull_jobs",
+        ["organization_id", "source", "status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_source_pull_jobs_org_source_status", table_name="source_pull_jobs")
+    op.drop_index("ix_source_pull_jobs_status_available_at", table_name="source_pull_jobs")
+    op.drop_index("ix_source_pull_jobs_organization_id", table_name="source_pull_jobs")
+    op.drop_table("source_pull_jobs")
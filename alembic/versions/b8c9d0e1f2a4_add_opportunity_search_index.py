@@ -0,0 +1,95 @@
+"""add opportunity full-text search index
+
+Revision ID: b8c9d0e1f2a4
+Revises: a7b8c9d0e1f3
+"""
+
+from alembic import op
+
+
+revision = "b8c9d0e1f2a4"
+down_revision = "a7b8c9d0e1f3"
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of bidlens.search_index as of this revision.
+FTS_COLUMNS = (
+    "title",
+    "agency",
+    "solicitation_number",
+    "sam_notice_id",
+    "source_record_id",
+    "naics",
+    "naics_title",
+    "description",
+    "description_text",
+)
+TRIGRAM_COLUMNS = ("solicitation_number", "sam_notice_id", "source_record_id", "govwin_staging_id")
+
+POSTGRES_SEARCH_VECTOR_SQL = """
+setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A')
+|| setweight(to_tsvector('english'::regconfig,
+    coalesce(agency, '') || ' ' || coalesce(solicitation_number, '') || ' '
+    || coalesce(sam_notice_id, '') || ' ' || coalesce(source_record_id, '')), 'B')
+|| setweight(to_tsvector('english'::regconfig, coalesce(naics, '') || ' ' || coalesce(naics_title, '')), 'C')
+|| setweight(to_tsvector('english'::regconfig,
+    left(coalesce(nullif(description_text, ''), description, ''), 200000)), 'D')
+"""
+
+
+def _upgrade_postgresql() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({POSTGRES_SEARCH_VECTOR_SQL}) STORED"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_opportunities_search_vector ON opportunities USING gin (search_vector)")
+    for column in TRIGRAM_COLUMNS:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_opportunities_{column}_trgm ON opportunities "
+            f"USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def _upgrade_sqlite() -> None:
+    columns = ", ".join(FTS_COLUMNS)
+    new_values = ", ".join(f"new.{column}" for column in FTS_COLUMNS)
+    old_values = ", ".join(f"old.{column}" for column in FTS_COLUMNS)
+    insert_new = f"INSERT INTO opportunities_fts(rowid, {columns}) VALUES (new.id, {new_values});"
+    delete_old = (
+        f"INSERT INTO opportunities_fts(opportunities_fts, rowid, {columns}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    op.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS opportunities_fts USING fts5({columns}, "
+        "content='opportunities', content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(f"CREATE TRIGGER IF NOT EXISTS opportunities_fts_insert AFTER INSERT ON opportunities BEGIN {insert_new} END")
+    op.execute(f"CREATE TRIGGER IF NOT EXISTS opportunities_fts_delete AFTER DELETE ON opportunities BEGIN {delete_old} END")
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS opportunities_fts_update AFTER UPDATE OF {columns} ON opportunities "
+        f"BEGIN {delete_old} {insert_new} END"
+    )
+    op.execute("INSERT INTO opportunities_fts(opportunities_fts) VALUES ('rebuild')")
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        _upgrade_postgresql()
+    elif dialect == "sqlite":
+        _upgrade_sqlite()
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        for column in TRIGRAM_COLUMNS:
+            op.execute(f"DROP INDEX IF EXISTS ix_opportunities_{column}_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_opportunities_search_vector")
+        op.execute("ALTER TABLE opportunities DROP COLUMN IF EXISTS search_vector")
+    elif dialect == "sqlite":
+        for suffix in ("insert", "delete", "update"):
+            op.execute(f"DROP TRIGGER IF EXISTS opportunities_fts_{suffix}")
+        op.execute("DROP TABLE IF EXISTS opportunities_fts")
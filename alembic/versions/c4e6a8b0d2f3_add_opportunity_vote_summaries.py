@@ -0,0 +1,72 @@
+"""add opportunity vote summaries
+
+Revision ID: c4e6a8b0d2f3
+Revises: a2f4c6e8b0d1
+"""
+
+from itertools import groupby
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "c4e6a8b0d2f3"
+down_revision = "a2f4c6e8b0d1"
+branch_labels = None
+depends_on = None
+
+
+VOTES_SQL = sa.text(
+    "SELECT org_id, opp_id, user_id, vote, updated_at FROM votes ORDER BY opp_id, user_id"
+).columns(updated_at=sa.DateTime(timezone=True))
+
+
+def _backfill(connection, summaries: sa.Table) -> None:
+    """Frozen copy of bidlens.vote_summary.rebuild_vote_summaries as of this revision."""
+    rows = []
+    for opportunity_id, votes in groupby(connection.execute(VOTES_SQL).all(), key=lambda row: row.opp_id):
+        votes = list(votes)
+        interested = sorted({row.user_id for row in votes if row.vote == "PURSUE"})
+        passed = sorted({row.user_id for row in votes if row.vote == "PASS"})
+        activity = [row.updated_at for row in votes if row.updated_at is not None]
+        rows.append({
+            "organization_id": votes[0].org_id,
+            "opportunity_id": opportunity_id,
+            "pursue_count": len(interested),
+            "pass_count": len(passed),
+            "last_activity_at": max(activity) if activity else None,
+            "interested_user_ids": interested,
+            "passed_user_ids": passed,
+        })
+    if rows:
+        op.bulk_insert(summaries, rows)
+
+
+def upgrade() -> None:
+    summaries = op.create_table(
+        "opportunity_vote_summaries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("organization_id", sa.Integer(), nullable=False),
+        sa.Column("opportunity_id", sa.Integer(), nullable=False),
+        sa.Column("pursue_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("pass_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_activity_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("interested_user_ids", sa.JSON(), nullable=False),
+        sa.Column("passed_user_ids", sa.JSON(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["opportunity_id"], ["opportunities.id"]),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("opportunity_id"),
+    )
+    op.create_index(
+        "ix_opportunity_vote_summaries_organization_id",
+        "opportunity_vote_summaries",
+        ["organization_id"],
+    )
+    _backfill(op.get_bind(), summaries)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_opportunity_vote_summaries_organization_id", table_name="opportunity_vote_summaries")
+    op.drop_table("opportunity_vote_summaries")
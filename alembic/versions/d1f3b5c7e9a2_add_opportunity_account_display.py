@@ -0,0 +1,39 @@
+"""add persisted opportunity account display
+
+Revision ID: d1f3b5c7e9a2
+Revises: c4e6a8b0d2f3
+
+Existing rows are left unstamped. They are resolved by the account display
+backfill the scheduler runs at startup (or ``python -m bidlens.cli
+backfill-account-display``), because resolution depends on the deployed alias
+file rather than on anything this revision can freeze.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d1f3b5c7e9a2"
+down_revision = "c4e6a8b0d2f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("opportunities", sa.Column("account_display", sa.String(), nullable=True))
+    op.add_column("opportunities", sa.Column("parent_agency", sa.String(), nullable=True))
+    op.add_column("opportunities", sa.Column("sub_agency", sa.String(), nullable=True))
+    op.add_column("opportunities", sa.Column("account_display_revision", sa.String(), nullable=True))
+    op.create_index(
+        "ix_opportunities_account_display_revision",
+        "opportunities",
+        ["account_display_revision"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_opportunities_account_display_revision", table_name="opportunities")
+    op.drop_column("opportunities", "account_display_revision")
+    op.drop_column("opportunities", "sub_agency")
+    op.drop_column("opportunities", "parent_agency")
+    op.drop_column("opportunities", "account_display")
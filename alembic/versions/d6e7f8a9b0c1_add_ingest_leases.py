@@ -0,0 +1,31 @@
+"""add ingest leases
+
+Revision ID: d6e7f8a9b0c1
+Revises: b3c4d5e6f7a9
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d6e7f8a9b0c1"
+down_revision = "b3c4d5e6f7a9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ingest_leases",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("owner", sa.String(), nullable=False),
+        sa.Column("acquired_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("released_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ingest_leases")
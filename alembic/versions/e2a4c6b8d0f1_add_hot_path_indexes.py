@@ -0,0 +1,50 @@
+"""add hot path composite indexes
+
+Revision ID: e2a4c6b8d0f1
+Revises: d1f3b5c7e9a2
+
+Composite and partial indexes matched to the Feed, queue count, sidebar,
+Triage, Daily Snapshot and Feed enrichment queries. tests/test_query_plans.py
+asserts the planner keeps using them.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e2a4c6b8d0f1"
+down_revision = "d1f3b5c7e9a2"
+branch_labels = None
+depends_on = None
+
+FEED_PREDICATE = "qualification_status = 'qualified' AND decision_state <> 'ARCHIVED'"
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_opportunities_org_feed_deadline",
+        "opportunities",
+        ["organization_id", "response_deadline", "id"],
+        postgresql_where=sa.text(FEED_PREDICATE),
+        sqlite_where=sa.text(FEED_PREDICATE),
+    )
+    op.create_index(
+        "ix_opportunities_org_qualification_upserted",
+        "opportunities",
+        ["organization_id", "qualification_status", "upserted_at"],
+    )
+    op.create_index("ix_opportunities_org_created", "opportunities", ["organization_id", "created_at"])
+    op.create_index("ix_votes_org_user_vote", "votes", ["org_id", "user_id", "vote", "opp_id"])
+    op.create_index(
+        "ix_opportunity_history_events_org_opp_type_occurred",
+        "opportunity_history_events",
+        ["organization_id", "opportunity_id", "event_type", "occurred_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_opportunity_history_events_org_opp_type_occurred", table_name="opportunity_history_events")
+    op.drop_index("ix_votes_org_user_vote", table_name="votes")
+    op.drop_index("ix_opportunities_org_created", table_name="opportunities")
+    op.drop_index("ix_opportunities_org_qualification_upserted", table_name="opportunities")
+    op.drop_index("ix_opportunities_org_feed_deadline", table_name="opportunities")
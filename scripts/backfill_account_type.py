@@ -24,6 +24,8 @@ def main() -> None:
             opportunity.account_type = classification.account_type
             opportunity.account_type_confidence = classification.confidence
             opportunity.account_type_source = classification.source
+            # Written outside the source monitor, so the next pull must compare.
+            opportunity.content_fingerprint = None
             updated += 1
         db.commit()
     finally:
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Compare per-pair and compiled pursuit-lane matching on synthetic data."""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.bidlens.models import Opportunity, PursuitLane
+from src.bidlens.services.pursuit_lanes import compiled_lane_matcher, match_lane_to_opportunity
+
+
+TERMS = [
+    "behavioral health",
+    "Medicaid",
+    "CMS",
+    "evaluation",
+    "research",
+    "program evaluation",
+    "data analytics",
+    "cybersecurity",
+    "cloud migration",
+    "HHS",
+    "Department of Veterans Affairs",
+    "public health",
+    "technical assistance",
+    "training",
+    "8(a)",
+    "Small Business",
+    "SDVOSB",
+    "541611",
+    "5415",
+    "541720",
+    "modernization",
+    "claims processing",
+    "grants management",
+    "housing",
+    "workforce development",
+    "substance use",
+    "opioid",
+    "maternal health",
+    "education",
+    "transportation safety",
+]
+AGENCIES = [
+    "HEALTH AND HUMAN SERVICES, DEPARTMENT OF.CENTERS FOR MEDICARE AND MEDICAID SERVICES",
+    "VETERANS AFFAIRS, DEPARTMENT OF",
+    "Department of Education",
+    "TRANSPORTATION, DEPARTMENT OF.FEDERAL AVIATION ADMINISTRATION",
+    "Substance Abuse and Mental Health Services Administration",
+    "69A350 OSDBU",
+    "Maricopa County",
+]
+FILLER = [
+    "support", "services", "for", "the", "program", "office", "contract", "including",
+    "operations", "system", "delivery", "national", "regional", "community", "platform",
+]
+SET_ASIDES = [None, "Small Business", "8(a) Set-Aside", "Service-Disabled Veteran-Owned Small Business (SDVOSB)"]
+NAICS = ["541611", "541512", "541720", "561110", "611430", None]
+
+
+def _phrase(rng: random.Random, words: int) -> str:
+    parts = [rng.choice(FILLER) for _ in range(words)]
+    if rng.random() < 0.3:
+        parts.insert(rng.randrange(len(parts) + 1), rng.choice(TERMS))
+    return " ".join(parts)
+
+
+def build_lanes(count: int, rng: random.Random) -> list[PursuitLane]:
+    return [
+        PursuitLane(
+            id=index + 1,
+            organization_id=1,
+            name=f"Lane {index + 1}",
+            keywords=rng.sample(TERMS, rng.randint(2, 6)),
+            is_active=True,
+        )
+        for index in range(count)
+    ]
+
+
+def build_opportunities(count: int, rng: random.Random) -> list[Opportunity]:
+    return [
+        Opportunity(
+            id=index + 1,
+            organization_id=1,
+            source="sam_gov",
+            source_record_id=f"bench-{index}",
+            title=_phrase(rng, 6).title(),
+            agency=rng.choice(AGENCIES),
+            naics=rng.choice(NAICS),
+            naics_title=_phrase(rng, 3),
+            set_aside=rng.choice(SET_ASIDES),
+            description=_phrase(rng, 60),
+        )
+        for index in range(count)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--opportunities", type=int, default=50_000)
+    parser.add_argument("--lanes", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    lanes = build_lanes(args.lanes, rng)
+    opportunities = build_opportunities(args.opportunities, rng)
+
+    started = time.perf_counter()
+    expected = [
+        [(lane.id, reasons) for lane in lanes if (reasons := match_lane_to_opportunity(lane, opportunity))]
+        for opportunity in opportunities
+    ]
+    per_pair_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    matcher = compiled_lane_matcher(lanes)
+    agency_hits_by_agency: dict = {}
+    actual = [
+        matcher.match(opportunity, agency_hits_by_agency=agency_hits_by_agency)
+        for opportunity in opportunities
+    ]
+    compiled_seconds = time.perf_counter() - started
+
+    mismatches = sum(1 for old, new in zip(expected, actual) if old != new)
+    matches = sum(len(rows) for rows in actual)
+    print(f"{args.opportunities} opportunities x {args.lanes} lanes, {matches} lane matches")
+    print(f"per-pair matcher: {per_pair_seconds:.2f}s")
+    print(f"compiled matcher: {compiled_seconds:.2f}s ({per_pair_seconds / compiled_seconds:.1f}x)")
+    print(f"mismatched opportunities: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -20,9 +20,11 @@ from bidlens.models import (
     Event,
     Opportunity,
     OpportunityUpdateEvent,
+    OpportunityVoteSummary,
     Organization,
     OrganizationMembership,
     User,
+    UserFeedState,
     Vote,
     Workspace,
 )
@@ -249,6 +251,8 @@ def _qa_opportunity(
         existing.created_at = created_at
         existing.posted_date = created_at.date()
         existing.response_deadline = response_deadline or created_at.date() + dt.timedelta(days=14)
+        # Written outside the source monitor, so the next pull must compare.
+        existing.content_fingerprint = None
         existing.qualification_status = "qualified"
         existing.decision_state = "INBOX"
         return existing
@@ -632,6 +636,11 @@ def cleanup_qa_data(
                 .filter(Vote.org_id == workspace.organization_id, Vote.opp_id.in_(qa_opp_ids))
                 .delete(synchronize_session=False)
             )
+            # Bulk vote deletes skip the projection listeners; clear them too.
+            db.query(UserFeedState).filter(UserFeedState.opportunity_id.in_(qa_opp_ids)).delete(synchronize_session=False)
+            db.query(OpportunityVoteSummary).filter(
+                OpportunityVoteSummary.opportunity_id.in_(qa_opp_ids)
+            ).delete(synchronize_session=False)
             deleted_counts["update_events"] += (
                 db.query(OpportunityUpdateEvent)
                 .filter(
@@ -662,6 +671,10 @@ def cleanup_qa_data(
             if other_opp_ids:
                 deleted_counts["events"] += db.query(Event).filter(Event.opp_id.in_(other_opp_ids)).delete(synchronize_session=False)
                 deleted_counts["votes"] += db.query(Vote).filter(Vote.opp_id.in_(other_opp_ids)).delete(synchronize_session=False)
+                db.query(UserFeedState).filter(UserFeedState.opportunity_id.in_(other_opp_ids)).delete(synchronize_session=False)
+                db.query(OpportunityVoteSummary).filter(
+                    OpportunityVoteSummary.opportunity_id.in_(other_opp_ids)
+                ).delete(synchronize_session=False)
                 deleted_counts["update_events"] += (
                     db.query(OpportunityUpdateEvent)
                     .filter(OpportunityUpdateEvent.opportunity_id.in_(other_opp_ids))
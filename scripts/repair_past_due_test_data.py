@@ -223,6 +223,8 @@ def cleanup_test_records(conn: sqlite3.Connection, opportunities: list[TestOppor
         "opportunity_history_recipients": "opportunity_id",
         "opportunity_history_events": "opportunity_id",
         "opportunity_pursuit_lane_matches": "opportunity_id",
+        "user_feed_states": "opportunity_id",
+        "opportunity_vote_summaries": "opportunity_id",
         "user_opportunities": "opportunity_id",
         "opportunity_notes": "opportunity_id",
         "events": "opp_id",
@@ -47,6 +47,7 @@ from bidlens.models import (  # noqa: E402
     OpportunityNote,
     OpportunityPursuitLaneMatch,
     OpportunityUpdateEvent,
+    OpportunityVoteSummary,
     OrgProfile,
     Organization,
     OrganizationMembership,
@@ -54,6 +55,7 @@ from bidlens.models import (  # noqa: E402
     PursuitLaneAssignment,
     SamSourceConfig,
     User,
+    UserFeedState,
     UserOpportunity,
     Vote,
     Workspace,
@@ -301,6 +303,38 @@ def build_delete_plan(session: Session, scope: ResetScope) -> list[DeletePlanIte
                 )
             ), execute=execute),
         ),
+        DeletePlanItem(
+            "user_feed_states",
+            _count(session.query(UserFeedState).filter(
+                or_(
+                    UserFeedState.organization_id.in_(tenant_org_ids),
+                    UserFeedState.opportunity_id.in_(tenant_opportunity_ids),
+                    UserFeedState.user_id.in_(tenant_user_ids),
+                )
+            )),
+            lambda execute: _delete_query(session.query(UserFeedState).filter(
+                or_(
+                    UserFeedState.organization_id.in_(tenant_org_ids),
+                    UserFeedState.opportunity_id.in_(tenant_opportunity_ids),
+                    UserFeedState.user_id.in_(tenant_user_ids),
+                )
+            ), execute=execute),
+        ),
+        DeletePlanItem(
+            "opportunity_vote_summaries",
+            _count(session.query(OpportunityVoteSummary).filter(
+                or_(
+                    OpportunityVoteSummary.organization_id.in_(tenant_org_ids),
+                    OpportunityVoteSummary.opportunity_id.in_(tenant_opportunity_ids),
+                )
+            )),
+            lambda execute: _delete_query(session.query(OpportunityVoteSummary).filter(
+                or_(
+                    OpportunityVoteSummary.organization_id.in_(tenant_org_ids),
+                    OpportunityVoteSummary.opportunity_id.in_(tenant_opportunity_ids),
+                )
+            ), execute=execute),
+        ),
         DeletePlanItem(
             "user_opportunities",
             _count(session.query(UserOpportunity).filter(
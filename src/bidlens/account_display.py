@@ -0,0 +1,113 @@
+"""Persisted account presentation for opportunities.
+
+Lists, lane matching, Analytics, and exports show an opportunity's account
+through the semantic alias file plus the legacy agency cleanup. Both are pure
+string work, so the result is written to ``account_display``,
+``parent_agency`` and ``sub_agency`` whenever ``agency`` is written, and read
+back as plain columns.
+
+Each row records the alias revision (a hash of ``account_aliases.csv``) it was
+resolved against. When the file changes, ``backfill_account_display`` rewrites
+only the rows stamped with another revision, in id-ordered batches that are
+committed one at a time; readers fall back to the memoized resolver for those
+rows until it has run.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from sqlalchemy import bindparam, column, event, inspect, or_, select, table, update
+from sqlalchemy.orm import Session
+
+BACKFILL_BATCH_SIZE = 1000
+
+_opportunities = table(
+    "opportunities",
+    column("id"),
+    column("agency"),
+    column("account_display"),
+    column("parent_agency"),
+    column("sub_agency"),
+    column("account_display_revision"),
+)
+
+
+def account_display_columns(raw_agency: str | None) -> dict[str, str | None]:
+    """Column values for an opportunity whose source agency is ``raw_agency``."""
+    # Imported here: ``bidlens.models`` installs this module before the
+    # services package can be imported.
+    from .services.account_aliases import account_alias_revision, account_display_parts
+
+    parts = account_display_parts(raw_agency)
+    return {
+        "account_display": parts.display,
+        "parent_agency": parts.parent,
+        "sub_agency": parts.sub_agency,
+        "account_display_revision": account_alias_revision(),
+    }
+
+
+def backfill_account_display(db: Session, *, batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """Re-resolve rows stamped with a different alias revision.
+
+    Walks the stale rows by id and commits after each batch, so an
+    interrupted run keeps its progress and the next one resumes. Returns the
+    number of rows rewritten.
+    """
+    from .services.account_aliases import account_alias_revision
+
+    revision = account_alias_revision()
+    stale = or_(
+        _opportunities.c.account_display_revision.is_(None),
+        _opportunities.c.account_display_revision != revision,
+    )
+    # Rows whose agency is rewritten meanwhile are re-stamped by the mapper
+    # listener and drop out of ``stale``, so the batch leaves them alone.
+    write_row = update(_opportunities).where(_opportunities.c.id == bindparam("row_id"), stale)
+    written = 0
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(_opportunities.c.id, _opportunities.c.agency)
+            .where(_opportunities.c.id > last_id, stale)
+            .order_by(_opportunities.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return written
+        columns_by_agency = {agency: account_display_columns(agency) for agency in {row.agency for row in rows}}
+        db.execute(write_row, [{"row_id": row.id, **columns_by_agency[row.agency]} for row in rows])
+        db.commit()
+        written += len(rows)
+        last_id = rows[-1].id
+
+
+def run_account_display_backfill(session_factory: Callable) -> int:
+    db = session_factory()
+    try:
+        written = backfill_account_display(db)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    return written
+
+
+def install_account_display_sync(opportunity_class) -> None:
+    """Resolve the account columns whenever an opportunity's agency is written."""
+
+    def _stamp(target) -> None:
+        for key, value in account_display_columns(target.agency).items():
+            setattr(target, key, value)
+
+    def _on_insert(_mapper, _connection, target) -> None:
+        _stamp(target)
+
+    def _on_update(_mapper, _connection, target) -> None:
+        if inspect(target).attrs["agency"].history.has_changes():
+            _stamp(target)
+
+    event.listen(opportunity_class, "before_insert", _on_insert)
+    event.listen(opportunity_class, "before_update", _on_update)
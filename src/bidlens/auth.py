@@ -2,7 +2,8 @@ import os
 
 from itsdangerous import URLSafeSerializer
 from fastapi import Depends, Request, Response
-from sqlalchemy.orm import Session
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, object_session
 
 from . import config
 from .database import get_db
@@ -11,6 +12,7 @@ from .models import Opportunity, OrganizationMembership, User
 from .tenancy import current_organization, ensure_email_domain_membership, normalize_email
 from .services.opportunity_outcomes import unresolved_past_due_outcome_count
 from .services.qualification import triage_enabled_for_org
+from .user_context import UserContext, user_context_cache
 
 serializer = URLSafeSerializer(SECRET_KEY)
 
@@ -30,7 +32,35 @@ def is_platform_admin_email(email: str | None) -> bool:
     return normalize_email(email) in platform_admin_emails()
 
 
-def attach_request_user_context(request: Request, db: Session, user: User) -> User:
+def _request_state(request: Request):
+    state = getattr(request, "state", None)
+    return state if isinstance(getattr(state, "_state", None), dict) else None
+
+
+def _request_user_contexts(request: Request) -> dict:
+    state = _request_state(request)
+    if state is None:
+        return {}
+    contexts = getattr(state, "user_contexts", None)
+    if contexts is None:
+        contexts = {}
+        state.user_contexts = contexts
+    return contexts
+
+
+def _cache_engine(db: Session) -> Engine | None:
+    try:
+        engine = db.get_bind().engine
+    except Exception:
+        return None
+    return engine if isinstance(engine, Engine) else None
+
+
+def _user_context_key(request: Request, user: User) -> tuple:
+    return (user.id, request.query_params.get("org_id") or None)
+
+
+def _load_user_context(request: Request, db: Session, user: User) -> UserContext:
     org = current_organization(request, db, user)
     membership = (
         db.query(OrganizationMembership)
@@ -47,22 +77,74 @@ def attach_request_user_context(request: Request, db: Session, user: User) -> Us
         .filter(Opportunity.qualification_status == "unreviewed")
         .count()
     )
-    setattr(user, "current_organization_id", org.id)
-    setattr(user, "current_organization_name", org.name)
-    setattr(user, "current_organization_is_live", bool(getattr(org, "is_live", False)))
-    setattr(user, "current_role", membership.role if membership else "member")
-    setattr(user, "triage_enabled", triage_enabled_for_org(db, org.id))
-    setattr(user, "triage_unreviewed_count", triage_unreviewed_count)
-    setattr(
-        user,
-        "past_due_outcome_count",
-        unresolved_past_due_outcome_count(db, organization_id=org.id)
-        if membership
-        else 0,
+    return UserContext(
+        organization_id=org.id,
+        organization_name=org.name,
+        organization_is_live=bool(getattr(org, "is_live", False)),
+        role=membership.role if membership else "member",
+        triage_enabled=triage_enabled_for_org(db, org.id),
+        triage_unreviewed_count=triage_unreviewed_count,
+        past_due_outcome_count=(
+            unresolved_past_due_outcome_count(db, organization_id=org.id)
+            if membership
+            else 0
+        ),
     )
+
+
+def attach_request_user_context(request: Request, db: Session, user: User) -> User:
+    """Set workspace, role, and sidebar counts on ``user``.
+
+    Resolved once per request and then served from ``user_context_cache``
+    until the TTL lapses or a relevant write invalidates it.
+    """
+    key = _user_context_key(request, user)
+    request_contexts = _request_user_contexts(request)
+    context = request_contexts.get(key)
+    if context is None:
+        engine = _cache_engine(db)
+        context = user_context_cache.get(engine, key) if engine is not None else None
+        if context is None:
+            generation = user_context_cache.generation
+            context = _load_user_context(request, db, user)
+            if engine is not None:
+                user_context_cache.set(engine, key, context, generation=generation)
+        request_contexts[key] = context
+    context.apply(user)
     setattr(user, "is_platform_admin", is_platform_admin_email(user.email))
     return user
 
+
+def session_user_id(request: Request) -> int | None:
+    """Decode the session cookie once per request."""
+    state = _request_state(request)
+    if state is not None and "session_user_id" in state._state:
+        return state.session_user_id
+    user_id = None
+    token = request.cookies.get(SESSION_COOKIE_NAME)
+    if token:
+        try:
+            user_id = serializer.loads(token).get("user_id") or None
+        except Exception:
+            user_id = None
+    if state is not None:
+        state.session_user_id = user_id
+    return user_id
+
+
+def cached_user_email(db: Session, user_id: int) -> str | None:
+    """Email for ``user_id``, shared with ``user_context_cache`` invalidation."""
+    engine = _cache_engine(db)
+    key = (user_id, "email")
+    cached = user_context_cache.get(engine, key) if engine is not None else None
+    if cached is not None:
+        return cached
+    generation = user_context_cache.generation
+    email = db.query(User.email).filter(User.id == user_id).scalar()
+    if engine is not None and email is not None:
+        user_context_cache.set(engine, key, email, generation=generation)
+    return email
+
 def create_session(response: Response, user_id: int):
     token = serializer.dumps({"user_id": user_id})
     response.set_cookie(
@@ -75,22 +157,31 @@ def create_session(response: Response, user_id: int):
     )
 
 def get_current_user(request: Request, db: Session=Depends(get_db),) -> User | None:
-    token = request.cookies.get(SESSION_COOKIE_NAME)
-    if not token:
-        return None
+    state = _request_state(request)
+    cached_user = getattr(state, "current_user", None) if state is not None else None
+    if cached_user is not None and object_session(cached_user) is db:
+        return cached_user
     try:
-        data = serializer.loads(token)
-        user_id = data.get("user_id")
+        user_id = session_user_id(request)
         if user_id:
             user = db.query(User).filter(User.id == user_id).first()
             if user:
-                matched_org = ensure_email_domain_membership(db, user)
-                if matched_org:
-                    db.commit()
+                engine = _cache_engine(db)
+                context_cached = (
+                    engine is not None
+                    and user_context_cache.get(engine, _user_context_key(request, user)) is not None
+                )
+                # A cached context means domain membership was already settled.
+                if not context_cached:
+                    matched_org = ensure_email_domain_membership(db, user)
+                    if matched_org:
+                        db.commit()
                 try:
                     attach_request_user_context(request, db, user)
                 except Exception:
                     pass
+                if state is not None:
+                    state.current_user = user
             return user
     except Exception:
         pass
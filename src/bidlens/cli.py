@@ -10,7 +10,10 @@ from typing import Callable, TextIO
 from sqlalchemy import inspect, text
 
 from . import config
+from .account_display import backfill_account_display
 from .database import SessionLocal
+from .feed_state import rebuild_feed_states
+from .vote_summary import rebuild_vote_summaries
 from .models import OpportunityKnowledgeBriefGeneration, OrganizationMembership, User
 from .services.opportunity_knowledge_brief import (
     GUTSServiceError, OpportunityKnowledgeBriefService,
@@ -340,6 +343,7 @@ def _generate_guts(
             generation = service_factory(db).generate(
                 opportunity_id=args.opportunity_id, requesting_user=user,
                 active_organization_id=membership.organization_id,
+                force_regenerate=args.force_regenerate,
             )
         except GUTSServiceError as exc:
             status = _failure(
@@ -379,6 +383,55 @@ def _probe_guts(args, *, output: TextIO, probe_factory: Callable = probe_guts_mo
     return 0 if result.success else 1
 
 
+def _rebuild_feed_state(args, *, session_factory: Callable = SessionLocal, output: TextIO) -> int:
+    """Backfill ``user_feed_states`` from votes and watches."""
+    db = session_factory()
+    try:
+        written = rebuild_feed_states(db.connection(), organization_id=args.organization_id)
+        db.commit()
+    except Exception:
+        db.rollback()
+        _line(output, "Feed state rebuild failed; no rows were changed.")
+        return 1
+    finally:
+        db.close()
+    scope = f"organization_id={args.organization_id}" if args.organization_id is not None else "all organizations"
+    _line(output, f"Rebuilt feed state for {scope}: rows={written}")
+    return 0
+
+
+def _rebuild_vote_summary(args, *, session_factory: Callable = SessionLocal, output: TextIO) -> int:
+    """Backfill ``opportunity_vote_summaries`` from votes."""
+    db = session_factory()
+    try:
+        written = rebuild_vote_summaries(db.connection(), organization_id=args.organization_id)
+        db.commit()
+    except Exception:
+        db.rollback()
+        _line(output, "Vote summary rebuild failed; no rows were changed.")
+        return 1
+    finally:
+        db.close()
+    scope = f"organization_id={args.organization_id}" if args.organization_id is not None else "all organizations"
+    _line(output, f"Rebuilt vote summaries for {scope}: rows={written}")
+    return 0
+
+
+def _backfill_account_display(*, session_factory: Callable = SessionLocal, output: TextIO) -> int:
+    """Re-resolve opportunity account columns against the current alias file."""
+    db = session_factory()
+    try:
+        written = backfill_account_display(db)
+    except Exception:
+        db.rollback()
+        _line(output, "Account display backfill failed; batches already written were kept.")
+        return 1
+    finally:
+        db.close()
+    _line(output, f"Backfilled account display: rows={written}")
+    return 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="python -m bidlens.cli",
@@ -392,6 +445,10 @@ def build_parser() -> argparse.ArgumentParser:
     generate.add_argument("--opportunity-id", type=int, required=True)
     generate.add_argument("--user-id", type=int, required=True)
     generate.add_argument("--organization-id", type=int)
+    generate.add_argument(
+        "--force-regenerate", action="store_true",
+        help="Call the model even when an identical earlier briefing could be reused.",
+    )
     generate.add_argument(
         "--debug-validation", action="store_true",
         help="Development CLI only: print the single rejected validation statement to this terminal.",
@@ -413,6 +470,20 @@ def build_parser() -> argparse.ArgumentParser:
         "database-preflight",
         help="Read-only: identify the resolved database before GUTS production debugging.",
     )
+    rebuild = commands.add_parser(
+        "rebuild-feed-state",
+        help="Rebuild the per-user Feed triage state from votes and watches.",
+    )
+    rebuild.add_argument("--organization-id", type=int, help="Limit the rebuild to one organization.")
+    rebuild_votes = commands.add_parser(
+        "rebuild-vote-summary",
+        help="Rebuild the per-opportunity Interested/Not Interested rollup from votes.",
+    )
+    rebuild_votes.add_argument("--organization-id", type=int, help="Limit the rebuild to one organization.")
+    commands.add_parser(
+        "backfill-account-display",
+        help="Re-resolve persisted opportunity account names after account_aliases.csv changes.",
+    )
     return parser
 
 
@@ -432,6 +503,12 @@ def main(
         return _probe_guts(args, output=output, probe_factory=probe_factory)
     if args.command == "database-preflight":
         return _database_preflight(session_factory=session_factory, output=output)
+    if args.command == "rebuild-feed-state":
+        return _rebuild_feed_state(args, session_factory=session_factory, output=output)
+    if args.command == "rebuild-vote-summary":
+        return _rebuild_vote_summary(args, session_factory=session_factory, output=output)
+    if args.command == "backfill-account-display":
+        return _backfill_account_display(session_factory=session_factory, output=output)
     return 2
 
 
@@ -85,8 +85,38 @@ ENABLE_INTERNAL_SCHEDULER = _env_bool("ENABLE_INTERNAL_SCHEDULER", False)
 AUTO_CREATE_SCHEMA = _env_bool("AUTO_CREATE_SCHEMA", True)
 VALIDATE_DEPLOYMENT_CONFIG = _env_bool("BIDLENS_VALIDATE_DEPLOYMENT", False)
 SAM_API_KEY = os.getenv("SAM_API_KEY")
+SAM_REQUESTS_PER_SECOND = float(os.getenv("SAM_REQUESTS_PER_SECOND", "1"))
+SAM_REQUEST_BURST = int(os.getenv("SAM_REQUEST_BURST", "1"))
+SAM_MAX_CONCURRENT_REQUESTS = int(os.getenv("SAM_MAX_CONCURRENT_REQUESTS", "4"))
+SAM_SEARCH_CACHE_TTL_SECONDS = int(os.getenv("SAM_SEARCH_CACHE_TTL_SECONDS", "3600"))
+SAM_SEARCH_CACHE_MAX_BYTES = int(os.getenv("SAM_SEARCH_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+SOURCE_PULL_QUEUE_ENABLED = _env_bool("SOURCE_PULL_QUEUE_ENABLED", False)
+SOURCE_PULL_JOB_LEASE_SECONDS = int(os.getenv("SOURCE_PULL_JOB_LEASE_SECONDS", "300"))
+SOURCE_PULL_JOB_MAX_ATTEMPTS = int(os.getenv("SOURCE_PULL_JOB_MAX_ATTEMPTS", "3"))
+SOURCE_PULL_JOB_RETRY_BASE_SECONDS = int(os.getenv("SOURCE_PULL_JOB_RETRY_BASE_SECONDS", "60"))
+SOURCE_PULL_WORKER_POLL_SECONDS = float(os.getenv("SOURCE_PULL_WORKER_POLL_SECONDS", "5"))
+INGEST_LEASE_TTL_SECONDS = int(os.getenv("INGEST_LEASE_TTL_SECONDS", "900"))
+JOB_TENANT_CONCURRENCY = int(os.getenv("JOB_TENANT_CONCURRENCY", "4"))
+JOB_SAM_CONCURRENCY = int(os.getenv("JOB_SAM_CONCURRENCY", "2"))
+JOB_GRANTS_GOV_CONCURRENCY = int(os.getenv("JOB_GRANTS_GOV_CONCURRENCY", "2"))
+JOB_RESEND_CONCURRENCY = int(os.getenv("JOB_RESEND_CONCURRENCY", "2"))
 GRANTS_GOV_API_KEY = os.getenv("GRANTS_GOV_API_KEY")
 GRANTS_GOV_SEARCH_URL = os.getenv("GRANTS_GOV_SEARCH_URL", "https://api.grants.gov/v1/api/search2")
+GRANTS_GOV_MAX_CONCURRENT_REQUESTS = int(os.getenv("GRANTS_GOV_MAX_CONCURRENT_REQUESTS", "6"))
+OPPORTUNITY_SEARCH_BACKEND = os.getenv("OPPORTUNITY_SEARCH_BACKEND", "auto").strip().lower()
+QUEUE_COUNT_CACHE_SECONDS = int(os.getenv("QUEUE_COUNT_CACHE_SECONDS", "60"))
+USER_CONTEXT_CACHE_SECONDS = int(os.getenv("USER_CONTEXT_CACHE_SECONDS", "30"))
+REQUEST_QUERY_COUNT_HEADER = _env_bool("REQUEST_QUERY_COUNT_HEADER", False)
+WEB_THREADPOOL_SIZE = int(os.getenv("WEB_THREADPOOL_SIZE", "40"))
+EVENT_LOOP_LAG_WARN_MS = int(os.getenv("EVENT_LOOP_LAG_WARN_MS", "250"))
+CSV_EXPORT_BATCH_SIZE = int(os.getenv("CSV_EXPORT_BATCH_SIZE", "500"))
+GRANTS_DETAIL_WORKERS = int(os.getenv("GRANTS_DETAIL_WORKERS", "2"))
+GRANTS_DETAIL_FAILURE_TTL_SECONDS = int(os.getenv("GRANTS_DETAIL_FAILURE_TTL_SECONDS", "900"))
+FRAGMENT_CACHE_SECONDS = int(os.getenv("FRAGMENT_CACHE_SECONDS", "60"))
+FRAGMENT_CACHE_BACKEND = os.getenv("FRAGMENT_CACHE_BACKEND", "memory").strip().lower()
+FRAGMENT_CACHE_PATH = Path(
+    os.getenv("FRAGMENT_CACHE_PATH", str(BASE_DIR / ".bidlens" / "fragment-cache.sqlite3"))
+).expanduser()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 ACCOUNT_ALIAS_FILE_PATH = (
@@ -104,6 +134,8 @@ GUTS_TIMEOUT_SECONDS = float(os.getenv("GUTS_TIMEOUT_SECONDS", "45"))
 GUTS_MAX_OUTPUT_TOKENS = int(os.getenv("GUTS_MAX_OUTPUT_TOKENS", "2400"))
 GUTS_MAX_RETRIES = int(os.getenv("GUTS_MAX_RETRIES", "1"))
 GUTS_STALE_ATTEMPT_SECONDS = int(os.getenv("GUTS_STALE_ATTEMPT_SECONDS", "900"))
+GUTS_GENERATION_QUEUE_ENABLED = _env_bool("GUTS_GENERATION_QUEUE_ENABLED", False)
+GUTS_WORKER_POLL_SECONDS = float(os.getenv("GUTS_WORKER_POLL_SECONDS", "2"))
 GUTS_MAX_TOTAL_INPUT_CHARS = int(os.getenv("GUTS_MAX_TOTAL_INPUT_CHARS", "100000"))
 GUTS_MAX_NOTES = int(os.getenv("GUTS_MAX_NOTES", "20"))
 GUTS_MAX_NOTE_CHARS = int(os.getenv("GUTS_MAX_NOTE_CHARS", "3000"))
@@ -142,6 +174,10 @@ TEAM_SUMMARY_MAX_TOTAL_NOTE_CHARS = int(os.getenv("TEAM_SUMMARY_MAX_TOTAL_NOTE_C
 COMPANY_PROFILE_WEBHOOK_URL = os.getenv("COMPANY_PROFILE_WEBHOOK_URL")
 RESEND_API_KEY = os.getenv("RESEND_API_KEY")
 DAILY_BRIEF_EMAIL_FROM = os.getenv("DAILY_BRIEF_EMAIL_FROM")
+DAILY_BRIEF_EMAIL_WORKERS = int(os.getenv("DAILY_BRIEF_EMAIL_WORKERS", "4"))
+DAILY_BRIEF_EMAIL_RATE_PER_SECOND = float(os.getenv("DAILY_BRIEF_EMAIL_RATE_PER_SECOND", "2"))
+DAILY_BRIEF_EMAIL_BATCH_SIZE = int(os.getenv("DAILY_BRIEF_EMAIL_BATCH_SIZE", "1"))
+DAILY_BRIEF_EMAIL_MAX_ATTEMPTS = int(os.getenv("DAILY_BRIEF_EMAIL_MAX_ATTEMPTS", "3"))
 BIDLENS_APP_BASE_URL = os.getenv("BIDLENS_APP_BASE_URL")
 SALESFORCE_INSTANCE_URL = os.getenv("SALESFORCE_INSTANCE_URL")
 SALESFORCE_CLIENT_ID = os.getenv("SALESFORCE_CLIENT_ID")
@@ -1,6 +1,7 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from .config import DATABASE_SCHEME, DATABASE_URL
+from .query_metrics import install_query_counter
 
 engine_options = {}
 if DATABASE_SCHEME == "sqlite":
@@ -8,6 +9,7 @@ if DATABASE_SCHEME == "sqlite":
 else:
     engine_options["pool_pre_ping"] = True
 
+install_query_counter()
 engine = create_engine(DATABASE_URL, **engine_options)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
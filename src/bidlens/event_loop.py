@@ -0,0 +1,88 @@
+"""Threadpool sizing and event-loop lag monitoring for the web process.
+
+Route handlers are plain ``def`` functions because they use the synchronous
+SQLAlchemy session and ``requests``; Starlette runs them in its threadpool
+so the event loop only parses requests and writes responses. A handler
+should only be ``async def`` if it never blocks.
+
+``LoopLagMonitor`` wakes up every ``interval_seconds`` and measures how late
+it woke. A late wake-up means something held the loop, and the requests in
+flight at that moment are logged so the blocking handler can be found.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from contextlib import contextmanager
+from time import monotonic
+from typing import Iterator
+
+import anyio.to_thread
+
+from . import config
+
+logger = logging.getLogger(__name__)
+
+
+def configure_threadpool(size: int | None = None) -> int:
+    """Set how many sync handlers may run at once; call from the event loop."""
+    size = config.WEB_THREADPOOL_SIZE if size is None else size
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    if size > 0:
+        limiter.total_tokens = size
+    return int(limiter.total_tokens)
+
+
+class LoopLagMonitor:
+    def __init__(self, threshold_ms: float | None = None, interval_seconds: float = 0.1):
+        self._threshold_ms = threshold_ms
+        self.interval_seconds = interval_seconds
+        self._in_flight: dict[int, str] = {}
+        self._ids = itertools.count()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def threshold_ms(self) -> float:
+        return config.EVENT_LOOP_LAG_WARN_MS if self._threshold_ms is None else self._threshold_ms
+
+    @contextmanager
+    def track(self, label: str) -> Iterator[None]:
+        request_id = next(self._ids)
+        self._in_flight[request_id] = label
+        try:
+            yield
+        finally:
+            self._in_flight.pop(request_id, None)
+
+    def check(self, lag_ms: float) -> bool:
+        if self.threshold_ms <= 0 or lag_ms < self.threshold_ms:
+            return False
+        in_flight = ", ".join(sorted(set(self._in_flight.values()))) or "none"
+        logger.warning("Event loop blocked for %.0f ms; requests in flight: %s", lag_ms, in_flight)
+        return True
+
+    async def run(self) -> None:
+        while True:
+            expected = monotonic() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            self.check((monotonic() - expected) * 1000)
+
+    def start(self) -> None:
+        if self.threshold_ms <= 0 or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+loop_lag_monitor = LoopLagMonitor()
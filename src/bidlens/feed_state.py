@@ -0,0 +1,171 @@
+"""Maintenance of ``user_feed_states``, the per-user triage-state projection.
+
+The Feed, its queue counts, and the Daily Brief only need to know whether a
+user has passed on, shortlisted, or is watching an opportunity. That state
+lives in ``votes`` and ``user_opportunities``; keeping one row per
+(organization, user, opportunity) lets those screens use a single indexed
+join instead of anti-joining both tables on every render.
+
+Rows are refreshed by mapper events on ``Vote`` and ``UserOpportunity``, on
+the flushing connection, so the projection commits or rolls back with the
+change that caused it. Bulk ``Query.update``/``delete`` calls bypass mapper
+events; callers that use them must delete or rebuild the affected rows.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Boolean, and_, column, delete, event, false, func, inspect, select, table, union, update
+
+FEED_STATE_TABLE = "user_feed_states"
+FEED_VOTES = ("PURSUE", "PASS")
+
+_states = table(
+    FEED_STATE_TABLE,
+    column("organization_id"),
+    column("user_id"),
+    column("opportunity_id"),
+    column("vote"),
+    column("watched", Boolean),
+    column("updated_at"),
+)
+_votes = table("votes", column("org_id"), column("user_id"), column("opp_id"), column("vote"))
+_watches = table(
+    "user_opportunities",
+    column("organization_id"),
+    column("user_id"),
+    column("opportunity_id"),
+    column("watched", Boolean),
+)
+
+
+def _key_clause(key: tuple[int, int, int]):
+    organization_id, user_id, opportunity_id = key
+    return and_(
+        _states.c.organization_id == organization_id,
+        _states.c.user_id == user_id,
+        _states.c.opportunity_id == opportunity_id,
+    )
+
+
+def refresh_feed_state(connection, key: tuple[int, int, int]) -> None:
+    """Recompute one (organization, user, opportunity) row from its sources."""
+    organization_id, user_id, opportunity_id = key
+    vote = connection.execute(
+        select(_votes.c.vote).where(
+            _votes.c.org_id == organization_id,
+            _votes.c.user_id == user_id,
+            _votes.c.opp_id == opportunity_id,
+        )
+    ).scalar()
+    watched = connection.execute(
+        select(_watches.c.watched).where(
+            _watches.c.organization_id == organization_id,
+            _watches.c.user_id == user_id,
+            _watches.c.opportunity_id == opportunity_id,
+        )
+    ).scalar()
+    vote = vote if vote in FEED_VOTES else None
+    watched = bool(watched)
+    if vote is None and not watched:
+        connection.execute(delete(_states).where(_key_clause(key)))
+        return
+
+    values = {"vote": vote, "watched": watched, "updated_at": func.now()}
+    row = {"organization_id": organization_id, "user_id": user_id, "opportunity_id": opportunity_id, **values}
+    dialect_name = connection.dialect.name
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        if not connection.execute(update(_states).where(_key_clause(key)).values(**values)).rowcount:
+            connection.execute(_states.insert().values(**row))
+        return
+    connection.execute(
+        insert(_states)
+        .values(**row)
+        .on_conflict_do_update(
+            index_elements=["organization_id", "user_id", "opportunity_id"],
+            set_=values,
+        )
+    )
+
+
+def rebuild_feed_states(connection, *, organization_id: int | None = None) -> int:
+    """Rebuild the projection from ``votes`` and ``user_opportunities``.
+
+    Scoped to one organization when ``organization_id`` is given. Returns the
+    number of rows written; the caller owns the transaction.
+    """
+    keys_from_votes = select(
+        _votes.c.org_id.label("organization_id"),
+        _votes.c.user_id.label("user_id"),
+        _votes.c.opp_id.label("opportunity_id"),
+    ).where(_votes.c.vote.in_(FEED_VOTES))
+    keys_from_watches = select(
+        _watches.c.organization_id, _watches.c.user_id, _watches.c.opportunity_id,
+    ).where(_watches.c.watched.is_(True))
+    clear = delete(_states)
+    if organization_id is not None:
+        keys_from_votes = keys_from_votes.where(_votes.c.org_id == organization_id)
+        keys_from_watches = keys_from_watches.where(_watches.c.organization_id == organization_id)
+        clear = clear.where(_states.c.organization_id == organization_id)
+    keys = union(keys_from_votes, keys_from_watches).subquery("feed_keys")
+    rows = (
+        select(
+            keys.c.organization_id,
+            keys.c.user_id,
+            keys.c.opportunity_id,
+            _votes.c.vote,
+            func.coalesce(_watches.c.watched, false()),
+            func.now(),
+        )
+        .select_from(keys)
+        .outerjoin(
+            _votes,
+            and_(
+                _votes.c.org_id == keys.c.organization_id,
+                _votes.c.user_id == keys.c.user_id,
+                _votes.c.opp_id == keys.c.opportunity_id,
+                _votes.c.vote.in_(FEED_VOTES),
+            ),
+        )
+        .outerjoin(
+            _watches,
+            and_(
+                _watches.c.organization_id == keys.c.organization_id,
+                _watches.c.user_id == keys.c.user_id,
+                _watches.c.opportunity_id == keys.c.opportunity_id,
+            ),
+        )
+    )
+    connection.execute(clear)
+    result = connection.execute(
+        _states.insert().from_select(
+            ["organization_id", "user_id", "opportunity_id", "vote", "watched", "updated_at"], rows,
+        )
+    )
+    return result.rowcount if result.rowcount is not None and result.rowcount >= 0 else 0
+
+
+def install_feed_state_sync(vote_class, user_opportunity_class) -> None:
+    """Keep ``user_feed_states`` in step with ORM writes to votes and watches."""
+
+    def _vote_changed(_mapper, connection, target) -> None:
+        refresh_feed_state(connection, (target.org_id, target.user_id, target.opp_id))
+
+    def _watch_changed(_mapper, connection, target) -> None:
+        refresh_feed_state(connection, (target.organization_id, target.user_id, target.opportunity_id))
+
+    def _only_when(attribute: str, listener):
+        # Shortlist timestamps and notes also flush as updates; skip those.
+        def _listener(mapper, connection, target) -> None:
+            if inspect(target).attrs[attribute].history.has_changes():
+                listener(mapper, connection, target)
+        return _listener
+
+    for event_name in ("after_insert", "after_delete"):
+        event.listen(vote_class, event_name, _vote_changed)
+        event.listen(user_opportunity_class, event_name, _watch_changed)
+    event.listen(vote_class, "after_update", _only_when("vote", _vote_changed))
+    event.listen(user_opportunity_class, "after_update", _only_when("watched", _watch_changed))
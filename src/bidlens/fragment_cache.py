@@ -0,0 +1,300 @@
+"""Cached per-user page fragments: the sidebar, queue counts and result totals.
+
+Feed, My Shortlist, Archive, Calendar and detail pages all render the same
+sidebar for a user, and it only changes when that user votes or watches, an
+opportunity changes state, or an ingest lands. Fragments are cached per
+(database, organization, user) for ``FRAGMENT_CACHE_SECONDS`` and dropped
+explicitly at those write points:
+
+- ``cast_vote`` and the watch toggle call ``invalidate_user``;
+- ``transition_state`` and ingest commits call ``invalidate_organization``.
+
+Invalidation advances an epoch counter instead of deleting entries. Each entry
+records the organization and user epochs read before it was computed, so a
+value computed while a write committed is never served afterwards.
+
+``FRAGMENT_CACHE_BACKEND`` picks the store: ``memory`` keeps fragments in the
+process; ``sqlite`` keeps them in a local SQLite file
+(``FRAGMENT_CACHE_PATH``) shared by every worker on the host, so a vote in one
+worker invalidates the sidebar the others serve. Writes that bypass these hooks
+are picked up when the TTL expires.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import uuid
+import weakref
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from pathlib import Path
+from time import monotonic, time
+from typing import Any, Callable, Hashable, Iterable
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from . import config
+
+
+class FragmentCacheError(RuntimeError):
+    pass
+
+
+class FragmentStore(ABC):
+    """Key/value store behind ``FragmentCache``; values are JSON-compatible."""
+
+    #: Whether other processes see the same entries.
+    shared = False
+
+    @abstractmethod
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]: ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None: ...
+
+    @abstractmethod
+    def incr(self, key: str) -> int: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class MemoryFragmentStore(FragmentStore):
+    def __init__(self, max_entries: int = 4096, max_epochs: int = 16384):
+        self.max_entries = max_entries
+        self.max_epochs = max_epochs
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._epochs: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        now = monotonic()
+        found: dict[str, Any] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._epochs:
+                    found[key] = self._epochs[key]
+                    continue
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                expires_at, value = entry
+                if now >= expires_at:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = value
+        return found
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            if key not in self._epochs and len(self._epochs) >= self.max_epochs:
+                # A forgotten epoch would read as 0 again and could revive an
+                # entry computed before it advanced, so start over instead.
+                self._epochs.clear()
+                self._entries.clear()
+            self._epochs[key] = self._epochs.get(key, 0) + 1
+            return self._epochs[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._epochs.clear()
+
+
+class SqliteFragmentStore(FragmentStore):
+    """Fragments in a local SQLite file shared by the workers on one host."""
+
+    shared = True
+    _PRUNE_EVERY = 256
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path).expanduser()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS fragments "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS fragment_epochs (key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" for _ in keys)
+        connection = self._connection()
+        found = dict(
+            connection.execute(f"SELECT key, value FROM fragment_epochs WHERE key IN ({placeholders})", keys).fetchall()
+        )
+        rows = connection.execute(
+            f"SELECT key, value FROM fragments WHERE key IN ({placeholders}) AND expires_at > ?",
+            [*keys, time()],
+        ).fetchall()
+        found.update((key, json.loads(value)) for key, value in rows)
+        return found
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        connection = self._connection()
+        now = time()
+        connection.execute(
+            "INSERT INTO fragments (key, value, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at",
+            (key, json.dumps(value, separators=(",", ":")), now + ttl_seconds),
+        )
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self._PRUNE_EVERY == 0
+        if prune:
+            connection.execute("DELETE FROM fragments WHERE expires_at <= ?", (now,))
+
+    def incr(self, key: str) -> int:
+        row = self._connection().execute(
+            "INSERT INTO fragment_epochs (key, value) VALUES (?, 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + 1 RETURNING value",
+            (key,),
+        ).fetchone()
+        return int(row[0])
+
+    def clear(self) -> None:
+        connection = self._connection()
+        connection.execute("DELETE FROM fragments")
+        connection.execute("DELETE FROM fragment_epochs")
+
+
+def configured_fragment_store() -> FragmentStore:
+    backend = config.FRAGMENT_CACHE_BACKEND
+    if backend == "memory":
+        return MemoryFragmentStore()
+    if backend == "sqlite":
+        return SqliteFragmentStore(config.FRAGMENT_CACHE_PATH)
+    raise FragmentCacheError(f"Unsupported FRAGMENT_CACHE_BACKEND: {backend or '<empty>'}")
+
+
+class FragmentCache:
+    """Per-(organization, user) fragment cache with hit/miss counters."""
+
+    def __init__(self, store: FragmentStore | None = None, ttl_seconds: float | None = None):
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        self._namespaces: "weakref.WeakKeyDictionary[Engine, str]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    @property
+    def ttl_seconds(self) -> float:
+        return config.FRAGMENT_CACHE_SECONDS if self._ttl_seconds is None else self._ttl_seconds
+
+    @property
+    def store(self) -> FragmentStore:
+        if self._store is None:
+            with self._lock:
+                if self._store is None:
+                    self._store = configured_fragment_store()
+        return self._store
+
+    def _namespace(self, db: Session) -> str:
+        engine = db.get_bind()
+        engine = getattr(engine, "engine", engine)
+        # Resolve the store first: it takes ``_lock`` itself on first use.
+        shared = self.store.shared
+        with self._lock:
+            namespace = self._namespaces.get(engine)
+            if namespace is None:
+                if shared:
+                    namespace = engine.url.render_as_string(hide_password=True)
+                else:
+                    # In-process entries never outlive their engine's identity.
+                    namespace = uuid.uuid4().hex
+                self._namespaces[engine] = namespace
+        return namespace
+
+    @staticmethod
+    def _organization_epoch_key(namespace: str, organization_id: int) -> str:
+        return f"{namespace}|epoch|org|{organization_id}"
+
+    @staticmethod
+    def _user_epoch_key(namespace: str, organization_id: int, user_id: int) -> str:
+        return f"{namespace}|epoch|user|{organization_id}|{user_id}"
+
+    def get_or_compute(
+        self,
+        db: Session,
+        name: str,
+        *,
+        organization_id: int,
+        user_id: int,
+        compute: Callable[[], Any],
+        variant: tuple[Hashable, ...] = (),
+        ttl_seconds: float | None = None,
+    ) -> Any:
+        """Return the cached ``name`` fragment, computing and storing it on a miss.
+
+        ``compute`` must return a JSON-compatible value. ``ttl_seconds``
+        overrides ``FRAGMENT_CACHE_SECONDS`` for this fragment.
+        """
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl_seconds <= 0:
+            return compute()
+        namespace = self._namespace(db)
+        organization_key = self._organization_epoch_key(namespace, organization_id)
+        user_key = self._user_epoch_key(namespace, organization_id, user_id)
+        key = "|".join(str(part) for part in (namespace, name, organization_id, user_id, *variant))
+        found = self.store.get_many([organization_key, user_key, key])
+        epochs = [found.get(organization_key, 0), found.get(user_key, 0)]
+        entry = found.get(key)
+        if entry is not None and entry.get("epochs") == epochs:
+            with self._lock:
+                self.hits[name] += 1
+            return entry["value"]
+
+        with self._lock:
+            self.misses[name] += 1
+        value = compute()
+        self.store.set(key, {"epochs": epochs, "value": value}, ttl_seconds)
+        return value
+
+    def invalidate_user(self, db: Session, *, organization_id: int, user_id: int) -> None:
+        self.store.incr(self._user_epoch_key(self._namespace(db), organization_id, user_id))
+
+    def invalidate_organization(self, db: Session, organization_id: int) -> None:
+        self.store.incr(self._organization_epoch_key(self._namespace(db), organization_id))
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            names = sorted(set(self.hits) | set(self.misses))
+            return {name: {"hits": self.hits[name], "misses": self.misses[name]} for name in names}
+
+    def clear(self) -> None:
+        self.store.clear()
+        with self._lock:
+            self.hits.clear()
+            self.misses.clear()
+
+
+fragment_cache = FragmentCache()
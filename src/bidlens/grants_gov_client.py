@@ -1,16 +1,64 @@
 import logging
+import threading
 from typing import Any
+from urllib.parse import urlparse
 
 import requests
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .config import GRANTS_GOV_SEARCH_URL
+from .config import GRANTS_GOV_MAX_CONCURRENT_REQUESTS, GRANTS_GOV_SEARCH_URL
 
 
 logger = logging.getLogger(__name__)
 GRANTS_GOV_DETAIL_URL = "https://api.grants.gov/v1/api/fetchOpportunity"
 DEFAULT_GRANTS_POSTED_DAYS_BACK = 7
 DEFAULT_GRANTS_ROWS = 25
+# search2 and fetchOpportunity are read-only POSTs, so retrying them is safe.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+_HOST_SLOTS: dict[str, threading.BoundedSemaphore] = {}
+
+
+def _session() -> requests.Session:
+    """Keep-alive session shared by every Grants.gov call in the process."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=2,
+                    pool_maxsize=max(1, GRANTS_GOV_MAX_CONCURRENT_REQUESTS),
+                    max_retries=_RETRY,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    host = urlparse(url).netloc
+    with _SESSION_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = threading.BoundedSemaphore(max(1, GRANTS_GOV_MAX_CONCURRENT_REQUESTS))
+    return slot
+
+
+def _post(url: str, payload: dict[str, Any], headers: dict[str, str]) -> requests.Response:
+    with _host_slot(url):
+        return _session().post(url, json=payload, headers=headers, timeout=30)
 
 
 class GrantsGovApiError(RuntimeError):
@@ -30,7 +78,7 @@ def _post_search(payload: dict[str, Any]) -> requests.Response:
         "Accept": "application/json",
         "Content-Type": "application/json",
     }
-    response = requests.post(GRANTS_GOV_SEARCH_URL, json=payload, headers=headers, timeout=30)
+    response = _post(GRANTS_GOV_SEARCH_URL, payload, headers)
     logger.info("Grants.gov search status=%s url=%s", response.status_code, GRANTS_GOV_SEARCH_URL)
     return response
 
@@ -40,7 +88,7 @@ def _post_json(url: str, payload: dict[str, Any]) -> requests.Response:
         "Accept": "application/json",
         "Content-Type": "application/json",
     }
-    response = requests.post(url, json=payload, headers=headers, timeout=30)
+    response = _post(url, payload, headers)
     logger.info("Grants.gov POST status=%s url=%s", response.status_code, url)
     return response
 
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 import datetime as dt
 import logging
-from typing import Any
+from typing import Any, Iterator
 
 import requests
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from . import config
+from .config import GRANTS_GOV_MAX_CONCURRENT_REQUESTS
+from .fragment_cache import fragment_cache
 from .grants_gov_client import (
     DEFAULT_GRANTS_POSTED_DAYS_BACK,
     DEFAULT_GRANTS_ROWS,
@@ -16,6 +20,7 @@ from .grants_gov_client import (
     search_recent_opportunities,
 )
 from .models import Opportunity, OpportunityHistoryEvent
+from .services.ingest_leases import GRANTS_INGEST_LEASE, ingest_lease, ingest_lease_slot, organization_lease
 from .services.ingestion_details import build_error_detail, build_invalid_detail, build_upsert_detail
 from .services.opportunity_history import (
     EVENT_GRANTS_FORECAST_VERSION,
@@ -23,7 +28,7 @@ from .services.opportunity_history import (
     record_history_event,
     record_imported_history,
 )
-from .services.opportunity_monitor import apply_source_update
+from .services.opportunity_monitor import apply_source_update, source_fingerprint
 from .services.opportunity_types import grants_canonical_type
 from .services.opportunity_qualification import grants_eligibility
 from .services.qualification import new_opportunity_qualification_status
@@ -31,6 +36,7 @@ from .services.pursuit_lanes import refresh_opportunity_lane_matches
 
 
 SOURCE = "grants_gov"
+GRANTS_BUSY_MESSAGE = "A Grants.gov pull is already in progress"
 logger = logging.getLogger(__name__)
 
 _GRANTS_FORECAST_VALUES = {"forecast", "forecasted", "forecasted opportunity"}
@@ -459,6 +465,7 @@ def upsert_grants_gov_opportunity(
                     qualification_status=new_opportunity_qualification_status(db, organization_id),
                     upserted_at=dt.datetime.utcnow(),
                     last_seen_at=dt.datetime.utcnow(),
+                    content_fingerprint=source_fingerprint(data),
                 )
                 db.add(opportunity)
                 db.flush()
@@ -594,6 +601,94 @@ def _fetch_daily_search_results(*, days_back: int, rows: int) -> tuple[list[dict
     return records, pages_pulled
 
 
+# Search-hit fields that change whenever Grants.gov revises an opportunity or
+# moves it between stages; if none changed, the stored detail is still current.
+_DETAIL_CHANGE_MARKERS = ("closeDate", "lastUpdatedDate", "oppStatus", "docType")
+_STORED_PAYLOAD_CHUNK_SIZE = 500
+
+
+def _record_source_id(record: dict[str, Any]) -> str | None:
+    return _clean(
+        _first_value(record, "id", "opportunityId", "opportunityID", "opportunity_id", "oppId", "opp_id")
+    )
+
+
+def _stored_grants_payloads(
+    db: Session,
+    organization_id: int,
+    source_record_ids: list[str],
+) -> dict[str, dict[str, Any]]:
+    ids = list(dict.fromkeys(source_record_ids))
+    stored: dict[str, dict[str, Any]] = {}
+    for start in range(0, len(ids), _STORED_PAYLOAD_CHUNK_SIZE):
+        rows = (
+            db.query(Opportunity.source_record_id, Opportunity.raw_source_payload)
+            .filter(
+                Opportunity.organization_id == organization_id,
+                Opportunity.source == SOURCE,
+                Opportunity.source_record_id.in_(ids[start:start + _STORED_PAYLOAD_CHUNK_SIZE]),
+            )
+            .all()
+        )
+        for source_record_id, payload in rows:
+            if isinstance(payload, dict):
+                stored[source_record_id] = payload
+    return stored
+
+
+def _reusable_detail_payload(record: dict[str, Any], stored_payload: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return the stored detail if the search hit shows no change since it was fetched."""
+    if not stored_payload:
+        return None
+    detail_payload = stored_payload.get("detail_payload")
+    stored_hit = stored_payload.get("search_result")
+    if not isinstance(detail_payload, dict) or not detail_payload or not isinstance(stored_hit, dict):
+        return None
+    if any(record.get(key) != stored_hit.get(key) for key in _DETAIL_CHANGE_MARKERS):
+        return None
+    return detail_payload
+
+
+def _fetch_detail(source_record_id: str) -> tuple[dict[str, Any] | None, Exception | None]:
+    try:
+        return fetch_opportunity_detail(source_record_id), None
+    except (GrantsGovApiError, requests.RequestException) as exc:
+        return None, exc
+
+
+def _iter_detail_payloads(
+    records: list[dict[str, Any]],
+    source_record_ids: list[str | None],
+    stored_payloads: dict[str, dict[str, Any]],
+    *,
+    max_workers: int = GRANTS_GOV_MAX_CONCURRENT_REQUESTS,
+) -> Iterator[tuple[dict[str, Any] | None, Exception | None, bool]]:
+    """Yield ``(detail_payload, lookup_error, reused)`` per record, in input order.
+
+    Detail lookups run concurrently on a bounded pool while the caller
+    normalizes and upserts earlier records on its own thread.
+    """
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="grants-detail")
+    try:
+        planned: list[Future | dict[str, Any] | None] = []
+        for record, source_record_id in zip(records, source_record_ids):
+            if not source_record_id:
+                planned.append(None)
+                continue
+            reusable = _reusable_detail_payload(record, stored_payloads.get(source_record_id))
+            planned.append(reusable if reusable is not None else pool.submit(_fetch_detail, source_record_id))
+        for item in planned:
+            if isinstance(item, Future):
+                detail_payload, error = item.result()
+                yield detail_payload, error, False
+            elif item is not None:
+                yield item, None, True
+            else:
+                yield None, None, False
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 def ingest_grants_gov(
     db: Session,
     *,
@@ -601,8 +696,34 @@ def ingest_grants_gov(
     days_back: int = DEFAULT_GRANTS_POSTED_DAYS_BACK,
     rows: int = DEFAULT_GRANTS_ROWS,
     run_type: str = "Manual",
+) -> dict[str, Any]:
+    lease_name = organization_lease(GRANTS_INGEST_LEASE, organization_id)
+    with (
+        ingest_lease(db, lease_name, busy_message=GRANTS_BUSY_MESSAGE),
+        ingest_lease_slot(
+            db, GRANTS_INGEST_LEASE, slots=config.JOB_GRANTS_GOV_CONCURRENCY, busy_message=GRANTS_BUSY_MESSAGE
+        ),
+    ):
+        return _ingest_grants_gov(
+            db,
+            organization_id=organization_id,
+            days_back=days_back,
+            rows=rows,
+            run_type=run_type,
+        )
+
+
+def _ingest_grants_gov(
+    db: Session,
+    *,
+    organization_id: int,
+    days_back: int,
+    rows: int,
+    run_type: str,
 ) -> dict[str, Any]:
     records, pages_pulled = _fetch_daily_search_results(days_back=days_back, rows=rows)
+    source_record_ids = [_record_source_id(record) for record in records]
+    stored_payloads = _stored_grants_payloads(db, organization_id, [sid for sid in source_record_ids if sid])
     result = {
         "status": "success",
         "organization_id": organization_id,
@@ -617,28 +738,31 @@ def ingest_grants_gov(
         "skipped": 0,
         "errors": 0,
         "detail_errors": 0,
+        "details_reused": 0,
         "skipped_reasons": [],
         "_record_details": [],
     }
-    for index, record in enumerate(records, start=1):
+    detail_payloads = _iter_detail_payloads(records, source_record_ids, stored_payloads)
+    for index, (record, source_record_id, (detail_payload, detail_error, reused)) in enumerate(
+        zip(records, source_record_ids, detail_payloads),
+        start=1,
+    ):
         detail_lookup_error = None
-        source_record_id = _clean(
-            _first_value(record, "id", "opportunityId", "opportunityID", "opportunity_id", "oppId", "opp_id")
-        )
+        if reused:
+            result["details_reused"] += 1
         if source_record_id:
-            try:
-                detail_payload = fetch_opportunity_detail(source_record_id)
+            if detail_error is None:
                 record = _merge_detail_payload(record, detail_payload)
-            except (GrantsGovApiError, requests.RequestException) as exc:
-                detail_lookup_error = str(exc)
+            else:
+                detail_lookup_error = str(detail_error)
                 result["detail_errors"] += 1
                 result["skipped_reasons"].append(
-                    {"row": index, "reason": f"detail lookup failed for {source_record_id}: {exc}"}
+                    {"row": index, "reason": f"detail lookup failed for {source_record_id}: {detail_error}"}
                 )
                 logger.warning(
                     "Grants.gov detail lookup failed source_record_id=%s error=%s",
                     source_record_id,
-                    exc,
+                    detail_error,
                 )
         normalized, reason = normalize_grants_gov_record(record)
         if reason:
@@ -690,6 +814,7 @@ def ingest_grants_gov(
     elif result["received"] == 0:
         result["status"] = "no_records"
     db.commit()
+    fragment_cache.invalidate_organization(db, organization_id)
     if result["status"] == "no_records":
         result["message"] = (
             f"Completed — no records returned for the requested {days_back}-day Grants.gov posted-date window."
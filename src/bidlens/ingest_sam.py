@@ -3,26 +3,45 @@ import hashlib
 import json
 import logging
 import math
-import threading
 from email.utils import parsedate_to_datetime
 from typing import Any, Dict, Optional, Set
 
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
-from .sam_client import SamRateLimitError, SamTemporaryUnavailableError, resolve_notice_description, search_opportunities
+from . import config
+from .sam_client import (
+    SamRateLimitError,
+    SamTemporaryUnavailableError,
+    resolve_notice_descriptions,
+    search_opportunities,
+)
+from .account_display import account_display_columns
+from .fragment_cache import fragment_cache
 from .models import Opportunity, IngestionRun
+from .services.ingest_leases import (
+    SAM_INGEST_LEASE,
+    ingest_lease,
+    ingest_lease_held,
+    ingest_lease_slot,
+    organization_lease,
+)
 from .services.ingestion_details import build_error_detail, build_invalid_detail, build_upsert_detail
 from .services.ingestion_runs import record_source_activity
-from .services.opportunity_history import record_imported_history
-from .services.opportunity_monitor import apply_source_update
+from .services.opportunity_history import imported_history_entry, record_history_events, record_imported_history
+from .services.opportunity_monitor import (
+    apply_source_update,
+    apply_source_updates,
+    mark_observed,
+    source_fingerprint,
+)
 from .services.opportunity_types import sam_canonical_type
 from .services.opportunity_qualification import sam_set_aside
 from .services.qualification import new_opportunity_qualification_status
-from .services.pursuit_lanes import refresh_opportunity_lane_matches
+from .services.sam_search_cache import SamSearchCache
+from .services.pursuit_lanes import refresh_opportunities_lane_matches, refresh_opportunity_lane_matches
 
 logger = logging.getLogger(__name__)
-_INGEST_LOCK = threading.Lock()
 
 ALLOWED_TYPES = {
     "Solicitation",
@@ -65,8 +84,11 @@ def parse_allowed_types(s: str | None) -> set[str]:
     return {x.strip() for x in s.split(",") if x.strip()}
 
 
-def sam_ingest_in_progress() -> bool:
-    return _INGEST_LOCK.locked()
+SAM_BUSY_MESSAGE = "A SAM pull is already in progress"
+
+
+def sam_ingest_in_progress(db: Session, organization_id: int) -> bool:
+    return ingest_lease_held(db, organization_lease(SAM_INGEST_LEASE, organization_id))
 
 
 def _sam_config_signature(**values: Any) -> str:
@@ -92,6 +114,32 @@ def _retry_after_at(value: str | None, seconds: float | None) -> dt.datetime | N
     return None
 
 
+def _save_run_progress(
+    db: Session,
+    run: IngestionRun,
+    checkpoint: dict[str, Any],
+    *,
+    scope_count: int,
+    records_seen: int,
+    inserted: int,
+    updated: int,
+    unchanged: int,
+    skipped: int,
+    filtered: int,
+    errors: int,
+) -> None:
+    """Persist per-scope progress so queued pulls can be polled while running."""
+    run.checkpoint_json = {**checkpoint, "scope_count": scope_count}
+    run.processed_count = records_seen
+    run.created_count = inserted
+    run.updated_count = updated
+    run.unchanged_count = unchanged
+    run.skipped_count = skipped
+    run.filtered_count = filtered
+    run.error_count = errors
+    db.commit()
+
+
 def ingest_sam(
     db: Session,
     organization_id: int,
@@ -111,17 +159,23 @@ def ingest_sam(
     saved_search_name: str | None = None,
     run_type: str | None = None,
     source_config_id: int | None = None,
+    search_cache: SamSearchCache | None = None,
 ):
     allowed_types = allowed_types or set()
+    search_cache = search_cache or SamSearchCache()
     keywords = keywords or set()
     agencies = agencies or set()
     set_asides = set_asides or set()
     naics_list = list(dict.fromkeys(code.strip() for code in naics_list if code.strip()))
 
-    if not _INGEST_LOCK.acquire(blocking=False):
-        raise RuntimeError("A SAM pull is already in progress")
-
-    try:
+    # One SAM pull per organization at a time across every web worker, job,
+    # and node, and at most JOB_SAM_CONCURRENCY of them against the shared
+    # API key.
+    lease_name = organization_lease(SAM_INGEST_LEASE, organization_id)
+    with (
+        ingest_lease(db, lease_name, busy_message=SAM_BUSY_MESSAGE),
+        ingest_lease_slot(db, SAM_INGEST_LEASE, slots=config.JOB_SAM_CONCURRENCY, busy_message=SAM_BUSY_MESSAGE),
+    ):
         agency_scopes = sorted(agencies) if agencies else [None]
         search_scopes = [
             (naics, agency_scope)
@@ -224,6 +278,7 @@ def ingest_sam(
         pages_pulled = int(checkpoint.get("pages_pulled", 0))
         records_seen = run.processed_count or 0
         search_requests_made = int(checkpoint.get("search_requests_made", 0))
+        search_cache_hits = 0
         results: list[dict[str, Any]] = []
         record_details: list[dict[str, Any]] = []
         stopped_due_to_rate_limit = False
@@ -272,6 +327,7 @@ def ingest_sam(
                     initial_pulled=int(checkpoint.get("scope_pulled", 0)) if resuming_scope else 0,
                     posted_from_override=dt.date.fromisoformat(checkpoint["posted_from"]),
                     posted_to_override=dt.date.fromisoformat(checkpoint["posted_to"]),
+                    search_cache=search_cache,
                 )
 
                 inserted += int(result.get("inserted", 0))
@@ -283,6 +339,7 @@ def ingest_sam(
                 pages_pulled += int(result.get("pages_pulled", 0))
                 records_seen += int(result.get("records_seen", 0))
                 search_requests_made += int(result.get("search_requests_made", 0))
+                search_cache_hits += int(result.get("search_cache_hits", 0))
                 record_details.extend(result.pop("_record_details", []))
 
                 results.append(result)
@@ -318,6 +375,19 @@ def ingest_sam(
                     "pages_pulled": pages_pulled,
                     "search_requests_made": search_requests_made,
                 })
+                _save_run_progress(
+                    db,
+                    run,
+                    checkpoint,
+                    scope_count=len(search_scopes),
+                    records_seen=records_seen,
+                    inserted=inserted,
+                    updated=updated,
+                    unchanged=unchanged,
+                    skipped=skipped,
+                    filtered=filtered,
+                    errors=errors,
+                )
                 logger.info(
                     "Completed SAM NAICS naics=%s pages_pulled=%s records_seen=%s search_requests=%s inserted=%s updated=%s skipped=%s filtered=%s errors=%s pulled=%s",
                     naics,
@@ -423,6 +493,7 @@ def ingest_sam(
             "pages_pulled": pages_pulled,
             "records_seen": records_seen,
             "search_requests_made": search_requests_made,
+            "search_cache_hits": search_cache_hits,
             "results": results,
             "_record_details": record_details,
             "stopped_due_to_rate_limit": stopped_due_to_rate_limit,
@@ -456,8 +527,6 @@ def ingest_sam(
         )
         db.commit()
         return final_result
-    finally:
-        _INGEST_LOCK.release()
 
 
 def _parse_date(s: Optional[str]) -> Optional[dt.date]:
@@ -583,6 +652,7 @@ def upsert_opportunity(
                     qualification_status=new_opportunity_qualification_status(db, organization_id),
                     upserted_at=dt.datetime.utcnow(),
                     last_seen_at=dt.datetime.utcnow(),
+                    content_fingerprint=source_fingerprint(data),
                 )
                 db.add(opportunity)
                 db.flush()
@@ -618,6 +688,243 @@ def upsert_opportunity(
     return "unchanged"
 
 
+def _insert_opportunities_ignoring_conflicts(
+    db: Session,
+    rows: list[dict[str, Any]],
+) -> list[Opportunity] | None:
+    """Insert a page of rows in one statement, skipping existing source records.
+
+    Returns the inserted rows, or None when the dialect has no ON CONFLICT
+    support and the caller should fall back to per-record inserts.
+    """
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    statement = (
+        insert(Opportunity)
+        .on_conflict_do_nothing(index_elements=["organization_id", "source", "source_record_id"])
+        .returning(Opportunity)
+    )
+    return list(db.scalars(statement, rows).all())
+
+
+def upsert_opportunities(
+    db: Session,
+    organization_id: int,
+    records: list[Dict[str, Any]],
+    *,
+    audits: list[dict[str, Any]] | None = None,
+) -> list[str]:
+    """
+    Set-based ``upsert_opportunity`` for one page of normalized records.
+
+    Existing rows are prefetched in one query, inserts share one
+    INSERT ... ON CONFLICT DO NOTHING, and updates, history and lane matches
+    are written per page. Records whose content fingerprint matches the stored
+    one are only marked seen, in one UPDATE, without loading the full row.
+    Returns one status per record, in input order, and fills ``audits`` with
+    the same per-record details as ``upsert_opportunity``.
+    """
+    if audits is None:
+        audits = [{} for _ in records]
+    statuses: list[str | None] = [None] * len(records)
+    now = dt.datetime.utcnow()
+    keys = [
+        (
+            data.get("source") or "sam",
+            data.get("source_record_id") or data.get("sam_notice_id"),
+        )
+        for data in records
+    ]
+    fingerprints = [source_fingerprint(data) for data in records]
+
+    stored_by_key: dict[tuple[str, str], Any] = {}
+    for source in sorted({source for source, _record_id in keys}):
+        source_record_ids = sorted({record_id for key_source, record_id in keys if key_source == source})
+        for row in (
+            db.query(
+                Opportunity.id,
+                Opportunity.source_record_id,
+                Opportunity.content_fingerprint,
+                Opportunity.salesforce_opportunity_id,
+            )
+            .filter(
+                Opportunity.organization_id == organization_id,
+                Opportunity.source == source,
+                Opportunity.source_record_id.in_(source_record_ids),
+            )
+            .all()
+        ):
+            stored_by_key[(source, row.source_record_id)] = row
+
+    seen: set[tuple[str, str]] = set()
+    insert_indexes: list[int] = []
+    unchanged_indexes: list[int] = []
+    update_indexes: list[int] = []
+    # A record repeated within the page must observe the first copy's write,
+    # so repeats go through the per-record path once the page is applied.
+    deferred_indexes: list[int] = []
+    for index, key in enumerate(keys):
+        if key in seen:
+            deferred_indexes.append(index)
+            continue
+        seen.add(key)
+        stored = stored_by_key.get(key)
+        if stored is None:
+            insert_indexes.append(index)
+        elif stored.content_fingerprint == fingerprints[index]:
+            unchanged_indexes.append(index)
+        else:
+            update_indexes.append(index)
+
+    if unchanged_indexes:
+        mark_observed(db, [stored_by_key[keys[index]].id for index in unchanged_indexes], now)
+        for index in unchanged_indexes:
+            stored = stored_by_key[keys[index]]
+            audits[index].update({
+                "matched_opportunity_id": stored.id,
+                "salesforce_linked": bool(stored.salesforce_opportunity_id),
+                "changed_fields": {},
+                "salesforce_sync_status": None,
+                "salesforce_error": None,
+                "update_event_id": None,
+            })
+            statuses[index] = "unchanged"
+
+    existing_by_key: dict[tuple[str, str], Opportunity] = {}
+    if update_indexes:
+        for opportunity in (
+            db.query(Opportunity)
+            .filter(Opportunity.id.in_([stored_by_key[keys[index]].id for index in update_indexes]))
+            .all()
+        ):
+            existing_by_key[(opportunity.source, opportunity.source_record_id)] = opportunity
+
+    touched: list[Opportunity] = []
+    if insert_indexes:
+        qualification_status = new_opportunity_qualification_status(db, organization_id)
+        rows = [
+            {
+                **records[index],
+                "organization_id": organization_id,
+                "source": keys[index][0],
+                "source_record_id": keys[index][1],
+                "qualification_status": qualification_status,
+                "upserted_at": now,
+                "last_seen_at": now,
+                "content_fingerprint": fingerprints[index],
+                # Bulk inserts skip mapper events, so resolve the account here.
+                **account_display_columns(records[index].get("agency")),
+            }
+            for index in insert_indexes
+        ]
+        inserted_rows = _insert_opportunities_ignoring_conflicts(db, rows)
+        if inserted_rows is None:
+            deferred_indexes.extend(insert_indexes)
+        else:
+            inserted_by_key = {
+                (opportunity.source, opportunity.source_record_id): opportunity
+                for opportunity in inserted_rows
+            }
+            for index in insert_indexes:
+                opportunity = inserted_by_key.get(keys[index])
+                if opportunity is None:
+                    audits[index]["integrity_error"] = True
+                    logger.info(
+                        "Skipping duplicate source record source=%s source_record_id=%s",
+                        keys[index][0],
+                        keys[index][1],
+                    )
+                    statuses[index] = "skipped"
+                    continue
+                audits[index].update({
+                    "matched_opportunity_id": opportunity.id,
+                    "salesforce_linked": False,
+                    "changed_fields": {},
+                })
+                statuses[index] = "inserted"
+                touched.append(opportunity)
+            record_history_events(
+                db,
+                [imported_history_entry(opportunity) for opportunity in inserted_rows],
+                notify_interested=False,
+            )
+
+    if update_indexes:
+        monitor_results = apply_source_updates(
+            db,
+            [(existing_by_key[keys[index]], records[index]) for index in update_indexes],
+            observed_at=now,
+        )
+        for index, monitor_result in zip(update_indexes, monitor_results):
+            existing = existing_by_key[keys[index]]
+            audits[index].update({
+                "matched_opportunity_id": existing.id,
+                "salesforce_linked": bool(existing.salesforce_opportunity_id),
+                "changed_fields": monitor_result.changed_fields,
+                "salesforce_sync_status": monitor_result.salesforce_sync_status,
+                "salesforce_error": monitor_result.salesforce_error,
+                "update_event_id": monitor_result.update_event_id,
+            })
+            if monitor_result.changed:
+                statuses[index] = "updated"
+                touched.append(existing)
+            else:
+                statuses[index] = "unchanged"
+
+    refresh_opportunities_lane_matches(db, organization_id, touched)
+
+    for index in sorted(deferred_indexes):
+        statuses[index] = upsert_opportunity(db, organization_id, records[index], audit=audits[index])
+
+    return [status or "skipped" for status in statuses]
+
+
+def _upsert_sam_page(
+    db: Session,
+    organization_id: int,
+    naics: str,
+    records: list[Dict[str, Any]],
+) -> list[tuple[str | None, dict[str, Any], Exception | None]]:
+    """Upsert one SAM page, falling back to per-record writes on failure.
+
+    The batched path runs inside a savepoint so a single bad record rolls back
+    only the batch; the per-record retry then isolates it the way the
+    unbatched ingest always has.
+    """
+    audits: list[dict[str, Any]] = [{} for _ in records]
+    try:
+        with db.begin_nested():
+            statuses = upsert_opportunities(db, organization_id, records, audits=audits)
+        return [(status, audit, None) for status, audit in zip(statuses, audits)]
+    except Exception as exc:
+        logger.warning(
+            "SAM batched upsert failed; retrying per record naics=%s records=%s error=%s",
+            naics,
+            len(records),
+            repr(exc),
+        )
+
+    outcomes: list[tuple[str | None, dict[str, Any], Exception | None]] = []
+    for data in records:
+        audit: dict[str, Any] = {}
+        try:
+            outcomes.append((upsert_opportunity(db, organization_id, data, audit=audit), audit, None))
+        except Exception as exc:
+            logger.exception(
+                "SAM record failed naics=%s sam_notice_id=%s error=%s",
+                naics,
+                data.get("sam_notice_id"),
+                repr(exc),
+            )
+            outcomes.append((None, audit, exc))
+    return outcomes
+
+
 def _record_matches_source_criteria(
     record: dict[str, Any],
     *,
@@ -704,6 +1011,56 @@ def _record_matches_source_criteria(
     return True
 
 
+def _enrich_pending_descriptions(
+    pending_upserts: list[tuple[int, Dict[str, Any]]],
+    targets: list[int],
+    record_details: list[dict[str, Any]],
+    *,
+    naics: str,
+) -> tuple[list[tuple[int, Dict[str, Any]]], int]:
+    """Fetch the page's notice descriptions concurrently and fold them in.
+
+    A record whose description fetch is rate limited is reported as an error
+    and left out of the page upsert, as the one-at-a-time fetch did.
+    """
+    outcomes = resolve_notice_descriptions([
+        (pending_upserts[index][1]["description_url"], pending_upserts[index][1].get("sam_url"))
+        for index in targets
+    ])
+    failed: set[int] = set()
+    for index, (resolved_description, error) in zip(targets, outcomes):
+        detail_index, data = pending_upserts[index]
+        if isinstance(error, SamRateLimitError):
+            failed.add(index)
+            record_details[detail_index] = build_error_detail(
+                source="sam.gov",
+                source_record_id=data.get("source_record_id"),
+                title=data.get("title"),
+                error=error,
+            )
+            logger.warning(
+                "SAM record failed naics=%s sam_notice_id=%s error=%s",
+                naics,
+                data["sam_notice_id"],
+                repr(error),
+            )
+            continue
+        if error is not None:
+            logger.warning(
+                "SAM notice description fetch failed naics=%s sam_notice_id=%s error=%s",
+                naics,
+                data["sam_notice_id"],
+                repr(error),
+            )
+            continue
+        if resolved_description:
+            data["description"] = resolved_description
+            data["description_text"] = resolved_description
+    if not failed:
+        return pending_upserts, 0
+    return [item for index, item in enumerate(pending_upserts) if index not in failed], len(failed)
+
+
 def pull_sam_into_db(
     db: Session,
     *,
@@ -729,8 +1086,10 @@ def pull_sam_into_db(
     initial_pulled: int = 0,
     posted_from_override: dt.date | None = None,
     posted_to_override: dt.date | None = None,
+    search_cache: SamSearchCache | None = None,
 ) -> Dict[str, Any]:
     allowed_types = allowed_types or set()
+    search_cache = search_cache or SamSearchCache()
     keywords = keywords or set()
     agencies = agencies or set()
     set_asides = set_asides or set()
@@ -760,6 +1119,7 @@ def pull_sam_into_db(
     records_seen = 0
     pages_pulled = 0
     search_requests_made = 0
+    search_cache_hits = 0
     description_enrichments = 0
     record_details: list[dict[str, Any]] = []
 
@@ -772,7 +1132,9 @@ def pull_sam_into_db(
         )
         search_requests_made += 1
         try:
-            payload = search_opportunities(
+            payload, cache_hit = search_cache.search_page(
+                db,
+                search_opportunities,
                 naics=naics,
                 posted_from=posted_from,
                 posted_to=posted_to,
@@ -822,6 +1184,7 @@ def pull_sam_into_db(
         except Exception as e:
             logger.exception("SAM page fetch failed naics=%s offset=%s error=%s", naics, offset, repr(e))
             raise
+        search_cache_hits += int(cache_hit)
 
         records = payload.get("opportunitiesData") or payload.get("opportunities") or []
         if max_records is not None:
@@ -838,6 +1201,8 @@ def pull_sam_into_db(
         if not records:
             break
 
+        pending_upserts: list[tuple[int, Dict[str, Any]]] = []
+        enrichment_targets: list[int] = []
         for rec in records:
             try:
                 if _is_excluded_discovery_type(rec):
@@ -891,25 +1256,7 @@ def pull_sam_into_db(
                     continue
 
                 if enrich_descriptions and data.get("description_url") and description_enrichments < max_description_enrichments:
-                    try:
-                        resolved_description = resolve_notice_description(
-                            data["description_url"],
-                            data.get("sam_url"),
-                        )
-                    except SamRateLimitError:
-                        raise
-                    except Exception as exc:
-                        logger.warning(
-                            "SAM notice description fetch failed naics=%s sam_notice_id=%s error=%s",
-                            naics,
-                            data["sam_notice_id"],
-                            repr(exc),
-                        )
-                        resolved_description = None
-
-                    if resolved_description:
-                        data["description"] = resolved_description
-                        data["description_text"] = resolved_description
+                    enrichment_targets.append(len(pending_upserts))
                     description_enrichments += 1
                 elif data.get("description_url") and not enrich_descriptions:
                     logger.debug(
@@ -926,22 +1273,8 @@ def pull_sam_into_db(
                         max_description_enrichments,
                     )
 
-                audit: dict[str, Any] = {}
-                status = upsert_opportunity(db, organization_id, data, audit=audit)
-                if status == "inserted":
-                    inserted += 1
-                elif status == "updated":
-                    updated += 1
-                elif status == "unchanged":
-                    unchanged += 1
-                else:
-                    skipped += 1
-                record_details.append(build_upsert_detail(
-                    source="sam.gov",
-                    data=data,
-                    status=status,
-                    audit=audit,
-                ))
+                pending_upserts.append((len(record_details), data))
+                record_details.append({})
 
             except Exception as e:
                 errors += 1
@@ -960,6 +1293,47 @@ def pull_sam_into_db(
                     repr(e),
                 )
 
+        if enrichment_targets:
+            pending_upserts, enrichment_errors = _enrich_pending_descriptions(
+                pending_upserts,
+                enrichment_targets,
+                record_details,
+                naics=naics,
+            )
+            errors += enrichment_errors
+
+        if pending_upserts:
+            outcomes = _upsert_sam_page(
+                db,
+                organization_id,
+                naics,
+                [data for _detail_index, data in pending_upserts],
+            )
+            for (detail_index, data), (status, audit, error) in zip(pending_upserts, outcomes):
+                if error is not None:
+                    errors += 1
+                    record_details[detail_index] = build_error_detail(
+                        source="sam.gov",
+                        source_record_id=data.get("source_record_id"),
+                        title=data.get("title"),
+                        error=error,
+                    )
+                    continue
+                if status == "inserted":
+                    inserted += 1
+                elif status == "updated":
+                    updated += 1
+                elif status == "unchanged":
+                    unchanged += 1
+                else:
+                    skipped += 1
+                record_details[detail_index] = build_upsert_detail(
+                    source="sam.gov",
+                    data=data,
+                    status=status,
+                    audit=audit,
+                )
+
         try:
             db.commit()
         except Exception as e:
@@ -971,6 +1345,9 @@ def pull_sam_into_db(
                 offset,
                 repr(e),
             )
+        else:
+            if pending_upserts:
+                fragment_cache.invalidate_organization(db, organization_id)
 
         total_records = payload.get("totalRecords")
         try:
@@ -999,6 +1376,7 @@ def pull_sam_into_db(
         "pages_pulled": pages_pulled,
         "records_seen": records_seen,
         "search_requests_made": search_requests_made,
+        "search_cache_hits": search_cache_hits,
         "description_enrichments": description_enrichments,
         "enrich_descriptions": enrich_descriptions,
         "paused_rate_limit": False,
@@ -1032,6 +1410,7 @@ def backfill_opportunity_descriptions(
         .all()
     )
 
+    pending: list[Opportunity] = []
     for opp in rows:
         checked += 1
 
@@ -1043,27 +1422,26 @@ def backfill_opportunity_descriptions(
                 "reason": "description_text already present",
             })
             continue
+        pending.append(opp)
 
-        try:
-            resolved = resolve_notice_description(opp.description_url, opp.sam_url)
-        except SamRateLimitError as exc:
-            db.rollback()
+    outcomes = resolve_notice_descriptions([(opp.description_url, opp.sam_url) for opp in pending])
+    for opp, (resolved, error) in zip(pending, outcomes):
+        if isinstance(error, SamRateLimitError):
             errors += 1
             rate_limited += 1
             results.append({
                 "opp_id": opp.id,
                 "status": "rate_limited",
-                "retry_after_seconds": exc.retry_after_seconds,
-                "error": str(exc),
+                "retry_after_seconds": error.retry_after_seconds,
+                "error": str(error),
             })
-            break
-        except Exception as exc:
-            db.rollback()
+            continue
+        if error is not None:
             errors += 1
             results.append({
                 "opp_id": opp.id,
                 "status": "error",
-                "error": str(exc),
+                "error": str(error),
             })
             continue
 
@@ -1073,7 +1451,8 @@ def backfill_opportunity_descriptions(
                 pass
             elif not opp.description:
                 opp.description = resolved
-            db.commit()
+            # Written outside the source monitor, so the next pull must compare.
+            opp.content_fingerprint = None
             updated += 1
             results.append({
                 "opp_id": opp.id,
@@ -1086,6 +1465,8 @@ def backfill_opportunity_descriptions(
                 "status": "skipped",
                 "reason": "no readable description resolved",
             })
+    if updated:
+        db.commit()
 
     return {
         "checked": checked,
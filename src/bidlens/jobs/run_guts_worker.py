@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import argparse
+
+from bidlens.services.opportunity_knowledge_brief.worker import run_guts_generation_worker
+
+
+def run(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run queued Get Up to Speed generations.")
+    parser.add_argument("--once", action="store_true", help="Drain pending generations and exit instead of polling.")
+    parser.add_argument("--max-jobs", type=int, default=None, help="Exit after running this many generations.")
+    args = parser.parse_args(argv)
+
+    print("BidLens GUTS worker started", flush=True)
+    processed = run_guts_generation_worker(once=args.once, max_jobs=args.max_jobs)
+    print(f"BidLens GUTS worker stopped after {processed} generations", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(run())
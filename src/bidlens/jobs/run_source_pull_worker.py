@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import argparse
+
+from bidlens.services.source_pull_jobs import run_source_pull_worker
+
+
+def run(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run queued manual SAM.gov and Grants.gov pulls.")
+    parser.add_argument("--once", action="store_true", help="Drain runnable jobs and exit instead of polling.")
+    parser.add_argument("--max-jobs", type=int, default=None, help="Exit after running this many jobs.")
+    parser.add_argument("--worker-id", default=None, help="Lease owner name. Defaults to host:pid:random.")
+    args = parser.parse_args(argv)
+
+    print("BidLens source pull worker started", flush=True)
+    processed = run_source_pull_worker(worker_id=args.worker_id, once=args.once, max_jobs=args.max_jobs)
+    print(f"BidLens source pull worker stopped after {processed} jobs", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(run())
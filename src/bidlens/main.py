@@ -16,12 +16,16 @@ from . import models
 from .routes import sam
 from .scheduler import start_scheduler
 from .middleware import ClientRedirectMiddleware
+from .event_loop import configure_threadpool, loop_lag_monitor
+from .services.grants_detail_queue import grants_detail_queue, install_grants_detail_prewarm
 
 if AUTO_CREATE_SCHEMA:
     Base.metadata.create_all(bind=engine)
 else:
     print("AUTO_CREATE_SCHEMA disabled; skipping Base.metadata.create_all()")
 
+install_grants_detail_prewarm()
+
 app = FastAPI(title="BidLens")
 app.add_middleware(ClientRedirectMiddleware)
 app.mount("/static", StaticFiles(directory="src/bidlens/static"), name="static")
@@ -46,6 +50,27 @@ def health():
     return {"status": "ok"}
 
 
+@app.on_event("startup")
+async def _start_event_loop_monitoring():
+    configure_threadpool()
+    loop_lag_monitor.start()
+
+
+@app.on_event("shutdown")
+async def _stop_event_loop_monitoring():
+    await loop_lag_monitor.stop()
+
+
+@app.on_event("startup")
+def _start_grants_detail_queue():
+    grants_detail_queue.start()
+
+
+@app.on_event("shutdown")
+def _stop_grants_detail_queue():
+    grants_detail_queue.shutdown()
+
+
 @app.on_event("startup")
 def _startup():
     if not ENABLE_INTERNAL_SCHEDULER:
@@ -5,15 +5,24 @@ Some reverse proxies (including Duet's sandbox gateway) do not follow
 redirect responses to non-safe methods (POST, PUT, PATCH, DELETE) and
 rewrites them as 200 OK with a tiny HTML/JS page that performs the
 redirect client-side.
+
+It also counts the SQL statements each request runs (see ``query_metrics``)
+and registers in-flight requests with the event-loop lag monitor.
 """
 
+import logging
+
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import HTMLResponse
 
-from .auth import is_platform_admin_email, serializer
-from .config import SESSION_COOKIE_NAME
+from . import config
+from .auth import cached_user_email, is_platform_admin_email, platform_admin_emails, session_user_id
 from .database import SessionLocal
-from .models import User
+from .event_loop import loop_lag_monitor
+from .query_metrics import count_queries
+
+logger = logging.getLogger(__name__)
 
 
 PLATFORM_ALLOWED_PATH_PREFIXES = (
@@ -37,7 +46,18 @@ def _client_redirect(location: str) -> HTMLResponse:
 
 class ClientRedirectMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request, call_next):
-        if _platform_owner_should_return_to_platform(request):
+        with loop_lag_monitor.track(f"{request.method} {request.url.path}"), count_queries() as queries:
+            response = await self._dispatch(request, call_next)
+        request.state.query_count = queries.count
+        logger.debug("%s %s ran %d queries", request.method, request.url.path, queries.count)
+        if config.REQUEST_QUERY_COUNT_HEADER:
+            response.headers["X-Query-Count"] = str(queries.count)
+        return response
+
+    async def _dispatch(self, request, call_next):
+        user_id = _platform_owner_candidate(request)
+        # A cold email lookup hits the database; keep it off the event loop.
+        if user_id and await run_in_threadpool(_is_platform_owner, user_id):
             return _client_redirect("/platform")
 
         response = await call_next(request)
@@ -64,27 +84,26 @@ class ClientRedirectMiddleware(BaseHTTPMiddleware):
         return response
 
 
-def _platform_owner_should_return_to_platform(request) -> bool:
+def _platform_owner_candidate(request) -> int | None:
+    """Signed-in user id to check against the platform admins, without I/O."""
     path = request.url.path
     if any(path == prefix or path.startswith(f"{prefix}/") for prefix in PLATFORM_ALLOWED_PATH_PREFIXES):
-        return False
+        return None
 
-    token = request.cookies.get(SESSION_COOKIE_NAME)
-    if not token:
-        return False
+    if not platform_admin_emails():
+        return None
 
-    try:
-        data = serializer.loads(token)
-        user_id = data.get("user_id")
-    except Exception:
-        return False
+    return session_user_id(request)
 
-    if not user_id:
-        return False
 
+def _is_platform_owner(user_id: int) -> bool:
     db = SessionLocal()
     try:
-        user = db.query(User).filter(User.id == user_id).first()
-        return bool(user and is_platform_admin_email(user.email))
+        return is_platform_admin_email(cached_user_email(db, user_id))
     finally:
         db.close()
+
+
+def _platform_owner_should_return_to_platform(request) -> bool:
+    user_id = _platform_owner_candidate(request)
+    return bool(user_id) and _is_platform_owner(user_id)
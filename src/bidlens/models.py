@@ -41,6 +41,15 @@ class Opportunity(Base):
     __tablename__ = "opportunities"
     __table_args__ = (
         UniqueConstraint("organization_id", "source", "source_record_id", name="uq_opportunity_org_source_record"),
+        # Feed, queue counts, sidebar and Daily Brief: live qualified rows by deadline.
+        Index(
+            "ix_opportunities_org_feed_deadline",
+            "organization_id", "response_deadline", "id",
+            postgresql_where=text("qualification_status = 'qualified' AND decision_state <> 'ARCHIVED'"),
+            sqlite_where=text("qualification_status = 'qualified' AND decision_state <> 'ARCHIVED'"),
+        ),
+        Index("ix_opportunities_org_qualification_upserted", "organization_id", "qualification_status", "upserted_at"),
+        Index("ix_opportunities_org_created", "organization_id", "created_at"),
     )
 
     # internal DB PK (keep)
@@ -67,6 +76,12 @@ class Opportunity(Base):
 
     title = Column(String, nullable=False)
     agency = Column(String, nullable=False)
+    # Presentation of ``agency`` through the account alias file, written by
+    # ``bidlens.account_display`` and stamped with the alias revision used.
+    account_display = Column(String, nullable=True)
+    parent_agency = Column(String, nullable=True)
+    sub_agency = Column(String, nullable=True)
+    account_display_revision = Column(String, nullable=True, index=True)
     opportunity_type = Column(String, nullable=False)
     canonical_type = Column(String, nullable=True)
     source_stage = Column(String, nullable=True, index=True)
@@ -89,6 +104,9 @@ class Opportunity(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     upserted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=True)
     last_seen_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=True)
+    # Hash of the normalized monitored fields from the last source observation
+    # applied to this row. A matching re-observation skips the field compare.
+    content_fingerprint = Column(String(64), nullable=True)
 
     # Org-level decision state: INBOX → SHORTLISTED or ARCHIVED
     decision_state = Column(String, nullable=False, default="INBOX", server_default="INBOX", index=True)
@@ -202,6 +220,7 @@ class OpportunityKnowledgeBriefGeneration(Base):
     output_schema_version = Column(String, nullable=False)
     provider = Column(String, nullable=True)
     model = Column(String, nullable=True)
+    force_regenerate = Column(Boolean, nullable=False, default=False, server_default=false())
 
     manifest_hash = Column(String(64), nullable=True)
     source_snapshot_started_at = Column(DateTime(timezone=True), nullable=True)
@@ -738,6 +757,12 @@ class OpportunityUpdateEvent(Base):
 
 class OpportunityHistoryEvent(Base):
     __tablename__ = "opportunity_history_events"
+    __table_args__ = (
+        Index(
+            "ix_opportunity_history_events_org_opp_type_occurred",
+            "organization_id", "opportunity_id", "event_type", "occurred_at",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False, index=True)
@@ -886,7 +911,10 @@ class JobRun(Base):
 
 class Vote(Base):
     __tablename__ = "votes"
-    __table_args__ = (UniqueConstraint("org_id", "opp_id", "user_id", name="uq_vote"),)
+    __table_args__ = (
+        UniqueConstraint("org_id", "opp_id", "user_id", name="uq_vote"),
+        Index("ix_votes_org_user_vote", "org_id", "user_id", "vote", "opp_id"),
+    )
 
     id = Column(Integer, primary_key=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False, index=True)
@@ -1286,6 +1314,85 @@ class SamSourceConfig(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
 
+class SamSearchCacheEntry(Base):
+    """Raw SAM.gov search page shared by every tenant's pulls.
+
+    Keyed by a digest of the normalized search parameters (never the API key),
+    so organizations watching the same NAICS and window read one page.
+    """
+
+    __tablename__ = "sam_search_cache_entries"
+    __table_args__ = (
+        UniqueConstraint("cache_key", name="uq_sam_search_cache_key"),
+        Index("ix_sam_search_cache_expires_at", "expires_at"),
+        Index("ix_sam_search_cache_last_accessed_at", "last_accessed_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String(64), nullable=False)
+    request_params = Column(JSON, nullable=False, default=dict)
+    payload = Column(JSON, nullable=False, default=dict)
+    size_bytes = Column(Integer, nullable=False, default=0, server_default="0")
+    hit_count = Column(Integer, nullable=False, default=0, server_default="0")
+    fetched_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    last_accessed_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+
+
+class IngestLease(Base):
+    """Cross-process ingest lease and its owner diagnostics.
+
+    On Postgres the lease itself is a session advisory lock and this row only
+    records who holds it; on SQLite the row is the lease, guarded by
+    ``expires_at`` and renewed by heartbeats.
+    """
+
+    __tablename__ = "ingest_leases"
+
+    name = Column(String, primary_key=True)
+    owner = Column(String, nullable=False)
+    acquired_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    released_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class SourcePullJob(Base):
+    """Queued manual source pull executed by the source-pull worker.
+
+    The web request only enqueues; a worker claims the row with a lease,
+    keeps the lease alive with heartbeats while the pull runs, and stores the
+    same response payload the synchronous route used to return.
+    """
+
+    __tablename__ = "source_pull_jobs"
+    __table_args__ = (
+        Index("ix_source_pull_jobs_status_available_at", "status", "available_at"),
+        Index("ix_source_pull_jobs_org_source_status", "organization_id", "source", "status"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    source = Column(String, nullable=False)
+    params_json = Column(JSON, nullable=False, default=dict)
+    status = Column(String, nullable=False, default="queued", server_default="queued")
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    max_attempts = Column(Integer, nullable=False, default=3, server_default="3")
+    available_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    lease_owner = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    ingestion_run_id = Column(Integer, ForeignKey("ingestion_runs.id"), nullable=True)
+    response_status_code = Column(Integer, nullable=True)
+    result_json = Column(JSON, nullable=True)
+    error_type = Column(String, nullable=True)
+    error_message = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
 class GrantsSourceConfig(Base):
     __tablename__ = "grants_source_configs"
     __table_args__ = (
@@ -1424,6 +1531,49 @@ class UserOpportunity(Base):
     opportunity = relationship("Opportunity", back_populates="user_opportunities")
     watched = Column(Boolean, nullable=False, server_default="false")
 
+
+class UserFeedState(Base):
+    """Per-user triage state for an opportunity: the Feed-relevant vote and watch flag.
+
+    A projection of ``votes`` and ``user_opportunities`` maintained in the same
+    flush by ``bidlens.feed_state``; a missing row means no signal at all.
+    """
+
+    __tablename__ = "user_feed_states"
+    __table_args__ = (
+        UniqueConstraint("organization_id", "user_id", "opportunity_id", name="uq_user_feed_state"),
+        Index("ix_user_feed_states_user_vote", "organization_id", "user_id", "vote", "opportunity_id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    opportunity_id = Column(Integer, ForeignKey("opportunities.id"), nullable=False, index=True)
+    vote = Column(String, nullable=True)  # "PURSUE", "PASS", or null
+    watched = Column(Boolean, nullable=False, default=False, server_default=false())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class OpportunityVoteSummary(Base):
+    """Team-wide Interested/Not Interested rollup for one opportunity.
+
+    A projection of ``votes`` maintained in the same flush by
+    ``bidlens.vote_summary``; a missing row means nobody has signalled yet.
+    """
+
+    __tablename__ = "opportunity_vote_summaries"
+
+    id = Column(Integer, primary_key=True)
+    organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False, index=True)
+    opportunity_id = Column(Integer, ForeignKey("opportunities.id"), nullable=False, unique=True)
+    pursue_count = Column(Integer, nullable=False, default=0, server_default="0")
+    pass_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_activity_at = Column(DateTime(timezone=True), nullable=True)
+    interested_user_ids = Column(JSON, nullable=False, default=list)
+    passed_user_ids = Column(JSON, nullable=False, default=list)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
 class DigestLog(Base):
     __tablename__ = "digest_log"
 
@@ -1433,3 +1583,26 @@ class DigestLog(Base):
     sent_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     since_ts = Column(DateTime(timezone=True), nullable=True)
     item_count = Column(Integer, nullable=False, default=0)
+
+
+from .search_index import install_opportunity_search_ddl  # noqa: E402
+from .account_display import install_account_display_sync  # noqa: E402
+from .feed_state import install_feed_state_sync  # noqa: E402
+from .vote_summary import install_vote_summary_sync  # noqa: E402
+from .user_context import install_user_context_invalidation  # noqa: E402
+
+install_opportunity_search_ddl(Opportunity.__table__)
+install_account_display_sync(Opportunity)
+install_feed_state_sync(Vote, UserOpportunity)
+install_vote_summary_sync(Vote)
+install_user_context_invalidation(
+    [
+        (Vote, "org_id", None, ("vote",)),
+        (OpportunityOutcome, "organization_id", None, None),
+        (Opportunity, "organization_id", None, ("qualification_status", "decision_state", "response_deadline")),
+        (OrgProfile, "org_id", None, ("triage_enabled",)),
+        (OrganizationMembership, "organization_id", "user_id", None),
+        (User, None, "id", ("email", "organization_id")),
+    ],
+    structural=(Organization, WorkspaceInvitation),
+)
@@ -0,0 +1,46 @@
+"""Count SQL statements executed on behalf of one web request.
+
+``ClientRedirectMiddleware`` opens a counter around each request; every
+statement sent by any engine in that context (including sessions opened in
+the middleware itself and sync routes running in the threadpool, which
+inherit the context) increments it. The total is logged at DEBUG and, with
+``REQUEST_QUERY_COUNT_HEADER`` enabled, returned as ``X-Query-Count``.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+
+_current_counter: ContextVar[QueryCounter | None] = ContextVar("bidlens_query_counter", default=None)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    counter = QueryCounter()
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+def _count_statement(_connection, _cursor, _statement, _parameters, _context, executemany) -> None:
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.count += 1
+
+
+def install_query_counter() -> None:
+    if not event.contains(Engine, "before_cursor_execute", _count_statement):
+        event.listen(Engine, "before_cursor_execute", _count_statement)
@@ -445,7 +445,7 @@ def invitation_csv_template(organization_id: int, request: Request, db: Session
 
 
 @router.post("/organizations/{organization_id}/invitations/bulk")
-async def bulk_create_organization_invitations(
+def bulk_create_organization_invitations(
     organization_id: int,
     request: Request,
     csv_file: UploadFile = File(...),
@@ -459,7 +459,7 @@ async def bulk_create_organization_invitations(
             _members_context(request, db, user=user, org=org, error="Upload a CSV file with email,name,role columns."),
             status_code=422,
         )
-    content = (await csv_file.read()).decode("utf-8-sig")
+    content = csv_file.file.read().decode("utf-8-sig")
     reader = csv.DictReader(io.StringIO(content))
     required = {"email", "name", "role"}
     if not reader.fieldnames or not required.issubset({field.strip() for field in reader.fieldnames}):
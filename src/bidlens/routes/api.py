@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from typing import Any, Optional
 from ..database import get_db
+from ..fragment_cache import fragment_cache
 from ..auth import attach_request_user_context, get_current_user
 from ..state_machine import OppState
 from ..services import transition_state, cast_vote, push_opportunity_to_crm
@@ -31,8 +32,12 @@ from ..services.opportunity_outcomes import (
     record_opportunity_outcome,
 )
 from ..services.opportunity_knowledge_brief import (
+    GUTSAccessError,
     GUTSServiceError,
     OpportunityKnowledgeBriefService,
+    generation_status_payload,
+    get_generation,
+    resolve_guts_access,
 )
 from ..services.integration_credentials import decrypt_credentials, encrypt_credentials
 from ..tenancy import current_org_id
@@ -46,10 +51,9 @@ import requests
 import secrets
 import hashlib
 from .. import config
-from ..services import get_vote_counts, get_vote_user_maps
+from ..services import get_vote_overview
 from ..sam_client import _is_url_like
-from ..services.agency_display import agency_presentation
-from ..services.account_aliases import resolve_account_display_name
+from ..services.account_aliases import opportunity_account_display
 router = APIRouter(prefix="/api", tags=["api"])
 logger = logging.getLogger(__name__)
 N8N_PROVIDER = "n8n"
@@ -102,7 +106,7 @@ def _clean_preview_text(value: str | None) -> str:
 
 def _build_preview_payload(opp: Opportunity) -> dict[str, Any]:
     description = _clean_preview_text(_best_description_text(opp))
-    agency_display = resolve_account_display_name(opp.agency)
+    agency_display = opportunity_account_display(opp).display
     if description:
         return {
             "ok": True,
@@ -239,8 +243,8 @@ def _build_n8n_payload(opp: Opportunity, brief_payload: dict[str, Any]) -> dict[
     from ..services.research.brief_generator import build_opportunity_source_text
     from ..services.research.document_fetcher import fetch_opportunity_attachment_metadata
 
-    account_display = resolve_account_display_name(opp.agency)
-    agency = agency_presentation(account_display)
+    agency = opportunity_account_display(opp)
+    account_display = agency.display
     source_text, source_text_field = build_opportunity_source_text(
         opp,
         brief_context=brief_payload.get("brief_context") or brief_payload.get("text_for_enrichment"),
@@ -712,12 +716,12 @@ def _serialize_sidebar(sidebar: dict) -> dict:
 
 
 def _crm_workflow_response_payload(db: Session, user, opp_id: int) -> dict[str, Any]:
-    counts = get_vote_counts(db, [opp_id]).get(opp_id, {"pursue": 0, "pass": 0})
-    pursue_users_map, pass_users_map = get_vote_user_maps(
+    counts_map, pursue_users_map, pass_users_map = get_vote_overview(
         db,
         org_id=_user_org_id(user),
         opp_ids=[opp_id],
     )
+    counts = counts_map.get(opp_id, {"pursue": 0, "pass": 0})
     from .opportunities import get_sidebar
 
     sidebar = get_sidebar(db, user)
@@ -1106,6 +1110,7 @@ def _set_qualification_status(opp_id: int, status: str, request: Request, db: Se
 
     opp.qualification_status = status
     db.commit()
+    fragment_cache.invalidate_organization(db, opp.organization_id)
     return {
         "success": True,
         "opportunity_id": opp.id,
@@ -1188,6 +1193,7 @@ def bulk_set_qualification_status(
     for opportunity in opportunities:
         opportunity.qualification_status = status
     db.commit()
+    fragment_cache.invalidate_organization(db, org_id)
     return {
         "success": True,
         "action": payload.action,
@@ -1587,30 +1593,52 @@ def mark_pending(opp_id: int, request: Request, db: Session = Depends(get_db)):
     db.commit()
     return {"ok": True, "opp_id": opp_id, "organization_id": org_id, "status": "generating"}
 
+def _guts_error_status(category: str) -> int:
+    if category == "opportunity_not_found":
+        return 404
+    if category in {"access_denied", "shortlist_required"}:
+        return 403
+    if category == "generation_already_in_progress":
+        return 409
+    return 422
+
+
+def _guts_status_url(generation) -> str:
+    return f"/api/opps/{generation.opportunity_id}/guts-generations/{generation.id}"
+
+
 @router.post("/opps/{opp_id}/generate-guts")
 def generate_guts(
     opp_id: int,
     request: Request,
     db: Session = Depends(get_db),
+    force_regenerate: bool = False,
 ):
     user = require_user(request, db)
+    service = OpportunityKnowledgeBriefService(db)
     try:
-        generation = OpportunityKnowledgeBriefService(db).generate(
+        if config.GUTS_GENERATION_QUEUE_ENABLED:
+            # The GUTS worker compiles it; a request for an opportunity that is
+            # already generating gets the in-flight generation back.
+            generation = service.enqueue(
+                opportunity_id=opp_id,
+                requesting_user=user,
+                active_organization_id=_user_org_id(user),
+                force_regenerate=force_regenerate,
+            )
+            return JSONResponse(
+                status_code=202,
+                content=generation_status_payload(generation, status_url=_guts_status_url(generation)),
+            )
+        generation = service.generate(
             opportunity_id=opp_id,
             requesting_user=user,
             active_organization_id=_user_org_id(user),
+            force_regenerate=force_regenerate,
         )
     except GUTSServiceError as exc:
-        if exc.safe_category == "opportunity_not_found":
-            status_code = 404
-        elif exc.safe_category in {"access_denied", "shortlist_required"}:
-            status_code = 403
-        elif exc.safe_category == "generation_already_in_progress":
-            status_code = 409
-        else:
-            status_code = 422
         raise HTTPException(
-            status_code=status_code,
+            status_code=_guts_error_status(exc.safe_category),
             detail={"code": exc.safe_category, "message": exc.safe_message},
         ) from None
     return {
@@ -1620,6 +1648,29 @@ def generate_guts(
     }
 
 
+@router.get("/opps/{opp_id}/guts-generations/{generation_id}")
+def guts_generation_status(
+    opp_id: int,
+    generation_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    user = require_user(request, db)
+    try:
+        context = resolve_guts_access(db, user=user, opportunity_id=opp_id)
+    except GUTSAccessError as exc:
+        raise HTTPException(
+            status_code=_guts_error_status(exc.failure_category),
+            detail={"code": exc.failure_category, "message": str(exc)},
+        ) from None
+    generation = get_generation(
+        db, organization_id=context.organization_id, opportunity_id=opp_id, generation_id=generation_id,
+    )
+    if generation is None:
+        raise HTTPException(status_code=404, detail="Generation not found")
+    return generation_status_payload(generation, status_url=_guts_status_url(generation))
+
+
 @router.post("/opps/{opp_id}/generate_brief")
 def generate_brief(
     opp_id: int,
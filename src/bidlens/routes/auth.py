@@ -35,14 +35,14 @@ def _get_or_create_platform_org(db: Session) -> Organization:
     return org
 
 @router.get("/login")
-async def login_page(request: Request):
+def login_page(request: Request):
     return templates.TemplateResponse("login.html", {
         "request": request,
         "user": None
     })
 
 @router.post("/login")
-async def login(request: Request, email: str = Form(...), db: Session = Depends(get_db)):
+def login(request: Request, email: str = Form(...), db: Session = Depends(get_db)):
     email = normalize_email(email)
     user = db.query(User).filter(User.email == email).first()
 
@@ -108,7 +108,7 @@ async def login(request: Request, email: str = Form(...), db: Session = Depends(
     return response
 
 @router.get("/logout")
-async def logout():
+def logout():
     response = RedirectResponse(url="/login", status_code=303)
     clear_session(response)
     return response
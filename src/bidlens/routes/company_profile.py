@@ -367,7 +367,7 @@ def render_company_profile(
 
 
 @router.get("/company-profile")
-async def company_profile_page(
+def company_profile_page(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -397,7 +397,7 @@ async def company_profile_page(
 
 
 @router.post("/company-profile")
-async def company_profile_save(
+def company_profile_save(
     request: Request,
     website_url: str = Form(""),
     uei: str = Form(""),
@@ -447,7 +447,7 @@ def _resource_redirect(request: Request, org_id: int, *, key: str) -> RedirectRe
 
 
 @router.post("/company-profile/resources")
-async def organization_resource_create(
+def organization_resource_create(
     request: Request,
     title: str = Form(""),
     description: str = Form(""),
@@ -487,7 +487,7 @@ async def organization_resource_create(
 
 
 @router.post("/company-profile/resources/{resource_id}")
-async def organization_resource_update(
+def organization_resource_update(
     resource_id: int,
     request: Request,
     title: str = Form(""),
@@ -528,7 +528,7 @@ async def organization_resource_update(
 
 
 @router.post("/company-profile/resources/{resource_id}/delete")
-async def organization_resource_delete(
+def organization_resource_delete(
     resource_id: int,
     request: Request,
     db: Session = Depends(get_db),
@@ -553,7 +553,7 @@ async def organization_resource_delete(
 
 
 @router.post("/company-profile/save")
-async def company_profile_save_legacy(
+def company_profile_save_legacy(
     request: Request,
     website_url: str = Form(""),
     uei: str = Form(""),
@@ -561,7 +561,7 @@ async def company_profile_save_legacy(
     duns: str = Form(""),
     db: Session = Depends(get_db),
 ):
-    return await company_profile_save(
+    return company_profile_save(
         request,
         website_url=website_url,
         uei=uei,
@@ -572,12 +572,12 @@ async def company_profile_save_legacy(
 
 
 @router.post("/company-profile/generate")
-async def company_profile_generate_removed():
+def company_profile_generate_removed():
     return RedirectResponse(url="/company-profile", status_code=303)
 
 
 @router.get("/company-profile/{profile_id}")
-async def company_profile_saved_detail(
+def company_profile_saved_detail(
     profile_id: int,
     request: Request,
     db: Session = Depends(get_db),
@@ -93,7 +93,7 @@ def _source_context(db: Session, org_id: int) -> dict:
 
 
 @router.get("/connect-sources")
-async def connect_sources_page(request: Request, db: Session = Depends(get_db)):
+def connect_sources_page(request: Request, db: Session = Depends(get_db)):
     user = require_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -103,7 +103,7 @@ async def connect_sources_page(request: Request, db: Session = Depends(get_db)):
 
 
 @router.get("/outbound-integrations")
-async def outbound_integrations_page(request: Request, db: Session = Depends(get_db)):
+def outbound_integrations_page(request: Request, db: Session = Depends(get_db)):
     user = require_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -119,7 +119,7 @@ async def outbound_integrations_page(request: Request, db: Session = Depends(get
 
 
 @router.get("/connect-sources/sam")
-async def connect_sam_page(request: Request, db: Session = Depends(get_db)):
+def connect_sam_page(request: Request, db: Session = Depends(get_db)):
     user = require_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -143,7 +143,7 @@ async def connect_sam_page(request: Request, db: Session = Depends(get_db)):
 
 
 @router.post("/connect-sources/grants/enable")
-async def enable_grants_source(request: Request, db: Session = Depends(get_db)):
+def enable_grants_source(request: Request, db: Session = Depends(get_db)):
     user = require_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -215,7 +215,7 @@ async def enable_grants_source(request: Request, db: Session = Depends(get_db)):
 
 
 @router.post("/connect-sources/sam")
-async def save_connect_sam(
+def save_connect_sam(
     request: Request,
     search_name: str = Form("Primary SAM.gov Search"),
     naics_codes: str = Form(...),
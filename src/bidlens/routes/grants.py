@@ -1,14 +1,18 @@
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
-import requests
 from sqlalchemy.orm import Session
 
+from .. import config
 from ..auth import get_current_user
 from ..database import get_db
-from ..grants_gov_client import GrantsGovApiError
-from ..ingest_grants_gov import ingest_grants_gov
 from ..models import OrganizationMembership
-from ..services.ingestion_runs import record_source_activity
+from ..services.grants_pulls import run_manual_grants_pull
+from ..services.source_pull_jobs import (
+    SOURCE_GRANTS,
+    enqueue_source_pull,
+    find_source_pull_job,
+    source_pull_job_payload,
+)
 from ..tenancy import current_org_id
 
 router = APIRouter(prefix="/grants", tags=["grants"])
@@ -30,42 +34,6 @@ def _is_org_admin(db: Session, user) -> bool:
     return bool(membership and membership.role == "admin")
 
 
-def _record_grants_source_activity(
-    db: Session,
-    *,
-    org_id: int,
-    user_id: int,
-    result: dict,
-    reason_code: str | None = None,
-) -> None:
-    reason_counts = {reason_code: 1} if reason_code else {}
-    reason_labels = {reason_code: result.get("message", reason_code)} if reason_code else {}
-    if result.get("status") == "no_records":
-        reason_counts["no_records"] = 1
-        reason_labels["no_records"] = result.get("message", "No records returned")
-    if int(result.get("detail_errors", 0) or 0):
-        reason_counts["detail_lookup_error"] = int(result.get("detail_errors", 0) or 0)
-        reason_labels["detail_lookup_error"] = "One or more Grants.gov detail lookups failed"
-    record_source_activity(
-        db,
-        source="grants.gov",
-        organization_id=org_id,
-        user_id=user_id,
-        filename="Manual Grants.gov pull",
-        result=result,
-        processed_count=int(result.get("received", 0) or 0),
-        created_count=int(result.get("created", 0) or 0),
-        updated_count=int(result.get("updated", 0) or 0),
-        unchanged_count=int(result.get("unchanged", 0) or 0),
-        skipped_count=int(result.get("skipped", 0) or 0),
-        error_count=int(result.get("errors", 0) or 0) + int(result.get("detail_errors", 0) or 0),
-        reason_counts=reason_counts or None,
-        reason_labels=reason_labels or None,
-        notes=result.get("message"),
-    )
-    db.commit()
-
-
 @router.post("/pull-now", response_model=None)
 def pull_now(
     request: Request,
@@ -82,65 +50,37 @@ def pull_now(
             "status": "error",
             "message": "Only workspace admins can run Grants.gov pulls.",
         })
-    try:
-        result = ingest_grants_gov(db, organization_id=org_id, run_type="Manual")
-    except RuntimeError as exc:
-        db.rollback()
-        result = {
-            "status": "error",
-            "organization_id": org_id,
-            "message": str(exc),
-            "received": 0,
-            "created": 0,
-            "updated": 0,
-            "skipped": 0,
-            "errors": 1,
-        }
-        _record_grants_source_activity(db, org_id=org_id, user_id=user.id, result=result, reason_code="runtime_error")
-        return JSONResponse(status_code=400, content=result)
-    except (requests.ConnectionError, requests.Timeout) as exc:
-        db.rollback()
-        result = {
-            "status": "error",
-            "organization_id": org_id,
-            "message": f"Could not reach Grants.gov API. Check network/DNS access from the BidLens server. Detail: {exc}",
-            "received": 0,
-            "created": 0,
-            "updated": 0,
-            "skipped": 0,
-            "errors": 1,
-        }
-        _record_grants_source_activity(db, org_id=org_id, user_id=user.id, result=result, reason_code="connection_error")
-        return JSONResponse(status_code=503, content=result)
-    except GrantsGovApiError as exc:
-        db.rollback()
-        status_code = 400 if exc.status_code and 400 <= exc.status_code < 500 else 502
-        result = {
-            "status": "error",
-            "organization_id": org_id,
-            "message": str(exc),
-            "received": 0,
-            "created": 0,
-            "updated": 0,
-            "skipped": 0,
-            "errors": 1,
-            "grants_gov_status_code": exc.status_code,
-        }
-        _record_grants_source_activity(db, org_id=org_id, user_id=user.id, result=result, reason_code="grants_gov_api_error")
-        return JSONResponse(status_code=status_code, content=result)
-    except Exception as exc:
-        db.rollback()
-        result = {
+    if config.SOURCE_PULL_QUEUE_ENABLED:
+        job = enqueue_source_pull(db, organization_id=org_id, user_id=user.id, source=SOURCE_GRANTS)
+        payload = source_pull_job_payload(db, job, status_url=f"/grants/pull-jobs/{job.id}")
+        payload["message"] = "Grants.gov pull queued."
+        return JSONResponse(status_code=202, content=payload)
+
+    status_code, result, headers = run_manual_grants_pull(db, organization_id=org_id, user_id=user.id)
+    return JSONResponse(status_code=status_code, content=result, headers=headers)
+
+
+@router.get("/pull-jobs/{job_id}", response_model=None)
+def pull_job_status(
+    request: Request,
+    job_id: int,
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    if not user:
+        return JSONResponse(status_code=401, content={"status": "error", "message": "Login required."})
+
+    setattr(user, "current_organization_id", current_org_id(request, db, user))
+    org_id = _user_org_id(user)
+    if not _is_org_admin(db, user):
+        return JSONResponse(status_code=403, content={
             "status": "error",
-            "organization_id": org_id,
-            "message": f"Grants.gov pull failed: {exc}",
-            "received": 0,
-            "created": 0,
-            "updated": 0,
-            "skipped": 0,
-            "errors": 1,
-        }
-        _record_grants_source_activity(db, org_id=org_id, user_id=user.id, result=result, reason_code="import_error")
-        return JSONResponse(status_code=502, content=result)
-    _record_grants_source_activity(db, org_id=org_id, user_id=user.id, result=result)
-    return JSONResponse(status_code=200, content=result)
+            "message": "Only workspace admins can view Grants.gov pulls.",
+        })
+    job = find_source_pull_job(db, job_id=job_id, organization_id=org_id, source=SOURCE_GRANTS)
+    if not job:
+        return JSONResponse(status_code=404, content={"status": "error", "message": "Pull job was not found."})
+    return JSONResponse(
+        status_code=200,
+        content=source_pull_job_payload(db, job, status_url=f"/grants/pull-jobs/{job.id}"),
+    )
@@ -15,7 +15,7 @@ templates = Jinja2Templates(directory="src/bidlens/templates")
 
 
 @router.get("/home")
-async def home_page(request: Request, db: Session = Depends(get_db)):
+def home_page(request: Request, db: Session = Depends(get_db)):
     user = get_current_user(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -45,7 +45,7 @@ async def home_page(request: Request, db: Session = Depends(get_db)):
 
 
 @router.get("/organization-setup")
-async def organization_setup_page(request: Request, db: Session = Depends(get_db)):
+def organization_setup_page(request: Request, db: Session = Depends(get_db)):
     user = get_current_user(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -76,7 +76,7 @@ async def organization_setup_page(request: Request, db: Session = Depends(get_db
 
 
 @router.post("/home/go-live")
-async def go_live(request: Request, db: Session = Depends(get_db)):
+def go_live(request: Request, db: Session = Depends(get_db)):
     user = get_current_user(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
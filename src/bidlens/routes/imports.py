@@ -1,5 +1,3 @@
-import csv
-import io
 from datetime import date, datetime, time, timedelta
 from urllib.parse import urlencode
 
@@ -30,8 +28,10 @@ from ..services.market_activity import (
     VIEW_BY_OPTIONS,
     MarketActivityFilters,
     build_market_activity,
+    market_activity_rows,
     market_period_dates,
 )
+from ..services.csv_export import streaming_csv_response
 from ..services.govwin_import import REASON_LABELS, import_govwin_xlsx
 from ..services.manual_import import (
     REASON_LABELS as MANUAL_IMPORT_REASON_LABELS,
@@ -39,6 +39,7 @@ from ..services.manual_import import (
     csv_template_text,
     import_manual_csv,
 )
+from ..services.opportunity_search import SCOPE_LOOKUP, apply_opportunity_search, opportunity_search_rank
 from ..services.opportunity_stages import normalize_display_stage
 from ..services.sam_source_config import (
     SAM_NOTICE_TYPES,
@@ -349,7 +350,7 @@ def _opportunity_discovery_url(request: Request, *, org_id: int | None = None, f
 
 
 @router.get("/opportunity-discovery")
-async def opportunity_discovery_page(request: Request, db: Session = Depends(get_db)):
+def opportunity_discovery_page(request: Request, db: Session = Depends(get_db)):
     user = require_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -359,7 +360,7 @@ async def opportunity_discovery_page(request: Request, db: Session = Depends(get
 
 
 @router.get("/imports/govwin")
-async def govwin_import_page(request: Request, db: Session = Depends(get_db)):
+def govwin_import_page(request: Request, db: Session = Depends(get_db)):
     user = require_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -370,7 +371,7 @@ async def govwin_import_page(request: Request, db: Session = Depends(get_db)):
 
 
 @router.get("/imports/manual/template.csv")
-async def manual_import_template(request: Request, db: Session = Depends(get_db)):
+def manual_import_template(request: Request, db: Session = Depends(get_db)):
     user = require_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -423,7 +424,7 @@ def _sam_config_context(
 
 
 @router.get("/admin/sources/sam")
-async def sam_source_config_page(request: Request, db: Session = Depends(get_db)):
+def sam_source_config_page(request: Request, db: Session = Depends(get_db)):
     user = require_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -442,7 +443,7 @@ async def sam_source_config_page(request: Request, db: Session = Depends(get_db)
 
 
 @router.post("/admin/sources/sam")
-async def save_sam_source_config(
+def save_sam_source_config(
     request: Request,
     config_id: str = Form(""),
     search_name: str = Form(...),
@@ -537,7 +538,7 @@ async def save_sam_source_config(
 
 
 @router.post("/admin/sources/sam/{search_id}/delete")
-async def delete_sam_saved_search(
+def delete_sam_saved_search(
     search_id: int,
     request: Request,
     db: Session = Depends(get_db),
@@ -562,7 +563,7 @@ async def delete_sam_saved_search(
     return RedirectResponse(url=f"/admin/sources/sam{suffix}", status_code=303)
 
 
-async def _source_activity_response(request: Request, db: Session):
+def _source_activity_response(request: Request, db: Session):
     user = require_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -594,12 +595,12 @@ async def _source_activity_response(request: Request, db: Session):
 
 
 @router.get("/imports/history")
-async def import_history_page(request: Request, db: Session = Depends(get_db)):
-    return await _source_activity_response(request, db)
+def import_history_page(request: Request, db: Session = Depends(get_db)):
+    return _source_activity_response(request, db)
 
 
 @router.get("/imports/history/{run_id}")
-async def import_history_detail_page(
+def import_history_detail_page(
     run_id: int,
     request: Request,
     db: Session = Depends(get_db),
@@ -648,7 +649,7 @@ async def import_history_detail_page(
 
 
 @router.get("/admin/opportunity-lookup")
-async def opportunity_lookup_page(
+def opportunity_lookup_page(
     request: Request,
     q: str = "",
     page: int = 1,
@@ -667,18 +668,10 @@ async def opportunity_lookup_page(
     result_items: list[dict] = []
 
     if search_term:
-        pattern = f"%{search_term}%"
-        search_query = (
-            db.query(Opportunity)
-            .filter(Opportunity.organization_id == org_id)
-            .filter(or_(
-                Opportunity.title.ilike(pattern),
-                Opportunity.agency.ilike(pattern),
-                Opportunity.solicitation_number.ilike(pattern),
-                Opportunity.source_record_id.ilike(pattern),
-                Opportunity.sam_notice_id.ilike(pattern),
-                Opportunity.govwin_staging_id.ilike(pattern),
-            ))
+        search_query = apply_opportunity_search(
+            db.query(Opportunity).filter(Opportunity.organization_id == org_id),
+            search_term,
+            scope=SCOPE_LOOKUP,
         )
         total_results = search_query.count()
         total_pages = max(1, (total_results + page_size - 1) // page_size)
@@ -701,6 +694,7 @@ async def opportunity_lookup_page(
             search_query
             .order_by(
                 exact_match_rank.asc(),
+                opportunity_search_rank(db, search_term, scope=SCOPE_LOOKUP).asc(),
                 Opportunity.upserted_at.desc(),
                 Opportunity.updated_at.desc(),
                 Opportunity.id.desc(),
@@ -764,7 +758,7 @@ async def opportunity_lookup_page(
 
 
 @router.get("/admin/source-updates")
-async def source_update_log_page(request: Request, db: Session = Depends(get_db)):
+def source_update_log_page(request: Request, db: Session = Depends(get_db)):
     user = require_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -864,7 +858,7 @@ async def source_update_log_page(request: Request, db: Session = Depends(get_db)
 
 
 @router.get("/admin/source-updates/{event_id}")
-async def source_update_detail_page(
+def source_update_detail_page(
     event_id: int,
     request: Request,
     db: Session = Depends(get_db),
@@ -903,7 +897,7 @@ async def source_update_detail_page(
 
 
 @router.get("/admin/market-activity")
-async def market_activity_page(request: Request, db: Session = Depends(get_db)):
+def market_activity_page(request: Request, db: Session = Depends(get_db)):
     user = require_admin(
         request,
         db,
@@ -967,7 +961,7 @@ async def market_activity_page(request: Request, db: Session = Depends(get_db)):
 
 
 @router.get("/admin/market-activity/export.csv")
-async def market_activity_export(request: Request, db: Session = Depends(get_db)):
+def market_activity_export(request: Request, db: Session = Depends(get_db)):
     user = require_admin(
         request,
         db,
@@ -989,7 +983,7 @@ async def market_activity_export(request: Request, db: Session = Depends(get_db)
     sort = (request.query_params.get("sort") or "").strip().lower() or None
     direction = (request.query_params.get("direction") or "desc").strip().lower()
     start_date, end_date = market_period_dates(period, today=today)
-    dashboard = build_market_activity(
+    rows = market_activity_rows(
         db,
         organization_id=_user_org_id(user),
         filters=MarketActivityFilters(start_date=start_date, end_date=end_date),
@@ -997,38 +991,34 @@ async def market_activity_export(request: Request, db: Session = Depends(get_db)
         metric=metric,
         sort=sort,
         direction=direction,
-        page_size=1_000_000,
     )
 
-    output = io.StringIO(newline="")
-    writer = csv.writer(output)
-    writer.writerow([INSIGHTS_VIEW_BY_OPTIONS[dashboard["view_by"]], "Imported", "Qualified", "Shortlisted"])
-    for row in dashboard["rows"]:
-        if dashboard["metric"] == "conversion":
-            values = [
-                "—" if row["conversion"][key] is None else f'{row["conversion"][key]:.1f}%'
-                for key in ("imported", "qualified", "shortlisted")
-            ]
-        else:
-            values = [row[key] for key in ("imported", "qualified", "shortlisted")]
-        writer.writerow([row["label"], *values])
-    return Response(
-        content=output.getvalue(),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f'attachment; filename="bidlens-insights-{view_by}-{period}.csv"',
-            "Cache-Control": "private, no-store",
-        },
+    def csv_rows():
+        for row in rows:
+            if metric == "conversion":
+                values = [
+                    "—" if row["conversion"][key] is None else f'{row["conversion"][key]:.1f}%'
+                    for key in ("imported", "qualified", "shortlisted")
+                ]
+            else:
+                values = [row[key] for key in ("imported", "qualified", "shortlisted")]
+            yield [row["label"], *values]
+
+    return streaming_csv_response(
+        [INSIGHTS_VIEW_BY_OPTIONS[view_by], "Imported", "Qualified", "Shortlisted"],
+        csv_rows(),
+        filename=f"bidlens-insights-{view_by}-{period}.csv",
+        headers={"Cache-Control": "private, no-store"},
     )
 
 
 @router.get("/source-activity")
-async def source_activity_page(request: Request, db: Session = Depends(get_db)):
-    return await _source_activity_response(request, db)
+def source_activity_page(request: Request, db: Session = Depends(get_db)):
+    return _source_activity_response(request, db)
 
 
 @router.post("/imports/govwin")
-async def govwin_import_upload(
+def govwin_import_upload(
     request: Request,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
@@ -1054,7 +1044,7 @@ async def govwin_import_upload(
         db.commit()
     else:
         try:
-            file_bytes = await file.read()
+            file_bytes = file.file.read()
             if not file_bytes:
                 error = "The uploaded file was empty."
                 _record_govwin_import_run(
@@ -1094,7 +1084,7 @@ async def govwin_import_upload(
 
 
 @router.post("/imports/manual")
-async def manual_import_upload(
+def manual_import_upload(
     request: Request,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
@@ -1120,7 +1110,7 @@ async def manual_import_upload(
         db.commit()
     else:
         try:
-            file_bytes = await file.read()
+            file_bytes = file.file.read()
             if not file_bytes:
                 error = "The uploaded file was empty."
                 _record_manual_import_run(
@@ -654,7 +654,7 @@ def _salesforce_configuration_context(
 
 
 @router.get("/integrations")
-async def integrations_page(request: Request, db: Session = Depends(get_db)):
+def integrations_page(request: Request, db: Session = Depends(get_db)):
     user, redirect = _admin_or_redirect(request, db)
     if redirect:
         return redirect
@@ -680,7 +680,7 @@ async def integrations_page(request: Request, db: Session = Depends(get_db)):
 
 
 @router.get("/workspace-management/business-systems/salesforce")
-async def salesforce_configuration_page(request: Request, db: Session = Depends(get_db)):
+def salesforce_configuration_page(request: Request, db: Session = Depends(get_db)):
     user, redirect = _admin_or_redirect(request, db)
     if redirect:
         return redirect
@@ -691,7 +691,7 @@ async def salesforce_configuration_page(request: Request, db: Session = Depends(
 
 
 @router.post("/workspace-management/business-systems/salesforce/validate")
-async def validate_salesforce_setup(request: Request, db: Session = Depends(get_db)):
+def validate_salesforce_setup(request: Request, db: Session = Depends(get_db)):
     user, redirect = _admin_or_redirect(request, db)
     if redirect:
         return redirect
@@ -726,7 +726,7 @@ async def validate_salesforce_setup(request: Request, db: Session = Depends(get_
 
 
 @router.post("/workspace-management/business-systems/salesforce/test")
-async def test_salesforce_connection(request: Request, db: Session = Depends(get_db)):
+def test_salesforce_connection(request: Request, db: Session = Depends(get_db)):
     user, redirect = _admin_or_redirect(request, db)
     if redirect:
         return redirect
@@ -746,7 +746,7 @@ async def test_salesforce_connection(request: Request, db: Session = Depends(get
 
 
 @router.post("/workspace-management/business-systems/salesforce/disconnect")
-async def disconnect_salesforce(request: Request, db: Session = Depends(get_db)):
+def disconnect_salesforce(request: Request, db: Session = Depends(get_db)):
     user, redirect = _admin_or_redirect(request, db)
     if redirect:
         return redirect
@@ -809,7 +809,7 @@ def _microsoft_adoption_summary(db: Session, workspace: Workspace) -> dict[str,
 
 
 @router.get("/integrations/microsoft")
-async def microsoft_connection_page(request: Request, db: Session = Depends(get_db)):
+def microsoft_connection_page(request: Request, db: Session = Depends(get_db)):
     user, workspace, redirect = _microsoft_user_context(request, db)
     if redirect:
         return redirect
@@ -860,7 +860,7 @@ async def microsoft_connection_page(request: Request, db: Session = Depends(get_
 
 
 @router.post("/integrations/microsoft/mode")
-async def configure_microsoft_connection_mode(
+def configure_microsoft_connection_mode(
     request: Request,
     mode: str = Form(...),
     external_tenant_id: str = Form(""),
@@ -903,7 +903,7 @@ async def configure_microsoft_connection_mode(
 
 
 @router.post("/integrations/microsoft/sync")
-async def sync_microsoft_conversations(request: Request, db: Session = Depends(get_db)):
+def sync_microsoft_conversations(request: Request, db: Session = Depends(get_db)):
     user, redirect = _admin_or_redirect(request, db)
     if redirect:
         return redirect
@@ -926,7 +926,7 @@ async def sync_microsoft_conversations(request: Request, db: Session = Depends(g
 
 
 @router.get("/integrations/microsoft/oauth/start")
-async def microsoft_oauth_start(request: Request, db: Session = Depends(get_db)):
+def microsoft_oauth_start(request: Request, db: Session = Depends(get_db)):
     user, workspace, redirect = _microsoft_user_context(request, db)
     if redirect:
         return redirect
@@ -958,7 +958,7 @@ async def microsoft_oauth_start(request: Request, db: Session = Depends(get_db))
 
 
 @router.get("/integrations/microsoft/oauth/callback")
-async def microsoft_oauth_callback(
+def microsoft_oauth_callback(
     request: Request,
     code: str | None = None,
     state: str | None = None,
@@ -1012,7 +1012,7 @@ async def microsoft_oauth_callback(
 
 
 @router.post("/integrations/microsoft/test")
-async def test_microsoft_connection(request: Request, db: Session = Depends(get_db)):
+def test_microsoft_connection(request: Request, db: Session = Depends(get_db)):
     user, workspace, redirect = _microsoft_user_context(request, db)
     if redirect:
         return redirect
@@ -1031,7 +1031,7 @@ async def test_microsoft_connection(request: Request, db: Session = Depends(get_
 
 
 @router.post("/integrations/microsoft/disconnect")
-async def disconnect_microsoft(request: Request, db: Session = Depends(get_db)):
+def disconnect_microsoft(request: Request, db: Session = Depends(get_db)):
     user, workspace, redirect = _microsoft_user_context(request, db)
     if redirect:
         return redirect
@@ -1042,7 +1042,7 @@ async def disconnect_microsoft(request: Request, db: Session = Depends(get_db)):
 
 
 @router.get("/integrations/govwin")
-async def govwin_configuration_page(request: Request, db: Session = Depends(get_db)):
+def govwin_configuration_page(request: Request, db: Session = Depends(get_db)):
     user, redirect = _admin_or_redirect(request, db)
     if redirect:
         return redirect
@@ -1061,7 +1061,7 @@ async def govwin_configuration_page(request: Request, db: Session = Depends(get_
 
 
 @router.post("/integrations/govwin")
-async def save_govwin_configuration(
+def save_govwin_configuration(
     request: Request,
     client_id: str = Form(""),
     client_secret: str = Form(""),
@@ -1100,7 +1100,7 @@ async def save_govwin_configuration(
 
 
 @router.post("/integrations/govwin/test")
-async def test_govwin_connection(request: Request, db: Session = Depends(get_db)):
+def test_govwin_connection(request: Request, db: Session = Depends(get_db)):
     user, redirect = _admin_or_redirect(request, db)
     if redirect:
         return redirect
@@ -1123,7 +1123,7 @@ async def test_govwin_connection(request: Request, db: Session = Depends(get_db)
 
 
 @router.post("/integrations/govwin/sync")
-async def run_govwin_sync(request: Request, db: Session = Depends(get_db)):
+def run_govwin_sync(request: Request, db: Session = Depends(get_db)):
     user, redirect = _admin_or_redirect(request, db)
     if redirect:
         return redirect
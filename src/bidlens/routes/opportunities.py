@@ -2,19 +2,20 @@ from datetime import date, datetime, timedelta, timezone
 import html
 import logging
 import re
-import csv
-import io
 import json
 from time import perf_counter
 import requests
-from fastapi import APIRouter, Request, Form, Depends, HTTPException
-from fastapi.responses import RedirectResponse, Response
+from fastapi import APIRouter, Body, Request, Form, Depends, HTTPException
+from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 from collections import OrderedDict
+from .. import config
 from ..database import get_db
+from ..fragment_cache import fragment_cache
 from ..models import (
     Opportunity,
     User,
@@ -28,7 +29,7 @@ from ..models import (
     OpportunityCommunicationSummary,
 )
 from ..auth import attach_request_user_context, get_current_user
-from ..services import get_vote_counts, get_user_votes, get_last_activity, get_vote_user_maps
+from ..services import get_user_votes, get_last_activity, get_vote_overview
 from ..services.opportunity_history import unread_history_count
 from ..services.opportunity_conversations import (
     OpportunityConversationTenancyError,
@@ -77,10 +78,10 @@ from ..services.feed_queries import (
     build_feed_query,
     exclude_past_due_opportunities,
     feed_awaiting_review_query,
+    feed_state_join_condition,
 )
 from ..services.pursuit_lanes import user_my_lanes
-from ..services.agency_display import agency_presentation
-from ..services.account_aliases import resolve_account_display_name
+from ..services.account_aliases import AccountDisplay, opportunity_account_display
 from ..services.opportunity_qualification import qualification_presentation
 from ..services.opportunity_outcomes import (
     OUTCOME_BIDDING,
@@ -99,6 +100,15 @@ from ..services.salesforce_promotion import (
     record_salesforce_sync_failure,
 )
 from ..services.opportunity_access import authorized_opportunity_for_user
+from ..services.opportunity_search import apply_opportunity_search, normalize_search_term, opportunity_search_rank
+from ..services.queue_pagination import (
+    QueuePage,
+    SortKey,
+    keyset_page,
+    offset_page,
+    order_by_clauses,
+)
+from ..services.csv_export import batched, streaming_csv_response
 from ..services.opportunity_descriptions import (
     clean_solicitation_description,
     select_opportunity_description,
@@ -109,10 +119,9 @@ from sqlalchemy import and_, or_, select
 from dataclasses import dataclass
 from typing import Optional
 from sqlalchemy import func, case
-from ..models import OpportunityPursuitLaneMatch, PursuitLane, Vote
+from ..models import OpportunityPursuitLaneMatch, OpportunityVoteSummary, PursuitLane, UserFeedState, Vote
 from ..models import Workspace
-from ..grants_gov_client import GrantsGovApiError
-from ..ingest_grants_gov import enrich_grants_gov_opportunity_detail
+from ..services.grants_detail_queue import grants_detail_queue, needs_grants_gov_detail
 router = APIRouter()
 templates = Jinja2Templates(directory="src/bidlens/templates")
 logger = logging.getLogger(__name__)
@@ -131,8 +140,9 @@ DATE_TYPE_POSTED = "posted"
 DATE_TYPES = {DATE_TYPE_IMPORTED, DATE_TYPE_DUE, DATE_TYPE_POSTED}
 FEED_PAGE_SIZE = 50
 TRIAGE_PAGE_SIZE = 100
-FEED_SORT_VALUES = frozenset({"imported", "due", "agency", "title", "lane"})
+FEED_SORT_VALUES = frozenset({"imported", "due", "agency", "title", "lane", "relevance"})
 MY_SHORTLIST_SORT_VALUES = FEED_SORT_VALUES | {"shortlisted"}
+RELEVANCE_EXPORT_VIEWS = frozenset({"feed", "my_shortlist", "triage"})
 TRIAGE_SOURCE_FILTERS = ("sam", "grants", "govwin")
 TRIAGE_SOURCE_OPTIONS = (
     {"value": "sam", "label": "SAM.gov"},
@@ -512,9 +522,15 @@ def _exclude_inactive_govwin_stages(query):
     )
 
 
-def _agency_parts_for_export(raw_agency: str | None) -> tuple[str | None, str | None]:
-    agency = agency_presentation(resolve_account_display_name(raw_agency))
-    return agency.parent, agency.sub_agency
+def _refresh_account_parts(opp: Opportunity) -> AccountDisplay:
+    """Return the opportunity's account presentation from its persisted columns."""
+    account = opportunity_account_display(opp)
+    if account.parent != opp.parent_agency or account.sub_agency != opp.sub_agency:
+        # The row predates the current alias revision; show the fresh parts
+        # without turning a page view into a write.
+        set_committed_value(opp, "parent_agency", account.parent)
+        set_committed_value(opp, "sub_agency", account.sub_agency)
+    return account
 
 
 def _current_org_status(opp: Opportunity) -> str:
@@ -601,6 +617,8 @@ def _export_view_query(
         if _is_admin(user):
             q = _apply_triage_source_filter(q, _normalize_triage_source_filters(sources))
 
+    if view in RELEVANCE_EXPORT_VIEWS and _normalize_feed_sort(sort, search_term=search) == "relevance":
+        q = q.order_by(opportunity_search_rank(db, search).asc(), Opportunity.id.desc())
     return q
 
 
@@ -608,58 +626,58 @@ def _vote_export_maps(db: Session, org_id: int, opp_ids: list[int]) -> tuple[dic
     if not opp_ids:
         return {}, {}, {}
 
-    counts = get_vote_counts(db, opp_ids)
-    interest_users, pass_users = get_vote_user_maps(db, org_id=org_id, opp_ids=opp_ids)
-    return counts, interest_users, pass_users
+    return get_vote_overview(db, org_id=org_id, opp_ids=opp_ids)
 
 
-def _sort_export_opportunities(
-    db: Session,
-    opportunities: list[Opportunity],
+def _order_export_query(
+    query,
     *,
     view: str,
     sort: str,
     direction: str = "desc",
-    date_type: str = DATE_TYPE_IMPORTED,
-) -> list[Opportunity]:
-    if not opportunities:
-        return opportunities
+    organization_id: int,
+    search: str = "",
+):
+    """Order an export in SQL the way its on-screen list is ordered."""
+    if view in RELEVANCE_EXPORT_VIEWS and _normalize_feed_sort(sort, search_term=search) == "relevance":
+        # Already ranked by the export query.
+        return query
 
+    deadline_keys = [
+        SortKey(Opportunity.response_deadline),
+        SortKey(Opportunity.id, nullable=False),
+    ]
     if view == "shortlist":
         if sort == "activity":
-            opp_ids = [opp.id for opp in opportunities]
-            activity_map = get_last_activity(db, opp_ids)
-            for opp in opportunities:
-                opp.last_activity = activity_map.get(opp.id)
-            opportunities.sort(key=lambda opp: opp.last_activity or datetime.min, reverse=True)
+            last_activity = (
+                select(OpportunityVoteSummary.last_activity_at)
+                .where(OpportunityVoteSummary.opportunity_id == Opportunity.id)
+                .scalar_subquery()
+            )
+            keys = [SortKey(last_activity, descending=True), SortKey(Opportunity.id, nullable=False)]
         elif sort == "pursue":
-            opportunities.sort(key=lambda opp: (opp.pursue_count, opp.response_deadline or date.max), reverse=True)
+            pursue_count = func.coalesce(
+                select(OpportunityVoteSummary.pursue_count)
+                .where(OpportunityVoteSummary.opportunity_id == Opportunity.id)
+                .scalar_subquery(),
+                0,
+            )
+            keys = [
+                SortKey(pursue_count, descending=True, nullable=False),
+                SortKey(Opportunity.response_deadline, descending=True, nulls_first=True),
+                SortKey(Opportunity.id, nullable=False),
+            ]
         else:
-            opportunities.sort(key=lambda opp: (opp.response_deadline or date.max, opp.id))
+            keys = deadline_keys
     elif view in {"feed", "my_shortlist"}:
-        sort = _normalize_feed_sort(sort)
-        direction = _normalize_sort_direction(direction)
-
-        def feed_sort_value(opp):
-            if sort == "due":
-                return opp.response_deadline
-            if sort == "agency":
-                return (opp.agency or "").casefold() or None
-            if sort == "title":
-                return (opp.title or "").casefold() or None
-            return opp.upserted_at
-
-        populated = [opp for opp in opportunities if feed_sort_value(opp) is not None]
-        missing = [opp for opp in opportunities if feed_sort_value(opp) is None]
-        populated.sort(
-            key=lambda opp: (feed_sort_value(opp), opp.id),
-            reverse=direction == "desc",
+        keys = _feed_sort_keys(
+            _normalize_feed_sort(sort),
+            _normalize_sort_direction(direction),
+            organization_id=organization_id,
         )
-        opportunities = populated + missing
     else:
-        opportunities.sort(key=lambda opp: (opp.response_deadline or date.max, opp.id))
-
-    return opportunities
+        keys = deadline_keys
+    return query.order_by(None).order_by(*order_by_clauses(keys))
 
 
 def _team_interest_label(*, total: int, current_user_interested: bool) -> str:
@@ -710,9 +728,8 @@ def _enrich_opps(rows, db, user, watched_col=True):
         opportunities.append(opp)
 
     opp_ids = [o.id for o in opportunities]
-    counts = get_vote_counts(db, opp_ids)
+    counts, pursue_users_map, pass_users_map = get_vote_overview(db, org_id=_user_org_id(user), opp_ids=opp_ids)
     user_votes = get_user_votes(db, user.id, opp_ids)
-    pursue_users_map, pass_users_map = get_vote_user_maps(db, org_id=_user_org_id(user), opp_ids=opp_ids)
     lane_rows = (
         db.query(OpportunityPursuitLaneMatch, PursuitLane)
         .join(PursuitLane, PursuitLane.id == OpportunityPursuitLaneMatch.pursuit_lane_id)
@@ -766,8 +783,7 @@ def _enrich_opps(rows, db, user, watched_col=True):
     current_user_label = (user.name or user.email or "").strip()
 
     for opp in opportunities:
-        account_display = resolve_account_display_name(opp.agency)
-        agency = agency_presentation(account_display)
+        account_display = _refresh_account_parts(opp).display
         c = counts.get(opp.id, {"pursue": 0, "pass": 0})
         opp.pursue_count = c["pursue"]
         opp.pass_count = c["pass"]
@@ -791,8 +807,6 @@ def _enrich_opps(rows, db, user, watched_col=True):
         opp.normalized_opportunity_type = _normalized_opportunity_type(opp)
         opp.qualification_display = qualification_presentation(opp)
         opp.agency_display = account_display
-        opp.parent_agency = agency.parent
-        opp.sub_agency = agency.sub_agency
         opp.pursuit_lanes = lane_map.get(opp.id, [])
         opp.crm_pushed_by_current_user = bool(getattr(opp, "crm_pushed", False) and opp.crm_pushed_by == user.id)
         opp.crm_pushed_by_label = crm_user_map.get(getattr(opp, "crm_pushed_by", None))
@@ -944,7 +958,7 @@ def _calendar_drawer_items(rows) -> list[dict[str, object]]:
         {
             "id": opportunity.id,
             "title": opportunity.title,
-            "agency": resolve_account_display_name(opportunity.agency),
+            "agency": opportunity_account_display(opportunity).display,
             "deadline": opportunity.response_deadline.isoformat(),
             "url": f"/opportunity/{opportunity.id}?return_to=shortlist",
         }
@@ -1186,24 +1200,7 @@ def _apply_lane_filter(query, db: Session, user, *, lane_id: str | int | None =
 
 
 def _apply_feed_search(query, *, search_term: str = ""):
-    term = (search_term or "").strip()
-    if not term:
-        return query
-
-    pattern = f"%{term}%"
-    return query.filter(
-        or_(
-            Opportunity.title.ilike(pattern),
-            Opportunity.agency.ilike(pattern),
-            Opportunity.solicitation_number.ilike(pattern),
-            Opportunity.sam_notice_id.ilike(pattern),
-            Opportunity.source_record_id.ilike(pattern),
-            Opportunity.naics.ilike(pattern),
-            Opportunity.naics_title.ilike(pattern),
-            Opportunity.description.ilike(pattern),
-            Opportunity.description_text.ilike(pattern),
-        )
-    )
+    return apply_opportunity_search(query, search_term)
 
 
 def _normalize_date_type(date_type: str = "", *, sort: str = "") -> str:
@@ -1249,13 +1246,19 @@ def _apply_date_ordering(query, *, date_type: str = DATE_TYPE_IMPORTED):
     return query.order_by(date_field.desc(), Opportunity.id.desc())
 
 
-def _normalize_feed_sort(sort: str = "", *, allow_shortlisted: bool = False) -> str:
+def _normalize_feed_sort(sort: str = "", *, allow_shortlisted: bool = False, search_term: str = "") -> str:
+    """Searches default to relevance; relevance without a search is Imported."""
+    searching = bool(normalize_search_term(search_term))
+    if not sort and searching:
+        return "relevance"
     aliases = {
         "newest": "imported",
         "deadline": "due",
     }
     normalized = aliases.get(sort, sort)
     allowed = MY_SHORTLIST_SORT_VALUES if allow_shortlisted else FEED_SORT_VALUES
+    if normalized == "relevance" and not searching:
+        return "imported"
     return normalized if normalized in allowed else "imported"
 
 
@@ -1286,102 +1289,135 @@ def _representative_lane_sort_value(*, organization_id: int):
     )
 
 
+def _feed_sort_keys(
+    sort: str, direction: str, *, organization_id: int, allow_shortlisted: bool = False,
+) -> list[SortKey]:
+    """Sort key tuple for a non-relevance queue ordering; ids break ties."""
+    if sort == "lane":
+        return [
+            SortKey(
+                _representative_lane_sort_value(organization_id=organization_id),
+                nulls_first=direction != "asc",
+            ),
+            SortKey(Opportunity.upserted_at, descending=True),
+            SortKey(Opportunity.id, descending=True, nullable=False),
+        ]
+    if sort == "shortlisted" and allow_shortlisted:
+        return [
+            SortKey(Vote.shortlisted_at, descending=direction != "asc"),
+            SortKey(Opportunity.upserted_at, descending=True),
+            SortKey(Opportunity.id, descending=True, nullable=False),
+        ]
+    sort_field = {
+        "due": Opportunity.response_deadline,
+        "agency": func.lower(Opportunity.agency),
+        "title": func.lower(Opportunity.title),
+    }.get(sort, Opportunity.upserted_at)
+    return [
+        SortKey(sort_field, descending=direction != "asc"),
+        SortKey(Opportunity.id, descending=direction != "asc", nullable=False),
+    ]
+
+
 def _apply_feed_ordering(
     query, *, sort: str = "imported", direction: str = "desc",
-    organization_id: int, allow_shortlisted: bool = False,
+    organization_id: int, allow_shortlisted: bool = False, search_term: str = "",
 ):
-    sort = _normalize_feed_sort(sort, allow_shortlisted=allow_shortlisted)
+    sort = _normalize_feed_sort(sort, allow_shortlisted=allow_shortlisted, search_term=search_term)
     direction = _normalize_sort_direction(direction)
     # A selected sort is authoritative. SQLAlchemy appends order_by() clauses,
     # so clear any ordering introduced by an upstream query before applying it.
     query = query.order_by(None)
-    if sort == "lane":
-        lane_name = _representative_lane_sort_value(organization_id=organization_id)
-        unassigned_order = lane_name.is_(None).asc() if direction == "asc" else lane_name.is_(None).desc()
+    if sort == "relevance":
         return query.order_by(
-            unassigned_order,
-            lane_name.asc(),
+            opportunity_search_rank(query.session, search_term).asc(),
             Opportunity.upserted_at.is_(None).asc(),
             Opportunity.upserted_at.desc(),
             Opportunity.id.desc(),
         )
-    if sort == "shortlisted":
-        ordered_shortlisted = Vote.shortlisted_at.asc() if direction == "asc" else Vote.shortlisted_at.desc()
-        return query.order_by(
-            Vote.shortlisted_at.is_(None).asc(),
-            ordered_shortlisted,
-            Opportunity.upserted_at.is_(None).asc(),
-            Opportunity.upserted_at.desc(),
-            Opportunity.id.desc(),
+    keys = _feed_sort_keys(
+        sort, direction, organization_id=organization_id, allow_shortlisted=allow_shortlisted,
+    )
+    return query.order_by(*order_by_clauses(keys))
+
+
+def _queue_page(
+    query, *, sort: str, direction: str, organization_id: int, page: int, page_size: int,
+    user_id: int, count_key: tuple, after: str = "", before: str = "", allow_shortlisted: bool = False,
+) -> tuple[QueuePage, int, int]:
+    """Read one queue page plus its (cached) total and page count.
+
+    Key-ordered sorts page by cursor; relevance and old ``page=N`` links fall
+    back to a numbered page. Totals are a ``fragment_cache`` fragment, so the
+    vote, watch, state and ingest write points that refresh the sidebar
+    refresh them too.
+    """
+    def count() -> int:
+        return fragment_cache.get_or_compute(
+            query.session,
+            "queue_result_count",
+            organization_id=organization_id,
+            user_id=user_id,
+            compute=lambda: query.order_by(None).count(),
+            variant=count_key,
+            ttl_seconds=config.QUEUE_COUNT_CACHE_SECONDS,
         )
-    sort_field = {
-        "due": Opportunity.response_deadline,
-        "agency": func.lower(Opportunity.agency),
-        "title": func.lower(Opportunity.title),
-    }.get(sort, Opportunity.upserted_at)
-    ordered_field = sort_field.asc() if direction == "asc" else sort_field.desc()
-    ordered_id = Opportunity.id.asc() if direction == "asc" else Opportunity.id.desc()
-    return query.order_by(sort_field.is_(None).asc(), ordered_field, ordered_id)
+
+    result = None
+    keys = None
+    ordering = f"{sort}:{direction}"
+    if sort != "relevance":
+        keys = _feed_sort_keys(
+            sort, direction, organization_id=organization_id, allow_shortlisted=allow_shortlisted,
+        )
+        if after or before or page <= 1:
+            result = keyset_page(
+                query, keys, ordering=ordering, page_size=page_size, after=after, before=before,
+            )
+    if result is None:
+        current_page, _total_pages, _offset = _pagination_values(count(), page, page_size)
+        result = offset_page(query, page=current_page, page_size=page_size, keys=keys, ordering=ordering)
+
+    seen = (result.page - 1) * page_size + len(result.rows)
+    if result.page == 1 and not result.has_next:
+        result_count = seen
+    else:
+        # Keep a stale total consistent with the rows the cursor has reached.
+        result_count = max(count(), seen + (1 if result.has_next else 0))
+    total_pages = max(1, (result_count + page_size - 1) // page_size)
+    total_pages = max(total_pages, result.page + 1) if result.has_next else result.page
+    return result, result_count, total_pages
 
 
 def _queue_counts(db: Session, user, tab: str) -> dict[str, int]:
-    org_id = _user_org_id(user)
-    base = (
-        db.query(Opportunity.id)
-        .filter(Opportunity.organization_id == org_id)
-        .filter(Opportunity.decision_state != "ARCHIVED")
-        .filter(Opportunity.qualification_status == QUALIFICATION_QUALIFIED)
+    return fragment_cache.get_or_compute(
+        db,
+        "queue_counts",
+        organization_id=_user_org_id(user),
+        user_id=user.id,
+        variant=(tab,),
+        compute=lambda: _compute_queue_counts(db, user, tab),
     )
-    base = _apply_type_tab(base, tab)
 
-    interested_opp_ids = (
-        select(Vote.opp_id)
-        .where(Vote.org_id == org_id, Vote.user_id == user.id, Vote.vote == "PURSUE")
-    )
-    passed_opp_ids = (
-        select(Vote.opp_id)
-        .where(Vote.org_id == org_id, Vote.user_id == user.id, Vote.vote == "PASS")
-    )
 
-    new_count = (
-        base
-        .filter(~Opportunity.id.in_(interested_opp_ids))
-        .filter(~Opportunity.id.in_(passed_opp_ids))
-        .count()
-    )
-    my_interested_count_query = (
-        db.query(func.count(func.distinct(Opportunity.id)))
-        .join(
-            Vote,
-            and_(
-                Vote.opp_id == Opportunity.id,
-                Vote.org_id == org_id,
-                Vote.user_id == user.id,
-                Vote.vote == "PURSUE",
-            ),
-        )
+def _compute_queue_counts(db: Session, user, tab: str) -> dict[str, int]:
+    org_id = _user_org_id(user)
+    user_id = user.id
+    # One grouped pass over the user's feed-state rows: opportunities without
+    # a PURSUE/PASS vote are "new", the rest fall into their vote's bucket.
+    query = (
+        db.query(UserFeedState.vote, func.count(Opportunity.id))
+        .select_from(Opportunity)
+        .outerjoin(UserFeedState, feed_state_join_condition(organization_id=org_id, user_id=user_id))
         .filter(Opportunity.organization_id == org_id)
         .filter(Opportunity.decision_state != "ARCHIVED")
         .filter(Opportunity.qualification_status == QUALIFICATION_QUALIFIED)
     )
-    my_interested_count = _apply_type_tab(my_interested_count_query, tab).scalar() or 0
-    passed_count = (
-        db.query(func.count(Vote.id))
-        .join(Opportunity, Opportunity.id == Vote.opp_id)
-        .filter(
-            Vote.org_id == org_id,
-            Vote.user_id == user.id,
-            Vote.vote == "PASS",
-            Opportunity.organization_id == org_id,
-            Opportunity.decision_state != "ARCHIVED",
-            Opportunity.qualification_status == QUALIFICATION_QUALIFIED,
-        )
-    )
-    passed_count = _apply_type_tab(passed_count, tab).scalar() or 0
+    counts = dict(_apply_type_tab(query, tab).group_by(UserFeedState.vote).all())
     return {
-        "new": new_count,
-        "my_interested": my_interested_count,
-        "passed": passed_count,
+        "new": counts.get(None, 0),
+        "my_interested": counts.get("PURSUE", 0),
+        "passed": counts.get("PASS", 0),
     }
 
 
@@ -1404,10 +1440,10 @@ def _triage_counts(db: Session, user) -> dict[str, int]:
 # ── Feed (INBOX) ──────────────────────────────────────────────
 
 @router.get("/")
-async def feed(
+def feed(
     request: Request,
     tab: str = "solicitations",
-    sort: str = "imported",
+    sort: str = "",
     direction: str = "desc",
     date_type: str = "",
     date_filter: str = "",
@@ -1421,6 +1457,8 @@ async def feed(
     sources: str | None = None,
     stage: str | None = None,
     page: int = 1,
+    after: str = "",
+    before: str = "",
     db: Session = Depends(get_db),
 ):
     user = require_user(request, db)
@@ -1431,7 +1469,7 @@ async def feed(
         return pre_live_redirect
 
     search_query = q
-    selected_sort = _normalize_feed_sort(sort)
+    selected_sort = _normalize_feed_sort(sort, search_term=search_query)
     selected_direction = _normalize_sort_direction(direction)
     # Legacy date/pass parameters remain accepted for old links, but the Feed
     # always represents the current user's active queue.
@@ -1451,21 +1489,23 @@ async def feed(
         query = _apply_triage_source_filter(query, selected_sources)
     query = _apply_feed_ordering(
         query, sort=selected_sort, direction=selected_direction,
-        organization_id=_user_org_id(user),
+        organization_id=_user_org_id(user), search_term=search_query,
     )
 
-    result_count = query.count()
-    current_page, total_pages, offset = _pagination_values(
-        result_count,
-        page,
-        FEED_PAGE_SIZE,
+    queue_page, result_count, total_pages = _queue_page(
+        query, sort=selected_sort, direction=selected_direction, organization_id=_user_org_id(user),
+        page=page, page_size=FEED_PAGE_SIZE, after=after, before=before,
+        user_id=user.id,
+        count_key=(
+            "feed", lane_id, normalize_search_term(search_query),
+            tuple(selected_stages), tuple(selected_sources),
+        ),
     )
-    rows = query.offset(offset).limit(FEED_PAGE_SIZE).all()
 
     return templates.TemplateResponse("feed.html", {
         "request": request,
         "user": user,
-        "opportunities": _enrich_opps(rows, db, user),
+        "opportunities": _enrich_opps(queue_page.rows, db, user),
         "active_page": "feed",
         "sidebar": get_sidebar(db, user),
         "sort": selected_sort,
@@ -1478,9 +1518,11 @@ async def feed(
         "selected_sources": selected_sources if _is_admin(user) else (),
         "sources_value": ",".join(selected_sources) if _is_admin(user) else "",
         "result_count": result_count,
-        "page": current_page,
+        "page": queue_page.page,
         "page_size": FEED_PAGE_SIZE,
         "total_pages": total_pages,
+        "next_cursor": queue_page.next_cursor,
+        "prev_cursor": queue_page.prev_cursor,
         "active_lanes": _active_lanes(db, user),
         "my_lanes": user_my_lanes(db, organization_id=_user_org_id(user), user_id=user.id),
         "triage_enabled": user.triage_enabled,
@@ -1489,10 +1531,10 @@ async def feed(
 
 
 @router.get("/triage")
-async def triage_queue(
+def triage_queue(
     request: Request,
     date_type: str = "",
-    sort: str = "imported",
+    sort: str = "",
     direction: str = "desc",
     date_filter: str = "",
     q: str = "",
@@ -1501,6 +1543,8 @@ async def triage_queue(
     lane_id: str | None = None,
     stage: str | None = None,
     page: int = 1,
+    after: str = "",
+    before: str = "",
     db: Session = Depends(get_db),
 ):
     user = require_user(request, db)
@@ -1527,7 +1571,7 @@ async def triage_queue(
         .filter(Opportunity.qualification_status == QUALIFICATION_UNREVIEWED)
     )
     query = _exclude_inactive_govwin_stages(query)
-    selected_sort = _normalize_feed_sort(sort)
+    selected_sort = _normalize_feed_sort(sort, search_term=q)
     selected_direction = _normalize_sort_direction(direction)
     selected_stages = _normalize_stage_filters(
         stages if stages is not None else ([stage] if stage and stage != "All" else None)
@@ -1539,20 +1583,22 @@ async def triage_queue(
     query = _apply_lane_filter(query, db, user, lane_id=lane_id)
     query = _apply_feed_ordering(
         query, sort=selected_sort, direction=selected_direction,
-        organization_id=_user_org_id(user),
+        organization_id=_user_org_id(user), search_term=q,
     )
-    result_count = query.count()
-    current_page, total_pages, offset = _pagination_values(
-        result_count,
-        page,
-        TRIAGE_PAGE_SIZE,
+    queue_page, result_count, total_pages = _queue_page(
+        query, sort=selected_sort, direction=selected_direction, organization_id=_user_org_id(user),
+        page=page, page_size=TRIAGE_PAGE_SIZE, after=after, before=before,
+        user_id=user.id,
+        count_key=(
+            "triage", lane_id, normalize_search_term(q),
+            tuple(selected_stages), tuple(selected_sources),
+        ),
     )
-    rows = query.offset(offset).limit(TRIAGE_PAGE_SIZE).all()
 
     return templates.TemplateResponse("triage.html", {
         "request": request,
         "user": user,
-        "opportunities": _enrich_opps(rows, db, user),
+        "opportunities": _enrich_opps(queue_page.rows, db, user),
         "active_page": "triage",
         "triage_enabled": user.triage_enabled,
         "sort": selected_sort,
@@ -1566,15 +1612,17 @@ async def triage_queue(
         "lane_id": lane_id,
         "active_lanes": _active_lanes(db, user),
         "result_count": result_count,
-        "page": current_page,
+        "page": queue_page.page,
         "page_size": TRIAGE_PAGE_SIZE,
         "total_pages": total_pages,
+        "next_cursor": queue_page.next_cursor,
+        "prev_cursor": queue_page.prev_cursor,
         "now": datetime.utcnow(),
     })
 
 
 @router.get("/intake")
-async def intake_redirect():
+def intake_redirect():
     return RedirectResponse(url="/triage", status_code=303)
 
 
@@ -1584,7 +1632,7 @@ REVIEW_STAGES = ["Team Review", "Director Review", "Approved"]
 # ── Team Interest ────────────────────────────────────────────
 
 @router.get("/shortlist")
-async def shortlist(
+def shortlist(
     request: Request,
     tab: str = "solicitations",
     sort: str = "pursue",
@@ -1633,10 +1681,10 @@ async def shortlist(
 # ── My Interest ──────────────────────────────────────────────
 
 @router.get("/my-shortlist")
-async def my_shortlist(
+def my_shortlist(
     request: Request,
     tab: str = "solicitations",
-    sort: str = "imported",
+    sort: str = "",
     direction: str = "desc",
     q: str = "",
     stages: str | None = None,
@@ -1644,6 +1692,8 @@ async def my_shortlist(
     stage: str | None = None,
     lane_id: str | None = None,
     page: int = 1,
+    after: str = "",
+    before: str = "",
     db: Session = Depends(get_db),
 ):
     user = require_user(request, db)
@@ -1653,7 +1703,7 @@ async def my_shortlist(
     if pre_live_redirect:
         return pre_live_redirect
 
-    selected_sort = _normalize_feed_sort(sort, allow_shortlisted=True)
+    selected_sort = _normalize_feed_sort(sort, allow_shortlisted=True, search_term=q)
     selected_direction = _normalize_sort_direction(direction)
     selected_stages = _normalize_stage_filters(
         stages if stages is not None else ([stage] if stage and stage != "All" else None)
@@ -1675,17 +1725,19 @@ async def my_shortlist(
         query = _apply_triage_source_filter(query, selected_sources)
     query = _apply_feed_ordering(
         query, sort=selected_sort, direction=selected_direction,
-        organization_id=_user_org_id(user), allow_shortlisted=True,
+        organization_id=_user_org_id(user), allow_shortlisted=True, search_term=q,
     )
-    result_count = query.count()
-    current_page, total_pages, offset = _pagination_values(
-        result_count,
-        page,
-        FEED_PAGE_SIZE,
+    queue_page, result_count, total_pages = _queue_page(
+        query, sort=selected_sort, direction=selected_direction, organization_id=_user_org_id(user),
+        page=page, page_size=FEED_PAGE_SIZE, after=after, before=before, allow_shortlisted=True,
+        user_id=user.id,
+        count_key=(
+            "my_shortlist", tab, lane_id, normalize_search_term(q),
+            tuple(selected_stages), tuple(selected_sources),
+        ),
     )
-    rows = query.offset(offset).limit(FEED_PAGE_SIZE).all()
 
-    opps = _enrich_opps(rows, db, user)
+    opps = _enrich_opps(queue_page.rows, db, user)
     recent_activity = shortlist_recent_activity(
         db,
         organization_id=_user_org_id(user),
@@ -1711,9 +1763,11 @@ async def my_shortlist(
         "selected_sources": selected_sources if _is_admin(user) else (),
         "sources_value": ",".join(selected_sources) if _is_admin(user) else "",
         "result_count": result_count,
-        "page": current_page,
+        "page": queue_page.page,
         "page_size": FEED_PAGE_SIZE,
         "total_pages": total_pages,
+        "next_cursor": queue_page.next_cursor,
+        "prev_cursor": queue_page.prev_cursor,
         "active_lanes": _active_lanes(db, user),
         "my_lanes": user_my_lanes(db, organization_id=_user_org_id(user), user_id=user.id),
     })
@@ -1722,10 +1776,10 @@ async def my_shortlist(
 # ── Personal Archive (PASS) ──────────────────────────────────
 
 @router.get("/archive")
-async def archive(
+def archive(
     request: Request,
     tab: str = "solicitations",
-    sort: str = "imported",
+    sort: str = "",
     direction: str = "desc",
     q: str = "",
     stages: str | None = None,
@@ -1741,7 +1795,7 @@ async def archive(
     if pre_live_redirect:
         return pre_live_redirect
 
-    selected_sort = _normalize_feed_sort(sort)
+    selected_sort = _normalize_feed_sort(sort, search_term=q)
     selected_direction = _normalize_sort_direction(direction)
     selected_stages = _normalize_stage_filters(
         stages
@@ -1765,6 +1819,7 @@ async def archive(
         sort=selected_sort,
         direction=selected_direction,
         organization_id=_user_org_id(user),
+        search_term=q,
     )
     result_count = query.count()
     rows = query.limit(50).all()
@@ -1791,7 +1846,7 @@ async def archive(
 
 
 @router.get("/past-due-outcomes")
-async def past_due_outcomes(
+def past_due_outcomes(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -1826,16 +1881,16 @@ async def past_due_outcomes(
 
 
 @router.post("/past-due-outcomes/{opp_id}")
-async def record_past_due_outcome(
+def record_past_due_outcome(
     opp_id: int,
     request: Request,
+    payload: dict = Body(default_factory=dict),
     db: Session = Depends(get_db),
 ):
     user = require_user(request, db)
     if not user:
         raise HTTPException(status_code=401, detail="Login required")
 
-    payload = await request.json()
     outcome_type = str(payload.get("outcome_type") or "").strip()
     if outcome_type not in {OUTCOME_BIDDING, OUTCOME_NO_BID}:
         raise HTTPException(status_code=400, detail="Invalid outcome")
@@ -1864,7 +1919,7 @@ async def record_past_due_outcome(
 
 
 @router.get("/opportunities/export.csv")
-async def export_opportunities_csv(
+def export_opportunities_csv(
     request: Request,
     view: str = "feed",
     tab: str = "solicitations",
@@ -1888,6 +1943,7 @@ async def export_opportunities_csv(
     if view == "triage" and not _is_admin(user):
         return RedirectResponse(url="/", status_code=303)
 
+    search_term = q
     q = _export_view_query(
         db,
         user,
@@ -1902,41 +1958,20 @@ async def export_opportunities_csv(
         show_passed=show_passed,
         show_past_due=show_past_due,
         lane_id=lane_id,
-        search=q,
+        search=search_term,
         stages=stages,
         sources=sources,
     )
 
-    rows = q.all()
-    opportunities = _enrich_opps(rows, db, user)
-    opportunities = _sort_export_opportunities(
-        db,
-        opportunities,
+    q = _order_export_query(
+        q,
         view=view,
         sort=sort,
         direction=direction,
-        date_type=date_type,
-    )
-    opp_ids = [opp.id for opp in opportunities]
-
-    vote_counts, interest_users_map, pass_users_map = _vote_export_maps(db, _user_org_id(user), opp_ids)
-    user_votes = get_user_votes(db, user.id, opp_ids)
-
-    user_opp_rows = (
-        db.query(UserOpportunity)
-        .filter(
-            UserOpportunity.organization_id == _user_org_id(user),
-            UserOpportunity.user_id == user.id,
-            UserOpportunity.opportunity_id.in_(opp_ids),
-        )
-        .all()
-        if opp_ids else []
+        organization_id=_user_org_id(user),
+        search=search_term,
     )
-    user_opp_map = {row.opportunity_id: row for row in user_opp_rows}
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
+    header = [
         "BidLens ID",
         "DB ID",
         "Title",
@@ -1972,31 +2007,63 @@ async def export_opportunities_csv(
         "My Interested",
         "Internal Deadline",
         "Notes",
-    ])
+    ]
+    return streaming_csv_response(
+        header,
+        _export_csv_rows(db, user, q),
+        filename=_base_export_filename(view, tab),
+    )
+
+
+def _enriched_export_rows(db: Session, user, query, *, batch_size: int):
+    """Stream ``query`` and yield ``(opportunity, watched, enrichment)`` per row.
+
+    Vote, watch, and note lookups run once per batch of ``batch_size`` ids.
+    """
+    org_id = _user_org_id(user)
+    for batch in batched(query.yield_per(batch_size), batch_size):
+        rows = [(row, False) if isinstance(row, Opportunity) else (row[0], row[1]) for row in batch]
+        opp_ids = [opp.id for opp, _watched in rows]
+        vote_counts, interest_users_map, pass_users_map = _vote_export_maps(db, org_id, opp_ids)
+        enrichment = {
+            "vote_counts": vote_counts,
+            "interest_users": interest_users_map,
+            "pass_users": pass_users_map,
+            "user_votes": get_user_votes(db, user.id, opp_ids),
+            "user_opportunities": {
+                row.opportunity_id: row
+                for row in db.query(UserOpportunity).filter(
+                    UserOpportunity.organization_id == org_id,
+                    UserOpportunity.user_id == user.id,
+                    UserOpportunity.opportunity_id.in_(opp_ids),
+                )
+            },
+        }
+        for opp, watched in rows:
+            yield opp, watched, enrichment
+
 
+def _export_csv_rows(db: Session, user, query, *, batch_size: int | None = None):
+    batch_size = max(1, batch_size or config.CSV_EXPORT_BATCH_SIZE)
     today = date.today()
-    for opp in opportunities:
-        department, sub_agency = _agency_parts_for_export(opp.agency)
-        counts = vote_counts.get(opp.id, {"pursue": getattr(opp, "pursue_count", 0), "pass": getattr(opp, "pass_count", 0)})
-        interest_users = "; ".join(interest_users_map.get(opp.id, []))
-        pass_users = "; ".join(pass_users_map.get(opp.id, []))
-        user_opp = user_opp_map.get(opp.id)
-        current_vote = user_votes.get(opp.id) or getattr(opp, "user_vote", None) or ""
+    for opp, row_watched, enrichment in _enriched_export_rows(db, user, query, batch_size=batch_size):
+        account = opportunity_account_display(opp)
+        counts = enrichment["vote_counts"].get(opp.id, {"pursue": 0, "pass": 0})
+        interest_users_map = enrichment["interest_users"]
+        pass_users_map = enrichment["pass_users"]
+        user_opp = enrichment["user_opportunities"].get(opp.id)
+        current_vote = enrichment["user_votes"].get(opp.id) or ""
         current_vote_label = "Interested" if current_vote == "PURSUE" else "Archive" if current_vote == "PASS" else ""
-        my_interest = "Yes" if current_vote == "PURSUE" else "No"
-        watched = "Yes" if bool(getattr(opp, "watched", False) or (user_opp and user_opp.watched)) else "No"
-        days_until_due = ""
-        if opp.response_deadline:
-            days_until_due = (opp.response_deadline - today).days
-
-        writer.writerow([
+        watched = "Yes" if bool(row_watched or (user_opp and user_opp.watched)) else "No"
+        days_until_due = (opp.response_deadline - today).days if opp.response_deadline else ""
+        yield [
             str(opp.bidlens_id or ""),
             opp.id,
             opp.title or "",
-            resolve_account_display_name(opp.agency),
+            account.display,
             opp.agency or "",
-            department or "",
-            sub_agency or "",
+            account.parent or "",
+            account.sub_agency or "",
             opp.canonical_type or "",
             opp.opportunity_type or "",
             _format_date(opp.posted_date),
@@ -2018,27 +2085,20 @@ async def export_opportunities_csv(
             _current_org_status(opp),
             counts.get("pursue", 0),
             counts.get("pass", 0),
-            interest_users,
-            pass_users,
+            "; ".join(interest_users_map.get(opp.id, [])),
+            "; ".join(pass_users_map.get(opp.id, [])),
             current_vote_label,
             watched,
-            my_interest,
+            "Yes" if current_vote == "PURSUE" else "No",
             _format_date(user_opp.internal_deadline) if user_opp else "",
             user_opp.notes if user_opp and user_opp.notes else "",
-        ])
-
-    filename = _base_export_filename(view, tab)
-    return Response(
-        content=output.getvalue(),
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+        ]
 
 
 # ── Detail ────────────────────────────────────────────────────
 
 @router.get("/opportunity/{opp_id}")
-async def opportunity_detail(
+def opportunity_detail(
     request: Request,
     opp_id: int,
     db: Session = Depends(get_db),
@@ -2052,22 +2112,10 @@ async def opportunity_detail(
         return RedirectResponse(url="/", status_code=303)
 
     resolved_description = _best_description_text(opportunity)
-    raw_payload = opportunity.raw_source_payload if isinstance(opportunity.raw_source_payload, dict) else {}
-    needs_grants_gov_detail = opportunity.source == "grants_gov" and (
-        not resolved_description or not raw_payload.get("detail_payload")
-    )
-    if needs_grants_gov_detail:
-        try:
-            if enrich_grants_gov_opportunity_detail(db, opportunity):
-                resolved_description = _best_description_text(opportunity)
-        except (GrantsGovApiError, requests.RequestException) as exc:
-            db.rollback()
-            logger.warning(
-                "Grants.gov detail enrichment failed opportunity_id=%s source_record_id=%s error=%s",
-                opportunity.id,
-                opportunity.source_record_id,
-                exc,
-            )
+    # The Grants.gov detail lookup runs in the background; render what is stored.
+    grants_gov_details_loading = needs_grants_gov_detail(
+        opportunity, description=resolved_description,
+    ) and grants_detail_queue.enqueue(opportunity.id, bind=db.get_bind())
     resolved_description = resolved_description or None
     grants_gov_metadata = _grants_gov_detail_metadata(opportunity)
     grants_gov_documents = _grants_gov_document_metadata(opportunity)
@@ -2087,15 +2135,14 @@ async def opportunity_detail(
     today = date.today()
     days_until_due = (opportunity.response_deadline - today).days
 
-    counts = get_vote_counts(db, [opp_id])
-    c = counts.get(opp_id, {"pursue": 0, "pass": 0})
-    user_votes = get_user_votes(db, user.id, [opp_id])
-    user_vote = user_votes.get(opp_id)
-    pursue_users_map, _ = get_vote_user_maps(
+    counts, pursue_users_map, _ = get_vote_overview(
         db,
         org_id=_user_org_id(user),
         opp_ids=[opp_id],
     )
+    c = counts.get(opp_id, {"pursue": 0, "pass": 0})
+    user_votes = get_user_votes(db, user.id, [opp_id])
+    user_vote = user_votes.get(opp_id)
     pursue_users = pursue_users_map.get(opp_id, [])
     current_user_interested = user_vote == "PURSUE"
     current_user_label = (user.name or user.email or "").strip()
@@ -2162,12 +2209,9 @@ async def opportunity_detail(
         opportunity_id=opportunity.id,
         user_id=user.id,
     )
-    account_display = resolve_account_display_name(opportunity.agency)
-    agency = agency_presentation(account_display)
+    account_display = _refresh_account_parts(opportunity).display
     opportunity.agency_display = account_display
     opportunity.qualification_display = qualification_presentation(opportunity)
-    opportunity.parent_agency = agency.parent
-    opportunity.sub_agency = agency.sub_agency
     try:
         conversation_context = get_opportunity_conversation_context(
             db,
@@ -2230,6 +2274,7 @@ async def opportunity_detail(
         "resolved_description": resolved_description,
         "grants_gov_metadata": grants_gov_metadata,
         "grants_gov_documents": grants_gov_documents,
+        "grants_gov_details_loading": grants_gov_details_loading,
         "opportunity_notes": notes,
         "pursuit_lanes": pursuit_lanes,
         "history_events": history_events,
@@ -2248,7 +2293,7 @@ async def opportunity_detail(
 
 
 @router.post("/opportunity/{opp_id}/communication-summary")
-async def generate_opportunity_communication_summary(
+def generate_opportunity_communication_summary(
     request: Request,
     opp_id: int,
     csrf_token: str = Form(""),
@@ -2299,7 +2344,7 @@ async def generate_opportunity_communication_summary(
 
 
 @router.get("/opportunity/{opp_id}/conversation/new")
-async def new_opportunity_conversation(
+def new_opportunity_conversation(
     request: Request,
     opp_id: int,
     return_to: str | None = None,
@@ -2358,7 +2403,7 @@ async def new_opportunity_conversation(
 
 
 @router.post("/opportunity/{opp_id}/conversation/send")
-async def send_opportunity_conversation(
+def send_opportunity_conversation(
     request: Request,
     opp_id: int,
     to: str = Form(""),
@@ -2534,7 +2579,7 @@ def _sync_emailed_opportunity_to_salesforce(
 # ── User-level actions (notes, bookmark, etc.) ───────────────
 
 @router.post("/opportunity/{opp_id}/update")
-async def update_opportunity(
+def update_opportunity(
     request: Request,
     opp_id: int,
     internal_deadline: str = Form(None),
@@ -2568,7 +2613,7 @@ async def update_opportunity(
 
 
 @router.post("/opportunity/{opp_id}/watch")
-async def toggle_watch(
+def toggle_watch(
     request: Request,
     opp_id: int,
     db: Session = Depends(get_db),
@@ -2590,13 +2635,14 @@ async def toggle_watch(
         uo.watched = not bool(uo.watched)
 
     db.commit()
+    fragment_cache.invalidate_user(db, organization_id=_user_org_id(user), user_id=user.id)
 
     referer = request.headers.get("referer", "/")
     return RedirectResponse(url=referer, status_code=303)
 
 
 @router.post("/opportunities/{opp_id}/notes")
-async def add_opportunity_note(
+def add_opportunity_note(
     request: Request,
     opp_id: int,
     body: str = Form(""),
@@ -2632,7 +2678,7 @@ async def add_opportunity_note(
 # ── Calendar ──────────────────────────────────────────────────
 
 @router.get("/calendar")
-async def calendar_page(
+def calendar_page(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -2680,10 +2726,66 @@ async def calendar_page(
 
 # ── Sidebar ───────────────────────────────────────────────────
 
+@dataclass(frozen=True)
+class SidebarItem:
+    """One sidebar opportunity, rebuilt from the cached fragment."""
+
+    id: int
+    title: str
+    response_deadline: date | None
+    salesforce_opportunity_url: str | None = None
+
+    @property
+    def days_until_due(self) -> int | None:
+        if self.response_deadline is None:
+            return None
+        return (self.response_deadline - date.today()).days
+
+
+def _sidebar_fragment(opportunities) -> list[dict]:
+    return [
+        {
+            "id": opp.id,
+            "title": opp.title,
+            "response_deadline": opp.response_deadline.isoformat() if opp.response_deadline else None,
+            "salesforce_opportunity_url": opp.salesforce_opportunity_url,
+        }
+        for opp in opportunities
+    ]
+
+
+def _sidebar_items(fragment: list[dict]) -> list[SidebarItem]:
+    return [
+        SidebarItem(
+            id=item["id"],
+            title=item["title"],
+            response_deadline=date.fromisoformat(item["response_deadline"]) if item["response_deadline"] else None,
+            salesforce_opportunity_url=item["salesforce_opportunity_url"],
+        )
+        for item in fragment
+    ]
+
+
 def get_sidebar(db: Session, user: User):
-    """Sidebar: My Interested Due Soon + Following."""
-    today = date.today()
+    """Sidebar: My Interested Due Soon + Following.
 
+    Served from ``fragment_cache``; votes, watches, state transitions and
+    ingests invalidate it.
+    """
+    fragment = fragment_cache.get_or_compute(
+        db,
+        "sidebar",
+        organization_id=_user_org_id(user),
+        user_id=user.id,
+        compute=lambda: _compute_sidebar(db, user),
+    )
+    return {
+        "my_shortlisted": _sidebar_items(fragment["my_shortlisted"]),
+        "following": _sidebar_items(fragment["following"]),
+    }
+
+
+def _compute_sidebar(db: Session, user: User) -> dict[str, list[dict]]:
     # My Interested Due Soon: current user's interest signal.
     my_shortlisted = (
         db.query(Opportunity)
@@ -2723,10 +2825,4 @@ def get_sidebar(db: Session, user: User):
         .all()
     )
 
-    for opp in my_shortlisted:
-        opp.days_until_due = (opp.response_deadline - today).days
-
-    for opp in following:
-        opp.days_until_due = (opp.response_deadline - today).days
-
-    return {"my_shortlisted": my_shortlisted, "following": following}
+    return {"my_shortlisted": _sidebar_fragment(my_shortlisted), "following": _sidebar_fragment(following)}
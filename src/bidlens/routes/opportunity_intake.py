@@ -175,7 +175,7 @@ def start_manual_intake(
 
 
 @router.post("/opportunity-intake/document")
-async def upload_rfp_document(
+def upload_rfp_document(
     request: Request,
     csrf_token: str = Form(""),
     document: UploadFile = File(...),
@@ -187,7 +187,7 @@ async def upload_rfp_document(
     if not validate_intake_csrf_token(csrf_token, user.id, action="upload_document"):
         raise HTTPException(status_code=403, detail="Invalid form token")
     workspace = _workspace(db, user)
-    content = await document.read(config.SOURCE_MATERIAL_MAX_BYTES + 1)
+    content = document.file.read(config.SOURCE_MATERIAL_MAX_BYTES + 1)
     try:
         storage = configured_source_material_storage()
         result = process_rfp_document(
@@ -224,7 +224,7 @@ async def upload_rfp_document(
 
 
 @router.post("/opportunity-intake/email")
-async def upload_email_file(
+def upload_email_file(
     request: Request,
     csrf_token: str = Form(""),
     email_file: UploadFile = File(...),
@@ -236,7 +236,7 @@ async def upload_email_file(
     if not validate_intake_csrf_token(csrf_token, user.id, action="upload_email"):
         raise HTTPException(status_code=403, detail="Invalid form token")
     workspace = _workspace(db, user)
-    content = await email_file.read(config.SOURCE_MATERIAL_MAX_BYTES + 1)
+    content = email_file.file.read(config.SOURCE_MATERIAL_MAX_BYTES + 1)
     try:
         result = process_email_file(
             db,
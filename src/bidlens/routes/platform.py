@@ -474,7 +474,7 @@ def _organization_detail_context(
 
 
 @router.get("/platform")
-async def platform_page(request: Request, db: Session = Depends(get_db)):
+def platform_page(request: Request, db: Session = Depends(get_db)):
     user = require_platform_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -493,7 +493,7 @@ async def platform_page(request: Request, db: Session = Depends(get_db)):
 
 
 @router.get("/platform/operations")
-async def platform_operations_page(request: Request, db: Session = Depends(get_db)):
+def platform_operations_page(request: Request, db: Session = Depends(get_db)):
     user = require_platform_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -501,7 +501,7 @@ async def platform_operations_page(request: Request, db: Session = Depends(get_d
 
 
 @router.get("/platform/operations/{run_id}")
-async def platform_operation_detail(run_id: int, request: Request, db: Session = Depends(get_db)):
+def platform_operation_detail(run_id: int, request: Request, db: Session = Depends(get_db)):
     user = require_platform_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -509,7 +509,7 @@ async def platform_operation_detail(run_id: int, request: Request, db: Session =
 
 
 @router.get("/platform/organizations/{organization_id}")
-async def platform_organization_detail(organization_id: int, request: Request, db: Session = Depends(get_db)):
+def platform_organization_detail(organization_id: int, request: Request, db: Session = Depends(get_db)):
     user = require_platform_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -520,7 +520,7 @@ async def platform_organization_detail(organization_id: int, request: Request, d
 
 
 @router.post("/platform/organizations/{organization_id}/invitations/{invitation_id}/replace")
-async def platform_replace_invitation(
+def platform_replace_invitation(
     organization_id: int,
     invitation_id: int,
     request: Request,
@@ -551,7 +551,7 @@ async def platform_replace_invitation(
 
 
 @router.post("/platform/organizations/{organization_id}/owner-invitation")
-async def platform_create_owner_invitation(
+def platform_create_owner_invitation(
     organization_id: int,
     request: Request,
     db: Session = Depends(get_db),
@@ -571,7 +571,7 @@ async def platform_create_owner_invitation(
 
 
 @router.get("/platform/organizations/{organization_id}/delete")
-async def platform_delete_organization_confirm(organization_id: int, request: Request, db: Session = Depends(get_db)):
+def platform_delete_organization_confirm(organization_id: int, request: Request, db: Session = Depends(get_db)):
     user = require_platform_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -588,7 +588,7 @@ async def platform_delete_organization_confirm(organization_id: int, request: Re
 
 
 @router.post("/platform/organizations/{organization_id}/delete")
-async def platform_delete_organization(
+def platform_delete_organization(
     organization_id: int,
     request: Request,
     confirmation_name: str = Form(""),
@@ -619,7 +619,7 @@ async def platform_delete_organization(
 
 
 @router.get("/platform/diagnostics/duplicate-domains")
-async def platform_duplicate_domain_diagnostics(request: Request, db: Session = Depends(get_db)):
+def platform_duplicate_domain_diagnostics(request: Request, db: Session = Depends(get_db)):
     user = require_platform_admin(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -629,7 +629,7 @@ async def platform_duplicate_domain_diagnostics(request: Request, db: Session =
 
 
 @router.post("/platform/organizations")
-async def platform_create_organization(
+def platform_create_organization(
     request: Request,
     organization_name: str = Form(""),
     owner_name: str = Form(""),
@@ -694,7 +694,7 @@ async def platform_create_organization(
 
 
 @router.get("/invite/{token}")
-async def accept_invitation(token: str, request: Request, db: Session = Depends(get_db)):
+def accept_invitation(token: str, request: Request, db: Session = Depends(get_db)):
     invitation = accept_workspace_invitation(db, token=token)
     if not invitation:
         return RedirectResponse(url="/login", status_code=303)
@@ -124,7 +124,7 @@ def _match_terms_from_inputs(
 
 
 @router.get("/pursuit-lanes")
-async def pursuit_lanes_page(request: Request, db: Session = Depends(get_db)):
+def pursuit_lanes_page(request: Request, db: Session = Depends(get_db)):
     user = require_user(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
@@ -167,7 +167,7 @@ def lane_management_context(db: Session, user: User) -> dict:
 
 
 @router.post("/pursuit-lanes")
-async def create_pursuit_lane(
+def create_pursuit_lane(
     request: Request,
     name: str = Form(""),
     match_terms: str = Form(""),
@@ -226,7 +226,7 @@ async def create_pursuit_lane(
 
 
 @router.post("/pursuit-lanes/{lane_id}")
-async def update_pursuit_lane(
+def update_pursuit_lane(
     request: Request,
     lane_id: int,
     name: str = Form(""),
@@ -287,7 +287,7 @@ async def update_pursuit_lane(
 
 
 @router.post("/pursuit-lanes/{lane_id}/delete")
-async def delete_pursuit_lane(
+def delete_pursuit_lane(
     request: Request,
     lane_id: int,
     db: Session = Depends(get_db),
@@ -318,7 +318,7 @@ async def delete_pursuit_lane(
 
 
 @router.post("/pursuit-lanes/my-lanes")
-async def update_my_lanes(
+def update_my_lanes(
     request: Request,
     lane_ids: list[int] = Form(default=[]),
     db: Session = Depends(get_db),
@@ -340,7 +340,7 @@ async def update_my_lanes(
 
 
 @router.post("/pursuit-lanes/rematch")
-async def rematch_pursuit_lanes(request: Request, db: Session = Depends(get_db)):
+def rematch_pursuit_lanes(request: Request, db: Session = Depends(get_db)):
     user = require_user(request, db)
     if not user:
         return RedirectResponse(url="/login", status_code=303)
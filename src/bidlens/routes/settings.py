@@ -78,7 +78,7 @@ def _my_settings_redirect_url(request: Request, *, saved: str) -> str:
 
 
 @router.get("/my-settings")
-async def my_settings_page(
+def my_settings_page(
     request: Request,
     db: Session = Depends(get_db)
 ):
@@ -115,7 +115,7 @@ async def my_settings_page(
 
 
 @router.post("/my-settings/daily-brief")
-async def save_daily_brief_settings(
+def save_daily_brief_settings(
     request: Request,
     daily_brief_email_enabled: str | None = Form(None),
     db: Session = Depends(get_db),
@@ -151,7 +151,7 @@ def _settings_placeholder_response(request: Request, user, title: str, descripti
 
 
 @router.get("/my-settings/account")
-async def my_account_settings_page(
+def my_account_settings_page(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -169,7 +169,7 @@ async def my_account_settings_page(
 
 
 @router.get("/my-settings/notifications")
-async def my_notification_settings_page(
+def my_notification_settings_page(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -185,7 +185,7 @@ async def my_notification_settings_page(
 
 
 @router.get("/my-settings/organization")
-async def my_organization_settings_page(
+def my_organization_settings_page(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -201,7 +201,7 @@ async def my_organization_settings_page(
 
 
 @router.get("/my-settings/my-lanes")
-async def my_lanes_settings_page(
+def my_lanes_settings_page(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -232,7 +232,7 @@ async def my_lanes_settings_page(
 
 
 @router.post("/my-settings/my-lanes")
-async def save_my_lanes_settings(
+def save_my_lanes_settings(
     request: Request,
     lane_ids: list[int] = Form(default=[]),
     db: Session = Depends(get_db),
@@ -262,7 +262,7 @@ async def save_my_lanes_settings(
 
 
 @router.get("/administration")
-async def administration_page(
+def administration_page(
     request: Request,
     db: Session = Depends(get_db)
 ):
@@ -279,7 +279,7 @@ async def administration_page(
 
 @router.get("/salesforce")
 @router.get("/settings/salesforce")
-async def salesforce_admin_page(
+def salesforce_admin_page(
     request: Request,
     db: Session = Depends(get_db)
 ):
@@ -294,7 +294,7 @@ async def salesforce_admin_page(
     return RedirectResponse(url=f"/workspace-management/business-systems/salesforce{suffix}", status_code=303)
 
 @router.get("/settings")
-async def settings_page(
+def settings_page(
     request: Request,
     db: Session = Depends(get_db)
 ):
@@ -318,7 +318,7 @@ async def settings_page(
     })
 
 @router.post("/settings")
-async def settings_save(
+def settings_save(
     request: Request,
     include_keywords: str = Form(None),
     exclude_keywords: str = Form(None),
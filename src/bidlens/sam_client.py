@@ -4,19 +4,18 @@ import threading
 import logging
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from html import unescape
 from email.utils import parsedate_to_datetime
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 import requests
-from typing import Any, Dict
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Dict, Sequence
 
-from .config import SAM_API_KEY
+from .config import SAM_API_KEY, SAM_MAX_CONCURRENT_REQUESTS, SAM_REQUEST_BURST, SAM_REQUESTS_PER_SECOND
 
 SAM_BASE = "https://api.sam.gov/opportunities/v2/search"
 logger = logging.getLogger(__name__)
-_REQUEST_LOCK = threading.Lock()
-_LAST_REQUEST_AT = 0.0
-MIN_REQUEST_INTERVAL_SECONDS = 1.0
 MAX_RATE_LIMIT_WAIT_SECONDS = 30.0
 TRANSIENT_SAM_STATUS_CODES = {500, 502, 503, 504}
 
@@ -50,14 +49,58 @@ def _mmddyyyy(d: dt.date) -> str:
     return d.strftime("%m/%d/%Y")
 
 
-def _throttle_requests() -> None:
-    global _LAST_REQUEST_AT
-    with _REQUEST_LOCK:
-        now = time.monotonic()
-        wait_s = max(0.0, MIN_REQUEST_INTERVAL_SECONDS - (now - _LAST_REQUEST_AT))
-        if wait_s > 0:
-            time.sleep(wait_s)
-        _LAST_REQUEST_AT = time.monotonic()
+class TokenBucket:
+    """Thread-safe token bucket shared by every SAM.gov request in the process.
+
+    ``pause`` empties the bucket and blocks all callers until the deadline,
+    which is how a ``Retry-After`` or ``nextAccessTime`` from one request
+    holds back the others.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate_per_second = max(0.001, float(rate_per_second))
+        self.capacity = max(1, int(capacity))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.capacity)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(float(self.capacity), self._tokens + elapsed * self.rate_per_second)
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping as needed; return the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                wait_s = self._paused_until - now
+                if wait_s <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    wait_s = (1 - self._tokens) / self.rate_per_second
+            self._sleep(wait_s)
+            waited += wait_s
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + max(0.0, seconds))
 
 
 def _parse_retry_after(value: str | None) -> float | None:
@@ -257,21 +300,7 @@ def _clean_extracted_text(text: str | None) -> str | None:
     return cleaned
 
 
-def fetch_sam_page_description(sam_url: str) -> str | None:
-    if not _is_url_like(sam_url):
-        return None
-
-    _throttle_requests()
-    resp = requests.get(
-        sam_url,
-        timeout=(5, 15),
-        headers={"User-Agent": "Mozilla/5.0"},
-    )
-    logger.info("SAM page description status=%s url=%s", resp.status_code, sam_url)
-    resp.raise_for_status()
-
-    html = resp.text
-
+def _description_from_sam_page(html: str) -> str | None:
     meta_matches = re.findall(
         r'<meta[^>]+(?:name|property)=["\'](?:description|og:description|twitter:description)["\'][^>]+content=["\']([^"\']+)',
         html,
@@ -316,231 +345,369 @@ def fetch_sam_page_description(sam_url: str) -> str | None:
     return None
 
 
-def resolve_notice_description(description_url: str | None, sam_url: str | None) -> str | None:
-    api_rate_limit_error: SamRateLimitError | None = None
+class SamClient:
+    """SAM.gov HTTP client with a pooled keep-alive session.
 
-    if _is_url_like(description_url):
-        try:
-            resolved = fetch_notice_description(description_url)
-        except SamRateLimitError as exc:
-            api_rate_limit_error = exc
-        except requests.RequestException as exc:
-            logger.warning("SAM notice description request failed url=%s error=%s", description_url, repr(exc))
-        except Exception as exc:
-            logger.warning("SAM notice description resolution failed url=%s error=%s", description_url, repr(exc))
-        else:
-            if resolved:
-                return resolved
+    Every request takes a token from a shared ``TokenBucket`` and one of
+    ``max_in_flight`` slots, so description enrichment can fetch notices in
+    parallel while the process as a whole stays inside the configured rate.
+    A rate-limit response pauses the bucket; when SAM.gov asks for a wait
+    longer than ``MAX_RATE_LIMIT_WAIT_SECONDS`` (quota exhausted until
+    ``nextAccessTime``), API calls fail fast with ``SamRateLimitError`` until
+    that time instead of spending more requests.
+    """
 
-    if _is_url_like(sam_url):
-        try:
-            resolved = fetch_sam_page_description(sam_url)
-        except requests.RequestException as exc:
-            logger.warning("SAM page description request failed url=%s error=%s", sam_url, repr(exc))
-        except Exception as exc:
-            logger.warning("SAM page description resolution failed url=%s error=%s", sam_url, repr(exc))
+    def __init__(
+        self,
+        *,
+        api_key: str | None = None,
+        requests_per_second: float = SAM_REQUESTS_PER_SECOND,
+        burst: int = SAM_REQUEST_BURST,
+        max_in_flight: int = SAM_MAX_CONCURRENT_REQUESTS,
+        session: requests.Session | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.api_key = api_key
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.limiter = TokenBucket(requests_per_second, burst, clock=clock, sleep=sleep)
+        self._clock = clock
+        self._sleep = sleep
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._quota_lock = threading.Lock()
+        self._quota_blocked_until = 0.0
+        self._quota_retry_after: str | None = None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_in_flight)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def _api_key(self) -> str:
+        api_key = self.api_key or SAM_API_KEY
+        if not api_key:
+            raise RuntimeError("SAM_API_KEY is not set")
+        return api_key
+
+    def _check_quota(self) -> None:
+        with self._quota_lock:
+            remaining = self._quota_blocked_until - self._clock()
+            retry_after = self._quota_retry_after
+        if remaining > 0:
+            raise SamRateLimitError(
+                f"SAM quota is exhausted; try again in about {int(round(remaining))} seconds.",
+                retry_after_seconds=remaining,
+                retry_after=retry_after,
+            )
+
+    def note_rate_limit(self, seconds: float | None, retry_after: str | None = None) -> None:
+        """Hold back every request after a 429 for as long as SAM.gov asked."""
+        if seconds is None:
+            return
+        if seconds > MAX_RATE_LIMIT_WAIT_SECONDS:
+            with self._quota_lock:
+                self._quota_blocked_until = max(self._quota_blocked_until, self._clock() + seconds)
+                self._quota_retry_after = retry_after
         else:
-            if resolved:
-                return resolved
+            self.limiter.pause(seconds)
 
-    if api_rate_limit_error is not None:
-        raise api_rate_limit_error
+    def _get(self, url: str, *, api: bool = True, **kwargs: Any) -> requests.Response:
+        if api:
+            self._check_quota()
+        with self._slots:
+            self.limiter.acquire()
+            return self.session.get(url, **kwargs)
 
-    return None
+    def fetch_sam_page_description(self, sam_url: str) -> str | None:
+        if not _is_url_like(sam_url):
+            return None
 
-def search_opportunities(
-    *,
-    naics: str,
-    posted_from: dt.date,
-    posted_to: dt.date,
-    response_deadline_from: dt.date | None = None,
-    response_deadline_to: dt.date | None = None,
-    organization_name: str | None = None,
-    procurement_types: list[str] | None = None,
-    limit: int = 100,
-    offset: int = 0,
-    max_retries: int = 3,
-    allow_rate_limit_wait: bool = True,
-) -> Dict[str, Any]:
-    api_key = SAM_API_KEY
-    if not api_key:
-        raise RuntimeError("SAM_API_KEY is not set")
-
-    params = {
-        "api_key": api_key,
-        "postedFrom": _mmddyyyy(posted_from),
-        "postedTo": _mmddyyyy(posted_to),
-        "ncode": naics,
-        "limit": limit,
-        "offset": offset,
-    }
-    if response_deadline_from is not None:
-        params["rdlfrom"] = _mmddyyyy(response_deadline_from)
-    if response_deadline_to is not None:
-        params["rdlto"] = _mmddyyyy(response_deadline_to)
-    if organization_name:
-        params["organizationName"] = organization_name
-    if procurement_types:
-        params["ptype"] = procurement_types
-
-    backoff = 1.0
-    last_exc = None
-
-    for attempt in range(max_retries):
-        try:
-            _throttle_requests()
-            r = requests.get(SAM_BASE, params=params, timeout=30)
-            logger.info(
-                "SAM request naics=%s offset=%s attempt=%s status=%s",
-                naics,
-                offset,
-                attempt + 1,
-                r.status_code,
-            )
+        resp = self._get(
+            sam_url,
+            api=False,
+            timeout=(5, 15),
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+        logger.info("SAM page description status=%s url=%s", resp.status_code, sam_url)
+        resp.raise_for_status()
+        return _description_from_sam_page(resp.text)
 
-            if r.status_code == 429:
-                retry_after = _extract_retry_after_value(r)
-                sleep_s = _extract_retry_after_seconds(r)
-                if sleep_s is None:
-                    sleep_s = backoff
+    def fetch_notice_description(self, description_url: str) -> str | None:
+        if not _is_url_like(description_url):
+            return None
 
-                logger.warning(
-                    "SAM rate limited naics=%s offset=%s attempt=%s retry_after=%s sleep=%s",
-                    naics,
-                    offset,
-                    attempt + 1,
-                    retry_after,
-                    sleep_s,
-                )
+        request_url = _with_api_key(description_url, self._api_key())
+        resp = self._get(request_url, timeout=30)
+        logger.info("SAM notice description status=%s url=%s", resp.status_code, description_url)
+
+        if resp.status_code == 429:
+            retry_after = _extract_retry_after_seconds(resp)
+            retry_after_value = _extract_retry_after_value(resp)
+            self.note_rate_limit(retry_after, retry_after_value)
+            raise SamRateLimitError(
+                _rate_limit_message(resp, "SAM rate limited notice description fetch."),
+                retry_after_seconds=retry_after,
+                retry_after=retry_after_value,
+            )
 
-                if not allow_rate_limit_wait:
-                    raise SamRateLimitError(
-                        _rate_limit_message(r, "SAM.gov is rate limiting requests. Try again later."),
-                        retry_after_seconds=sleep_s,
-                        retry_after=retry_after,
-                    )
+        resp.raise_for_status()
 
-                if sleep_s > MAX_RATE_LIMIT_WAIT_SECONDS:
-                    raise SamRateLimitError(
-                        f"SAM rate limited requests for about {int(round(sleep_s))} seconds; try again later.",
-                        retry_after_seconds=sleep_s,
-                        retry_after=retry_after,
-                    )
+        content_type = (resp.headers.get("Content-Type") or "").lower()
+        if "json" in content_type:
+            try:
+                normalized = _normalize_description_payload(resp.json())
+            except ValueError:
+                normalized = None
+            if normalized:
+                return normalized
 
-                if attempt == max_retries - 1:
-                    raise SamRateLimitError(
-                        f"SAM rate limited requests and asked us to wait about {int(round(sleep_s))} seconds.",
-                        retry_after_seconds=sleep_s,
-                        retry_after=retry_after,
-                    )
+        normalized = _normalize_description_payload(resp.text)
+        return normalized
+
+    def resolve_notice_description(self, description_url: str | None, sam_url: str | None) -> str | None:
+        api_rate_limit_error: SamRateLimitError | None = None
+
+        if _is_url_like(description_url):
+            try:
+                resolved = self.fetch_notice_description(description_url)
+            except SamRateLimitError as exc:
+                api_rate_limit_error = exc
+            except requests.RequestException as exc:
+                logger.warning("SAM notice description request failed url=%s error=%s", description_url, repr(exc))
+            except Exception as exc:
+                logger.warning("SAM notice description resolution failed url=%s error=%s", description_url, repr(exc))
+            else:
+                if resolved:
+                    return resolved
+
+        if _is_url_like(sam_url):
+            try:
+                resolved = self.fetch_sam_page_description(sam_url)
+            except requests.RequestException as exc:
+                logger.warning("SAM page description request failed url=%s error=%s", sam_url, repr(exc))
+            except Exception as exc:
+                logger.warning("SAM page description resolution failed url=%s error=%s", sam_url, repr(exc))
+            else:
+                if resolved:
+                    return resolved
+
+        if api_rate_limit_error is not None:
+            raise api_rate_limit_error
 
-                time.sleep(sleep_s)
-                backoff = min(max(backoff * 2, sleep_s), MAX_RATE_LIMIT_WAIT_SECONDS)
-                continue
+        return None
 
-            if r.status_code in TRANSIENT_SAM_STATUS_CODES:
-                logger.warning(
-                    "SAM transient failure naics=%s offset=%s attempt=%s status=%s body=%s",
+    def resolve_notice_descriptions(
+        self,
+        notices: Sequence[tuple[str | None, str | None]],
+    ) -> list[tuple[str | None, Exception | None]]:
+        """Resolve ``(description_url, sam_url)`` pairs concurrently, in input order.
+
+        Each entry is ``(description, None)`` or ``(None, error)``; errors are
+        the ones ``resolve_notice_description`` would raise (rate limits).
+        """
+
+        def resolve(notice: tuple[str | None, str | None]) -> tuple[str | None, Exception | None]:
+            try:
+                return self.resolve_notice_description(*notice), None
+            except Exception as exc:
+                return None, exc
+
+        if len(notices) <= 1:
+            return [resolve(notice) for notice in notices]
+        with ThreadPoolExecutor(max_workers=min(self.max_in_flight, len(notices))) as pool:
+            return list(pool.map(resolve, notices))
+
+    def search_opportunities(
+        self,
+        *,
+        naics: str,
+        posted_from: dt.date,
+        posted_to: dt.date,
+        response_deadline_from: dt.date | None = None,
+        response_deadline_to: dt.date | None = None,
+        organization_name: str | None = None,
+        procurement_types: list[str] | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        max_retries: int = 3,
+        allow_rate_limit_wait: bool = True,
+    ) -> Dict[str, Any]:
+        params = {
+            "api_key": self._api_key(),
+            "postedFrom": _mmddyyyy(posted_from),
+            "postedTo": _mmddyyyy(posted_to),
+            "ncode": naics,
+            "limit": limit,
+            "offset": offset,
+        }
+        if response_deadline_from is not None:
+            params["rdlfrom"] = _mmddyyyy(response_deadline_from)
+        if response_deadline_to is not None:
+            params["rdlto"] = _mmddyyyy(response_deadline_to)
+        if organization_name:
+            params["organizationName"] = organization_name
+        if procurement_types:
+            params["ptype"] = procurement_types
+
+        backoff = 1.0
+        last_exc = None
+
+        for attempt in range(max_retries):
+            try:
+                r = self._get(SAM_BASE, params=params, timeout=30)
+                logger.info(
+                    "SAM request naics=%s offset=%s attempt=%s status=%s",
                     naics,
                     offset,
                     attempt + 1,
                     r.status_code,
-                    r.text[:400],
                 )
-                last_exc = SamTemporaryUnavailableError(
-                    "SAM.gov is temporarily unavailable. Try again later.",
-                    status_code=r.status_code,
-                )
-                if attempt == max_retries - 1:
-                    break
-                time.sleep(backoff)
-                backoff = min(backoff * 2, MAX_RATE_LIMIT_WAIT_SECONDS)
-                continue
 
-            r.raise_for_status()
-            payload = r.json()
-            if _looks_like_sam_runtime_error(payload):
-                message = _extract_sam_error_text(payload) or "SAM.gov returned a runtime error."
+                if r.status_code == 429:
+                    retry_after = _extract_retry_after_value(r)
+                    sleep_s = _extract_retry_after_seconds(r)
+                    if sleep_s is None:
+                        sleep_s = backoff
+                    # Short waits pause the shared bucket (the next _get sleeps
+                    # them out); long ones block API calls until nextAccessTime.
+                    self.note_rate_limit(sleep_s, retry_after)
+
+                    logger.warning(
+                        "SAM rate limited naics=%s offset=%s attempt=%s retry_after=%s sleep=%s",
+                        naics,
+                        offset,
+                        attempt + 1,
+                        retry_after,
+                        sleep_s,
+                    )
+
+                    if not allow_rate_limit_wait:
+                        raise SamRateLimitError(
+                            _rate_limit_message(r, "SAM.gov is rate limiting requests. Try again later."),
+                            retry_after_seconds=sleep_s,
+                            retry_after=retry_after,
+                        )
+
+                    if sleep_s > MAX_RATE_LIMIT_WAIT_SECONDS:
+                        raise SamRateLimitError(
+                            f"SAM rate limited requests for about {int(round(sleep_s))} seconds; try again later.",
+                            retry_after_seconds=sleep_s,
+                            retry_after=retry_after,
+                        )
+
+                    if attempt == max_retries - 1:
+                        raise SamRateLimitError(
+                            f"SAM rate limited requests and asked us to wait about {int(round(sleep_s))} seconds.",
+                            retry_after_seconds=sleep_s,
+                            retry_after=retry_after,
+                        )
+
+                    backoff = min(max(backoff * 2, sleep_s), MAX_RATE_LIMIT_WAIT_SECONDS)
+                    continue
+
+                if r.status_code in TRANSIENT_SAM_STATUS_CODES:
+                    logger.warning(
+                        "SAM transient failure naics=%s offset=%s attempt=%s status=%s body=%s",
+                        naics,
+                        offset,
+                        attempt + 1,
+                        r.status_code,
+                        r.text[:400],
+                    )
+                    last_exc = SamTemporaryUnavailableError(
+                        "SAM.gov is temporarily unavailable. Try again later.",
+                        status_code=r.status_code,
+                    )
+                    if attempt == max_retries - 1:
+                        break
+                    self._sleep(backoff)
+                    backoff = min(backoff * 2, MAX_RATE_LIMIT_WAIT_SECONDS)
+                    continue
+
+                r.raise_for_status()
+                payload = r.json()
+                if _looks_like_sam_runtime_error(payload):
+                    message = _extract_sam_error_text(payload) or "SAM.gov returned a runtime error."
+                    logger.warning(
+                        "SAM runtime error payload naics=%s offset=%s attempt=%s message=%s",
+                        naics,
+                        offset,
+                        attempt + 1,
+                        message,
+                    )
+                    last_exc = SamTemporaryUnavailableError(
+                        "SAM.gov is temporarily unavailable. Try again later."
+                    )
+                    if attempt == max_retries - 1:
+                        break
+                    self._sleep(backoff)
+                    backoff = min(backoff * 2, MAX_RATE_LIMIT_WAIT_SECONDS)
+                    continue
+                return payload
+
+            except SamRateLimitError:
+                raise
+            except SamTemporaryUnavailableError:
+                raise
+            except requests.RequestException as e:
                 logger.warning(
-                    "SAM runtime error payload naics=%s offset=%s attempt=%s message=%s",
+                    "SAM request exception naics=%s offset=%s attempt=%s error=%s",
                     naics,
                     offset,
                     attempt + 1,
-                    message,
-                )
-                last_exc = SamTemporaryUnavailableError(
-                    "SAM.gov is temporarily unavailable. Try again later."
+                    repr(e),
                 )
+                last_exc = e
                 if attempt == max_retries - 1:
                     break
-                time.sleep(backoff)
+                self._sleep(backoff)
                 backoff = min(backoff * 2, MAX_RATE_LIMIT_WAIT_SECONDS)
-                continue
-            return payload
-
-        except SamRateLimitError:
-            raise
-        except SamTemporaryUnavailableError:
-            raise
-        except requests.RequestException as e:
-            logger.warning(
-                "SAM request exception naics=%s offset=%s attempt=%s error=%s",
-                naics,
-                offset,
-                attempt + 1,
-                repr(e),
+
+        # If we exhausted retries, raise the last exception
+        if isinstance(last_exc, SamTemporaryUnavailableError):
+            raise last_exc
+        if isinstance(last_exc, requests.RequestException) and getattr(last_exc, "response", None) is None:
+            raise SamTemporaryUnavailableError("SAM.gov is temporarily unavailable. Try again later.")
+        if last_exc is not None and getattr(last_exc, "response", None) is not None:
+            resp = last_exc.response
+            raise RuntimeError(
+                f"SAM request failed after retries: status={resp.status_code} url={resp.url} body={resp.text[:800]}"
             )
-            last_exc = e
-            if attempt == max_retries - 1:
-                break
-            time.sleep(backoff)
-            backoff = min(backoff * 2, MAX_RATE_LIMIT_WAIT_SECONDS)
-
-    # If we exhausted retries, raise the last exception
-    if isinstance(last_exc, SamTemporaryUnavailableError):
-        raise last_exc
-    if isinstance(last_exc, requests.RequestException) and getattr(last_exc, "response", None) is None:
-        raise SamTemporaryUnavailableError("SAM.gov is temporarily unavailable. Try again later.")
-    if last_exc is not None and getattr(last_exc, "response", None) is not None:
-        resp = last_exc.response
-        raise RuntimeError(
-            f"SAM request failed after retries: status={resp.status_code} url={resp.url} body={resp.text[:800]}"
-        )
-    raise RuntimeError(f"SAM request failed after retries: {repr(last_exc)}")
+        raise RuntimeError(f"SAM request failed after retries: {repr(last_exc)}")
 
 
-def fetch_notice_description(description_url: str) -> str | None:
-    if not _is_url_like(description_url):
-        return None
+_DEFAULT_CLIENT: SamClient | None = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
 
-    api_key = SAM_API_KEY
-    if not api_key:
-        raise RuntimeError("SAM_API_KEY is not set")
-
-    request_url = _with_api_key(description_url, api_key)
-    _throttle_requests()
-    resp = requests.get(request_url, timeout=30)
-    logger.info("SAM notice description status=%s url=%s", resp.status_code, description_url)
-
-    if resp.status_code == 429:
-        retry_after = _extract_retry_after_seconds(resp)
-        retry_after_value = _extract_retry_after_value(resp)
-        raise SamRateLimitError(
-            _rate_limit_message(resp, "SAM rate limited notice description fetch."),
-            retry_after_seconds=retry_after,
-            retry_after=retry_after_value,
-        )
 
-    resp.raise_for_status()
+def get_sam_client() -> SamClient:
+    """Process-wide client, so every caller shares one pool and one rate limit."""
+    global _DEFAULT_CLIENT
+    if _DEFAULT_CLIENT is None:
+        with _DEFAULT_CLIENT_LOCK:
+            if _DEFAULT_CLIENT is None:
+                _DEFAULT_CLIENT = SamClient()
+    return _DEFAULT_CLIENT
 
-    content_type = (resp.headers.get("Content-Type") or "").lower()
-    if "json" in content_type:
-        try:
-            normalized = _normalize_description_payload(resp.json())
-        except ValueError:
-            normalized = None
-        if normalized:
-            return normalized
 
-    normalized = _normalize_description_payload(resp.text)
-    return normalized
+def fetch_sam_page_description(sam_url: str) -> str | None:
+    return get_sam_client().fetch_sam_page_description(sam_url)
+
+
+def resolve_notice_description(description_url: str | None, sam_url: str | None) -> str | None:
+    return get_sam_client().resolve_notice_description(description_url, sam_url)
+
+
+def resolve_notice_descriptions(
+    notices: Sequence[tuple[str | None, str | None]],
+) -> list[tuple[str | None, Exception | None]]:
+    return get_sam_client().resolve_notice_descriptions(notices)
+
+
+def search_opportunities(**kwargs: Any) -> Dict[str, Any]:
+    return get_sam_client().search_opportunities(**kwargs)
+
+
+def fetch_notice_description(description_url: str) -> str | None:
+    return get_sam_client().fetch_notice_description(description_url)
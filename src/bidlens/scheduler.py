@@ -2,24 +2,55 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 import datetime as dt
+from .account_display import run_account_display_backfill
+from .database import SessionLocal
+from .services.ingest_leases import standalone_lease
 from .services.operational_jobs import run_grants_ingest_job, run_sam_ingest_job
 from .services.outlook_sync_jobs import run_outlook_conversation_sync_job
 
 print("[SCHEDULER] scheduler.py imported")
 
+# Every web worker that starts the scheduler fires the same cron triggers;
+# the lease lets exactly one of them run each job.
+SAM_INGEST_JOB_LEASE = "scheduler:sam_ingest"
+GRANTS_INGEST_JOB_LEASE = "scheduler:grants_ingest"
+OUTLOOK_SYNC_JOB_LEASE = "scheduler:outlook_conversation_sync"
+ACCOUNT_DISPLAY_BACKFILL_LEASE = "scheduler:account_display_backfill"
+
+
+def _run_leased(name, job):
+    with standalone_lease(name, session_factory=SessionLocal) as lease:
+        if lease is None:
+            print(f"[SCHEDULER] {name} skipped: another process holds the lease")
+            return None
+        return job()
+
+
 def run_sam_ingest():
     print("[SCHEDULER] run_sam_ingest fired at", dt.datetime.utcnow().isoformat(), "UTC")
-    run_sam_ingest_job()
+    _run_leased(SAM_INGEST_JOB_LEASE, run_sam_ingest_job)
 
 
 def run_grants_ingest():
     print("[SCHEDULER] run_grants_ingest fired at", dt.datetime.utcnow().isoformat(), "UTC")
-    run_grants_ingest_job()
+    _run_leased(GRANTS_INGEST_JOB_LEASE, run_grants_ingest_job)
 
 
 def run_outlook_conversation_sync():
     print("[SCHEDULER] run_outlook_conversation_sync fired at", dt.datetime.now(dt.timezone.utc).isoformat())
-    return run_outlook_conversation_sync_job()
+    return _run_leased(OUTLOOK_SYNC_JOB_LEASE, run_outlook_conversation_sync_job)
+
+
+def run_account_display_backfill_job():
+    # Only rows resolved against another account_aliases.csv revision are
+    # rewritten, so this is a no-op unless the alias file changed.
+    written = _run_leased(
+        ACCOUNT_DISPLAY_BACKFILL_LEASE,
+        lambda: run_account_display_backfill(SessionLocal),
+    )
+    if written:
+        print(f"[SCHEDULER] account display backfill rewrote {written} opportunities")
+    return written
 
 
 def start_scheduler():
@@ -38,6 +69,13 @@ def start_scheduler():
         misfire_grace_time=300,
         replace_existing=True,
     )
+    # No trigger: runs once as soon as the scheduler starts.
+    sched.add_job(
+        run_account_display_backfill_job,
+        id="account-display-backfill",
+        max_instances=1,
+        replace_existing=True,
+    )
 
     sched.start()
     return sched
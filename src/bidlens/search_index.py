@@ -0,0 +1,95 @@
+"""Database-side full-text index for opportunity search.
+
+The index is maintained by the database itself, so every write path (ORM
+upserts, bulk INSERT ... ON CONFLICT, bulk UPDATEs) keeps it current:
+
+* Postgres: ``opportunities.search_vector``, a stored generated ``tsvector``
+  column with a GIN index, plus trigram GIN indexes on the identifier
+  columns so substring lookups of solicitation/notice numbers stay indexed.
+* SQLite: ``opportunities_fts``, an FTS5 external-content table kept in sync
+  by triggers.
+
+The schema is installed by the Alembic migration and, for databases created
+with ``Base.metadata.create_all``, by the listeners registered here.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import DDL, Table, event
+
+
+FTS_TABLE = "opportunities_fts"
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+# Indexed in this order; bm25 weights in services.opportunity_search follow it.
+FTS_COLUMNS = (
+    "title",
+    "agency",
+    "solicitation_number",
+    "sam_notice_id",
+    "source_record_id",
+    "naics",
+    "naics_title",
+    "description",
+    "description_text",
+)
+TRIGRAM_COLUMNS = ("solicitation_number", "sam_notice_id", "source_record_id", "govwin_staging_id")
+
+# Cap the text fed to to_tsvector; a tsvector cannot exceed 1MB.
+_PG_TEXT_LIMIT = 200000
+
+POSTGRES_SEARCH_VECTOR_SQL = f"""
+setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A')
+|| setweight(to_tsvector('english'::regconfig,
+    coalesce(agency, '') || ' ' || coalesce(solicitation_number, '') || ' '
+    || coalesce(sam_notice_id, '') || ' ' || coalesce(source_record_id, '')), 'B')
+|| setweight(to_tsvector('english'::regconfig, coalesce(naics, '') || ' ' || coalesce(naics_title, '')), 'C')
+|| setweight(to_tsvector('english'::regconfig,
+    left(coalesce(nullif(description_text, ''), description, ''), {_PG_TEXT_LIMIT})), 'D')
+"""
+
+
+def postgres_search_statements() -> list[str]:
+    statements = [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        f"ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR_COLUMN} tsvector "
+        f"GENERATED ALWAYS AS ({POSTGRES_SEARCH_VECTOR_SQL}) STORED",
+        f"CREATE INDEX IF NOT EXISTS ix_opportunities_search_vector ON opportunities "
+        f"USING gin ({SEARCH_VECTOR_COLUMN})",
+    ]
+    statements.extend(
+        f"CREATE INDEX IF NOT EXISTS ix_opportunities_{column}_trgm ON opportunities "
+        f"USING gin ({column} gin_trgm_ops)"
+        for column in TRIGRAM_COLUMNS
+    )
+    return statements
+
+
+def sqlite_search_statements() -> list[str]:
+    columns = ", ".join(FTS_COLUMNS)
+    new_values = ", ".join(f"new.{column}" for column in FTS_COLUMNS)
+    old_values = ", ".join(f"old.{column}" for column in FTS_COLUMNS)
+    insert_new = f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_values});"
+    delete_old = (
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5({columns}, "
+        f"content='opportunities', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON opportunities BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON opportunities BEGIN {delete_old} END",
+        # Only text the index covers; last_seen_at bumps do not touch the index.
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE OF {columns} ON opportunities "
+        f"BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+    ]
+
+
+def install_opportunity_search_ddl(table: Table) -> None:
+    """Create the search index alongside ``opportunities`` in ``create_all``."""
+    for statement in postgres_search_statements():
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+    for statement in sqlite_search_statements():
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(table, "before_drop", DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite"))
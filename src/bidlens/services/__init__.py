@@ -1,10 +1,11 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, case
+from sqlalchemy import Row, and_
 from datetime import datetime
 
-from ..models import Opportunity, Vote, User
+from ..models import Opportunity, OpportunityVoteSummary, Vote, User
 from ..state_machine import OppState, validate_transition
 from ..events import log_event
+from ..fragment_cache import fragment_cache
 from .shortlisting import ensure_user_shortlisted, mark_opportunity_shortlisted_once
 
 
@@ -41,6 +42,7 @@ def transition_state(
         opp.archived_by = user_id
 
     db.commit()
+    fragment_cache.invalidate_organization(db, org_id)
 
     payload = {"from": from_state.value, "to": to_state.value}
     if archive_reason:
@@ -114,6 +116,7 @@ def cast_vote(
     db.flush()
 
     db.commit()
+    fragment_cache.invalidate_user(db, organization_id=org_id, user_id=user_id)
 
     effective_vote = None if toggled_off else vote
     log_event(
@@ -183,30 +186,37 @@ def push_opportunity_to_crm(
     return opp
 
 
-def get_vote_counts(db: Session, opp_ids: list[int]) -> dict[int, dict]:
-    """Get pursue/pass counts for a list of opportunity IDs.
+def get_vote_summaries(db: Session, opp_ids: list[int], *, org_id: int | None = None) -> dict[int, Row]:
+    """Get the stored vote rollup for each opportunity that has votes.
 
-    Returns {opp_id: {"pursue": N, "pass": N}}.
+    Reads plain rows rather than ORM objects so a rollup refreshed earlier in
+    the same transaction is never served from the identity map.
     """
     if not opp_ids:
         return {}
 
-    rows = (
-        db.query(
-            Vote.opp_id,
-            func.sum(case((Vote.vote == "PURSUE", 1), else_=0)).label("pursue"),
-            func.sum(case((Vote.vote == "PASS", 1), else_=0)).label("pass_count"),
-        )
-        .filter(Vote.opp_id.in_(opp_ids))
-        .group_by(Vote.opp_id)
-        .all()
-    )
+    query = db.query(
+        OpportunityVoteSummary.opportunity_id,
+        OpportunityVoteSummary.pursue_count,
+        OpportunityVoteSummary.pass_count,
+        OpportunityVoteSummary.last_activity_at,
+        OpportunityVoteSummary.interested_user_ids,
+        OpportunityVoteSummary.passed_user_ids,
+    ).filter(OpportunityVoteSummary.opportunity_id.in_(opp_ids))
+    if org_id is not None:
+        query = query.filter(OpportunityVoteSummary.organization_id == org_id)
+    return {summary.opportunity_id: summary for summary in query.all()}
 
-    result = {}
-    for opp_id, pursue, pass_count in rows:
-        result[opp_id] = {"pursue": pursue or 0, "pass": pass_count or 0}
 
-    return result
+def get_vote_counts(db: Session, opp_ids: list[int]) -> dict[int, dict]:
+    """Get pursue/pass counts for a list of opportunity IDs.
+
+    Returns {opp_id: {"pursue": N, "pass": N}}.
+    """
+    return {
+        opp_id: {"pursue": summary.pursue_count, "pass": summary.pass_count}
+        for opp_id, summary in get_vote_summaries(db, opp_ids).items()
+    }
 
 
 def get_user_votes(db: Session, user_id: int, opp_ids: list[int]) -> dict[int, str]:
@@ -226,6 +236,32 @@ def get_user_votes(db: Session, user_id: int, opp_ids: list[int]) -> dict[int, s
     return {opp_id: vote for opp_id, vote in rows}
 
 
+def _vote_user_name_maps(
+    db: Session,
+    summaries: dict[int, Row],
+) -> tuple[dict[int, list[str]], dict[int, list[str]]]:
+    user_ids = {
+        user_id
+        for summary in summaries.values()
+        for user_id in [*(summary.interested_user_ids or []), *(summary.passed_user_ids or [])]
+    }
+    display_names = {
+        user_id: (name or email or "").strip()
+        for user_id, name, email in (
+            db.query(User.id, User.name, User.email).filter(User.id.in_(user_ids)).all() if user_ids else []
+        )
+    }
+
+    pursue_users: dict[int, list[str]] = {}
+    pass_users: dict[int, list[str]] = {}
+    for opp_id, summary in summaries.items():
+        for target, ids in ((pursue_users, summary.interested_user_ids), (pass_users, summary.passed_user_ids)):
+            names = sorted({display_names[user_id] for user_id in ids or [] if display_names.get(user_id)})
+            if names:
+                target[opp_id] = names
+    return pursue_users, pass_users
+
+
 def get_vote_user_maps(
     db: Session,
     *,
@@ -233,32 +269,26 @@ def get_vote_user_maps(
     opp_ids: list[int],
 ) -> tuple[dict[int, list[str]], dict[int, list[str]]]:
     """Get human-readable user lists for pursue/pass votes by opportunity."""
-    if not opp_ids:
-        return {}, {}
+    return _vote_user_name_maps(db, get_vote_summaries(db, opp_ids, org_id=org_id))
 
-    vote_rows = (
-        db.query(Vote.opp_id, Vote.vote, User.name, User.email)
-        .join(User, User.id == Vote.user_id)
-        .filter(Vote.org_id == org_id, Vote.opp_id.in_(opp_ids))
-        .all()
-    )
 
-    pursue_users: dict[int, list[str]] = {}
-    pass_users: dict[int, list[str]] = {}
-    for opp_id, vote, name, email in vote_rows:
-        display_name = (name or email or "").strip()
-        if not display_name:
-            continue
-        target = pursue_users if vote == "PURSUE" else pass_users if vote == "PASS" else None
-        if target is None:
-            continue
-        target.setdefault(opp_id, []).append(display_name)
-
-    for value_map in (pursue_users, pass_users):
-        for opp_id, users in value_map.items():
-            value_map[opp_id] = sorted(dict.fromkeys(users))
+def get_vote_overview(
+    db: Session,
+    *,
+    org_id: int,
+    opp_ids: list[int],
+) -> tuple[dict[int, dict], dict[int, list[str]], dict[int, list[str]]]:
+    """Get counts and pursue/pass user lists from one read of the rollup.
 
-    return pursue_users, pass_users
+    Returns (counts, pursue_users, pass_users) shaped like ``get_vote_counts``
+    and ``get_vote_user_maps``.
+    """
+    summaries = get_vote_summaries(db, opp_ids, org_id=org_id)
+    counts = {
+        opp_id: {"pursue": summary.pursue_count, "pass": summary.pass_count}
+        for opp_id, summary in summaries.items()
+    }
+    return (counts, *_vote_user_name_maps(db, summaries))
 
 
 def get_last_activity(db: Session, opp_ids: list[int]) -> dict[int, "datetime"]:
@@ -266,14 +296,8 @@ def get_last_activity(db: Session, opp_ids: list[int]) -> dict[int, "datetime"]:
 
     Returns {opp_id: datetime}.
     """
-    if not opp_ids:
-        return {}
-
-    rows = (
-        db.query(Vote.opp_id, func.max(Vote.updated_at).label("last_at"))
-        .filter(Vote.opp_id.in_(opp_ids))
-        .group_by(Vote.opp_id)
-        .all()
-    )
-
-    return {opp_id: last_at for opp_id, last_at in rows if last_at}
+    return {
+        opp_id: summary.last_activity_at
+        for opp_id, summary in get_vote_summaries(db, opp_ids).items()
+        if summary.last_activity_at
+    }
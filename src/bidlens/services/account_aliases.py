@@ -4,6 +4,8 @@ from collections.abc import Iterable, Mapping
 import csv
 from dataclasses import dataclass
 from functools import lru_cache
+import hashlib
+import io
 import logging
 from pathlib import Path
 import re
@@ -21,6 +23,7 @@ _PLAIN_US = re.compile(r"(?<![\w])us(?![\w])", re.IGNORECASE)
 _WHITESPACE = re.compile(r"\s+")
 DEFAULT_ACCOUNT_ALIAS_FILE = Path(__file__).resolve().parents[1] / "data" / "account_aliases.csv"
 REQUIRED_ALIAS_COLUMNS = frozenset({"Alias", "Display"})
+ACCOUNT_DISPLAY_MEMO_SIZE = 8192
 logger = logging.getLogger(__name__)
 
 
@@ -38,6 +41,22 @@ class AccountAlias:
     display_name: str
 
 
+@dataclass(frozen=True)
+class AccountDisplay:
+    """Resolved account name plus the presentation parts derived from it."""
+
+    display: str
+    parent: str | None
+    sub_agency: str | None
+
+
+@dataclass(frozen=True)
+class _AccountAliasSource:
+    lookup: Mapping[str, str]
+    revision: str
+
+
+@lru_cache(maxsize=ACCOUNT_DISPLAY_MEMO_SIZE)
 def normalize_account_lookup_key(value: str | None) -> str:
     """Return a formatting-insensitive key for exact alias lookup.
 
@@ -101,18 +120,22 @@ def configured_account_alias_file() -> Path:
 
 
 @lru_cache(maxsize=4)
-def _load_account_alias_lookup(path_value: str) -> Mapping[str, str]:
+def _resolved_alias_path(path: Path) -> str:
+    return str(path.resolve())
+
+
+@lru_cache(maxsize=4)
+def _load_account_alias_lookup(path_value: str) -> _AccountAliasSource:
     path = Path(path_value)
     try:
-        with path.open("r", encoding="utf-8-sig", newline="") as source:
-            reader = csv.DictReader(source)
-            columns = set(reader.fieldnames or [])
-            if not REQUIRED_ALIAS_COLUMNS.issubset(columns):
-                raise AccountAliasConfigurationError(
-                    "Account alias data must contain Alias and Display columns."
-                )
-            rows = list(reader)
-        lookup = build_account_alias_lookup(rows)
+        content = path.read_bytes()
+        reader = csv.DictReader(io.StringIO(content.decode("utf-8-sig"), newline=""))
+        columns = set(reader.fieldnames or [])
+        if not REQUIRED_ALIAS_COLUMNS.issubset(columns):
+            raise AccountAliasConfigurationError(
+                "Account alias data must contain Alias and Display columns."
+            )
+        lookup = build_account_alias_lookup(list(reader))
     except (OSError, UnicodeError, csv.Error, AccountAliasConflictError, AccountAliasConfigurationError) as exc:
         logger.error(
             "account_alias_configuration_failed file=%s error_type=%s",
@@ -122,19 +145,66 @@ def _load_account_alias_lookup(path_value: str) -> Mapping[str, str]:
         if isinstance(exc, AccountAliasConfigurationError):
             raise
         raise AccountAliasConfigurationError("Account alias data could not be loaded safely.") from exc
-    return MappingProxyType(lookup)
+    return _AccountAliasSource(
+        lookup=MappingProxyType(lookup),
+        revision=hashlib.sha256(content).hexdigest()[:16],
+    )
+
+
+def _account_alias_source() -> _AccountAliasSource:
+    return _load_account_alias_lookup(_resolved_alias_path(configured_account_alias_file()))
 
 
 def get_account_alias_lookup() -> Mapping[str, str]:
     """Return the process-cached semantic alias lookup."""
 
-    return _load_account_alias_lookup(str(configured_account_alias_file().resolve()))
+    return _account_alias_source().lookup
+
+
+def account_alias_revision() -> str:
+    """Return a content hash of the alias data the process-cached lookup was built from."""
+
+    return _account_alias_source().revision
 
 
 def clear_account_alias_cache() -> None:
     """Clear cached configuration for tests or an explicit configuration revision."""
 
+    _resolved_alias_path.cache_clear()
     _load_account_alias_lookup.cache_clear()
+    _memoized_account_display.cache_clear()
+
+
+@lru_cache(maxsize=ACCOUNT_DISPLAY_MEMO_SIZE)
+def _memoized_account_display(revision: str, raw_account: str) -> AccountDisplay:
+    # ``revision`` is part of the key so a reloaded alias file never serves
+    # names resolved against the previous one.
+    display = match_account_alias(raw_account, get_account_alias_lookup()) or agency_presentation(raw_account).display
+    agency = agency_presentation(display)
+    return AccountDisplay(display=display, parent=agency.parent, sub_agency=agency.sub_agency)
+
+
+def account_display_parts(raw_account: str | None) -> AccountDisplay:
+    """Resolve a source account once per alias revision and raw value."""
+
+    return _memoized_account_display(account_alias_revision(), str(raw_account or ""))
+
+
+def opportunity_account_display(opportunity) -> AccountDisplay:
+    """Return the display parts persisted on an opportunity when still current.
+
+    Rows written before the current alias revision (or objects that are not
+    persisted opportunities) fall back to the memoized resolver.
+    """
+
+    display = getattr(opportunity, "account_display", None)
+    if display and getattr(opportunity, "account_display_revision", None) == account_alias_revision():
+        return AccountDisplay(
+            display=display,
+            parent=getattr(opportunity, "parent_agency", None),
+            sub_agency=getattr(opportunity, "sub_agency", None),
+        )
+    return account_display_parts(getattr(opportunity, "agency", None))
 
 
 def resolve_account_display_name(
@@ -144,6 +214,7 @@ def resolve_account_display_name(
 ) -> str:
     """Resolve semantic aliases first, then use legacy presentation cleanup."""
 
-    lookup = alias_lookup if alias_lookup is not None else get_account_alias_lookup()
-    resolved = match_account_alias(raw_account, lookup)
+    if alias_lookup is None:
+        return account_display_parts(raw_account).display
+    resolved = match_account_alias(raw_account, alias_lookup)
     return resolved or agency_presentation(raw_account).display
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 
 
@@ -58,6 +59,7 @@ def _display_case(value: str | None) -> str:
     )
 
 
+@lru_cache(maxsize=8192)
 def agency_presentation(raw_agency: str | None) -> AgencyPresentation:
     """Return consistent display parts for a source-provided agency value.
 
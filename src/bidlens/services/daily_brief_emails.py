@@ -1,18 +1,20 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from dataclasses import dataclass
 import datetime as dt
 from html import escape
 import re
-from typing import Any
+from typing import Any, Sequence
 from urllib.parse import urlencode
 
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 
 from ..config import BIDLENS_APP_BASE_URL
-from ..models import DailySnapshot, Opportunity, OpportunityPursuitLaneMatch, PursuitLane, Workspace
+from ..models import DailySnapshot, OpportunityPursuitLaneMatch, PursuitLane, Workspace
 from .email_delivery import EmailMessage
-from .feed_queries import feed_awaiting_review_query
+from .feed_queries import feed_awaiting_review_by_user_query
 
 
 MAX_EMAIL_SHORTLIST_ACTIVITY = 5
@@ -42,84 +44,78 @@ def _first_name(name: str | None, email: str) -> str:
     return label.split()[0] if label else "there"
 
 
-def _snapshot_for_user(
-    db: Session,
-    *,
-    workspace_id: int,
-    user_id: int,
-    snapshot_date: dt.date,
-) -> DailySnapshot | None:
-    return (
-        db.query(DailySnapshot)
-        .filter(
-            DailySnapshot.workspace_id == workspace_id,
-            DailySnapshot.user_id == user_id,
-            DailySnapshot.snapshot_date == snapshot_date,
+def _primary_lane_subquery(db: Session, *, organization_id: int):
+    """Each lane-matched opportunity's first active lane by name, as one row."""
+    ranked = (
+        db.query(
+            OpportunityPursuitLaneMatch.opportunity_id.label("opportunity_id"),
+            PursuitLane.id.label("lane_id"),
+            PursuitLane.name.label("lane_name"),
+            func.row_number()
+            .over(
+                partition_by=OpportunityPursuitLaneMatch.opportunity_id,
+                order_by=(PursuitLane.name.asc(), PursuitLane.id.asc()),
+            )
+            .label("lane_rank"),
+        )
+        .join(
+            PursuitLane,
+            and_(
+                PursuitLane.id == OpportunityPursuitLaneMatch.pursuit_lane_id,
+                PursuitLane.organization_id == organization_id,
+                PursuitLane.is_active.is_(True),
+            ),
         )
-        .first()
+        .filter(OpportunityPursuitLaneMatch.organization_id == organization_id)
+        .subquery()
+    )
+    return (
+        select(ranked.c.opportunity_id, ranked.c.lane_id, ranked.c.lane_name)
+        .where(ranked.c.lane_rank == 1)
+        .subquery()
     )
 
 
-def _current_feed_summary(
+def current_feed_summaries(
     db: Session,
     *,
     organization_id: int,
-    user_id: int,
-) -> tuple[int, list[dict[str, Any]]]:
-    feed_query = feed_awaiting_review_query(
+    user_ids: Sequence[int],
+) -> dict[int, tuple[int, list[dict[str, Any]]]]:
+    """Feed size and primary-lane breakdown for each user, from one grouped query."""
+    user_ids = list(user_ids)
+    summaries: dict[int, tuple[int, list[dict[str, Any]]]] = {user_id: (0, []) for user_id in user_ids}
+    if not user_ids:
+        return summaries
+
+    feed = feed_awaiting_review_by_user_query(
         db,
         organization_id=organization_id,
-        user_id=user_id,
-        include_watched=False,
-    )
-    feed_count = int(feed_query.with_entities(func.count(Opportunity.id)).scalar() or 0)
-    if not feed_count:
-        return 0, []
-
-    feed_rows = (
-        feed_query
-        .with_entities(Opportunity.id)
-        .order_by(Opportunity.response_deadline.asc(), Opportunity.id.asc())
+        user_ids=user_ids,
+    ).subquery()
+    primary_lane = _primary_lane_subquery(db, organization_id=organization_id)
+    rows = (
+        db.query(feed.c.user_id, primary_lane.c.lane_id, primary_lane.c.lane_name, func.count(feed.c.opportunity_id))
+        .select_from(feed)
+        .outerjoin(primary_lane, primary_lane.c.opportunity_id == feed.c.opportunity_id)
+        .group_by(feed.c.user_id, primary_lane.c.lane_id, primary_lane.c.lane_name)
         .all()
     )
-    feed_ids = [int(row.id) for row in feed_rows]
-    lane_rows = (
-        db.query(OpportunityPursuitLaneMatch.opportunity_id, PursuitLane.id, PursuitLane.name)
-        .join(
-            PursuitLane,
-            and_(
-                PursuitLane.id == OpportunityPursuitLaneMatch.pursuit_lane_id,
-                PursuitLane.organization_id == organization_id,
-                PursuitLane.is_active.is_(True),
-            ),
-        )
-        .filter(
-            OpportunityPursuitLaneMatch.organization_id == organization_id,
-            OpportunityPursuitLaneMatch.opportunity_id.in_(feed_ids),
-        )
-        .order_by(
-            OpportunityPursuitLaneMatch.opportunity_id.asc(),
-            PursuitLane.name.asc(),
-            PursuitLane.id.asc(),
+    lanes_by_user: dict[int, list[dict[str, Any]]] = defaultdict(list)
+    for user_id, lane_id, lane_name, count in rows:
+        if not count:
+            continue
+        lanes_by_user[int(user_id)].append(
+            {
+                "id": int(lane_id) if lane_id is not None else None,
+                "name": str(lane_name) if lane_id is not None else "Unassigned",
+                "count": int(count),
+            }
         )
-        .all()
-    )
-    primary_lane_by_opp: dict[int, tuple[int, str]] = {}
-    for opportunity_id, lane_id, lane_name in lane_rows:
-        primary_lane_by_opp.setdefault(int(opportunity_id), (int(lane_id), str(lane_name)))
-
-    counts: dict[tuple[int | None, str], int] = {}
-    for opportunity_id in feed_ids:
-        bucket = primary_lane_by_opp.get(opportunity_id) or (None, "Unassigned")
-        counts[bucket] = counts.get(bucket, 0) + 1
-
-    lanes = [
-        {"id": lane_id, "name": lane_name, "count": count}
-        for (lane_id, lane_name), count in counts.items()
-        if count > 0
-    ]
-    lanes.sort(key=lambda item: (-int(item["count"]), str(item["name"])))
-    return feed_count, lanes
+    for user_id, lanes in lanes_by_user.items():
+        lanes.sort(key=lambda item: (-int(item["count"]), str(item["name"]), item["id"] is None, item["id"] or 0))
+        summaries[user_id] = (sum(int(item["count"]) for item in lanes), lanes)
+    return summaries
 
 
 def _shortlist_activity_from_snapshot(payload: dict[str, Any]) -> list[dict[str, Any]]:
@@ -171,6 +167,13 @@ def _activity_destination(item: dict[str, Any], *, organization_id: int, app_bas
     )
 
 
+@dataclass(frozen=True)
+class DailyBriefRecipient:
+    user_id: int
+    name: str | None
+    email: str
+
+
 def build_daily_brief_email_message(
     db: Session,
     *,
@@ -181,21 +184,73 @@ def build_daily_brief_email_message(
     snapshot_date: dt.date,
     app_base_url: str | None = None,
 ) -> tuple[EmailMessage | None, int, str | None]:
-    snapshot = _snapshot_for_user(
+    return build_daily_brief_email_messages(
         db,
-        workspace_id=workspace.id,
-        user_id=user_id,
+        workspace=workspace,
+        recipients=[DailyBriefRecipient(user_id=user_id, name=user_name, email=user_email)],
         snapshot_date=snapshot_date,
-    )
-    if not snapshot:
-        return None, 0, "No current-day Daily Snapshot exists."
+        app_base_url=app_base_url,
+    )[user_id]
+
 
-    payload = snapshot.snapshot_json or {}
-    feed_count, lane_breakdown = _current_feed_summary(
+def build_daily_brief_email_messages(
+    db: Session,
+    *,
+    workspace: Workspace,
+    recipients: Sequence[DailyBriefRecipient],
+    snapshot_date: dt.date,
+    app_base_url: str | None = None,
+) -> dict[int, tuple[EmailMessage | None, int, str | None]]:
+    """Render the Daily Brief for every recipient of a workspace.
+
+    Snapshots are read in one query and the Feed summaries in one grouped
+    query, whatever the number of recipients.
+    """
+    user_ids = [recipient.user_id for recipient in recipients]
+    snapshots = {
+        snapshot.user_id: snapshot
+        for snapshot in db.query(DailySnapshot).filter(
+            DailySnapshot.workspace_id == workspace.id,
+            DailySnapshot.user_id.in_(user_ids),
+            DailySnapshot.snapshot_date == snapshot_date,
+        )
+    } if user_ids else {}
+    feed_summaries = current_feed_summaries(
         db,
         organization_id=workspace.organization_id,
-        user_id=user_id,
+        user_ids=[user_id for user_id in user_ids if user_id in snapshots],
     )
+    rendered = {}
+    for recipient in recipients:
+        snapshot = snapshots.get(recipient.user_id)
+        if not snapshot:
+            rendered[recipient.user_id] = (None, 0, "No current-day Daily Snapshot exists.")
+            continue
+        feed_count, lane_breakdown = feed_summaries[recipient.user_id]
+        rendered[recipient.user_id] = _render_daily_brief_email(
+            workspace=workspace,
+            payload=snapshot.snapshot_json or {},
+            feed_count=feed_count,
+            lane_breakdown=lane_breakdown,
+            user_name=recipient.name,
+            user_email=recipient.email,
+            snapshot_date=snapshot_date,
+            app_base_url=app_base_url,
+        )
+    return rendered
+
+
+def _render_daily_brief_email(
+    *,
+    workspace: Workspace,
+    payload: dict[str, Any],
+    feed_count: int,
+    lane_breakdown: list[dict[str, Any]],
+    user_name: str | None,
+    user_email: str,
+    snapshot_date: dt.date,
+    app_base_url: str | None = None,
+) -> tuple[EmailMessage | None, int, str | None]:
     shortlist_activity = _shortlist_activity_from_snapshot(payload)
     first_name = _first_name(user_name, user_email)
     subject = f"{first_name}'s BidLens Daily Brief"
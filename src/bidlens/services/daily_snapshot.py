@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from dataclasses import dataclass
 import datetime as dt
-from typing import Any
+from itertools import islice
+from typing import Any, Callable, Iterable
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
@@ -17,7 +20,7 @@ from ..models import (
     Vote,
     Workspace,
 )
-from .pursuit_lanes import user_my_lanes
+from .pursuit_lanes import users_my_lanes
 
 
 SNAPSHOT_VERSION = "daily_snapshot_v1"
@@ -74,13 +77,54 @@ def _opportunity_payload(opportunity: Opportunity) -> dict[str, Any]:
     }
 
 
-def _event_user_payload(db: Session, user_id: int | None) -> dict[str, Any] | None:
+@dataclass(frozen=True)
+class OrganizationSnapshotSections:
+    """Snapshot sections that are identical for every user of a workspace on one day.
+
+    ``build_organization_sections`` computes them once; ``build_user_snapshot_payloads``
+    overlays the vote, lane and event sections for a batch of users on top.
+    """
+
+    workspace: dict[str, Any]
+    organization_id: int
+    snapshot_date: dt.date
+    activity_day: dt.date
+    start_at: dt.datetime
+    end_before: dt.datetime
+    new_opportunities: list[dict[str, Any]]
+    updated_opportunities: list[dict[str, Any]]
+    upcoming_deadlines: list[dict[str, Any]]
+    connector_issues: list[dict[str, Any]]
+    new_feed_candidates: list[dict[str, Any]]
+
+
+def _user_payloads(db: Session, user_ids: Iterable[int | None]) -> dict[int, dict[str, Any]]:
+    ids = {user_id for user_id in user_ids if user_id}
+    if not ids:
+        return {}
+    return {
+        user.id: {"id": user.id, "name": user.name, "email": user.email}
+        for user in db.query(User).filter(User.id.in_(ids)).all()
+    }
+
+
+def _event_user_payload(users: dict[int, dict[str, Any]], user_id: int | None) -> dict[str, Any] | None:
     if not user_id:
         return None
-    user = db.query(User).filter(User.id == user_id).first()
+    user = users.get(user_id)
     if not user:
         return {"id": user_id, "name": None, "email": None}
-    return {"id": user.id, "name": user.name, "email": user.email}
+    return dict(user)
+
+
+def _rows_by_user(rows: Iterable[Any], *, user_id: Callable[[Any], int], limit: int) -> dict[int, list[Any]]:
+    """Group ordered rows by user, keeping each user's first ``limit`` rows."""
+    grouped: dict[int, list[Any]] = defaultdict(list)
+    for row in rows:
+        user_rows = grouped[user_id(row)]
+        if len(user_rows) < limit:
+            user_rows.append(row)
+    return grouped
 
 
 def _new_opportunities(
@@ -141,35 +185,32 @@ def _new_opportunity_count(
     )
 
 
-def _new_feed_opportunities(
+def _new_feed_filters(
+    *,
+    organization_id: int,
+    start_at: dt.datetime,
+    end_before: dt.datetime,
+) -> tuple[Any, ...]:
+    return (
+        Opportunity.organization_id == organization_id,
+        Opportunity.created_at >= start_at,
+        Opportunity.created_at < end_before,
+        Opportunity.decision_state != "ARCHIVED",
+        Opportunity.qualification_status == "qualified",
+    )
+
+
+def _new_feed_candidates(
     db: Session,
     *,
     organization_id: int,
-    user_id: int,
     start_at: dt.datetime,
     end_before: dt.datetime,
-    limit: int = 20,
 ) -> list[dict[str, Any]]:
-    acted_opp_ids = (
-        db.query(Vote.opp_id)
-        .filter(
-            Vote.org_id == organization_id,
-            Vote.user_id == user_id,
-            Vote.vote.in_(("PURSUE", "PASS")),
-        )
-    )
     rows = (
         db.query(Opportunity)
-        .filter(
-            Opportunity.organization_id == organization_id,
-            Opportunity.created_at >= start_at,
-            Opportunity.created_at < end_before,
-            Opportunity.decision_state != "ARCHIVED",
-            Opportunity.qualification_status == "qualified",
-            ~Opportunity.id.in_(acted_opp_ids),
-        )
+        .filter(*_new_feed_filters(organization_id=organization_id, start_at=start_at, end_before=end_before))
         .order_by(Opportunity.created_at.asc(), Opportunity.id.asc())
-        .limit(limit)
         .all()
     )
     return [
@@ -181,6 +222,42 @@ def _new_feed_opportunities(
     ]
 
 
+def _acted_new_feed_ids(
+    db: Session,
+    *,
+    organization_id: int,
+    user_ids: list[int],
+    start_at: dt.datetime,
+    end_before: dt.datetime,
+) -> dict[int, set[int]]:
+    window_opp_ids = db.query(Opportunity.id).filter(
+        *_new_feed_filters(organization_id=organization_id, start_at=start_at, end_before=end_before)
+    )
+    rows = (
+        db.query(Vote.user_id, Vote.opp_id)
+        .filter(
+            Vote.org_id == organization_id,
+            Vote.user_id.in_(user_ids),
+            Vote.vote.in_(("PURSUE", "PASS")),
+            Vote.opp_id.in_(window_opp_ids),
+        )
+        .all()
+    )
+    acted: dict[int, set[int]] = defaultdict(set)
+    for user_id, opp_id in rows:
+        acted[user_id].add(opp_id)
+    return acted
+
+
+def _new_feed_opportunities(
+    candidates: list[dict[str, Any]],
+    acted_opp_ids: set[int],
+    *,
+    limit: int = 20,
+) -> list[dict[str, Any]]:
+    return [candidate for candidate in candidates if candidate["id"] not in acted_opp_ids][:limit]
+
+
 def _updated_opportunities(
     db: Session,
     *,
@@ -253,17 +330,17 @@ def _shortlist_updates(
     db: Session,
     *,
     organization_id: int,
-    user_id: int,
+    user_ids: list[int],
     start_at: dt.datetime,
     end_before: dt.datetime,
-) -> list[dict[str, Any]]:
+) -> dict[int, list[dict[str, Any]]]:
     rows = (
-        db.query(OpportunityUpdateEvent, Opportunity)
+        db.query(OpportunityUpdateEvent, Opportunity, Vote.user_id)
         .join(Opportunity, Opportunity.id == OpportunityUpdateEvent.opportunity_id)
         .join(
             Vote,
             (Vote.org_id == organization_id)
-            & (Vote.user_id == user_id)
+            & (Vote.user_id.in_(user_ids))
             & (Vote.opp_id == Opportunity.id)
             & (Vote.vote == "PURSUE"),
         )
@@ -276,49 +353,57 @@ def _shortlist_updates(
             Opportunity.qualification_status == "qualified",
         )
         .order_by(OpportunityUpdateEvent.detected_at.asc(), OpportunityUpdateEvent.id.asc())
-        .limit(100)
         .all()
     )
-    updates = _deduped_update_payloads(rows, limit=10)
-    return [
-        {
-            "title": item["opportunity"]["title"],
-            "subtitle": _changed_field_label(item["changed_fields"]),
-            "destination_url": f"/opportunity/{item['opportunity']['id']}",
-            "event_id": item["event_id"],
-            "event_ids": item["event_ids"],
-            "detected_at": item["detected_at"],
-            "changed_fields": item["changed_fields"],
-            "update_count": item["update_count"],
-            "opportunity": item["opportunity"],
-        }
-        for item in updates
-    ]
+    updates_by_user = {}
+    for user_id, user_rows in _rows_by_user(rows, user_id=lambda row: row[2], limit=100).items():
+        updates = _deduped_update_payloads([(event, opportunity) for event, opportunity, _ in user_rows], limit=10)
+        updates_by_user[user_id] = [
+            {
+                "title": item["opportunity"]["title"],
+                "subtitle": _changed_field_label(item["changed_fields"]),
+                "destination_url": f"/opportunity/{item['opportunity']['id']}",
+                "event_id": item["event_id"],
+                "event_ids": item["event_ids"],
+                "detected_at": item["detected_at"],
+                "changed_fields": item["changed_fields"],
+                "update_count": item["update_count"],
+                "opportunity": item["opportunity"],
+            }
+            for item in updates
+        ]
+    return updates_by_user
 
 
-def _shortlist_changes(
+def _shortlist_change_rows(
     db: Session,
     *,
     organization_id: int,
-    user_id: int,
+    user_ids: list[int],
     start_at: dt.datetime,
     end_before: dt.datetime,
-) -> list[dict[str, Any]]:
+) -> dict[int, list[tuple[Event, Opportunity]]]:
     rows = (
         db.query(Event, Opportunity)
         .join(Opportunity, Opportunity.id == Event.opp_id)
         .filter(
             Event.org_id == organization_id,
-            Event.user_id == user_id,
+            Event.user_id.in_(user_ids),
             Event.event_type == "vote_cast",
             Event.ts >= start_at,
             Event.ts < end_before,
             Opportunity.organization_id == organization_id,
         )
         .order_by(Event.ts.asc(), Event.id.asc())
-        .limit(50)
         .all()
     )
+    return _rows_by_user(rows, user_id=lambda row: row[0].user_id, limit=50)
+
+
+def _shortlist_changes(
+    rows: list[tuple[Event, Opportunity]],
+    users: dict[int, dict[str, Any]],
+) -> list[dict[str, Any]]:
     changes = []
     for event, opportunity in rows:
         payload = event.payload or {}
@@ -347,7 +432,7 @@ def _shortlist_changes(
                 "vote": effective_vote,
                 "requested_vote": requested_vote,
                 "toggled_off": toggled_off,
-                "user": _event_user_payload(db, event.user_id),
+                "user": _event_user_payload(users, event.user_id),
                 "opportunity": _opportunity_payload(opportunity),
             }
         )
@@ -389,17 +474,17 @@ def _shortlist_deadlines(
     db: Session,
     *,
     organization_id: int,
-    user_id: int,
+    user_ids: list[int],
     snapshot_date: dt.date,
     days: int = DEFAULT_DEADLINE_WINDOW_DAYS,
-) -> list[dict[str, Any]]:
+) -> dict[int, list[dict[str, Any]]]:
     end_date = snapshot_date + dt.timedelta(days=days)
     rows = (
-        db.query(Opportunity)
+        db.query(Opportunity, Vote.user_id)
         .join(
             Vote,
             (Vote.org_id == organization_id)
-            & (Vote.user_id == user_id)
+            & (Vote.user_id.in_(user_ids))
             & (Vote.opp_id == Opportunity.id)
             & (Vote.vote == "PURSUE"),
         )
@@ -411,52 +496,53 @@ def _shortlist_deadlines(
             Opportunity.response_deadline <= end_date,
         )
         .order_by(Opportunity.response_deadline.asc(), Opportunity.id.asc())
-        .limit(10)
         .all()
     )
-    deadlines = []
-    for opportunity in rows:
-        days_until = (
-            (opportunity.response_deadline - snapshot_date).days
-            if opportunity.response_deadline
-            else None
-        )
-        if days_until is None:
-            subtitle = "Deadline needs review"
-        elif days_until < 0:
-            subtitle = f"Overdue by {abs(days_until)} day{'s' if abs(days_until) != 1 else ''}"
-        elif days_until == 0:
-            subtitle = "Due today"
-        elif days_until == 1:
-            subtitle = "Due tomorrow"
-        else:
-            subtitle = f"Due in {days_until} days"
-        deadlines.append(
-            {
-                "title": opportunity.title,
-                "subtitle": subtitle,
-                "destination_url": f"/opportunity/{opportunity.id}",
-                "days_until_deadline": days_until,
-                "opportunity": _opportunity_payload(opportunity),
-            }
-        )
-    return deadlines
+    deadlines_by_user: dict[int, list[dict[str, Any]]] = {}
+    for user_id, user_rows in _rows_by_user(rows, user_id=lambda row: row[1], limit=10).items():
+        deadlines = []
+        for opportunity, _ in user_rows:
+            days_until = (
+                (opportunity.response_deadline - snapshot_date).days
+                if opportunity.response_deadline
+                else None
+            )
+            if days_until is None:
+                subtitle = "Deadline needs review"
+            elif days_until < 0:
+                subtitle = f"Overdue by {abs(days_until)} day{'s' if abs(days_until) != 1 else ''}"
+            elif days_until == 0:
+                subtitle = "Due today"
+            elif days_until == 1:
+                subtitle = "Due tomorrow"
+            else:
+                subtitle = f"Due in {days_until} days"
+            deadlines.append(
+                {
+                    "title": opportunity.title,
+                    "subtitle": subtitle,
+                    "destination_url": f"/opportunity/{opportunity.id}",
+                    "days_until_deadline": days_until,
+                    "opportunity": _opportunity_payload(opportunity),
+                }
+            )
+        deadlines_by_user[user_id] = deadlines
+    return deadlines_by_user
 
 
-def _interested_activity(
+def _interested_activity_rows(
     db: Session,
     *,
     organization_id: int,
-    user_id: int,
     start_at: dt.datetime,
     end_before: dt.datetime,
-) -> list[dict[str, Any]]:
-    rows = (
+) -> list[tuple[Event, Opportunity]]:
+    return (
         db.query(Event, Opportunity)
         .join(Opportunity, Opportunity.id == Event.opp_id)
         .filter(
             Event.org_id == organization_id,
-            Event.user_id != user_id,
+            Event.user_id.is_not(None),
             Event.event_type == "vote_cast",
             Event.ts >= start_at,
             Event.ts < end_before,
@@ -464,12 +550,20 @@ def _interested_activity(
             Opportunity.decision_state != "ARCHIVED",
         )
         .order_by(Event.ts.asc(), Event.id.asc())
-        .limit(50)
         .all()
     )
+
+
+def _interested_activity(
+    rows: list[tuple[Event, Opportunity]],
+    users: dict[int, dict[str, Any]],
+    *,
+    user_id: int,
+) -> list[dict[str, Any]]:
     activity = []
     seen: set[tuple[int | None, int]] = set()
-    for event, opportunity in rows:
+    others_rows = (row for row in rows if row[0].user_id != user_id)
+    for event, opportunity in islice(others_rows, 50):
         payload = event.payload or {}
         if payload.get("vote") != "PURSUE" or payload.get("toggled_off"):
             continue
@@ -483,27 +577,27 @@ def _interested_activity(
                 "occurred_at": _iso_datetime(event.ts),
                 "vote": payload.get("vote"),
                 "toggled_off": bool(payload.get("toggled_off")),
-                "user": _event_user_payload(db, event.user_id),
+                "user": _event_user_payload(users, event.user_id),
                 "opportunity": _opportunity_payload(opportunity),
             }
         )
     return activity
 
 
-def _my_shortlist(
+def _my_shortlists(
     db: Session,
     *,
     organization_id: int,
-    user_id: int,
+    user_ids: list[int],
     start_at: dt.datetime,
     end_before: dt.datetime,
-) -> list[dict[str, Any]]:
+) -> dict[int, list[dict[str, Any]]]:
     rows = (
         db.query(Vote, Opportunity)
         .join(Opportunity, Opportunity.id == Vote.opp_id)
         .filter(
             Vote.org_id == organization_id,
-            Vote.user_id == user_id,
+            Vote.user_id.in_(user_ids),
             Vote.vote == "PURSUE",
             Vote.updated_at >= start_at,
             Vote.updated_at < end_before,
@@ -512,42 +606,44 @@ def _my_shortlist(
             Opportunity.qualification_status == "qualified",
         )
         .order_by(Vote.updated_at.asc(), Vote.id.asc())
-        .limit(50)
         .all()
     )
-    return [
-        {
-            "title": opportunity.title,
-            "subtitle": "Added to My Shortlist",
-            "destination_url": f"/opportunity/{opportunity.id}",
-            "occurred_at": _iso_datetime(vote.updated_at),
-            "opportunity": _opportunity_payload(opportunity),
-        }
-        for vote, opportunity in rows
-    ]
+    return {
+        user_id: [
+            {
+                "title": opportunity.title,
+                "subtitle": "Added to My Shortlist",
+                "destination_url": f"/opportunity/{opportunity.id}",
+                "occurred_at": _iso_datetime(vote.updated_at),
+                "opportunity": _opportunity_payload(opportunity),
+            }
+            for vote, opportunity in user_rows
+        ]
+        for user_id, user_rows in _rows_by_user(rows, user_id=lambda row: row[0].user_id, limit=50).items()
+    }
 
 
-def _team_signals(
+def _team_signal_rows(
     db: Session,
     *,
     organization_id: int,
-    user_id: int,
+    user_ids: list[int],
     start_at: dt.datetime,
     end_before: dt.datetime,
-) -> list[dict[str, Any]]:
+) -> dict[int, list[tuple[Event, Opportunity, int]]]:
     rows = (
-        db.query(Event, Opportunity)
+        db.query(Event, Opportunity, Vote.user_id)
         .join(Opportunity, Opportunity.id == Event.opp_id)
         .join(
             Vote,
             (Vote.org_id == organization_id)
-            & (Vote.user_id == user_id)
+            & (Vote.user_id.in_(user_ids))
             & (Vote.opp_id == Opportunity.id)
             & (Vote.vote == "PURSUE"),
         )
         .filter(
             Event.org_id == organization_id,
-            Event.user_id != user_id,
+            Event.user_id != Vote.user_id,
             Event.event_type == "vote_cast",
             Event.ts >= start_at,
             Event.ts < end_before,
@@ -555,15 +651,21 @@ def _team_signals(
             Opportunity.decision_state != "ARCHIVED",
         )
         .order_by(Event.ts.asc(), Event.id.asc())
-        .limit(50)
         .all()
     )
+    return _rows_by_user(rows, user_id=lambda row: row[2], limit=50)
+
+
+def _team_signals(
+    rows: list[tuple[Event, Opportunity, int]],
+    users: dict[int, dict[str, Any]],
+) -> list[dict[str, Any]]:
     signals = []
-    for event, opportunity in rows:
+    for event, opportunity, _ in rows:
         payload = event.payload or {}
         if payload.get("vote") != "PURSUE" or payload.get("toggled_off"):
             continue
-        actor = _event_user_payload(db, event.user_id) or {}
+        actor = _event_user_payload(users, event.user_id) or {}
         actor_label = actor.get("name") or actor.get("email") or "A teammate"
         action = "removed interest" if payload.get("toggled_off") else "showed interest"
         signals.append(
@@ -618,204 +720,220 @@ def _connector_issues(
     return issue_rows
 
 
-def _my_lane_context(
+def _my_lane_contexts(
     db: Session,
     *,
     organization_id: int,
-    user_id: int,
+    user_ids: list[int],
     start_at: dt.datetime,
     end_before: dt.datetime,
     snapshot_date: dt.date,
-) -> list[dict[str, Any]]:
-    lanes = user_my_lanes(db, organization_id=organization_id, user_id=user_id)
-    if not lanes:
-        return []
+) -> dict[int, list[dict[str, Any]]]:
+    lanes_by_user = users_my_lanes(db, organization_id=organization_id, user_ids=user_ids)
+    lane_ids = sorted({lane.id for lanes in lanes_by_user.values() for lane in lanes})
+    if not lane_ids:
+        return {}
 
+    lane_id = OpportunityPursuitLaneMatch.pursuit_lane_id
     deadline_end = snapshot_date + dt.timedelta(days=DEFAULT_DEADLINE_WINDOW_DAYS)
-    context = []
-    for lane in lanes:
-        new_count = (
-            db.query(func.count(func.distinct(Opportunity.id)))
-            .join(
-                OpportunityPursuitLaneMatch,
-                OpportunityPursuitLaneMatch.opportunity_id == Opportunity.id,
-            )
-            .filter(
-                Opportunity.organization_id == organization_id,
-                OpportunityPursuitLaneMatch.organization_id == organization_id,
-                OpportunityPursuitLaneMatch.pursuit_lane_id == lane.id,
-                Opportunity.created_at >= start_at,
-                Opportunity.created_at < end_before,
-            )
-            .scalar()
-            or 0
+    new_counts = dict(
+        db.query(lane_id, func.count(func.distinct(Opportunity.id)))
+        .select_from(Opportunity)
+        .join(
+            OpportunityPursuitLaneMatch,
+            OpportunityPursuitLaneMatch.opportunity_id == Opportunity.id,
         )
-        updated_count = (
-            db.query(func.count(func.distinct(OpportunityUpdateEvent.opportunity_id)))
-            .join(Opportunity, Opportunity.id == OpportunityUpdateEvent.opportunity_id)
-            .join(
-                OpportunityPursuitLaneMatch,
-                OpportunityPursuitLaneMatch.opportunity_id == Opportunity.id,
-            )
-            .filter(
-                OpportunityUpdateEvent.organization_id == organization_id,
-                OpportunityPursuitLaneMatch.organization_id == organization_id,
-                OpportunityPursuitLaneMatch.pursuit_lane_id == lane.id,
-                OpportunityUpdateEvent.detected_at >= start_at,
-                OpportunityUpdateEvent.detected_at < end_before,
-            )
-            .scalar()
-            or 0
+        .filter(
+            Opportunity.organization_id == organization_id,
+            OpportunityPursuitLaneMatch.organization_id == organization_id,
+            lane_id.in_(lane_ids),
+            Opportunity.created_at >= start_at,
+            Opportunity.created_at < end_before,
         )
-        deadline_count = (
-            db.query(func.count(func.distinct(Opportunity.id)))
-            .join(
-                OpportunityPursuitLaneMatch,
-                OpportunityPursuitLaneMatch.opportunity_id == Opportunity.id,
-            )
-            .filter(
-                Opportunity.organization_id == organization_id,
-                Opportunity.decision_state != "ARCHIVED",
-                Opportunity.response_deadline >= snapshot_date,
-                Opportunity.response_deadline <= deadline_end,
-                OpportunityPursuitLaneMatch.organization_id == organization_id,
-                OpportunityPursuitLaneMatch.pursuit_lane_id == lane.id,
-            )
-            .scalar()
-            or 0
+        .group_by(lane_id)
+        .all()
+    )
+    updated_counts = dict(
+        db.query(lane_id, func.count(func.distinct(OpportunityUpdateEvent.opportunity_id)))
+        .select_from(OpportunityUpdateEvent)
+        .join(Opportunity, Opportunity.id == OpportunityUpdateEvent.opportunity_id)
+        .join(
+            OpportunityPursuitLaneMatch,
+            OpportunityPursuitLaneMatch.opportunity_id == Opportunity.id,
+        )
+        .filter(
+            OpportunityUpdateEvent.organization_id == organization_id,
+            OpportunityPursuitLaneMatch.organization_id == organization_id,
+            lane_id.in_(lane_ids),
+            OpportunityUpdateEvent.detected_at >= start_at,
+            OpportunityUpdateEvent.detected_at < end_before,
+        )
+        .group_by(lane_id)
+        .all()
+    )
+    deadline_counts = dict(
+        db.query(lane_id, func.count(func.distinct(Opportunity.id)))
+        .select_from(Opportunity)
+        .join(
+            OpportunityPursuitLaneMatch,
+            OpportunityPursuitLaneMatch.opportunity_id == Opportunity.id,
+        )
+        .filter(
+            Opportunity.organization_id == organization_id,
+            Opportunity.decision_state != "ARCHIVED",
+            Opportunity.response_deadline >= snapshot_date,
+            Opportunity.response_deadline <= deadline_end,
+            OpportunityPursuitLaneMatch.organization_id == organization_id,
+            lane_id.in_(lane_ids),
         )
-        context.append(
+        .group_by(lane_id)
+        .all()
+    )
+    return {
+        user_id: [
             {
                 "id": lane.id,
                 "name": lane.name,
-                "new_opportunity_count": new_count,
-                "updated_opportunity_count": updated_count,
-                "upcoming_deadline_count": deadline_count,
+                "new_opportunity_count": new_counts.get(lane.id, 0),
+                "updated_opportunity_count": updated_counts.get(lane.id, 0),
+                "upcoming_deadline_count": deadline_counts.get(lane.id, 0),
             }
-        )
-    return context
+            for lane in lanes
+        ]
+        for user_id, lanes in lanes_by_user.items()
+    }
 
 
-def build_snapshot_payload(
+def build_organization_sections(
     db: Session,
     *,
     workspace: Workspace,
-    user_id: int,
     snapshot_date: dt.date,
-) -> dict[str, Any]:
+) -> OrganizationSnapshotSections:
     activity_day = _activity_date(snapshot_date)
     start_at, end_before = _day_window(activity_day)
     organization_id = workspace.organization_id
-
-    my_lane_context = _my_lane_context(
-        db,
-        organization_id=organization_id,
-        user_id=user_id,
-        start_at=start_at,
-        end_before=end_before,
-        snapshot_date=snapshot_date,
-    )
-    new_opportunities = _new_opportunities(
-        db,
-        organization_id=organization_id,
-        start_at=start_at,
-        end_before=end_before,
-    )
-    updated_opportunities = _updated_opportunities(
-        db,
-        organization_id=organization_id,
-        start_at=start_at,
-        end_before=end_before,
-    )
-    upcoming_deadlines = _upcoming_deadlines(
-        db,
+    window = {"organization_id": organization_id, "start_at": start_at, "end_before": end_before}
+    return OrganizationSnapshotSections(
+        workspace={
+            "id": workspace.id,
+            "organization_id": organization_id,
+            "name": workspace.name,
+        },
         organization_id=organization_id,
         snapshot_date=snapshot_date,
-    )
-    my_shortlist = _my_shortlist(
-        db,
-        organization_id=organization_id,
-        user_id=user_id,
-        start_at=start_at,
-        end_before=end_before,
-    )
-    shortlist_updates = _shortlist_updates(
-        db,
-        organization_id=organization_id,
-        user_id=user_id,
+        activity_day=activity_day,
         start_at=start_at,
         end_before=end_before,
+        new_opportunities=_new_opportunities(db, **window),
+        updated_opportunities=_updated_opportunities(db, **window),
+        upcoming_deadlines=_upcoming_deadlines(
+            db,
+            organization_id=organization_id,
+            snapshot_date=snapshot_date,
+        ),
+        connector_issues=_connector_issues(db, organization_id=organization_id),
+        new_feed_candidates=_new_feed_candidates(db, **window),
     )
-    team_signals = _team_signals(
+
+
+def build_user_snapshot_payloads(
+    db: Session,
+    sections: OrganizationSnapshotSections,
+    *,
+    user_ids: Iterable[int],
+) -> dict[int, dict[str, Any]]:
+    """Overlay each user's sections on ``sections``, querying for all users at once."""
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return {}
+    organization_id = sections.organization_id
+    window = {
+        "organization_id": organization_id,
+        "user_ids": user_ids,
+        "start_at": sections.start_at,
+        "end_before": sections.end_before,
+    }
+    lane_contexts = _my_lane_contexts(db, **window, snapshot_date=sections.snapshot_date)
+    shortlists = _my_shortlists(db, **window)
+    shortlist_updates = _shortlist_updates(db, **window)
+    team_signal_rows = _team_signal_rows(db, **window)
+    shortlist_deadlines = _shortlist_deadlines(
         db,
         organization_id=organization_id,
-        user_id=user_id,
-        start_at=start_at,
-        end_before=end_before,
+        user_ids=user_ids,
+        snapshot_date=sections.snapshot_date,
     )
-    shortlist_deadlines = _shortlist_deadlines(
+    acted_new_feed_ids = _acted_new_feed_ids(db, **window)
+    interested_rows = _interested_activity_rows(
         db,
         organization_id=organization_id,
-        user_id=user_id,
-        snapshot_date=snapshot_date,
+        start_at=sections.start_at,
+        end_before=sections.end_before,
     )
-    connector_issues = _connector_issues(db, organization_id=organization_id)
-    new_feed_opportunities = _new_feed_opportunities(
+    change_rows = _shortlist_change_rows(db, **window)
+    users = _user_payloads(
         db,
-        organization_id=organization_id,
-        user_id=user_id,
-        start_at=start_at,
-        end_before=end_before,
+        [
+            *user_ids,
+            *(row[0].user_id for rows in team_signal_rows.values() for row in rows),
+            *(event.user_id for event, _ in interested_rows),
+        ],
     )
 
-    return {
-        "version": SNAPSHOT_VERSION,
-        "workspace": {
-            "id": workspace.id,
-            "organization_id": organization_id,
-            "name": workspace.name,
-        },
-        "user": _event_user_payload(db, user_id),
-        "snapshot_date": snapshot_date.isoformat(),
-        "activity_date": activity_day.isoformat(),
-        "activity_window": {
-            "start": start_at.isoformat(),
-            "end": end_before.isoformat(),
-            "basis": "calendar_day",
-        },
-        "summary": {
-            "new_feed_count": len(new_feed_opportunities),
-            "shortlist_update_count": len(shortlist_updates),
-            "team_signal_count": len(team_signals),
-            "shortlist_deadline_count": len(shortlist_deadlines),
-            "connector_issue_count": len(connector_issues),
-        },
-        "my_shortlist": my_shortlist,
-        "shortlist_updates": shortlist_updates,
-        "team_signals": team_signals,
-        "shortlist_deadlines": shortlist_deadlines,
-        "my_lanes": [],
-        "my_lane_context": my_lane_context,
-        "new_feed_opportunities": new_feed_opportunities,
-        "new_opportunities": new_opportunities,
-        "updated_opportunities": updated_opportunities,
-        "upcoming_deadlines": upcoming_deadlines,
-        "interested_activity": _interested_activity(
-            db,
-            organization_id=organization_id,
-            user_id=user_id,
-            start_at=start_at,
-            end_before=end_before,
-        ),
-        "shortlist_changes": _shortlist_changes(
-            db,
-            organization_id=organization_id,
-            user_id=user_id,
-            start_at=start_at,
-            end_before=end_before,
-        ),
-        "connector_issues": connector_issues,
-    }
+    payloads = {}
+    for user_id in user_ids:
+        new_feed_opportunities = _new_feed_opportunities(
+            sections.new_feed_candidates,
+            acted_new_feed_ids.get(user_id, set()),
+        )
+        user_updates = shortlist_updates.get(user_id, [])
+        team_signals = _team_signals(team_signal_rows.get(user_id, []), users)
+        user_deadlines = shortlist_deadlines.get(user_id, [])
+        payloads[user_id] = {
+            "version": SNAPSHOT_VERSION,
+            "workspace": sections.workspace,
+            "user": _event_user_payload(users, user_id),
+            "snapshot_date": sections.snapshot_date.isoformat(),
+            "activity_date": sections.activity_day.isoformat(),
+            "activity_window": {
+                "start": sections.start_at.isoformat(),
+                "end": sections.end_before.isoformat(),
+                "basis": "calendar_day",
+            },
+            "summary": {
+                "new_feed_count": len(new_feed_opportunities),
+                "shortlist_update_count": len(user_updates),
+                "team_signal_count": len(team_signals),
+                "shortlist_deadline_count": len(user_deadlines),
+                "connector_issue_count": len(sections.connector_issues),
+            },
+            "my_shortlist": shortlists.get(user_id, []),
+            "shortlist_updates": user_updates,
+            "team_signals": team_signals,
+            "shortlist_deadlines": user_deadlines,
+            "my_lanes": [],
+            "my_lane_context": lane_contexts.get(user_id, []),
+            "new_feed_opportunities": new_feed_opportunities,
+            "new_opportunities": sections.new_opportunities,
+            "updated_opportunities": sections.updated_opportunities,
+            "upcoming_deadlines": sections.upcoming_deadlines,
+            "interested_activity": _interested_activity(interested_rows, users, user_id=user_id),
+            "shortlist_changes": _shortlist_changes(change_rows.get(user_id, []), users),
+            "connector_issues": sections.connector_issues,
+        }
+    return payloads
+
+
+def build_snapshot_payload(
+    db: Session,
+    *,
+    workspace: Workspace,
+    user_id: int,
+    snapshot_date: dt.date,
+) -> dict[str, Any]:
+    sections = build_organization_sections(db, workspace=workspace, snapshot_date=snapshot_date)
+    return build_user_snapshot_payloads(db, sections, user_ids=[user_id])[user_id]
 
 
 def get_stored_daily_snapshot(
@@ -842,7 +960,13 @@ def create_daily_snapshot(
     workspace_id: int,
     user_id: int,
     snapshot_date: dt.date | None = None,
+    payload: dict[str, Any] | None = None,
 ) -> DailySnapshot:
+    """Store the user's snapshot for ``snapshot_date`` unless one already exists.
+
+    ``payload`` is a prebuilt ``build_user_snapshot_payloads`` entry for this
+    user; without it the payload is built here.
+    """
     snapshot_date = snapshot_date or dt.date.today()
     existing = get_stored_daily_snapshot(
         db,
@@ -853,18 +977,18 @@ def create_daily_snapshot(
     if existing:
         return existing
 
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
-    if not workspace:
-        raise ValueError(f"Workspace {workspace_id} not found")
-
-    payload = build_snapshot_payload(
-        db,
-        workspace=workspace,
-        user_id=user_id,
-        snapshot_date=snapshot_date,
-    )
+    if payload is None:
+        workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+        if not workspace:
+            raise ValueError(f"Workspace {workspace_id} not found")
+        payload = build_snapshot_payload(
+            db,
+            workspace=workspace,
+            user_id=user_id,
+            snapshot_date=snapshot_date,
+        )
     snapshot = DailySnapshot(
-        workspace_id=workspace.id,
+        workspace_id=workspace_id,
         user_id=user_id,
         snapshot_date=snapshot_date,
         status="completed",
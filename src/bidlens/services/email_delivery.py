@@ -1,16 +1,33 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any, Protocol
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Iterator, Protocol, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from ..config import DAILY_BRIEF_EMAIL_FROM, RESEND_API_KEY
+from ..config import (
+    DAILY_BRIEF_EMAIL_BATCH_SIZE,
+    DAILY_BRIEF_EMAIL_FROM,
+    DAILY_BRIEF_EMAIL_MAX_ATTEMPTS,
+    DAILY_BRIEF_EMAIL_RATE_PER_SECOND,
+    DAILY_BRIEF_EMAIL_WORKERS,
+    RESEND_API_KEY,
+)
 
 
 class EmailDeliveryError(RuntimeError):
     """Raised when a transactional email provider rejects or cannot send."""
 
+    def __init__(self, message: str, *, retryable: bool = False, retry_after_seconds: float | None = None) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after_seconds = retry_after_seconds
+
 
 @dataclass(frozen=True)
 class EmailMessage:
@@ -18,6 +35,8 @@ class EmailMessage:
     subject: str
     html_body: str
     text_body: str
+    # Sent as the provider's Idempotency-Key so a retried send is delivered once.
+    idempotency_key: str | None = None
 
 
 @dataclass(frozen=True)
@@ -35,6 +54,8 @@ class EmailSender(Protocol):
 class ResendEmailSender:
     provider = "resend"
     endpoint = "https://api.resend.com/emails"
+    batch_endpoint = "https://api.resend.com/emails/batch"
+    max_batch_size = 100
 
     def __init__(
         self,
@@ -42,41 +63,204 @@ class ResendEmailSender:
         api_key: str | None = None,
         from_email: str | None = None,
         timeout_seconds: int = 20,
+        pool_size: int = 10,
     ) -> None:
         self.api_key = api_key or RESEND_API_KEY
         self.from_email = from_email or DAILY_BRIEF_EMAIL_FROM
         self.timeout_seconds = timeout_seconds
+        # One keep-alive connection pool shared by every dispatcher worker.
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
 
-    def send(self, message: EmailMessage) -> EmailSendResult:
+    def _email_payload(self, message: EmailMessage) -> dict[str, Any]:
+        return {
+            "from": self.from_email,
+            "to": [message.to_email],
+            "subject": message.subject,
+            "html": message.html_body,
+            "text": message.text_body,
+        }
+
+    def _post(self, url: str, body: Any, *, idempotency_key: str | None) -> Any:
         if not self.api_key:
             raise EmailDeliveryError("RESEND_API_KEY is not configured.")
         if not self.from_email:
             raise EmailDeliveryError("DAILY_BRIEF_EMAIL_FROM is not configured.")
 
-        response = requests.post(
-            self.endpoint,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "from": self.from_email,
-                "to": [message.to_email],
-                "subject": message.subject,
-                "html": message.html_body,
-                "text": message.text_body,
-            },
-            timeout=self.timeout_seconds,
-        )
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        try:
+            response = self.session.post(url, headers=headers, json=body, timeout=self.timeout_seconds)
+        except (requests.Timeout, requests.ConnectionError) as exc:
+            raise EmailDeliveryError(f"Resend request failed: {type(exc).__name__}", retryable=True) from exc
         try:
             payload = response.json()
         except Exception:
             payload = {}
         if response.status_code >= 400:
-            error_message = payload.get("message") or payload.get("error") or f"HTTP {response.status_code}"
-            raise EmailDeliveryError(f"Resend rejected email: {error_message}")
+            details = payload if isinstance(payload, dict) else {}
+            error_message = details.get("message") or details.get("error") or f"HTTP {response.status_code}"
+            try:
+                retry_after = float(response.headers.get("retry-after") or 0) or None
+            except ValueError:
+                retry_after = None
+            raise EmailDeliveryError(
+                f"Resend rejected email: {error_message}",
+                retryable=response.status_code == 429 or response.status_code >= 500,
+                retry_after_seconds=retry_after,
+            )
+        return payload
+
+    def send(self, message: EmailMessage) -> EmailSendResult:
+        payload = self._post(self.endpoint, self._email_payload(message), idempotency_key=message.idempotency_key)
         return EmailSendResult(
             provider=self.provider,
             message_id=str(payload.get("id")) if payload.get("id") else None,
             raw_response=payload,
         )
+
+    def send_batch(self, messages: Sequence[EmailMessage], *, idempotency_key: str | None = None) -> list[EmailSendResult]:
+        payload = self._post(
+            self.batch_endpoint,
+            [self._email_payload(message) for message in messages],
+            idempotency_key=idempotency_key,
+        )
+        sent = payload.get("data") if isinstance(payload, dict) else None
+        if not isinstance(sent, list) or len(sent) != len(messages):
+            raise EmailDeliveryError("Resend returned an unexpected batch response.")
+        return [
+            EmailSendResult(
+                provider=self.provider,
+                message_id=str(item.get("id")) if isinstance(item, dict) and item.get("id") else None,
+                raw_response=item if isinstance(item, dict) else None,
+            )
+            for item in sent
+        ]
+
+
+class RateLimiter:
+    """Spaces calls at least ``1 / per_second`` seconds apart across threads."""
+
+    def __init__(
+        self,
+        per_second: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.interval = 1 / per_second if per_second > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = self._clock()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval
+        if start_at > now:
+            self._sleep(start_at - now)
+
+
+class EmailDispatcher:
+    """Send rendered messages through a bounded, rate-limited worker pool.
+
+    Transient provider failures (``EmailDeliveryError.retryable``) are retried
+    with backoff; each retry carries the message's idempotency key. Messages
+    marked batchable are grouped into provider batch requests when the sender
+    has ``send_batch`` and ``batch_size`` is above one. Dispatchers given the
+    same ``rate_limiter`` share one provider rate between them.
+    """
+
+    def __init__(
+        self,
+        sender: EmailSender,
+        *,
+        max_workers: int | None = None,
+        rate_per_second: float | None = None,
+        batch_size: int | None = None,
+        max_attempts: int | None = None,
+        retry_backoff_seconds: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        self.sender = sender
+        self.max_workers = max(1, DAILY_BRIEF_EMAIL_WORKERS if max_workers is None else max_workers)
+        self.batch_size = max(1, DAILY_BRIEF_EMAIL_BATCH_SIZE if batch_size is None else batch_size)
+        self.max_attempts = max(1, DAILY_BRIEF_EMAIL_MAX_ATTEMPTS if max_attempts is None else max_attempts)
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._sleep = sleep
+        self._limiter = rate_limiter or RateLimiter(
+            DAILY_BRIEF_EMAIL_RATE_PER_SECOND if rate_per_second is None else rate_per_second,
+            sleep=sleep,
+        )
+
+    def _units(self, messages: Sequence[EmailMessage], batchable: Sequence[bool]) -> list[list[int]]:
+        send_batch = getattr(self.sender, "send_batch", None)
+        batch_size = min(self.batch_size, getattr(self.sender, "max_batch_size", self.batch_size))
+        if send_batch is None or batch_size <= 1:
+            return [[index] for index in range(len(messages))]
+        single = [[index] for index in range(len(messages)) if not batchable[index]]
+        grouped = [index for index in range(len(messages)) if batchable[index]]
+        return single + [grouped[start:start + batch_size] for start in range(0, len(grouped), batch_size)]
+
+    def _attempt(self, call: Callable[[], Any]) -> Any:
+        for attempt in range(1, self.max_attempts + 1):
+            self._limiter.wait()
+            try:
+                return call()
+            except EmailDeliveryError as exc:
+                if not exc.retryable or attempt == self.max_attempts:
+                    return exc
+                self._sleep(exc.retry_after_seconds or self.retry_backoff_seconds * 2 ** (attempt - 1))
+            except Exception as exc:
+                return exc
+
+    @staticmethod
+    def _batch_idempotency_key(messages: list[EmailMessage]) -> str | None:
+        keys = [message.idempotency_key for message in messages]
+        if not all(keys):
+            return None
+        return "batch-" + hashlib.sha256("\n".join(keys).encode()).hexdigest()
+
+    def _send_unit(
+        self,
+        messages: Sequence[EmailMessage],
+        indexes: list[int],
+    ) -> list[tuple[int, EmailSendResult | Exception]]:
+        if len(indexes) == 1:
+            message = messages[indexes[0]]
+            return [(indexes[0], self._attempt(lambda: self.sender.send(message)))]
+        unit = [messages[index] for index in indexes]
+        key = self._batch_idempotency_key(unit)
+        outcome = self._attempt(lambda: self.sender.send_batch(unit, idempotency_key=key))
+        if isinstance(outcome, Exception):
+            return [(index, outcome) for index in indexes]
+        return list(zip(indexes, outcome))
+
+    def dispatch(
+        self,
+        messages: Sequence[EmailMessage],
+        *,
+        batchable: Sequence[bool] | None = None,
+    ) -> Iterator[tuple[int, EmailSendResult | Exception]]:
+        """Yield ``(index, result or exception)`` for each message as its send finishes."""
+        units = self._units(messages, batchable or [False] * len(messages))
+        if len(units) <= 1 or self.max_workers == 1:
+            for indexes in units:
+                yield from self._send_unit(messages, indexes)
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(units)),
+            thread_name_prefix="bidlens-email",
+        ) as executor:
+            futures = [executor.submit(self._send_unit, messages, indexes) for indexes in units]
+            for future in as_completed(futures):
+                yield from future.result()
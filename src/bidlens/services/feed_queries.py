@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
-from ..models import Opportunity, OrgProfile, UserOpportunity, Vote
+from ..models import Opportunity, OrgProfile, User, UserFeedState
 
 QUALIFICATION_QUALIFIED = "qualified"
 
@@ -87,43 +87,39 @@ def build_feed_query(
     user_id: int,
     include_watched: bool = True,
 ):
-    """Build the base Feed query before optional UI filters such as lane/search."""
+    """Build the base Feed query before optional UI filters such as lane/search.
+
+    The user's PURSUE/PASS votes and watch flag come from one indexed join on
+    ``user_feed_states`` rather than anti-joins over ``votes``.
+    """
+    state_join = feed_state_join_condition(organization_id=organization_id, user_id=user_id)
     if include_watched:
-        query = (
-            db.query(Opportunity, UserOpportunity.watched.label("watched"))
-            .outerjoin(
-                UserOpportunity,
-                and_(
-                    UserOpportunity.opportunity_id == Opportunity.id,
-                    UserOpportunity.user_id == user_id,
-                    UserOpportunity.organization_id == organization_id,
-                ),
-            )
-        )
+        query = db.query(Opportunity, UserFeedState.watched.label("watched"))
     else:
         query = db.query(Opportunity)
 
+    return _filter_feed_population(query.outerjoin(UserFeedState, state_join), organization_id=organization_id)
+
+
+def _filter_feed_population(query, *, organization_id: int):
+    """Keep qualified, unarchived opportunities the joined user has not voted on."""
     query = (
         query.filter(Opportunity.organization_id == organization_id)
         .filter(Opportunity.decision_state != "ARCHIVED")
         .filter(Opportunity.qualification_status == QUALIFICATION_QUALIFIED)
+        .filter(UserFeedState.vote.is_(None))
     )
 
-    interested_opp_ids = select(Vote.opp_id).where(
-        Vote.org_id == organization_id,
-        Vote.user_id == user_id,
-        Vote.vote == "PURSUE",
-    )
-    query = query.filter(~Opportunity.id.in_(interested_opp_ids))
+    return _exclude_inactive_govwin_stages(query)
 
-    archived_opp_ids = select(Vote.opp_id).where(
-        Vote.org_id == organization_id,
-        Vote.user_id == user_id,
-        Vote.vote == "PASS",
-    )
-    query = query.filter(~Opportunity.id.in_(archived_opp_ids))
 
-    return _exclude_inactive_govwin_stages(query)
+def feed_state_join_condition(*, organization_id: int, user_id: int):
+    """Join ``Opportunity`` to the user's ``UserFeedState`` row, if any."""
+    return and_(
+        UserFeedState.opportunity_id == Opportunity.id,
+        UserFeedState.organization_id == organization_id,
+        UserFeedState.user_id == user_id,
+    )
 
 
 def feed_awaiting_review_query(
@@ -142,3 +138,28 @@ def feed_awaiting_review_query(
     )
     query = apply_org_feed_filters(query, db, organization_id=organization_id)
     return exclude_past_due_opportunities(query)
+
+
+def feed_awaiting_review_by_user_query(
+    db: Session,
+    *,
+    organization_id: int,
+    user_ids: list[int],
+):
+    """``feed_awaiting_review_query`` for several users as ``(user_id, opportunity_id)`` rows."""
+    query = (
+        db.query(User.id.label("user_id"), Opportunity.id.label("opportunity_id"))
+        .select_from(Opportunity)
+        .join(User, User.id.in_(user_ids))
+        .outerjoin(
+            UserFeedState,
+            and_(
+                UserFeedState.opportunity_id == Opportunity.id,
+                UserFeedState.organization_id == organization_id,
+                UserFeedState.user_id == User.id,
+            ),
+        )
+    )
+    query = _filter_feed_population(query, organization_id=organization_id)
+    query = apply_org_feed_filters(query, db, organization_id=organization_id)
+    return exclude_past_due_opportunities(query)
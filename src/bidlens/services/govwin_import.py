@@ -338,6 +338,10 @@ def _apply_govwin_cross_source_metadata(
                 setattr(existing, key, value)
                 changed = True
 
+    if changed:
+        # These writes bypass the source monitor; force the next source
+        # observation of this row to compare field by field.
+        existing.content_fingerprint = None
     return changed, changed_fields
 
 
@@ -0,0 +1,250 @@
+"""Background Grants.gov detail enrichment.
+
+Grants.gov search hits arrive without the full description and attachment
+folders; those come from a separate detail lookup that can take tens of
+seconds. The detail page therefore never calls Grants.gov itself: it renders
+the stored payload, asks ``grants_detail_queue`` to fetch the detail, and
+shows a loading state until a later view finds it stored.
+
+The queue is process-local. Concurrent requests for one opportunity share a
+single lookup, and a lookup that fails (or still leaves the detail missing)
+is not retried for ``GRANTS_DETAIL_FAILURE_TTL_SECONDS``. Opportunities that
+become qualified, are shortlisted, or gain an Interested signal are queued
+after the committing transaction so their first page view is already warm.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from time import monotonic
+from typing import Callable
+
+import requests
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from .. import config
+from ..grants_gov_client import GrantsGovApiError
+from ..models import Opportunity, Vote
+from .opportunity_descriptions import select_opportunity_description
+
+logger = logging.getLogger(__name__)
+
+GRANTS_GOV_SOURCE = "grants_gov"
+_PENDING_KEY = "grants_detail_prewarm"
+_READY_KEY = "grants_detail_prewarm_ready"
+
+
+def needs_grants_gov_detail(opportunity: Opportunity, *, description: str | None = None) -> bool:
+    """Whether the opportunity is a Grants.gov record without its stored detail."""
+    if opportunity.source != GRANTS_GOV_SOURCE or not opportunity.source_record_id:
+        return False
+    payload = opportunity.raw_source_payload if isinstance(opportunity.raw_source_payload, dict) else {}
+    return not description or not payload.get("detail_payload")
+
+
+class GrantsDetailQueue:
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Session] | None = None,
+        max_workers: int | None = None,
+        failure_ttl_seconds: float | None = None,
+    ):
+        self._session_factory = session_factory
+        self._max_workers = max_workers
+        self._failure_ttl_seconds = failure_ttl_seconds
+        self._lock = threading.Lock()
+        self._pending: dict[int, Future] = {}
+        self._failed_until: dict[int, float] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def failure_ttl_seconds(self) -> float:
+        if self._failure_ttl_seconds is None:
+            return config.GRANTS_DETAIL_FAILURE_TTL_SECONDS
+        return self._failure_ttl_seconds
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._executor is None:
+                workers = self._max_workers if self._max_workers is not None else config.GRANTS_DETAIL_WORKERS
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, workers), thread_name_prefix="grants-detail-queue",
+                )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def enqueue(self, opportunity_id: int, *, bind=None) -> bool:
+        """Queue a detail lookup; returns whether one is now pending.
+
+        A stopped queue (scripts, tests, workers without startup) queues
+        nothing. ``bind`` lets the lookup use the caller's engine.
+        """
+        with self._lock:
+            if self._executor is None:
+                return False
+            if opportunity_id in self._pending:
+                return True
+            retry_at = self._failed_until.get(opportunity_id)
+            if retry_at is not None:
+                if monotonic() < retry_at:
+                    return False
+                del self._failed_until[opportunity_id]
+            future = self._executor.submit(self._enrich, opportunity_id, bind)
+            self._pending[opportunity_id] = future
+        future.add_done_callback(lambda _future: self._finished(opportunity_id))
+        return True
+
+    def is_pending(self, opportunity_id: int) -> bool:
+        with self._lock:
+            return opportunity_id in self._pending
+
+    def recently_failed(self, opportunity_id: int) -> bool:
+        with self._lock:
+            retry_at = self._failed_until.get(opportunity_id)
+        return retry_at is not None and monotonic() < retry_at
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for the lookups queued so far."""
+        with self._lock:
+            futures = list(self._pending.values())
+        wait(futures, timeout=timeout)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._failed_until.clear()
+
+    def _finished(self, opportunity_id: int) -> None:
+        with self._lock:
+            self._pending.pop(opportunity_id, None)
+
+    def _mark_failed(self, opportunity_id: int) -> None:
+        with self._lock:
+            self._failed_until[opportunity_id] = monotonic() + self.failure_ttl_seconds
+
+    def _open_session(self, bind) -> Session:
+        if bind is not None:
+            return Session(bind=bind)
+        if self._session_factory is None:
+            from ..database import SessionLocal
+
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    def _enrich(self, opportunity_id: int, bind=None) -> bool:
+        # Imported here so the ingest module (and its client) load lazily.
+        from ..ingest_grants_gov import enrich_grants_gov_opportunity_detail
+
+        db = self._open_session(bind)
+        try:
+            opportunity = db.get(Opportunity, opportunity_id)
+            if opportunity is None or not needs_grants_gov_detail(opportunity, description=select_opportunity_description(opportunity)):
+                return False
+            try:
+                changed = enrich_grants_gov_opportunity_detail(db, opportunity)
+            except (GrantsGovApiError, requests.RequestException) as exc:
+                db.rollback()
+                self._mark_failed(opportunity_id)
+                logger.warning(
+                    "Grants.gov detail enrichment failed opportunity_id=%s source_record_id=%s error=%s",
+                    opportunity_id,
+                    opportunity.source_record_id,
+                    exc,
+                )
+                return False
+            if needs_grants_gov_detail(opportunity, description=select_opportunity_description(opportunity)):
+                # Grants.gov answered but the record is still incomplete.
+                self._mark_failed(opportunity_id)
+            return changed
+        except Exception:
+            db.rollback()
+            self._mark_failed(opportunity_id)
+            logger.exception("Grants.gov detail enrichment crashed opportunity_id=%s", opportunity_id)
+            return False
+        finally:
+            db.close()
+
+
+grants_detail_queue = GrantsDetailQueue()
+
+
+def _remember(session: Session, opportunity_id: int | None) -> None:
+    if opportunity_id is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(opportunity_id)
+
+
+def _opportunity_inserted(_mapper, _connection, target: Opportunity) -> None:
+    if target.source == GRANTS_GOV_SOURCE and (target.qualification_status == "qualified" or target.date_shortlisted):
+        _remember(inspect(target).session, target.id)
+
+
+def _opportunity_updated(_mapper, _connection, target: Opportunity) -> None:
+    if target.source != GRANTS_GOV_SOURCE:
+        return
+    attrs = inspect(target).attrs
+    qualified = target.qualification_status == "qualified" and attrs["qualification_status"].history.has_changes()
+    shortlisted = target.date_shortlisted is not None and attrs["date_shortlisted"].history.has_changes()
+    if qualified or shortlisted:
+        _remember(inspect(target).session, target.id)
+
+
+def _vote_marked_interest(_mapper, _connection, target: Vote) -> None:
+    if target.vote == "PURSUE" and inspect(target).attrs["vote"].history.has_changes():
+        _remember(inspect(target).session, target.opp_id)
+
+
+def _collect_after_flush(session: Session, _flush_context) -> None:
+    opportunity_ids = session.info.pop(_PENDING_KEY, None)
+    if not opportunity_ids or not grants_detail_queue.running:
+        return
+    # Only Grants.gov records that still lack their detail are worth a worker.
+    # They are picked inside the transaction so the commit hook needs no SQL.
+    with session.no_autoflush:
+        rows = (
+            session.query(Opportunity)
+            .filter(Opportunity.id.in_(opportunity_ids), Opportunity.source == GRANTS_GOV_SOURCE)
+            .all()
+        )
+    candidates = {row.id for row in rows if needs_grants_gov_detail(row, description=select_opportunity_description(row))}
+    if candidates:
+        session.info.setdefault(_READY_KEY, set()).update(candidates)
+
+
+def _queue_after_commit(session: Session) -> None:
+    opportunity_ids = session.info.pop(_READY_KEY, None)
+    if not opportunity_ids:
+        return
+    bind = session.get_bind()
+    for opportunity_id in sorted(opportunity_ids):
+        grants_detail_queue.enqueue(opportunity_id, bind=bind)
+
+
+def _discard_after_rollback(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+        session.info.pop(_READY_KEY, None)
+
+
+def install_grants_detail_prewarm() -> None:
+    """Queue detail lookups for Grants.gov records entering a Feed or Shortlist."""
+    if event.contains(Session, "after_commit", _queue_after_commit):
+        return
+    event.listen(Opportunity, "after_insert", _opportunity_inserted)
+    event.listen(Opportunity, "after_update", _opportunity_updated)
+    event.listen(Vote, "after_insert", _vote_marked_interest)
+    event.listen(Vote, "after_update", _vote_marked_interest)
+    event.listen(Session, "after_flush", _collect_after_flush)
+    event.listen(Session, "after_commit", _queue_after_commit)
+    event.listen(Session, "after_soft_rollback", _discard_after_rollback)
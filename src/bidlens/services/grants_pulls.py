@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Any
+
+import requests
+from sqlalchemy.orm import Session
+
+from ..grants_gov_client import GrantsGovApiError
+from ..ingest_grants_gov import ingest_grants_gov
+from .ingest_leases import IngestLeaseBusy
+from .ingestion_runs import record_source_activity
+
+
+def record_grants_source_activity(
+    db: Session,
+    *,
+    org_id: int,
+    user_id: int | None,
+    result: dict,
+    reason_code: str | None = None,
+) -> None:
+    reason_counts = {reason_code: 1} if reason_code else {}
+    reason_labels = {reason_code: result.get("message", reason_code)} if reason_code else {}
+    if result.get("status") == "no_records":
+        reason_counts["no_records"] = 1
+        reason_labels["no_records"] = result.get("message", "No records returned")
+    if int(result.get("detail_errors", 0) or 0):
+        reason_counts["detail_lookup_error"] = int(result.get("detail_errors", 0) or 0)
+        reason_labels["detail_lookup_error"] = "One or more Grants.gov detail lookups failed"
+    record_source_activity(
+        db,
+        source="grants.gov",
+        organization_id=org_id,
+        user_id=user_id,
+        filename="Manual Grants.gov pull",
+        result=result,
+        processed_count=int(result.get("received", 0) or 0),
+        created_count=int(result.get("created", 0) or 0),
+        updated_count=int(result.get("updated", 0) or 0),
+        unchanged_count=int(result.get("unchanged", 0) or 0),
+        skipped_count=int(result.get("skipped", 0) or 0),
+        error_count=int(result.get("errors", 0) or 0) + int(result.get("detail_errors", 0) or 0),
+        reason_counts=reason_counts or None,
+        reason_labels=reason_labels or None,
+        notes=result.get("message"),
+    )
+    db.commit()
+
+
+def grants_busy_payload(*, organization_id: int) -> dict[str, Any]:
+    return {
+        "status": "busy",
+        "organization_id": organization_id,
+        "message": "A Grants.gov pull is already in progress. Wait for it to finish before starting another.",
+        "received": 0,
+        "created": 0,
+        "updated": 0,
+        "skipped": 0,
+        "errors": 0,
+    }
+
+
+def _error_result(org_id: int, message: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "status": "error",
+        "organization_id": org_id,
+        "message": message,
+        "received": 0,
+        "created": 0,
+        "updated": 0,
+        "skipped": 0,
+        "errors": 1,
+        **extra,
+    }
+
+
+def run_manual_grants_pull(
+    db: Session,
+    *,
+    organization_id: int,
+    user_id: int | None,
+) -> tuple[int, dict[str, Any], dict[str, str]]:
+    """Run an admin Grants.gov "Pull now" and return ``(status_code, payload, headers)``."""
+    org_id = organization_id
+    try:
+        result = ingest_grants_gov(db, organization_id=org_id, run_type="Manual")
+    except IngestLeaseBusy:
+        return 409, grants_busy_payload(organization_id=org_id), {}
+    except RuntimeError as exc:
+        db.rollback()
+        result = _error_result(org_id, str(exc))
+        record_grants_source_activity(db, org_id=org_id, user_id=user_id, result=result, reason_code="runtime_error")
+        return 400, result, {}
+    except (requests.ConnectionError, requests.Timeout) as exc:
+        db.rollback()
+        result = _error_result(
+            org_id,
+            f"Could not reach Grants.gov API. Check network/DNS access from the BidLens server. Detail: {exc}",
+        )
+        record_grants_source_activity(db, org_id=org_id, user_id=user_id, result=result, reason_code="connection_error")
+        return 503, result, {}
+    except GrantsGovApiError as exc:
+        db.rollback()
+        status_code = 400 if exc.status_code and 400 <= exc.status_code < 500 else 502
+        result = _error_result(org_id, str(exc), grants_gov_status_code=exc.status_code)
+        record_grants_source_activity(db, org_id=org_id, user_id=user_id, result=result, reason_code="grants_gov_api_error")
+        return status_code, result, {}
+    except Exception as exc:
+        db.rollback()
+        result = _error_result(org_id, f"Grants.gov pull failed: {exc}")
+        record_grants_source_activity(db, org_id=org_id, user_id=user_id, result=result, reason_code="import_error")
+        return 502, result, {}
+    record_grants_source_activity(db, org_id=org_id, user_id=user_id, result=result)
+    return 200, result, {}
@@ -0,0 +1,432 @@
+"""Cross-process leases for source ingests and scheduled jobs.
+
+A module-level ``threading.Lock`` only serializes pulls inside one process;
+with several web workers, the source-pull worker, and cron jobs, two SAM.gov
+pulls could run at once and share the API quota. Leases live in the database
+instead:
+
+* On Postgres the lease is a session-level advisory lock held on a dedicated
+  connection, so it is released automatically if the holder dies. The
+  ``ingest_leases`` row only records the owner for diagnostics.
+* Elsewhere (SQLite) the ``ingest_leases`` row is the lease. It is claimed
+  with a conditional UPDATE and expires after ``INGEST_LEASE_TTL_SECONDS``
+  unless the holder keeps heartbeating.
+
+Either way the holder renews ``heartbeat_at``/``expires_at`` from a
+background thread while it runs.
+
+Source ingests take two leases. The per-organization lease
+(``organization_lease``) keeps two pulls for one organization from
+overlapping. A counted lease (``ingest_lease_slot``) then caps how many pulls
+from every process call the same upstream at once, so the scheduled jobs can
+pull several organizations in parallel without cron, the source-pull worker
+and manual pulls together exceeding the shared API quota.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import hashlib
+import logging
+import os
+import socket
+import threading
+from typing import Any, Callable, Iterator
+import uuid
+
+from sqlalchemy import insert, or_, select, text, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from .. import config
+from ..database import SessionLocal
+from ..models import IngestLease
+
+
+logger = logging.getLogger(__name__)
+
+SAM_INGEST_LEASE = "ingest:sam.gov"
+GRANTS_INGEST_LEASE = "ingest:grants.gov"
+
+BACKEND_ADVISORY = "advisory"
+BACKEND_ROW = "row"
+
+# First key of the two-key advisory lock form ("bidl"), so BidLens leases do
+# not collide with advisory locks taken by other applications on the database.
+_ADVISORY_NAMESPACE = 0x6269646C
+
+
+class IngestLeaseBusy(RuntimeError):
+    """Raised when another process holds the lease."""
+
+    def __init__(self, name: str, message: str, holder: dict[str, Any] | None = None):
+        super().__init__(message)
+        self.name = name
+        self.holder = holder
+
+
+def organization_lease(name: str, organization_id: int) -> str:
+    """Scope the ``name`` lease to one organization."""
+    return f"{name}:org:{organization_id}"
+
+
+def lease_slots(name: str, slots: int) -> list[str]:
+    """Lease names making up a counted lease of ``slots`` holders."""
+    return [f"{name}:slot:{slot}" for slot in range(max(1, slots))]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _aware(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def lease_owner_id() -> str:
+    """Identify one acquisition: host, process, thread, and a unique suffix."""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}:{uuid.uuid4().hex[:8]}"
+
+
+def _uses_advisory_locks(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _advisory_keys(name: str) -> tuple[int, int]:
+    digest = hashlib.sha256(name.encode("utf-8")).digest()
+    return _ADVISORY_NAMESPACE, int.from_bytes(digest[:4], "big") & 0x7FFFFFFF
+
+
+def _ttl(ttl_seconds: int | None) -> int:
+    return max(1, config.INGEST_LEASE_TTL_SECONDS if ttl_seconds is None else ttl_seconds)
+
+
+@dataclass
+class HeldLease:
+    """A held lease. Release it exactly once."""
+
+    name: str
+    owner: str
+    ttl_seconds: int
+    backend: str
+    acquired_at: datetime
+    _connection: Connection | None = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    released: bool = False
+
+    def _renew_values(self, now: datetime) -> dict[str, Any]:
+        return {"heartbeat_at": now, "expires_at": now + timedelta(seconds=self.ttl_seconds)}
+
+    def heartbeat(self, db: Session | None = None, *, now: datetime | None = None) -> bool:
+        """Extend the lease; return False if it was lost (row backend only)."""
+        now = now or _utcnow()
+        statement = (
+            update(IngestLease)
+            .where(
+                IngestLease.name == self.name,
+                IngestLease.owner == self.owner,
+                IngestLease.released_at.is_(None),
+            )
+            .values(**self._renew_values(now))
+        )
+        with self._lock:
+            if self.released:
+                return False
+            if self._connection is not None:
+                self._connection.execute(statement)
+                self._connection.commit()
+                return True
+            if db is None:
+                raise ValueError("Row-backed leases need a session to heartbeat")
+            renewed = db.execute(statement, execution_options={"synchronize_session": False}).rowcount
+            db.commit()
+            return bool(renewed)
+
+    def release(self, db: Session | None = None, *, now: datetime | None = None) -> None:
+        now = now or _utcnow()
+        statement = (
+            update(IngestLease)
+            .where(IngestLease.name == self.name, IngestLease.owner == self.owner)
+            .values(released_at=now, expires_at=now)
+        )
+        with self._lock:
+            if self.released:
+                return
+            self.released = True
+            if self._connection is not None:
+                try:
+                    self._connection.execute(statement)
+                    self._connection.execute(
+                        text("SELECT pg_advisory_unlock(:namespace, :key)"),
+                        dict(zip(("namespace", "key"), _advisory_keys(self.name))),
+                    )
+                    self._connection.commit()
+                finally:
+                    self._connection.close()
+                return
+            if db is None:
+                raise ValueError("Row-backed leases need a session to release")
+            db.execute(statement, execution_options={"synchronize_session": False})
+            db.commit()
+
+
+def _write_owner_row(connection: Connection, lease: HeldLease, now: datetime) -> None:
+    values = {
+        "owner": lease.owner,
+        "acquired_at": now,
+        "released_at": None,
+        **lease._renew_values(now),
+    }
+    updated = connection.execute(
+        update(IngestLease).where(IngestLease.name == lease.name).values(**values)
+    ).rowcount
+    if not updated:
+        connection.execute(insert(IngestLease).values(name=lease.name, **values))
+
+
+def _acquire_advisory(db: Session, lease: HeldLease, now: datetime) -> HeldLease | None:
+    namespace, key = _advisory_keys(lease.name)
+    connection = db.get_bind().engine.connect()
+    try:
+        acquired = connection.execute(
+            text("SELECT pg_try_advisory_lock(:namespace, :key)"),
+            {"namespace": namespace, "key": key},
+        ).scalar()
+        if not acquired:
+            connection.rollback()
+            connection.close()
+            return None
+        _write_owner_row(connection, lease, now)
+        connection.commit()
+    except Exception:
+        # Returning the connection to the pool does not drop session-level
+        # advisory locks, so unlock explicitly before giving it back.
+        try:
+            connection.rollback()
+            connection.execute(text("SELECT pg_advisory_unlock_all()"))
+        finally:
+            connection.close()
+        raise
+    lease._connection = connection
+    return lease
+
+
+def _acquire_row(db: Session, lease: HeldLease, now: datetime) -> HeldLease | None:
+    values = {
+        "owner": lease.owner,
+        "acquired_at": now,
+        "released_at": None,
+        **lease._renew_values(now),
+    }
+    # Commit the caller's pending work first so a lost race only rolls back
+    # the lease statements.
+    db.commit()
+    claimed = db.execute(
+        update(IngestLease)
+        .where(
+            IngestLease.name == lease.name,
+            or_(IngestLease.released_at.is_not(None), IngestLease.expires_at <= now),
+        )
+        .values(**values),
+        execution_options={"synchronize_session": False},
+    ).rowcount
+    if claimed:
+        db.commit()
+        return lease
+    exists = db.execute(select(IngestLease.name).where(IngestLease.name == lease.name)).first()
+    if exists:
+        return None
+    try:
+        db.execute(insert(IngestLease).values(name=lease.name, **values))
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return None
+    return lease
+
+
+def acquire_ingest_lease(
+    db: Session,
+    name: str,
+    *,
+    ttl_seconds: int | None = None,
+    owner: str | None = None,
+    now: datetime | None = None,
+) -> HeldLease | None:
+    """Try to take the lease without waiting; return None if someone holds it.
+
+    On the row backend this commits ``db``.
+    """
+    now = now or _utcnow()
+    lease = HeldLease(
+        name=name,
+        owner=owner or lease_owner_id(),
+        ttl_seconds=_ttl(ttl_seconds),
+        backend=BACKEND_ADVISORY if _uses_advisory_locks(db) else BACKEND_ROW,
+        acquired_at=now,
+    )
+    if lease.backend == BACKEND_ADVISORY:
+        acquired = _acquire_advisory(db, lease, now)
+    else:
+        acquired = _acquire_row(db, lease, now)
+    if acquired is not None:
+        logger.info("ingest_lease_acquired name=%s owner=%s backend=%s", name, lease.owner, lease.backend)
+    return acquired
+
+
+def ingest_lease_status(db: Session, name: str, *, now: datetime | None = None) -> dict[str, Any] | None:
+    """Owner diagnostics for a lease, or None if it was never taken."""
+    now = now or _utcnow()
+    row = db.execute(
+        select(
+            IngestLease.owner,
+            IngestLease.acquired_at,
+            IngestLease.heartbeat_at,
+            IngestLease.expires_at,
+            IngestLease.released_at,
+        ).where(IngestLease.name == name)
+    ).first()
+    if _uses_advisory_locks(db):
+        namespace, key = _advisory_keys(name)
+        held = bool(db.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_locks WHERE locktype = 'advisory' "
+                "AND classid = :namespace AND objid = :key AND objsubid = 2 AND granted)"
+            ),
+            {"namespace": namespace, "key": key},
+        ).scalar())
+    else:
+        held = bool(row and row.released_at is None and _aware(row.expires_at) > now)
+    if row is None:
+        return {"name": name, "held": True, "owner": None} if held else None
+    return {
+        "name": name,
+        "held": held,
+        "owner": row.owner,
+        "acquired_at": _aware(row.acquired_at).isoformat() if row.acquired_at else None,
+        "heartbeat_at": _aware(row.heartbeat_at).isoformat() if row.heartbeat_at else None,
+        "expires_at": _aware(row.expires_at).isoformat() if row.expires_at else None,
+    }
+
+
+def ingest_lease_held(db: Session, name: str, *, now: datetime | None = None) -> bool:
+    status = ingest_lease_status(db, name, now=now)
+    return bool(status and status["held"])
+
+
+class _LeaseHeartbeat:
+    """Renew a lease from a background thread while the holder works."""
+
+    def __init__(self, lease: HeldLease, session_factory: Callable[[], Session]):
+        self.lease = lease
+        self.session_factory = session_factory
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"lease-heartbeat-{lease.name}", daemon=True)
+
+    def _run(self) -> None:
+        interval = max(1.0, self.lease.ttl_seconds / 3)
+        while not self._stop.wait(interval):
+            try:
+                if self.lease.backend == BACKEND_ADVISORY:
+                    renewed = self.lease.heartbeat()
+                else:
+                    with self.session_factory() as db:
+                        renewed = self.lease.heartbeat(db)
+                if not renewed:
+                    logger.warning("ingest_lease_lost name=%s owner=%s", self.lease.name, self.lease.owner)
+                    return
+            except Exception:
+                logger.exception("ingest_lease_heartbeat_failed name=%s", self.lease.name)
+
+    def __enter__(self) -> _LeaseHeartbeat:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+
+@contextmanager
+def ingest_lease(
+    db: Session,
+    name: str,
+    *,
+    busy_message: str,
+    ttl_seconds: int | None = None,
+) -> Iterator[HeldLease]:
+    """Hold ``name`` for the duration of the block or raise ``IngestLeaseBusy``.
+
+    If the block raises, ``db`` is rolled back before the lease is released so
+    the release does not commit a half-finished ingest.
+    """
+    lease = acquire_ingest_lease(db, name, ttl_seconds=ttl_seconds)
+    if lease is None:
+        raise IngestLeaseBusy(name, busy_message, ingest_lease_status(db, name))
+    with _hold(db, lease):
+        yield lease
+
+
+@contextmanager
+def ingest_lease_slot(
+    db: Session,
+    name: str,
+    *,
+    slots: int,
+    busy_message: str,
+    ttl_seconds: int | None = None,
+) -> Iterator[HeldLease]:
+    """Hold one of the ``slots`` leases of ``name`` or raise ``IngestLeaseBusy``."""
+    for slot_name in lease_slots(name, slots):
+        lease = acquire_ingest_lease(db, slot_name, ttl_seconds=ttl_seconds)
+        if lease is not None:
+            break
+    else:
+        raise IngestLeaseBusy(name, busy_message)
+    with _hold(db, lease):
+        yield lease
+
+
+@contextmanager
+def _hold(db: Session, lease: HeldLease) -> Iterator[None]:
+    """Heartbeat ``lease`` for the block, rolling ``db`` back if it raises."""
+    try:
+        with _LeaseHeartbeat(lease, sessionmaker(bind=db.get_bind())):
+            yield
+    except BaseException:
+        db.rollback()
+        raise
+    finally:
+        lease.release(db)
+
+
+@contextmanager
+def standalone_lease(
+    name: str,
+    *,
+    session_factory: Callable[[], Session] = SessionLocal,
+    ttl_seconds: int | None = None,
+) -> Iterator[HeldLease | None]:
+    """Hold ``name`` with a session of its own; yield None if it is taken.
+
+    Used by scheduled jobs that open their own sessions per workspace.
+    """
+    db = session_factory()
+    try:
+        lease = acquire_ingest_lease(db, name, ttl_seconds=ttl_seconds)
+        if lease is None:
+            yield None
+            return
+        try:
+            with _LeaseHeartbeat(lease, session_factory):
+                yield lease
+        finally:
+            db.rollback()
+            lease.release(db)
+    finally:
+        db.close()
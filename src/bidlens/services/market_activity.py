@@ -168,6 +168,71 @@ def _merged_account_rows(grouped_rows: list[Any]) -> list[dict[str, Any]]:
     return rows
 
 
+def _activity_rows(db: Session, *, conditions, qualified, shortlisted, view_by: str) -> list[dict[str, Any]]:
+    dimension = _dimension_expression(view_by).label("dimension")
+    title = func.max(func.nullif(func.trim(Opportunity.naics_title), "")).label("naics_title")
+    query_columns = [
+        dimension,
+        func.count(Opportunity.id).label("imported"),
+        func.sum(case((qualified, 1), else_=0)).label("qualified"),
+        func.sum(case((shortlisted, 1), else_=0)).label("shortlisted"),
+    ]
+    if view_by == "naics":
+        query_columns.append(title)
+    grouped = db.query(*query_columns).filter(*conditions).group_by(dimension).all()
+
+    if view_by == "account":
+        rows = _merged_account_rows(grouped)
+    else:
+        rows: list[dict[str, Any]] = []
+        for grouped_row in grouped:
+            code = str(grouped_row.dimension)
+            naics_title = getattr(grouped_row, "naics_title", None)
+            label = f"{code} — {naics_title}" if view_by == "naics" and code != "No NAICS" and naics_title else code
+            imported = int(grouped_row.imported or 0)
+            qualified_count = int(grouped_row.qualified or 0)
+            shortlisted_count = int(grouped_row.shortlisted or 0)
+            rows.append({
+                "label": label,
+                "imported": imported,
+                "qualified": qualified_count,
+                "shortlisted": shortlisted_count,
+                "conversion": {
+                    "imported": 100.0 if imported else None,
+                    "qualified": conversion_percent(qualified_count, imported),
+                    "shortlisted": conversion_percent(shortlisted_count, qualified_count),
+                },
+            })
+
+    return rows
+
+
+def market_activity_rows(
+    db: Session,
+    *,
+    organization_id: int,
+    filters: MarketActivityFilters,
+    view_by: str = "account",
+    metric: str = "count",
+    sort: str | None = None,
+    direction: str = "desc",
+) -> list[dict[str, Any]]:
+    """Every sorted row of the Analytics table, without totals or paging."""
+    view_by = view_by if view_by in VIEW_BY_OPTIONS else "account"
+    metric = metric if metric in METRIC_OPTIONS else "count"
+    sort = sort if sort in SORT_COLUMNS else ("qualified" if metric == "conversion" else "imported")
+    direction = direction if direction in {"asc", "desc"} else "desc"
+    rows = _activity_rows(
+        db,
+        conditions=_base_conditions(organization_id, filters),
+        qualified=_qualified_condition(organization_id),
+        shortlisted=_shortlisted_condition(organization_id),
+        view_by=view_by,
+    )
+    _sort_rows(rows, sort=sort, direction=direction, metric=metric)
+    return rows
+
+
 def build_market_activity(
     db: Session,
     *,
@@ -204,41 +269,13 @@ def build_market_activity(
         "shortlisted": conversion_percent(metrics["shortlisted"], metrics["qualified"]),
     }
 
-    dimension = _dimension_expression(view_by).label("dimension")
-    title = func.max(func.nullif(func.trim(Opportunity.naics_title), "")).label("naics_title")
-    query_columns = [
-        dimension,
-        func.count(Opportunity.id).label("imported"),
-        func.sum(case((qualified, 1), else_=0)).label("qualified"),
-        func.sum(case((shortlisted, 1), else_=0)).label("shortlisted"),
-    ]
-    if view_by == "naics":
-        query_columns.append(title)
-    grouped = db.query(*query_columns).filter(*conditions).group_by(dimension).all()
-
-    if view_by == "account":
-        rows = _merged_account_rows(grouped)
-    else:
-        rows: list[dict[str, Any]] = []
-        for grouped_row in grouped:
-            code = str(grouped_row.dimension)
-            naics_title = getattr(grouped_row, "naics_title", None)
-            label = f"{code} — {naics_title}" if view_by == "naics" and code != "No NAICS" and naics_title else code
-            imported = int(grouped_row.imported or 0)
-            qualified_count = int(grouped_row.qualified or 0)
-            shortlisted_count = int(grouped_row.shortlisted or 0)
-            rows.append({
-                "label": label,
-                "imported": imported,
-                "qualified": qualified_count,
-                "shortlisted": shortlisted_count,
-                "conversion": {
-                    "imported": 100.0 if imported else None,
-                    "qualified": conversion_percent(qualified_count, imported),
-                    "shortlisted": conversion_percent(shortlisted_count, qualified_count),
-                },
-            })
-
+    rows = _activity_rows(
+        db,
+        conditions=conditions,
+        qualified=qualified,
+        shortlisted=shortlisted,
+        view_by=view_by,
+    )
     _sort_rows(rows, sort=sort, direction=direction, metric=metric)
     page_size = max(1, int(page_size))
     total_rows = len(rows)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from collections import Counter, defaultdict
+from dataclasses import replace
 import datetime as dt
+from functools import partial
+from time import perf_counter
 from typing import Any, Callable
 
 from sqlalchemy.orm import Session
 
+from ..config import DAILY_BRIEF_EMAIL_RATE_PER_SECOND
 from ..database import SessionLocal
 from ..grants_gov_client import DEFAULT_GRANTS_POSTED_DAYS_BACK, DEFAULT_GRANTS_ROWS
 from ..ingest_grants_gov import ingest_grants_gov
@@ -20,9 +24,17 @@ from ..models import (
     User,
     Workspace,
 )
-from .daily_brief_emails import build_daily_brief_email_message, is_valid_recipient_email
-from .daily_snapshot import create_daily_snapshot
-from .email_delivery import EmailSender, ResendEmailSender
+from .daily_brief_emails import (
+    DailyBriefRecipient,
+    build_daily_brief_email_messages,
+    is_valid_recipient_email,
+)
+from .daily_snapshot import (
+    build_organization_sections,
+    build_user_snapshot_payloads,
+    create_daily_snapshot,
+)
+from .email_delivery import EmailDispatcher, EmailMessage, EmailSender, RateLimiter, ResendEmailSender
 from .ingestion_runs import record_source_activity
 from .job_runs import (
     JOB_STATUS_FAILED,
@@ -42,10 +54,21 @@ from .job_runs import (
     start_job_run,
 )
 from .sam_pulls import execute_sam_source_pull, record_sam_failure_activity
+from .sam_search_cache import SamSearchCache
+from .tenant_executor import (
+    UPSTREAM_GRANTS_GOV,
+    UPSTREAM_RESEND,
+    UPSTREAM_SAM,
+    TenantTask,
+    fair_tenant_order,
+    run_tenant_tasks,
+    tenant_print,
+    tenant_workers,
+)
 
 
 def _print(message: str) -> None:
-    print(message, flush=True)
+    tenant_print(message)
 
 
 def _job_exit_code(status_counts: Counter[str]) -> int:
@@ -93,6 +116,7 @@ def _sam_details(result: dict[str, Any], *, source_configs_processed: int) -> di
         "errors": int(result.get("errors", 0) or 0),
         "pages_pulled": int(result.get("pages_pulled", 0) or 0),
         "search_requests_made": int(result.get("search_requests_made", 0) or 0),
+        "search_cache_hits": int(result.get("search_cache_hits", 0) or 0),
         "checkpoint_saved": paused,
         "pause_reason": "rate_limit" if paused else None,
         "ingestion_run_ids": [result["run_id"]] if result.get("run_id") else [],
@@ -111,6 +135,7 @@ def _combine_sam_details(details: list[dict[str, Any]]) -> dict[str, Any]:
         "errors": 0,
         "pages_pulled": 0,
         "search_requests_made": 0,
+        "search_cache_hits": 0,
         "checkpoint_saved": False,
         "pause_reason": None,
         "ingestion_run_ids": [],
@@ -126,6 +151,7 @@ def _combine_sam_details(details: list[dict[str, Any]]) -> dict[str, Any]:
             "errors",
             "pages_pulled",
             "search_requests_made",
+            "search_cache_hits",
         ):
             combined[key] += int(detail.get(key, 0) or 0)
         combined["checkpoint_saved"] = combined["checkpoint_saved"] or bool(detail.get("checkpoint_saved"))
@@ -238,21 +264,126 @@ def _grants_details(result: dict[str, Any], *, source_configs_processed: int, in
     }
 
 
+def _run_sam_organization(
+    session_factory: Callable[[], Session],
+    *,
+    organization_id: int,
+    config_ids: list[int],
+    trigger_type: str,
+    search_cache: SamSearchCache,
+) -> str:
+    db = session_factory()
+    job_run = None
+    try:
+        job_run = start_job_run(
+            db,
+            organization_id=organization_id,
+            job_type=JOB_TYPE_SAM_INGEST,
+            trigger_type=trigger_type,
+            details={"source_config_ids": config_ids, "source_configs_processed": 0},
+        )
+        _print(f"Organization {organization_id}")
+        _print(f"JobRun {job_run.id}")
+        statuses: list[str] = []
+        details_by_config: list[dict[str, Any]] = []
+        for config_id in config_ids:
+            try:
+                config = db.query(SamSourceConfig).filter(SamSourceConfig.id == config_id).one()
+                result = execute_sam_source_pull(
+                    db,
+                    organization_id=config.organization_id,
+                    config=config,
+                    run_type="Scheduled",
+                    manual_pull=False,
+                    search_cache=search_cache,
+                )
+                statuses.append(_job_run_status(result.get("status")))
+                details_by_config.append(_sam_details(result, source_configs_processed=1))
+            except Exception as exc:
+                db.rollback()
+                try:
+                    failure_config = db.query(SamSourceConfig).filter(SamSourceConfig.id == config_id).first()
+                    record_sam_failure_activity(
+                        db,
+                        organization_id=organization_id,
+                        config=failure_config,
+                        error=exc,
+                        run_type="Scheduled",
+                    )
+                except Exception:
+                    db.rollback()
+                statuses.append(JOB_STATUS_FAILED)
+                details_by_config.append({
+                    "source_configs_processed": 1,
+                    "records_seen": 0,
+                    "created": 0,
+                    "updated": 0,
+                    "unchanged": 0,
+                    "skipped": 0,
+                    "filtered": 0,
+                    "errors": 1,
+                    "pages_pulled": 0,
+                    "search_requests_made": 0,
+                    "checkpoint_saved": False,
+                    "pause_reason": None,
+                    "ingestion_run_ids": [],
+                    "failed_source_config_id": config_id,
+                })
+                _print(f"Source config {config_id} failed: {type(exc).__name__}")
+        status = _combine_statuses(statuses)
+        details = _combine_sam_details(details_by_config)
+        summary = (
+            f"SAM.gov ingestion {status}: {details['records_seen']} records seen, "
+            f"{details['created']} created, {details['updated']} updated, "
+            f"{details['filtered']} filtered, {details['errors']} errors"
+        )
+        complete_job_run(db, job_run, status=status, summary=summary, details=details)
+        _print(f"Status: {status}")
+        _print(f"Records seen: {details['records_seen']}")
+        _print(f"Created: {details['created']}")
+        _print(f"Filtered: {details['filtered']}")
+        if details.get("pause_reason"):
+            _print(f"Reason: {details['pause_reason']}")
+    except Exception as exc:
+        db.rollback()
+        if job_run is not None:
+            fail_job_run(
+                db,
+                job_run,
+                exc,
+                summary="SAM.gov ingestion job failed before completion",
+                details={"source_config_ids": config_ids, "errors": 1},
+            )
+        status = JOB_STATUS_FAILED
+        _print(f"Organization {organization_id} failed: {type(exc).__name__}")
+    finally:
+        db.close()
+    return status
+
+
 def run_sam_ingest_job(
     *,
     session_factory: Callable[[], Session] = SessionLocal,
     trigger_type: str = TRIGGER_TYPE_SCHEDULED,
+    max_workers: int | None = None,
 ) -> int:
     _print("SAM.gov ingestion job started")
     list_db = session_factory()
     try:
-        config_rows = (
-            list_db.query(SamSourceConfig.id, SamSourceConfig.organization_id)
+        configs = (
+            list_db.query(SamSourceConfig)
             .join(Organization, Organization.id == SamSourceConfig.organization_id)
             .filter(Organization.is_live.is_(True))
             .order_by(SamSourceConfig.organization_id.asc(), SamSourceConfig.id.asc())
             .all()
         )
+        config_rows = [(config.id, config.organization_id) for config in configs]
+        organization_order = fair_tenant_order(
+            list_db,
+            [int(organization_id) for _, organization_id in config_rows],
+            job_type=JOB_TYPE_SAM_INGEST,
+        )
+        workers = tenant_workers(list_db, max_workers)
     finally:
         list_db.close()
 
@@ -264,104 +395,117 @@ def run_sam_ingest_job(
         _print("SAM.gov ingestion job finished")
         return 0
 
-    status_counts: Counter[str] = Counter()
-    for organization_id, config_ids in grouped.items():
-        db = session_factory()
-        job_run = None
-        try:
-            job_run = start_job_run(
-                db,
+    # One cache for the whole run: a search page several organizations'
+    # configs request is fetched from SAM once and served to each pull.
+    search_cache = SamSearchCache()
+
+    status_counts = run_tenant_tasks(
+        [
+            TenantTask(
                 organization_id=organization_id,
-                job_type=JOB_TYPE_SAM_INGEST,
-                trigger_type=trigger_type,
-                details={"source_config_ids": config_ids, "source_configs_processed": 0},
-            )
-            _print(f"Organization {organization_id}")
-            _print(f"JobRun {job_run.id}")
-            statuses: list[str] = []
-            details_by_config: list[dict[str, Any]] = []
-            for config_id in config_ids:
-                try:
-                    config = db.query(SamSourceConfig).filter(SamSourceConfig.id == config_id).one()
-                    result = execute_sam_source_pull(
-                        db,
-                        organization_id=config.organization_id,
-                        config=config,
-                        run_type="Scheduled",
-                        manual_pull=False,
-                    )
-                    statuses.append(_job_run_status(result.get("status")))
-                    details_by_config.append(_sam_details(result, source_configs_processed=1))
-                except Exception as exc:
-                    db.rollback()
-                    try:
-                        failure_config = db.query(SamSourceConfig).filter(SamSourceConfig.id == config_id).first()
-                        record_sam_failure_activity(
-                            db,
-                            organization_id=organization_id,
-                            config=failure_config,
-                            error=exc,
-                            run_type="Scheduled",
-                        )
-                    except Exception:
-                        db.rollback()
-                    statuses.append(JOB_STATUS_FAILED)
-                    details_by_config.append({
-                        "source_configs_processed": 1,
-                        "records_seen": 0,
-                        "created": 0,
-                        "updated": 0,
-                        "unchanged": 0,
-                        "skipped": 0,
-                        "filtered": 0,
-                        "errors": 1,
-                        "pages_pulled": 0,
-                        "search_requests_made": 0,
-                        "checkpoint_saved": False,
-                        "pause_reason": None,
-                        "ingestion_run_ids": [],
-                        "failed_source_config_id": config_id,
-                    })
-                    _print(f"Source config {config_id} failed: {type(exc).__name__}")
-            status = _combine_statuses(statuses)
-            details = _combine_sam_details(details_by_config)
-            summary = (
-                f"SAM.gov ingestion {status}: {details['records_seen']} records seen, "
-                f"{details['created']} created, {details['updated']} updated, "
-                f"{details['filtered']} filtered, {details['errors']} errors"
+                run=partial(
+                    _run_sam_organization,
+                    session_factory,
+                    organization_id=organization_id,
+                    config_ids=grouped[organization_id],
+                    trigger_type=trigger_type,
+                    search_cache=search_cache,
+                ),
+                upstream=UPSTREAM_SAM,
             )
-            complete_job_run(db, job_run, status=status, summary=summary, details=details)
-            status_counts[status] += 1
-            _print(f"Status: {status}")
-            _print(f"Records seen: {details['records_seen']}")
-            _print(f"Created: {details['created']}")
-            _print(f"Filtered: {details['filtered']}")
-            if details.get("pause_reason"):
-                _print(f"Reason: {details['pause_reason']}")
-        except Exception as exc:
-            db.rollback()
-            if job_run is not None:
-                fail_job_run(
-                    db,
-                    job_run,
-                    exc,
-                    summary="SAM.gov ingestion job failed before completion",
-                    details={"source_config_ids": config_ids, "errors": 1},
-                )
-            status_counts[JOB_STATUS_FAILED] += 1
-            _print(f"Organization {organization_id} failed: {type(exc).__name__}")
-        finally:
-            db.close()
+            for organization_id in organization_order
+        ],
+        max_workers=workers,
+    )
 
     _print("SAM.gov ingestion job finished")
     _print(_job_summary(status_counts))
     return _job_exit_code(status_counts)
 
 
+def _run_grants_organization(
+    session_factory: Callable[[], Session],
+    *,
+    organization_id: int,
+    config_ids: list[int],
+    trigger_type: str,
+) -> str:
+    db = session_factory()
+    job_run = None
+    try:
+        job_run = start_job_run(
+            db,
+            organization_id=organization_id,
+            job_type=JOB_TYPE_GRANTS_INGEST,
+            trigger_type=trigger_type,
+            details={"source_config_ids": config_ids, "source_configs_processed": 0},
+        )
+        _print(f"Organization {organization_id}")
+        _print(f"JobRun {job_run.id}")
+        config = db.query(GrantsSourceConfig).filter(GrantsSourceConfig.id == config_ids[0]).one()
+        result = ingest_grants_gov(
+            db,
+            organization_id=config.organization_id,
+            days_back=config.posted_days_back or DEFAULT_GRANTS_POSTED_DAYS_BACK,
+            rows=config.rows or DEFAULT_GRANTS_ROWS,
+            run_type="Scheduled",
+        )
+        ingestion_run = _record_grants_ingestion_run(db, organization_id=config.organization_id, result=result)
+        status = _job_run_status(result.get("status"))
+        details = _grants_details(
+            result,
+            source_configs_processed=len(config_ids),
+            ingestion_run_id=ingestion_run.id,
+        )
+        summary = result.get("message") or (
+            f"Grants.gov ingestion {status}: {details['records_seen']} records seen, "
+            f"{details['created']} created, {details['updated']} updated, {details['errors']} errors"
+        )
+        complete_job_run(db, job_run, status=status, summary=summary, details=details)
+        _print(f"Status: {status}")
+        _print(f"Records seen: {details['records_seen']}")
+        _print(f"Created: {details['created']}")
+        _print(f"Updated: {details['updated']}")
+    except Exception as exc:
+        db.rollback()
+        ingestion_run_id = None
+        try:
+            ingestion_run_id = _record_grants_failure_ingestion_run(
+                db,
+                organization_id=organization_id,
+                error=exc,
+            ).id
+        except Exception:
+            db.rollback()
+        if job_run is not None:
+            fail_job_run(
+                db,
+                job_run,
+                exc,
+                summary="Grants.gov ingestion job failed",
+                details={
+                    "source_configs_processed": len(config_ids),
+                    "records_seen": 0,
+                    "created": 0,
+                    "updated": 0,
+                    "unchanged": 0,
+                    "skipped": 0,
+                    "errors": 1,
+                    "ingestion_run_ids": [ingestion_run_id] if ingestion_run_id else [],
+                },
+            )
+        status = JOB_STATUS_FAILED
+        _print(f"Organization {organization_id} failed: {type(exc).__name__}")
+    finally:
+        db.close()
+    return status
+
+
 def run_grants_ingest_job(
     *,
     session_factory: Callable[[], Session] = SessionLocal,
     trigger_type: str = TRIGGER_TYPE_SCHEDULED,
+    max_workers: int | None = None,
 ) -> int:
     _print("Grants.gov ingestion job started")
     list_db = session_factory()
@@ -374,6 +518,12 @@ def run_grants_ingest_job(
             .order_by(GrantsSourceConfig.organization_id.asc(), GrantsSourceConfig.id.asc())
             .all()
         )
+        organization_order = fair_tenant_order(
+            list_db,
+            [int(organization_id) for _, organization_id in config_rows],
+            job_type=JOB_TYPE_GRANTS_INGEST,
+        )
+        workers = tenant_workers(list_db, max_workers)
     finally:
         list_db.close()
 
@@ -385,77 +535,23 @@ def run_grants_ingest_job(
         _print("Grants.gov ingestion job finished")
         return 0
 
-    status_counts: Counter[str] = Counter()
-    for organization_id, config_ids in grouped.items():
-        db = session_factory()
-        job_run = None
-        try:
-            job_run = start_job_run(
-                db,
+    status_counts = run_tenant_tasks(
+        [
+            TenantTask(
                 organization_id=organization_id,
-                job_type=JOB_TYPE_GRANTS_INGEST,
-                trigger_type=trigger_type,
-                details={"source_config_ids": config_ids, "source_configs_processed": 0},
-            )
-            _print(f"Organization {organization_id}")
-            _print(f"JobRun {job_run.id}")
-            config = db.query(GrantsSourceConfig).filter(GrantsSourceConfig.id == config_ids[0]).one()
-            result = ingest_grants_gov(
-                db,
-                organization_id=config.organization_id,
-                days_back=config.posted_days_back or DEFAULT_GRANTS_POSTED_DAYS_BACK,
-                rows=config.rows or DEFAULT_GRANTS_ROWS,
-                run_type="Scheduled",
-            )
-            ingestion_run = _record_grants_ingestion_run(db, organization_id=config.organization_id, result=result)
-            status = _job_run_status(result.get("status"))
-            details = _grants_details(
-                result,
-                source_configs_processed=len(config_ids),
-                ingestion_run_id=ingestion_run.id,
-            )
-            summary = result.get("message") or (
-                f"Grants.gov ingestion {status}: {details['records_seen']} records seen, "
-                f"{details['created']} created, {details['updated']} updated, {details['errors']} errors"
-            )
-            complete_job_run(db, job_run, status=status, summary=summary, details=details)
-            status_counts[status] += 1
-            _print(f"Status: {status}")
-            _print(f"Records seen: {details['records_seen']}")
-            _print(f"Created: {details['created']}")
-            _print(f"Updated: {details['updated']}")
-        except Exception as exc:
-            db.rollback()
-            ingestion_run_id = None
-            try:
-                ingestion_run_id = _record_grants_failure_ingestion_run(
-                    db,
+                run=partial(
+                    _run_grants_organization,
+                    session_factory,
                     organization_id=organization_id,
-                    error=exc,
-                ).id
-            except Exception:
-                db.rollback()
-            if job_run is not None:
-                fail_job_run(
-                    db,
-                    job_run,
-                    exc,
-                    summary="Grants.gov ingestion job failed",
-                    details={
-                        "source_configs_processed": len(config_ids),
-                        "records_seen": 0,
-                        "created": 0,
-                        "updated": 0,
-                        "unchanged": 0,
-                        "skipped": 0,
-                        "errors": 1,
-                        "ingestion_run_ids": [ingestion_run_id] if ingestion_run_id else [],
-                    },
-                )
-            status_counts[JOB_STATUS_FAILED] += 1
-            _print(f"Organization {organization_id} failed: {type(exc).__name__}")
-        finally:
-            db.close()
+                    config_ids=grouped[organization_id],
+                    trigger_type=trigger_type,
+                ),
+                upstream=UPSTREAM_GRANTS_GOV,
+            )
+            for organization_id in organization_order
+        ],
+        max_workers=workers,
+    )
 
     _print("Grants.gov ingestion job finished")
     _print(_job_summary(status_counts))
@@ -474,11 +570,119 @@ def _eligible_snapshot_users(db: Session, *, organization_id: int) -> list[User]
     )
 
 
+def _run_daily_snapshot_workspace(
+    session_factory: Callable[[], Session],
+    *,
+    workspace_id: int,
+    organization_id: int,
+    trigger_type: str,
+    snapshot_date: dt.date,
+) -> str:
+    db = session_factory()
+    job_run = None
+    try:
+        job_run = start_job_run(
+            db,
+            organization_id=int(organization_id),
+            job_type=JOB_TYPE_DAILY_SNAPSHOT,
+            trigger_type=trigger_type,
+            details={"snapshot_date": snapshot_date.isoformat()},
+        )
+        _print(f"Organization {organization_id}")
+        _print(f"JobRun {job_run.id}")
+        users = _eligible_snapshot_users(db, organization_id=int(organization_id))
+        details = {
+            "snapshot_date": snapshot_date.isoformat(),
+            "users_eligible": len(users),
+            "snapshots_created": 0,
+            "already_existed": 0,
+            "failed": 0,
+        }
+        if not users:
+            status = JOB_STATUS_SKIPPED
+            summary = "Daily Snapshot skipped: no eligible users"
+        else:
+            existing_user_ids = {
+                user_id
+                for (user_id,) in db.query(DailySnapshot.user_id).filter(
+                    DailySnapshot.workspace_id == int(workspace_id),
+                    DailySnapshot.snapshot_date == snapshot_date,
+                )
+            }
+            pending_user_ids = [user.id for user in users if user.id not in existing_user_ids]
+            phase_timings = {"organization": 0.0, "user_overlays": 0.0, "persist": 0.0}
+            payloads: dict[int, dict[str, Any]] = {}
+            if pending_user_ids:
+                # Organization-wide sections are built once for the workspace;
+                # the per-user sections are queried for every pending user at once.
+                phase_started = perf_counter()
+                sections = build_organization_sections(
+                    db,
+                    workspace=db.get(Workspace, int(workspace_id)),
+                    snapshot_date=snapshot_date,
+                )
+                phase_timings["organization"] = round((perf_counter() - phase_started) * 1000, 2)
+                phase_started = perf_counter()
+                payloads = build_user_snapshot_payloads(db, sections, user_ids=pending_user_ids)
+                phase_timings["user_overlays"] = round((perf_counter() - phase_started) * 1000, 2)
+            phase_started = perf_counter()
+            for user in users:
+                try:
+                    create_daily_snapshot(
+                        db,
+                        workspace_id=int(workspace_id),
+                        user_id=user.id,
+                        snapshot_date=snapshot_date,
+                        payload=payloads.get(user.id),
+                    )
+                    if user.id in existing_user_ids:
+                        details["already_existed"] += 1
+                    else:
+                        details["snapshots_created"] += 1
+                except Exception:
+                    db.rollback()
+                    details["failed"] += 1
+            phase_timings["persist"] = round((perf_counter() - phase_started) * 1000, 2)
+            details["phase_timings_ms"] = phase_timings
+            if details["failed"] == 0:
+                status = JOB_STATUS_SUCCESS
+            elif details["failed"] >= details["users_eligible"]:
+                status = JOB_STATUS_FAILED
+            else:
+                status = JOB_STATUS_PARTIAL_SUCCESS
+            summary = (
+                f"Daily Snapshot {status}: {details['snapshots_created']} created, "
+                f"{details['already_existed']} already existed, {details['failed']} failed"
+            )
+        complete_job_run(db, job_run, status=status, summary=summary, details=details)
+        _print(f"Status: {status}")
+        _print(f"Users eligible: {details['users_eligible']}")
+        _print(f"Snapshots created: {details['snapshots_created']}")
+        _print(f"Already existed: {details['already_existed']}")
+        _print(f"Failed: {details['failed']}")
+    except Exception as exc:
+        db.rollback()
+        if job_run is not None:
+            fail_job_run(
+                db,
+                job_run,
+                exc,
+                summary="Daily Snapshot job failed before completion",
+                details={"snapshot_date": snapshot_date.isoformat(), "failed": 1},
+            )
+        status = JOB_STATUS_FAILED
+        _print(f"Organization {organization_id} failed: {type(exc).__name__}")
+    finally:
+        db.close()
+    return status
+
+
 def run_daily_snapshots_job(
     *,
     session_factory: Callable[[], Session] = SessionLocal,
     trigger_type: str = TRIGGER_TYPE_SCHEDULED,
     snapshot_date: dt.date | None = None,
+    max_workers: int | None = None,
 ) -> int:
     snapshot_date = snapshot_date or dt.date.today()
     _print("Daily Snapshot job started")
@@ -491,6 +695,14 @@ def run_daily_snapshots_job(
             .order_by(Workspace.organization_id.asc())
             .all()
         )
+        organization_order = fair_tenant_order(
+            list_db,
+            [int(organization_id) for _, organization_id in workspace_rows],
+            job_type=JOB_TYPE_DAILY_SNAPSHOT,
+        )
+        rank = {organization_id: index for index, organization_id in enumerate(organization_order)}
+        workspace_rows.sort(key=lambda row: rank[int(row[1])])
+        workers = tenant_workers(list_db, max_workers)
     finally:
         list_db.close()
 
@@ -499,102 +711,184 @@ def run_daily_snapshots_job(
         _print("Daily Snapshot job finished")
         return 0
 
-    status_counts: Counter[str] = Counter()
-    for workspace_id, organization_id in workspace_rows:
-        db = session_factory()
-        job_run = None
-        try:
-            job_run = start_job_run(
-                db,
+    status_counts = run_tenant_tasks(
+        [
+            TenantTask(
                 organization_id=int(organization_id),
-                job_type=JOB_TYPE_DAILY_SNAPSHOT,
-                trigger_type=trigger_type,
-                details={"snapshot_date": snapshot_date.isoformat()},
+                run=partial(
+                    _run_daily_snapshot_workspace,
+                    session_factory,
+                    workspace_id=int(workspace_id),
+                    organization_id=int(organization_id),
+                    trigger_type=trigger_type,
+                    snapshot_date=snapshot_date,
+                ),
             )
-            _print(f"Organization {organization_id}")
-            _print(f"JobRun {job_run.id}")
-            users = _eligible_snapshot_users(db, organization_id=int(organization_id))
-            details = {
-                "snapshot_date": snapshot_date.isoformat(),
-                "users_eligible": len(users),
-                "snapshots_created": 0,
-                "already_existed": 0,
-                "failed": 0,
-            }
-            if not users:
-                status = JOB_STATUS_SKIPPED
-                summary = "Daily Snapshot skipped: no eligible users"
-            else:
-                for user in users:
-                    try:
-                        existing = (
-                            db.query(DailySnapshot)
-                            .filter(
-                                DailySnapshot.workspace_id == int(workspace_id),
-                                DailySnapshot.user_id == user.id,
-                                DailySnapshot.snapshot_date == snapshot_date,
-                            )
-                            .first()
-                        )
-                        create_daily_snapshot(
-                            db,
-                            workspace_id=int(workspace_id),
-                            user_id=user.id,
-                            snapshot_date=snapshot_date,
-                        )
-                        if existing:
-                            details["already_existed"] += 1
-                        else:
-                            details["snapshots_created"] += 1
-                    except Exception:
-                        db.rollback()
-                        details["failed"] += 1
-                if details["failed"] == 0:
-                    status = JOB_STATUS_SUCCESS
-                elif details["failed"] >= details["users_eligible"]:
-                    status = JOB_STATUS_FAILED
-                else:
-                    status = JOB_STATUS_PARTIAL_SUCCESS
-                summary = (
-                    f"Daily Snapshot {status}: {details['snapshots_created']} created, "
-                    f"{details['already_existed']} already existed, {details['failed']} failed"
-                )
-            complete_job_run(db, job_run, status=status, summary=summary, details=details)
-            status_counts[status] += 1
-            _print(f"Status: {status}")
-            _print(f"Users eligible: {details['users_eligible']}")
-            _print(f"Snapshots created: {details['snapshots_created']}")
-            _print(f"Already existed: {details['already_existed']}")
-            _print(f"Failed: {details['failed']}")
-        except Exception as exc:
-            db.rollback()
-            if job_run is not None:
-                fail_job_run(
-                    db,
-                    job_run,
-                    exc,
-                    summary="Daily Snapshot job failed before completion",
-                    details={"snapshot_date": snapshot_date.isoformat(), "failed": 1},
-                )
-            status_counts[JOB_STATUS_FAILED] += 1
-            _print(f"Organization {organization_id} failed: {type(exc).__name__}")
-        finally:
-            db.close()
+            for workspace_id, organization_id in workspace_rows
+        ],
+        max_workers=workers,
+    )
 
     _print("Daily Snapshot job finished")
     _print(_job_summary(status_counts))
     return _job_exit_code(status_counts)
 
 
+def _run_daily_brief_email_workspace(
+    session_factory: Callable[[], Session],
+    *,
+    workspace_id: int,
+    organization_id: int,
+    trigger_type: str,
+    snapshot_date: dt.date,
+    sender: EmailSender,
+    rate_limiter: RateLimiter,
+) -> str:
+    db = session_factory()
+    job_run = None
+    try:
+        job_run = start_job_run(
+            db,
+            organization_id=int(organization_id),
+            job_type=JOB_TYPE_DAILY_BRIEF_EMAIL,
+            trigger_type=trigger_type,
+            details={"snapshot_date": snapshot_date.isoformat()},
+        )
+        _print(f"Organization {organization_id}")
+        _print(f"JobRun {job_run.id}")
+        users = _eligible_snapshot_users(db, organization_id=int(organization_id))
+        details = {
+            "snapshot_date": snapshot_date.isoformat(),
+            "users_eligible": len(users),
+            "sent": 0,
+            "skipped": 0,
+            "failed": 0,
+        }
+        workspace = db.query(Workspace).filter(Workspace.id == int(workspace_id)).first()
+        deliveries_by_user = {
+            delivery.user_id: delivery
+            for delivery in db.query(DailyBriefEmailDelivery).filter(
+                DailyBriefEmailDelivery.workspace_id == int(workspace_id),
+                DailyBriefEmailDelivery.snapshot_date == snapshot_date,
+            )
+        }
+        recipients = []
+        for user in users:
+            email = (user.email or "").strip()
+            existing = deliveries_by_user.get(user.id)
+            if (
+                getattr(user, "daily_brief_email_opted_out", False)
+                or not is_valid_recipient_email(email)
+                or (existing and existing.status == JOB_STATUS_SUCCESS)
+                or workspace is None
+            ):
+                details["skipped"] += 1
+                continue
+            recipients.append(DailyBriefRecipient(user_id=user.id, name=user.name, email=email))
+
+        # Stage 1: render every recipient's message, then record the
+        # deliveries as running before anything is sent.
+        rendered = build_daily_brief_email_messages(
+            db,
+            workspace=workspace,
+            recipients=recipients,
+            snapshot_date=snapshot_date,
+        ) if workspace is not None else {}
+        attempted_at = dt.datetime.now(dt.timezone.utc)
+        outgoing: list[tuple[DailyBriefEmailDelivery, EmailMessage, bool]] = []
+        for recipient in recipients:
+            message, item_count, skip_reason = rendered[recipient.user_id]
+            existing = deliveries_by_user.get(recipient.user_id)
+            delivery = existing or DailyBriefEmailDelivery(
+                organization_id=int(organization_id),
+                workspace_id=int(workspace_id),
+                user_id=recipient.user_id,
+                snapshot_date=snapshot_date,
+                recipient_email=recipient.email,
+            )
+            delivery.recipient_email = recipient.email
+            delivery.attempted_at = attempted_at
+            delivery.item_count = item_count
+            if not existing:
+                db.add(delivery)
+            if not message:
+                delivery.status = JOB_STATUS_SKIPPED
+                delivery.error_message = skip_reason
+                details["skipped"] += 1
+                continue
+            delivery.status = JOB_STATUS_RUNNING
+            delivery.error_message = None
+            # Only first attempts may share a provider batch; a delivery
+            # that was tried before is resent under its own idempotency key.
+            outgoing.append((delivery, message, existing is None))
+        db.flush()
+        messages = [
+            replace(message, idempotency_key=f"daily-brief-email/{delivery.id}")
+            for delivery, message, _ in outgoing
+        ]
+        db.commit()
+
+        # Stage 2: send through the bounded, rate-limited dispatcher and
+        # record each outcome as it arrives.
+        dispatcher = EmailDispatcher(sender, rate_limiter=rate_limiter)
+        for index, outcome in dispatcher.dispatch(messages, batchable=[fresh for _, _, fresh in outgoing]):
+            delivery = outgoing[index][0]
+            if isinstance(outcome, Exception):
+                delivery.status = JOB_STATUS_FAILED
+                delivery.error_message = sanitize_error_message(str(outcome))
+                delivery.provider = getattr(sender, "provider", None)
+                delivery.attempted_at = dt.datetime.now(dt.timezone.utc)
+                details["failed"] += 1
+            else:
+                delivery.status = JOB_STATUS_SUCCESS
+                delivery.sent_at = dt.datetime.now(dt.timezone.utc)
+                delivery.provider = outcome.provider
+                delivery.provider_message_id = outcome.message_id
+                delivery.error_message = None
+                details["sent"] += 1
+            db.commit()
+
+        if not users or (details["sent"] == 0 and details["failed"] == 0):
+            status = JOB_STATUS_SKIPPED
+        elif details["failed"] == 0:
+            status = JOB_STATUS_SUCCESS
+        elif details["sent"] == 0:
+            status = JOB_STATUS_FAILED
+        else:
+            status = JOB_STATUS_PARTIAL_SUCCESS
+        summary = (
+            f"Daily Brief Email {status}: {details['sent']} sent, "
+            f"{details['skipped']} skipped, {details['failed']} failed"
+        )
+        complete_job_run(db, job_run, status=status, summary=summary, details=details)
+        _print(f"Status: {status}")
+        _print(f"Sent: {details['sent']}")
+        _print(f"Skipped: {details['skipped']}")
+        _print(f"Failed: {details['failed']}")
+    except Exception as exc:
+        db.rollback()
+        if job_run is not None:
+            fail_job_run(db, job_run, exc, summary="Daily Brief Email job failed")
+        status = JOB_STATUS_FAILED
+        _print(f"Status: {JOB_STATUS_FAILED}")
+        _print(f"Error: {sanitize_error_message(str(exc))}")
+    finally:
+        db.close()
+    return status
+
+
 def run_daily_brief_emails_job(
     *,
     session_factory: Callable[[], Session] = SessionLocal,
     trigger_type: str = TRIGGER_TYPE_SCHEDULED,
     snapshot_date: dt.date | None = None,
     email_sender: EmailSender | None = None,
+    max_workers: int | None = None,
 ) -> int:
     snapshot_date = snapshot_date or dt.date.today()
     sender = email_sender or ResendEmailSender()
+    # Workspaces sending at the same time share one provider rate limit.
+    rate_limiter = RateLimiter(DAILY_BRIEF_EMAIL_RATE_PER_SECOND)
     _print("Daily Brief Email job started")
     list_db = session_factory()
     try:
@@ -606,6 +900,14 @@ def run_daily_brief_emails_job(
             .order_by(Workspace.organization_id.asc())
             .all()
         )
+        organization_order = fair_tenant_order(
+            list_db,
+            [int(organization_id) for _, organization_id in workspace_rows],
+            job_type=JOB_TYPE_DAILY_BRIEF_EMAIL,
+        )
+        rank = {organization_id: index for index, organization_id in enumerate(organization_order)}
+        workspace_rows.sort(key=lambda row: rank[int(row[1])])
+        workers = tenant_workers(list_db, max_workers)
     finally:
         list_db.close()
 
@@ -614,140 +916,26 @@ def run_daily_brief_emails_job(
         _print("Daily Brief Email job finished")
         return 0
 
-    status_counts: Counter[str] = Counter()
-    for workspace_id, organization_id in workspace_rows:
-        db = session_factory()
-        job_run = None
-        try:
-            job_run = start_job_run(
-                db,
+    status_counts = run_tenant_tasks(
+        [
+            TenantTask(
                 organization_id=int(organization_id),
-                job_type=JOB_TYPE_DAILY_BRIEF_EMAIL,
-                trigger_type=trigger_type,
-                details={"snapshot_date": snapshot_date.isoformat()},
-            )
-            _print(f"Organization {organization_id}")
-            _print(f"JobRun {job_run.id}")
-            users = _eligible_snapshot_users(db, organization_id=int(organization_id))
-            details = {
-                "snapshot_date": snapshot_date.isoformat(),
-                "users_eligible": len(users),
-                "sent": 0,
-                "skipped": 0,
-                "failed": 0,
-            }
-            for user in users:
-                email = (user.email or "").strip()
-                if getattr(user, "daily_brief_email_opted_out", False):
-                    details["skipped"] += 1
-                    continue
-                if not is_valid_recipient_email(email):
-                    details["skipped"] += 1
-                    continue
-
-                existing = (
-                    db.query(DailyBriefEmailDelivery)
-                    .filter(
-                        DailyBriefEmailDelivery.workspace_id == int(workspace_id),
-                        DailyBriefEmailDelivery.user_id == user.id,
-                        DailyBriefEmailDelivery.snapshot_date == snapshot_date,
-                    )
-                    .first()
-                )
-                if existing and existing.status == JOB_STATUS_SUCCESS:
-                    details["skipped"] += 1
-                    continue
-
-                workspace = db.query(Workspace).filter(Workspace.id == int(workspace_id)).first()
-                if workspace is None:
-                    details["skipped"] += 1
-                    continue
-                message, item_count, skip_reason = build_daily_brief_email_message(
-                    db,
-                    workspace=workspace,
-                    user_id=user.id,
-                    user_name=user.name,
-                    user_email=email,
-                    snapshot_date=snapshot_date,
-                )
-                delivery = existing or DailyBriefEmailDelivery(
-                    organization_id=int(organization_id),
+                run=partial(
+                    _run_daily_brief_email_workspace,
+                    session_factory,
                     workspace_id=int(workspace_id),
-                    user_id=user.id,
+                    organization_id=int(organization_id),
+                    trigger_type=trigger_type,
                     snapshot_date=snapshot_date,
-                    recipient_email=email,
-                )
-                delivery.recipient_email = email
-                delivery.status = JOB_STATUS_RUNNING
-                delivery.attempted_at = dt.datetime.now(dt.timezone.utc)
-                delivery.item_count = item_count
-                delivery.error_message = None
-                if not existing:
-                    db.add(delivery)
-                db.commit()
-
-                if not message:
-                    delivery.status = JOB_STATUS_SKIPPED
-                    delivery.error_message = skip_reason
-                    db.commit()
-                    details["skipped"] += 1
-                    continue
-
-                try:
-                    result = sender.send(message)
-                    delivery.status = JOB_STATUS_SUCCESS
-                    delivery.sent_at = dt.datetime.now(dt.timezone.utc)
-                    delivery.provider = result.provider
-                    delivery.provider_message_id = result.message_id
-                    delivery.error_message = None
-                    db.commit()
-                    details["sent"] += 1
-                except Exception as exc:
-                    db.rollback()
-                    delivery = (
-                        db.query(DailyBriefEmailDelivery)
-                        .filter(
-                            DailyBriefEmailDelivery.workspace_id == int(workspace_id),
-                            DailyBriefEmailDelivery.user_id == user.id,
-                            DailyBriefEmailDelivery.snapshot_date == snapshot_date,
-                        )
-                        .first()
-                    )
-                    if delivery is not None:
-                        delivery.status = JOB_STATUS_FAILED
-                        delivery.error_message = sanitize_error_message(str(exc))
-                        delivery.provider = getattr(sender, "provider", None)
-                        delivery.attempted_at = dt.datetime.now(dt.timezone.utc)
-                        db.commit()
-                    details["failed"] += 1
-
-            if not users or (details["sent"] == 0 and details["failed"] == 0):
-                status = JOB_STATUS_SKIPPED
-            elif details["failed"] == 0:
-                status = JOB_STATUS_SUCCESS
-            elif details["sent"] == 0:
-                status = JOB_STATUS_FAILED
-            else:
-                status = JOB_STATUS_PARTIAL_SUCCESS
-            summary = (
-                f"Daily Brief Email {status}: {details['sent']} sent, "
-                f"{details['skipped']} skipped, {details['failed']} failed"
+                    sender=sender,
+                    rate_limiter=rate_limiter,
+                ),
+                upstream=UPSTREAM_RESEND,
             )
-            complete_job_run(db, job_run, status=status, summary=summary, details=details)
-            status_counts[status] += 1
-            _print(f"Status: {status}")
-            _print(f"Sent: {details['sent']}")
-            _print(f"Skipped: {details['skipped']}")
-            _print(f"Failed: {details['failed']}")
-        except Exception as exc:
-            db.rollback()
-            if job_run is not None:
-                fail_job_run(db, job_run, exc, summary="Daily Brief Email job failed")
-            status_counts[JOB_STATUS_FAILED] += 1
-            _print(f"Status: {JOB_STATUS_FAILED}")
-            _print(f"Error: {sanitize_error_message(str(exc))}")
-        finally:
-            db.close()
+            for workspace_id, organization_id in workspace_rows
+        ],
+        max_workers=workers,
+    )
 
     _print("Daily Brief Email job finished")
     _print(_job_summary(status_counts))
@@ -67,17 +67,81 @@ def record_history_event(
     return event
 
 
+def record_history_events(
+    db: Session,
+    entries: list[dict[str, Any]],
+    *,
+    notify_interested: bool = True,
+) -> list[OpportunityHistoryEvent]:
+    """Record many history events with one flush and one interest lookup.
+
+    Each entry carries the ``record_history_event`` keyword arguments
+    (``opportunity``, ``event_type``, ``source``, ``event_data``,
+    ``occurred_at``).
+    """
+    if not entries:
+        return []
+    events = [
+        OpportunityHistoryEvent(
+            organization_id=entry["opportunity"].organization_id,
+            opportunity_id=entry["opportunity"].id,
+            event_type=entry["event_type"],
+            source=entry.get("source"),
+            event_data=entry.get("event_data"),
+            occurred_at=entry.get("occurred_at") or dt.datetime.utcnow(),
+        )
+        for entry in entries
+    ]
+    db.add_all(events)
+    db.flush()
+
+    if notify_interested:
+        interested_by_opportunity: dict[tuple[int, int], list[int]] = {}
+        organization_ids = {event.organization_id for event in events}
+        opportunity_ids = {event.opportunity_id for event in events}
+        for org_id, opp_id, user_id in (
+            db.query(Vote.org_id, Vote.opp_id, Vote.user_id)
+            .filter(
+                Vote.org_id.in_(organization_ids),
+                Vote.opp_id.in_(opportunity_ids),
+                Vote.vote == "PURSUE",
+            )
+            .all()
+        ):
+            interested_by_opportunity.setdefault((org_id, opp_id), []).append(user_id)
+        db.add_all(
+            OpportunityHistoryRecipient(
+                organization_id=event.organization_id,
+                opportunity_id=event.opportunity_id,
+                history_event_id=event.id,
+                user_id=user_id,
+            )
+            for event in events
+            for user_id in interested_by_opportunity.get(
+                (event.organization_id, event.opportunity_id), []
+            )
+        )
+
+    return events
+
+
+def imported_history_entry(opportunity: Opportunity) -> dict[str, Any]:
+    return {
+        "opportunity": opportunity,
+        "event_type": EVENT_IMPORTED,
+        "source": opportunity.source,
+        "event_data": {"source_record_id": opportunity.source_record_id},
+        "occurred_at": opportunity.created_at or opportunity.upserted_at,
+    }
+
+
 def record_imported_history(
     db: Session,
     opportunity: Opportunity,
 ) -> OpportunityHistoryEvent:
     return record_history_event(
         db,
-        opportunity=opportunity,
-        event_type=EVENT_IMPORTED,
-        source=opportunity.source,
-        event_data={"source_record_id": opportunity.source_record_id},
-        occurred_at=opportunity.created_at or opportunity.upserted_at,
+        **imported_history_entry(opportunity),
         notify_interested=False,
     )
 
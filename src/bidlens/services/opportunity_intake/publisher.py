@@ -233,7 +233,7 @@ class OpportunityPublisher:
             record_imported_history(db, opportunity)
             lane_match_count = refresh_opportunity_lane_matches(
                 db, draft.organization_id, opportunity
-            )
+            ).matched
             added = False
             if add_to_shortlist is True:
                 added = ensure_user_shortlisted(
@@ -30,10 +30,14 @@ from .repository import (
     KnowledgeBriefPersistenceError,
     KnowledgeBriefScopeError,
     KnowledgeBriefValidationError,
+    claim_next_pending_generation,
     create_pending_generation,
     expire_stale_generation,
+    generation_result_rows,
     get_active_generation,
+    get_generation,
     get_latest_successful_generation,
+    get_reusable_generation,
     mark_generation_failed,
     mark_generation_running,
     save_generation_success,
@@ -73,6 +77,9 @@ from .output_validation import (
 )
 from .compiler import GUTSCompilerError, OpportunityKnowledgeBriefCompiler, has_minimum_evidence
 from .service import GUTSServiceError, OpportunityKnowledgeBriefService
+from .worker import (
+    GENERATION_STAGES, generation_stage, generation_status_payload, run_guts_generation_worker,
+)
 
 __all__ = [
     "AUTHORITIES",
@@ -105,10 +112,14 @@ __all__ = [
     "KnowledgeBriefPersistenceError",
     "KnowledgeBriefScopeError",
     "KnowledgeBriefValidationError",
+    "claim_next_pending_generation",
     "create_pending_generation",
     "expire_stale_generation",
+    "generation_result_rows",
     "get_active_generation",
+    "get_generation",
     "get_latest_successful_generation",
+    "get_reusable_generation",
     "mark_generation_failed",
     "mark_generation_running",
     "save_generation_success",
@@ -154,4 +165,8 @@ __all__ = [
     "has_minimum_evidence",
     "GUTSServiceError",
     "OpportunityKnowledgeBriefService",
+    "GENERATION_STAGES",
+    "generation_stage",
+    "generation_status_payload",
+    "run_guts_generation_worker",
 ]
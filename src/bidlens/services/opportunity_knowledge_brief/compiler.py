@@ -27,8 +27,9 @@ from .output_validation import GUTSOutputValidator
 from .official_evidence import OfficialEvidenceCollector
 from .organizational_evidence import CommunicationEvidenceCollector, NoteEvidenceCollector
 from .repository import (
-    KnowledgeBriefPersistenceError, mark_generation_failed, mark_generation_running,
-    save_generation_success, update_active_generation_metadata,
+    KnowledgeBriefPersistenceError, generation_result_rows, get_reusable_generation,
+    mark_generation_failed, mark_generation_running, save_generation_success,
+    update_active_generation_metadata,
 )
 from .selection import ConflictDetector, EvidenceSelector
 
@@ -227,6 +228,21 @@ def _summaries(
     return statistics, source_summary
 
 
+def _reuse_statistics(reused: OpportunityKnowledgeBriefGeneration) -> dict[str, Any]:
+    """Model latency and tokens a reused generation avoided spending again."""
+    earlier = reused.statistics_json or {}
+    if earlier.get("reused_generation_id"):
+        # A reuse of a reuse saved what the original model call cost.
+        return {key: earlier[key] for key in earlier if key.startswith("reuse")}
+    return {
+        "reused_generation_id": reused.id,
+        "reuse_saved_model_ms": (reused.model_ms or 0) + (reused.validation_ms or 0),
+        "reuse_saved_input_tokens": reused.input_tokens or 0,
+        "reuse_saved_output_tokens": reused.output_tokens or 0,
+        "reuse_saved_total_tokens": reused.total_tokens or 0,
+    }
+
+
 class OpportunityKnowledgeBriefCompiler:
     def __init__(
         self, db: Session, *, current_state_assembler=None, official_collector=None,
@@ -249,15 +265,24 @@ class OpportunityKnowledgeBriefCompiler:
         self.validator = validator
         self.clock = clock
 
-    def generate(self, *, generation: OpportunityKnowledgeBriefGeneration, access_context: GUTSAccessContext, authorization_ms: int = 0) -> OpportunityKnowledgeBriefGeneration:
+    def generate(
+        self, *, generation: OpportunityKnowledgeBriefGeneration, access_context: GUTSAccessContext,
+        authorization_ms: int = 0, force_regenerate: bool = False, claimed: bool = False,
+    ) -> OpportunityKnowledgeBriefGeneration:
+        """Run a pending generation, or one a worker has ``claimed`` and already marked running.
+
+        Each evidence stage's timing is committed as it finishes, so the
+        generation's status endpoint can report which stage is running.
+        """
         total_started = perf_counter()
         timings: dict[str, Any] = {"authorization_ms": authorization_ms}
         stage = "lifecycle"
         persistence_started: float | None = None
         try:
-            if generation.status != GenerationStatus.PENDING:
-                raise GUTSCompilerError("unexpected_error", "The generation attempt is not pending.", stage="lifecycle")
-            mark_generation_running(self.db, generation, started_at=self.clock())
+            if not (claimed and generation.status == GenerationStatus.RUNNING):
+                if generation.status != GenerationStatus.PENDING:
+                    raise GUTSCompilerError("unexpected_error", "The generation attempt is not pending.", stage="lifecycle")
+                mark_generation_running(self.db, generation, started_at=self.clock())
             snapshot_started = self.clock()
             update_active_generation_metadata(self.db, generation, metadata={"source_snapshot_started_at": snapshot_started, **timings})
 
@@ -267,6 +292,7 @@ class OpportunityKnowledgeBriefCompiler:
                 workspace_id=access_context.workspace_id,
             )
             timings["current_state_ms"] = _elapsed_ms(started)
+            update_active_generation_metadata(self.db, generation, metadata={"current_state_ms": timings["current_state_ms"]})
             if not has_minimum_evidence(state):
                 raise GUTSCompilerError("insufficient_evidence", "This opportunity does not yet contain enough information to generate a briefing.", stage="current_state")
 
@@ -274,15 +300,19 @@ class OpportunityKnowledgeBriefCompiler:
             stage = "official_evidence"; started = perf_counter()
             official = self.official_collector.collect(**collector_args, workspace_id=state.workspace_id)
             timings["official_evidence_ms"] = _elapsed_ms(started)
+            update_active_generation_metadata(self.db, generation, metadata={"official_evidence_ms": timings["official_evidence_ms"]})
             stage = "notes"; started = perf_counter()
             notes = self.note_collector.collect(**collector_args)
             timings["notes_ms"] = _elapsed_ms(started)
+            update_active_generation_metadata(self.db, generation, metadata={"notes_ms": timings["notes_ms"]})
             stage = "communication"; started = perf_counter()
             communications = self.communication_collector.collect(**collector_args, workspace_id=state.workspace_id)
             timings["communication_ms"] = _elapsed_ms(started)
+            update_active_generation_metadata(self.db, generation, metadata={"communication_ms": timings["communication_ms"]})
             stage = "history"; started = perf_counter()
             history = self.history_collector.collect(**collector_args)
             timings["history_ms"] = _elapsed_ms(started)
+            update_active_generation_metadata(self.db, generation, metadata={"history_ms": timings["history_ms"]})
             snapshot_completed = self.clock()
 
             stage = "manifest"; started = perf_counter()
@@ -316,29 +346,64 @@ class OpportunityKnowledgeBriefCompiler:
                 "input_truncated": input_truncated,
             })
 
-            stage = "model"; started = perf_counter()
-            validator = self.validator or GUTSOutputValidator(
+            stage = "reuse"
+            reused = None if force_regenerate else get_reusable_generation(
+                self.db, organization_id=state.organization_id, opportunity_id=state.opportunity_id,
+                manifest_hash=manifest_hash, prompt_version=generation.prompt_version,
                 output_schema_version=generation.output_schema_version,
+                model=getattr(self.model_client, "model", None) or generation.model,
             )
-            model_result = generate_validated_briefing(
-                manifest, client=self.model_client, validator=validator,
-            )
-            measured_model_ms = _elapsed_ms(started)
-            timings["model_ms"] = round(model_result.model_ms)
-            timings["validation_ms"] = max(0, measured_model_ms - timings["model_ms"])
+            if reused is None:
+                stage = "model"; started = perf_counter()
+                validator = self.validator or GUTSOutputValidator(
+                    output_schema_version=generation.output_schema_version,
+                )
+                model_result = generate_validated_briefing(
+                    manifest, client=self.model_client, validator=validator,
+                )
+                measured_model_ms = _elapsed_ms(started)
+                timings["model_ms"] = round(model_result.model_ms)
+                timings["validation_ms"] = max(0, measured_model_ms - timings["model_ms"])
+            else:
+                timings["model_ms"] = 0
+                timings["validation_ms"] = 0
 
             stage = "persistence"; persistence_started = perf_counter()
             statistics, source_summary = _summaries(
                 selection, official, notes, communications, history,
                 input_truncated=input_truncated,
             )
-            communication_coverage = _communication_coverage(selection, model_result.output)
+            if reused is None:
+                output_json = model_result.output.serializable_dict()
+                communication_coverage = _communication_coverage(selection, model_result.output)
+                sources = [*_current_state_sources(state), *(_evidence_source_row(source) for source in selection.selection.sources)]
+                statements = _statement_rows(model_result.output)
+                model_metadata = {
+                    "input_tokens": model_result.input_tokens, "output_tokens": model_result.output_tokens,
+                    "total_tokens": model_result.total_tokens,
+                    "validation_retry_count": model_result.validation_retry_count,
+                    "provider": model_result.provider, "model": model_result.model,
+                }
+            else:
+                # The same manifest was already briefed with this prompt, schema
+                # and model; its validated output is cloned instead of re-asked.
+                output_json = reused.output_json
+                reused_statistics = reused.statistics_json or {}
+                communication_coverage = {
+                    key: reused_statistics.get(key, 0)
+                    for key in ("selected_communications", "communication_derived_statements")
+                }
+                sources, statements = generation_result_rows(reused)
+                model_metadata = {
+                    "input_tokens": 0, "output_tokens": 0, "total_tokens": 0,
+                    "validation_retry_count": 0, "provider": reused.provider, "model": reused.model,
+                }
+                statistics.update(_reuse_statistics(reused))
             statistics.update(communication_coverage)
-            sources = [*_current_state_sources(state), *(_evidence_source_row(source) for source in selection.selection.sources)]
             completed = save_generation_success(
-                self.db, generation, output_json=model_result.output.serializable_dict(),
+                self.db, generation, output_json=output_json,
                 current_state_snapshot_json=self.current_state_assembler.compact_snapshot(state),
-                sources=sources, statements=_statement_rows(model_result.output),
+                sources=sources, statements=statements,
                 reproducibility_status=selection.reproducibility_status, completed_at=self.clock(),
                 metadata={
                     **timings, "manifest_hash": manifest_hash,
@@ -352,19 +417,16 @@ class OpportunityKnowledgeBriefCompiler:
                     ),
                     "statistics_json": statistics, "input_character_count": input_characters,
                     "estimated_input_tokens": (input_characters + 3) // 4,
-                    "input_tokens": model_result.input_tokens, "output_tokens": model_result.output_tokens,
-                    "total_tokens": model_result.total_tokens,
-                    "validation_retry_count": model_result.validation_retry_count,
+                    **model_metadata,
                     "degraded_source_count": len(selection.selection.unavailable_sources),
                     "input_truncated": input_truncated,
-                    "provider": model_result.provider, "model": model_result.model,
                 }, persistence_started_monotonic=persistence_started, total_started_monotonic=total_started,
             )
             logger.info(
-                "guts_generation_succeeded generation_id=%s opportunity_id=%s organization_id=%s total_ms=%s sources=%s statements=%s provider=%s model=%s retries=%s",
+                "guts_generation_succeeded generation_id=%s opportunity_id=%s organization_id=%s total_ms=%s sources=%s statements=%s provider=%s model=%s retries=%s reused_generation_id=%s",
                 completed.id, completed.opportunity_id, completed.organization_id, completed.total_ms,
                 len(sources), len(completed.statements), completed.provider, completed.model,
-                completed.validation_retry_count,
+                completed.validation_retry_count, reused.id if reused is not None else None,
             )
             return completed
         except Exception as exc:
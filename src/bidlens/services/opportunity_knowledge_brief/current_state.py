@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session, joinedload
 
 from ...models import Opportunity, OpportunityOutcome, User, Vote, Workspace
 from ..opportunity_descriptions import select_opportunity_description
-from ..account_aliases import resolve_account_display_name
+from ..account_aliases import opportunity_account_display
 from .contracts import (
     CurrentOpportunityState,
     CurrentStateField,
@@ -112,7 +112,7 @@ class CurrentStateAssembler:
             client=_field(
                 opportunity.id,
                 "client",
-                resolve_account_display_name(opportunity.agency),
+                opportunity_account_display(opportunity).display,
             ),
             description=_field(opportunity.id, "description", description or None),
             response_deadline=_field(opportunity.id, "response_deadline", _date_value(opportunity.response_deadline)),
@@ -143,6 +143,7 @@ def create_pending_generation(
     opportunity_id: int,
     generated_by_user_id: int,
     requested_at: datetime | None = None,
+    force_regenerate: bool = False,
 ) -> OpportunityKnowledgeBriefGeneration:
     _validate_scope(
         db,
@@ -166,6 +167,7 @@ def create_pending_generation(
         output_schema_version=config.GUTS_OUTPUT_SCHEMA_VERSION,
         provider=config.GUTS_AI_PROVIDER,
         model=config.GUTS_AI_MODEL,
+        force_regenerate=force_regenerate,
         reproducibility_status=ReproducibilityStatus.NOT_REPRODUCIBLE,
     )
     db.add(generation)
@@ -178,6 +180,53 @@ def create_pending_generation(
     return generation
 
 
+def get_generation(
+    db: Session,
+    *,
+    organization_id: int,
+    opportunity_id: int,
+    generation_id: int,
+) -> OpportunityKnowledgeBriefGeneration | None:
+    return db.query(OpportunityKnowledgeBriefGeneration).filter(
+        OpportunityKnowledgeBriefGeneration.id == generation_id,
+        OpportunityKnowledgeBriefGeneration.organization_id == organization_id,
+        OpportunityKnowledgeBriefGeneration.opportunity_id == opportunity_id,
+    ).first()
+
+
+def claim_next_pending_generation(
+    db: Session,
+    *,
+    started_at: datetime | None = None,
+) -> OpportunityKnowledgeBriefGeneration | None:
+    """Mark the oldest pending generation running for the calling worker.
+
+    The claim is a conditional UPDATE on the pending status, so two workers
+    racing for the same generation cannot both run it.
+    """
+    while True:
+        candidate = db.query(OpportunityKnowledgeBriefGeneration.id).filter(
+            OpportunityKnowledgeBriefGeneration.status == GenerationStatus.PENDING,
+        ).order_by(
+            OpportunityKnowledgeBriefGeneration.requested_at.asc(),
+            OpportunityKnowledgeBriefGeneration.id.asc(),
+        ).first()
+        if candidate is None:
+            return None
+        claimed = db.query(OpportunityKnowledgeBriefGeneration).filter(
+            OpportunityKnowledgeBriefGeneration.id == candidate.id,
+            OpportunityKnowledgeBriefGeneration.status == GenerationStatus.PENDING,
+        ).update(
+            {"status": GenerationStatus.RUNNING, "started_at": started_at or _utcnow()},
+            synchronize_session=False,
+        )
+        db.commit()
+        if claimed:
+            generation = db.get(OpportunityKnowledgeBriefGeneration, candidate.id)
+            db.refresh(generation)
+            return generation
+
+
 def mark_generation_running(
     db: Session,
     generation: OpportunityKnowledgeBriefGeneration,
@@ -403,6 +452,54 @@ def get_latest_successful_generation(
     ).first()
 
 
+def get_reusable_generation(
+    db: Session,
+    *,
+    organization_id: int,
+    opportunity_id: int,
+    manifest_hash: str,
+    prompt_version: str,
+    output_schema_version: str,
+    model: str | None,
+) -> OpportunityKnowledgeBriefGeneration | None:
+    """Return the newest success generated from an identical manifest and prompt."""
+    return db.query(OpportunityKnowledgeBriefGeneration).options(
+        selectinload(OpportunityKnowledgeBriefGeneration.sources),
+        selectinload(OpportunityKnowledgeBriefGeneration.statements)
+        .selectinload(OpportunityKnowledgeBriefStatement.source_links)
+        .selectinload(OpportunityKnowledgeBriefStatementSource.brief_source),
+    ).filter(
+        OpportunityKnowledgeBriefGeneration.manifest_hash == manifest_hash,
+        OpportunityKnowledgeBriefGeneration.organization_id == organization_id,
+        OpportunityKnowledgeBriefGeneration.opportunity_id == opportunity_id,
+        OpportunityKnowledgeBriefGeneration.status == GenerationStatus.SUCCEEDED,
+        OpportunityKnowledgeBriefGeneration.prompt_version == prompt_version,
+        OpportunityKnowledgeBriefGeneration.output_schema_version == output_schema_version,
+        OpportunityKnowledgeBriefGeneration.model == model,
+    ).order_by(
+        OpportunityKnowledgeBriefGeneration.completed_at.desc(),
+        OpportunityKnowledgeBriefGeneration.id.desc(),
+    ).first()
+
+
+def generation_result_rows(
+    generation: OpportunityKnowledgeBriefGeneration,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Source and statement rows of a persisted success, in ``save_generation_success`` shape."""
+    sources = [
+        {field: getattr(source, field) for field in _SOURCE_FIELDS}
+        for source in generation.sources
+    ]
+    statements = [
+        {
+            **{field: getattr(statement, field) for field in _STATEMENT_FIELDS},
+            "source_ids": [link.brief_source.source_id for link in statement.source_links],
+        }
+        for statement in generation.statements
+    ]
+    return sources, statements
+
+
 def expire_stale_generation(
     db: Session,
     generation: OpportunityKnowledgeBriefGeneration,
@@ -9,13 +9,14 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from ... import config
-from ...models import OpportunityKnowledgeBriefGeneration, User
-from .access_policy import GUTSAccessError, require_guts_generation_access
+from ...models import OpportunityKnowledgeBriefGeneration, OrganizationMembership, User
+from .access_policy import GUTSAccessContext, GUTSAccessError, require_guts_generation_access
 from .compiler import GUTSCompilerError, OpportunityKnowledgeBriefCompiler
+from .constants import FAILURE_CATEGORIES
 from .prompt import GUTSPromptConfigurationError, resolve_prompt
 from .repository import (
-    ActiveKnowledgeBriefGenerationError, create_pending_generation, expire_stale_generation,
-    get_active_generation,
+    ACTIVE_STATUSES, ActiveKnowledgeBriefGenerationError, create_pending_generation,
+    expire_stale_generation, get_active_generation, mark_generation_failed,
 )
 
 
@@ -46,10 +47,9 @@ class OpportunityKnowledgeBriefService:
         self.db = db
         self.compiler = compiler
 
-    def generate(
-        self, *, opportunity_id: int, requesting_user: User,
-        active_organization_id: int,
-    ) -> OpportunityKnowledgeBriefGeneration:
+    def _authorize(
+        self, *, opportunity_id: int, requesting_user: User, active_organization_id: int,
+    ) -> tuple[GUTSAccessContext, int]:
         if not config.GUTS_ENABLED:
             raise GUTSServiceError("access_denied", "Get Up to Speed is not enabled.", stage="authorization")
         try:
@@ -71,22 +71,68 @@ class OpportunityKnowledgeBriefService:
             raise GUTSServiceError(exc.failure_category, str(exc), stage="authorization") from None
         if context.organization_id != active_organization_id:
             raise GUTSServiceError("access_denied", "Opportunity organization context is unavailable.", stage="authorization")
-        authorization_ms = round((perf_counter() - authorization_started) * 1000)
+        return context, round((perf_counter() - authorization_started) * 1000)
 
+    def _live_active_generation(
+        self, context: GUTSAccessContext, opportunity_id: int,
+    ) -> OpportunityKnowledgeBriefGeneration | None:
         active = get_active_generation(
             self.db, organization_id=context.organization_id, opportunity_id=opportunity_id,
         )
-        if active and not expire_stale_generation(
+        if active and expire_stale_generation(
             self.db, active, max_age_seconds=config.GUTS_STALE_ATTEMPT_SECONDS,
         ):
+            return None
+        return active
+
+    def _create_pending(
+        self, context: GUTSAccessContext, *, opportunity_id: int, requesting_user: User,
+        force_regenerate: bool,
+    ) -> OpportunityKnowledgeBriefGeneration:
+        return create_pending_generation(
+            self.db, organization_id=context.organization_id, workspace_id=context.workspace_id,
+            opportunity_id=opportunity_id, generated_by_user_id=requesting_user.id,
+            force_regenerate=force_regenerate,
+        )
+
+    def _compile(
+        self, generation: OpportunityKnowledgeBriefGeneration, context: GUTSAccessContext, *,
+        authorization_ms: int, force_regenerate: bool, claimed: bool = False,
+    ) -> OpportunityKnowledgeBriefGeneration:
+        compiler = self.compiler or OpportunityKnowledgeBriefCompiler(self.db)
+        try:
+            return compiler.generate(
+                generation=generation, access_context=context, authorization_ms=authorization_ms,
+                force_regenerate=force_regenerate, claimed=claimed,
+            )
+        except GUTSCompilerError as exc:
+            raise GUTSServiceError(
+                exc.safe_category, exc.safe_message, stage=exc.stage,
+                retryable=exc.retryable, generation_id=generation.id,
+                validation_debug=exc.validation_debug,
+                provider_debug=exc.provider_debug,
+                schema_debug=exc.schema_debug,
+            ) from None
+
+    def generate(
+        self, *, opportunity_id: int, requesting_user: User,
+        active_organization_id: int, force_regenerate: bool = False,
+    ) -> OpportunityKnowledgeBriefGeneration:
+        """Generate a briefing, reusing an identical earlier one unless ``force_regenerate``."""
+        context, authorization_ms = self._authorize(
+            opportunity_id=opportunity_id, requesting_user=requesting_user,
+            active_organization_id=active_organization_id,
+        )
+        active = self._live_active_generation(context, opportunity_id)
+        if active:
             raise GUTSServiceError(
                 "generation_already_in_progress", "A briefing is already being generated.",
                 stage="lifecycle", retryable=True, generation_id=active.id,
             )
         try:
-            generation = create_pending_generation(
-                self.db, organization_id=context.organization_id, workspace_id=context.workspace_id,
-                opportunity_id=opportunity_id, generated_by_user_id=requesting_user.id,
+            generation = self._create_pending(
+                context, opportunity_id=opportunity_id, requesting_user=requesting_user,
+                force_regenerate=force_regenerate,
             )
         except ActiveKnowledgeBriefGenerationError:
             active = get_active_generation(
@@ -96,16 +142,78 @@ class OpportunityKnowledgeBriefService:
                 "generation_already_in_progress", "A briefing is already being generated.",
                 stage="lifecycle", retryable=True, generation_id=active.id if active else None,
             ) from None
-        compiler = self.compiler or OpportunityKnowledgeBriefCompiler(self.db)
+        return self._compile(
+            generation, context, authorization_ms=authorization_ms, force_regenerate=force_regenerate,
+        )
+
+    def enqueue(
+        self, *, opportunity_id: int, requesting_user: User,
+        active_organization_id: int, force_regenerate: bool = False,
+    ) -> OpportunityKnowledgeBriefGeneration:
+        """Queue a pending generation for the GUTS worker and return it without compiling.
+
+        A request for an opportunity that already has a live pending or running
+        generation returns that generation instead of queueing another.
+        """
+        context, _authorization_ms = self._authorize(
+            opportunity_id=opportunity_id, requesting_user=requesting_user,
+            active_organization_id=active_organization_id,
+        )
+        active = self._live_active_generation(context, opportunity_id)
+        if active:
+            return active
         try:
-            return compiler.generate(
-                generation=generation, access_context=context, authorization_ms=authorization_ms,
+            return self._create_pending(
+                context, opportunity_id=opportunity_id, requesting_user=requesting_user,
+                force_regenerate=force_regenerate,
             )
-        except GUTSCompilerError as exc:
-            raise GUTSServiceError(
-                exc.safe_category, exc.safe_message, stage=exc.stage,
-                retryable=exc.retryable, generation_id=generation.id,
-                validation_debug=exc.validation_debug,
-                provider_debug=exc.provider_debug,
-                schema_debug=exc.schema_debug,
-            ) from None
+        except ActiveKnowledgeBriefGenerationError:
+            # Another request queued one between the check and the insert.
+            active = get_active_generation(
+                self.db, organization_id=context.organization_id, opportunity_id=opportunity_id,
+            )
+            if active is None:
+                raise GUTSServiceError(
+                    "generation_already_in_progress", "A briefing is already being generated.",
+                    stage="lifecycle", retryable=True,
+                ) from None
+            return active
+
+    def run_claimed(self, generation: OpportunityKnowledgeBriefGeneration) -> OpportunityKnowledgeBriefGeneration:
+        """Compile a generation the worker has claimed, as the user who requested it.
+
+        Access is checked again because the requester may have left the
+        organization or dropped their ``PURSUE`` vote while it was queued.
+        """
+        user = self.db.get(User, generation.generated_by_user_id)
+        membership = self.db.query(OrganizationMembership).filter(
+            OrganizationMembership.organization_id == generation.organization_id,
+            OrganizationMembership.user_id == generation.generated_by_user_id,
+        ).first()
+        try:
+            if user is None or membership is None:
+                raise GUTSServiceError(
+                    "access_denied", "Opportunity organization context is unavailable.", stage="authorization",
+                )
+            # Match the request-established transient tenancy context used by the web app.
+            user.current_organization_id = membership.organization_id
+            user.current_role = membership.role
+            context, authorization_ms = self._authorize(
+                opportunity_id=generation.opportunity_id, requesting_user=user,
+                active_organization_id=generation.organization_id,
+            )
+        except GUTSServiceError as exc:
+            self.db.rollback()
+            self.db.refresh(generation)
+            if generation.status in ACTIVE_STATUSES:
+                mark_generation_failed(
+                    self.db, generation,
+                    failure_category=exc.safe_category if exc.safe_category in FAILURE_CATEGORIES else "access_denied",
+                    failure_stage=exc.stage, safe_error_message=exc.safe_message,
+                )
+            exc.generation_id = generation.id
+            raise
+        return self._compile(
+            generation, context, authorization_ms=authorization_ms,
+            force_regenerate=generation.force_regenerate, claimed=True,
+        )
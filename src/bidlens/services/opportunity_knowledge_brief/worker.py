@@ -0,0 +1,124 @@
+"""Background worker for queued Get Up to Speed generations.
+
+With ``GUTS_GENERATION_QUEUE_ENABLED`` the generate route only records a
+pending generation. A worker process (``python -m bidlens.jobs.run_guts_worker``)
+claims pending generations one at a time and compiles them; the route's status
+endpoint reports the stage from the timings the compiler commits as it goes.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import logging
+import time
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session
+
+from ... import config
+from ...database import SessionLocal
+from ...models import OpportunityKnowledgeBriefGeneration
+from .constants import GenerationStatus
+from .repository import claim_next_pending_generation, expire_stale_generation
+from .service import GUTSServiceError, OpportunityKnowledgeBriefService
+
+
+logger = logging.getLogger(__name__)
+
+# Compiler stages in order, each with the timing column written when it ends.
+GENERATION_STAGES = (
+    ("authorization", "source_snapshot_started_at"),
+    ("current_state", "current_state_ms"),
+    ("official_evidence", "official_evidence_ms"),
+    ("notes", "notes_ms"),
+    ("communication", "communication_ms"),
+    ("history", "history_ms"),
+    ("manifest", "manifest_ms"),
+    ("model", "model_ms"),
+)
+
+
+def generation_stage(generation: OpportunityKnowledgeBriefGeneration) -> str:
+    """The stage a generation is in, or ``queued``, ``complete`` or its failure stage."""
+    if generation.status == GenerationStatus.PENDING:
+        return "queued"
+    if generation.status == GenerationStatus.SUCCEEDED:
+        return "complete"
+    if generation.status == GenerationStatus.FAILED:
+        return generation.failure_stage or "failed"
+    for stage, field in GENERATION_STAGES:
+        if getattr(generation, field) is None:
+            return stage
+    return "persistence"
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    if value is not None and value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat() if value else None
+
+
+def generation_status_payload(
+    generation: OpportunityKnowledgeBriefGeneration, *, status_url: str | None = None,
+) -> dict[str, Any]:
+    """Serialize a generation for the enqueue response and the polling endpoint."""
+    return {
+        "ok": generation.status != GenerationStatus.FAILED,
+        "generation_id": generation.id,
+        "opportunity_id": generation.opportunity_id,
+        "status": generation.status,
+        "stage": generation_stage(generation),
+        "done": generation.status in (GenerationStatus.SUCCEEDED, GenerationStatus.FAILED),
+        "requested_at": _isoformat(generation.requested_at),
+        "started_at": _isoformat(generation.started_at),
+        "completed_at": _isoformat(generation.completed_at),
+        "status_url": status_url,
+        "failure_category": generation.failure_category,
+        "message": generation.safe_error_message,
+    }
+
+
+def run_guts_generation_worker(
+    *,
+    once: bool = False,
+    max_jobs: int | None = None,
+    poll_seconds: float | None = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+    service_factory: Callable[[Session], OpportunityKnowledgeBriefService] = OpportunityKnowledgeBriefService,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """Claim and compile pending generations until stopped; return how many ran.
+
+    With ``once=True`` the worker drains the pending generations and returns
+    instead of polling. A generation that waited past
+    ``GUTS_STALE_ATTEMPT_SECONDS`` is expired rather than run.
+    """
+    poll_seconds = config.GUTS_WORKER_POLL_SECONDS if poll_seconds is None else poll_seconds
+    processed = 0
+    while max_jobs is None or processed < max_jobs:
+        with session_factory() as db:
+            generation = claim_next_pending_generation(db)
+            if generation is not None:
+                if expire_stale_generation(db, generation, max_age_seconds=config.GUTS_STALE_ATTEMPT_SECONDS):
+                    continue
+                logger.info(
+                    "guts_generation_claimed generation_id=%s opportunity_id=%s organization_id=%s",
+                    generation.id, generation.opportunity_id, generation.organization_id,
+                )
+                try:
+                    service_factory(db).run_claimed(generation)
+                except GUTSServiceError as exc:
+                    # The failure is recorded on the generation for the status endpoint.
+                    logger.info(
+                        "guts_generation_worker_failed generation_id=%s stage=%s category=%s",
+                        generation.id, exc.stage, exc.safe_category,
+                    )
+                except Exception:
+                    db.rollback()
+                    logger.exception("guts_generation_worker_error generation_id=%s", generation.id)
+                processed += 1
+                continue
+        if once:
+            break
+        sleep(poll_seconds)
+    return processed
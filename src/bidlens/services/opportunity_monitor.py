@@ -1,19 +1,23 @@
 from __future__ import annotations
 
 import datetime as dt
+import hashlib
+import json
 import logging
 import re
 from dataclasses import dataclass
 from typing import Any, Iterable
 
 from sqlalchemy.orm import Session
-from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.orm.attributes import flag_modified, set_committed_value
+from sqlalchemy.orm.util import identity_key
 
 from ..models import Opportunity, OpportunityUpdateEvent, SalesforceConnection
 from .opportunity_history import (
     EVENT_SALESFORCE_SYNCHRONIZED,
     EVENT_SOURCE_UPDATED,
     record_history_event,
+    record_history_events,
 )
 from .salesforce import SalesforceService
 
@@ -188,18 +192,57 @@ def _audit_response(value: Any) -> Any:
     return {"accepted": True}
 
 
-def apply_source_update(
-    db: Session,
+def source_fingerprint(
+    incoming: dict[str, Any],
+    *,
+    monitored_fields: Iterable[str] = DEFAULT_MONITORED_FIELDS,
+    excluded_fields: Iterable[str] = (),
+) -> str:
+    """Hash the monitored fields of one normalized source observation.
+
+    Covers exactly the values ``detect_source_changes`` would compare:
+    excluded, absent, and None fields are left out, and the rest are
+    normalized the same way. Once an observation has been applied, the row
+    agrees with it on every hashed field, so a later observation with the same
+    fingerprint cannot produce a change.
+    """
+    excluded = set(excluded_fields)
+    normalized = {
+        field_name: _normalize_for_comparison(field_name, incoming[field_name])
+        for field_name in monitored_fields
+        if field_name not in excluded and incoming.get(field_name) is not None
+    }
+    encoded = json.dumps(normalized, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def mark_observed(db: Session, opportunity_ids: list[int], observed_at: dt.datetime) -> None:
+    """Bump ``last_seen_at`` for unchanged rows in one UPDATE."""
+    if not opportunity_ids:
+        return
+    # updated_at has an onupdate hook; setting it to itself keeps an
+    # observation-only write from looking like a record change.
+    db.query(Opportunity).filter(Opportunity.id.in_(opportunity_ids)).update(
+        {
+            Opportunity.last_seen_at: observed_at,
+            Opportunity.updated_at: Opportunity.updated_at,
+        },
+        synchronize_session=False,
+    )
+    for opportunity_id in opportunity_ids:
+        loaded = db.identity_map.get(identity_key(Opportunity, opportunity_id))
+        if loaded is not None:
+            set_committed_value(loaded, "last_seen_at", observed_at)
+
+
+def detect_source_changes(
     opportunity: Opportunity,
     incoming: dict[str, Any],
     *,
     monitored_fields: Iterable[str] = DEFAULT_MONITORED_FIELDS,
     excluded_fields: Iterable[str] = (),
-    observed_at: dt.datetime | None = None,
-) -> OpportunityMonitorResult:
-    """Apply one normalized source observation to an existing opportunity."""
-    now = observed_at or dt.datetime.utcnow()
-    opportunity.last_seen_at = now
+) -> dict[str, dict[str, Any]]:
+    """Return the meaningful monitored-field changes without touching the row."""
     excluded = set(excluded_fields)
     changes: dict[str, dict[str, Any]] = {}
 
@@ -226,27 +269,35 @@ def apply_source_update(
                 "after": after_value,
                 "label": _field_label(field_name),
             }
+    return changes
 
-    if not changes:
-        # updated_at has a mapper-level onupdate hook. Explicitly retain its
-        # current value so an observation-only write changes last_seen_at alone.
-        opportunity.updated_at = opportunity.updated_at
-        flag_modified(opportunity, "updated_at")
-        return OpportunityMonitorResult(changed=False, changed_fields={})
 
+def _assign_source_changes(
+    opportunity: Opportunity,
+    incoming: dict[str, Any],
+    changes: dict[str, dict[str, Any]],
+    now: dt.datetime,
+    fingerprint: str,
+) -> None:
     for field_name in changes:
         setattr(opportunity, field_name, incoming[field_name])
     if "raw_source_payload" in incoming:
         opportunity.raw_source_payload = incoming["raw_source_payload"]
+    opportunity.content_fingerprint = fingerprint
     opportunity.upserted_at = now
 
-    db.flush()
+
+def _source_update_event(
+    opportunity: Opportunity,
+    changes: dict[str, dict[str, Any]],
+    now: dt.datetime,
+) -> OpportunityUpdateEvent:
     salesforce_payload = (
         _salesforce_payload(opportunity, set(changes))
         if opportunity.salesforce_opportunity_id
         else None
     )
-    event = OpportunityUpdateEvent(
+    return OpportunityUpdateEvent(
         organization_id=opportunity.organization_id,
         opportunity_id=opportunity.id,
         source=opportunity.source,
@@ -258,6 +309,66 @@ def apply_source_update(
             "pending" if opportunity.salesforce_opportunity_id else "not_linked"
         ),
     )
+
+
+def _source_updated_history_data(
+    opportunity: Opportunity,
+    changes: dict[str, dict[str, Any]],
+    event: OpportunityUpdateEvent,
+) -> dict[str, Any]:
+    return {
+        "source_record_id": opportunity.source_record_id,
+        "changed_fields": sorted(changes),
+        "changed_field_labels": [_field_label(field_name) for field_name in sorted(changes)],
+        "change_count": len(changes),
+        "summary": _change_summary(changes),
+        "changes": _history_change_details(changes),
+        "update_event_id": event.id,
+    }
+
+
+def apply_source_update(
+    db: Session,
+    opportunity: Opportunity,
+    incoming: dict[str, Any],
+    *,
+    monitored_fields: Iterable[str] = DEFAULT_MONITORED_FIELDS,
+    excluded_fields: Iterable[str] = (),
+    observed_at: dt.datetime | None = None,
+) -> OpportunityMonitorResult:
+    """Apply one normalized source observation to an existing opportunity."""
+    now = observed_at or dt.datetime.utcnow()
+    monitored_fields = tuple(monitored_fields)
+    excluded_fields = tuple(excluded_fields)
+    opportunity.last_seen_at = now
+    fingerprint = source_fingerprint(
+        incoming,
+        monitored_fields=monitored_fields,
+        excluded_fields=excluded_fields,
+    )
+    if opportunity.content_fingerprint == fingerprint:
+        changes = {}
+    else:
+        changes = detect_source_changes(
+            opportunity,
+            incoming,
+            monitored_fields=monitored_fields,
+            excluded_fields=excluded_fields,
+        )
+
+    if not changes:
+        if opportunity.content_fingerprint != fingerprint:
+            opportunity.content_fingerprint = fingerprint
+        # updated_at has a mapper-level onupdate hook. Explicitly retain its
+        # current value so an observation-only write changes last_seen_at alone.
+        opportunity.updated_at = opportunity.updated_at
+        flag_modified(opportunity, "updated_at")
+        return OpportunityMonitorResult(changed=False, changed_fields={})
+
+    _assign_source_changes(opportunity, incoming, changes, now, fingerprint)
+
+    db.flush()
+    event = _source_update_event(opportunity, changes, now)
     db.add(event)
     db.flush()
     record_history_event(
@@ -265,15 +376,7 @@ def apply_source_update(
         opportunity=opportunity,
         event_type=EVENT_SOURCE_UPDATED,
         source=opportunity.source,
-        event_data={
-            "source_record_id": opportunity.source_record_id,
-            "changed_fields": sorted(changes),
-            "changed_field_labels": [_field_label(field_name) for field_name in sorted(changes)],
-            "change_count": len(changes),
-            "summary": _change_summary(changes),
-            "changes": _history_change_details(changes),
-            "update_event_id": event.id,
-        },
+        event_data=_source_updated_history_data(opportunity, changes, event),
         occurred_at=now,
     )
 
@@ -286,12 +389,12 @@ def apply_source_update(
         )
 
     try:
-        if salesforce_payload:
+        if event.salesforce_payload:
             response = SalesforceService(
                 db=db, workspace_id=opportunity.organization_id
             ).update_opportunity(
                 opportunity.salesforce_opportunity_id,
-                salesforce_payload,
+                event.salesforce_payload,
             )
             event.salesforce_response = _audit_response(response)
         else:
@@ -349,3 +452,85 @@ def apply_source_update(
         salesforce_error=event.salesforce_error,
         update_event_id=event.id,
     )
+
+
+def apply_source_updates(
+    db: Session,
+    observations: list[tuple[Opportunity, dict[str, Any]]],
+    *,
+    monitored_fields: Iterable[str] = DEFAULT_MONITORED_FIELDS,
+    observed_at: dt.datetime | None = None,
+) -> list[OpportunityMonitorResult]:
+    """Apply a page of source observations with set-based writes.
+
+    Produces the same rows and results as calling ``apply_source_update`` once
+    per observation. Unchanged rows whose fingerprint is current get one bulk
+    ``last_seen_at`` UPDATE; changed, unlinked rows share one flush for their
+    update events and one for their history. Salesforce-linked changes still
+    go through ``apply_source_update`` because each needs its own API call.
+    """
+    now = observed_at or dt.datetime.utcnow()
+    monitored_fields = tuple(monitored_fields)
+    results: list[OpportunityMonitorResult | None] = [None] * len(observations)
+    unchanged_ids: list[int] = []
+    pending: list[tuple[int, Opportunity, dict[str, dict[str, Any]]]] = []
+
+    for index, (opportunity, incoming) in enumerate(observations):
+        fingerprint = source_fingerprint(incoming, monitored_fields=monitored_fields)
+        if opportunity.content_fingerprint == fingerprint:
+            unchanged_ids.append(opportunity.id)
+            results[index] = OpportunityMonitorResult(changed=False, changed_fields={})
+            continue
+        changes = detect_source_changes(opportunity, incoming, monitored_fields=monitored_fields)
+        if not changes:
+            # Unchanged, but the stored fingerprint is missing or stale; write
+            # it with the observation so the next pull takes the bulk path.
+            opportunity.last_seen_at = now
+            opportunity.content_fingerprint = fingerprint
+            opportunity.updated_at = opportunity.updated_at
+            flag_modified(opportunity, "updated_at")
+            results[index] = OpportunityMonitorResult(changed=False, changed_fields={})
+        elif opportunity.salesforce_opportunity_id:
+            results[index] = apply_source_update(
+                db,
+                opportunity,
+                incoming,
+                monitored_fields=monitored_fields,
+                observed_at=now,
+            )
+        else:
+            opportunity.last_seen_at = now
+            _assign_source_changes(opportunity, incoming, changes, now, fingerprint)
+            pending.append((index, opportunity, changes))
+
+    mark_observed(db, unchanged_ids, now)
+
+    if pending:
+        events = [
+            _source_update_event(opportunity, changes, now)
+            for _index, opportunity, changes in pending
+        ]
+        db.add_all(events)
+        db.flush()
+        record_history_events(
+            db,
+            [
+                {
+                    "opportunity": opportunity,
+                    "event_type": EVENT_SOURCE_UPDATED,
+                    "source": opportunity.source,
+                    "event_data": _source_updated_history_data(opportunity, changes, event),
+                    "occurred_at": now,
+                }
+                for (_index, opportunity, changes), event in zip(pending, events)
+            ],
+        )
+        for (index, _opportunity, changes), event in zip(pending, events):
+            results[index] = OpportunityMonitorResult(
+                changed=True,
+                changed_fields=changes,
+                salesforce_sync_status=event.salesforce_sync_status,
+                update_event_id=event.id,
+            )
+
+    return [result for result in results if result is not None]
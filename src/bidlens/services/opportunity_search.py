@@ -0,0 +1,185 @@
+"""Ranked opportunity search over the database full-text index.
+
+Feed, Triage, CSV export, and Opportunity Lookup share these helpers. Words
+in the search box match as prefixes against the index built in
+``bidlens.search_index``; identifier columns are also matched as substrings
+so a partial solicitation or notice number still finds its record (trigram
+indexed on Postgres). When the index is unavailable, or
+``OPPORTUNITY_SEARCH_BACKEND=ilike``, the original ``ILIKE`` scan is used.
+"""
+
+from __future__ import annotations
+
+import re
+import weakref
+from typing import Any
+
+from sqlalchemy import case, func, inspect, literal_column, or_, select, table, column
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .. import config
+from ..models import Opportunity
+from ..search_index import FTS_TABLE, SEARCH_VECTOR_COLUMN
+
+
+BACKEND_POSTGRES = "postgres"
+BACKEND_SQLITE_FTS = "sqlite_fts"
+BACKEND_ILIKE = "ilike"
+
+SCOPE_FEED = "feed"
+SCOPE_LOOKUP = "lookup"
+
+# Substring-matched columns per scope, and the text the ILIKE fallback covers.
+# Every identifier column needs a trigram index (search_index.TRIGRAM_COLUMNS):
+# one unindexed arm turns the whole OR into a sequential scan on Postgres.
+# NAICS codes are prefix-matched through the text index instead.
+_IDENTIFIER_COLUMNS = {
+    SCOPE_FEED: ("solicitation_number", "sam_notice_id", "source_record_id"),
+    SCOPE_LOOKUP: ("solicitation_number", "source_record_id", "sam_notice_id", "govwin_staging_id"),
+}
+_ILIKE_COLUMNS = {
+    SCOPE_FEED: (
+        "title",
+        "agency",
+        "solicitation_number",
+        "sam_notice_id",
+        "source_record_id",
+        "naics",
+        "naics_title",
+        "description",
+        "description_text",
+    ),
+    SCOPE_LOOKUP: (
+        "title",
+        "agency",
+        "solicitation_number",
+        "source_record_id",
+        "sam_notice_id",
+        "govwin_staging_id",
+    ),
+}
+# FTS5 column filters and tsvector weight labels (see search_index).
+_FTS_COLUMN_FILTER = {
+    SCOPE_FEED: None,
+    SCOPE_LOOKUP: "{title agency solicitation_number sam_notice_id source_record_id}",
+}
+_TSQUERY_WEIGHTS = {SCOPE_FEED: "", SCOPE_LOOKUP: "AB"}
+# bm25 weights, in search_index.FTS_COLUMNS order.
+_BM25_WEIGHTS = (10.0, 4.0, 6.0, 6.0, 6.0, 2.0, 2.0, 1.0, 1.0)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_backend_cache: "weakref.WeakKeyDictionary[Engine, str]" = weakref.WeakKeyDictionary()
+
+_fts = table(FTS_TABLE, column("rowid"))
+_fts_ref = literal_column(FTS_TABLE)
+_search_vector = literal_column(f"opportunities.{SEARCH_VECTOR_COLUMN}")
+
+
+def _detect_backend(db: Session) -> str:
+    engine = db.get_bind().engine
+    cached = _backend_cache.get(engine)
+    if cached is not None:
+        return cached
+    backend = BACKEND_ILIKE
+    # Inspect on the session's own connection; a second checkout from an
+    # in-memory SQLite pool would share, and on close roll back, this one.
+    inspector = inspect(db.connection())
+    if engine.dialect.name == "postgresql":
+        if SEARCH_VECTOR_COLUMN in {col["name"] for col in inspector.get_columns("opportunities")}:
+            backend = BACKEND_POSTGRES
+    elif engine.dialect.name == "sqlite":
+        if FTS_TABLE in inspector.get_table_names():
+            backend = BACKEND_SQLITE_FTS
+    _backend_cache[engine] = backend
+    return backend
+
+
+def search_backend(db: Session) -> str:
+    if config.OPPORTUNITY_SEARCH_BACKEND == BACKEND_ILIKE:
+        return BACKEND_ILIKE
+    return _detect_backend(db)
+
+
+def normalize_search_term(term: str | None) -> str:
+    return (term or "").strip()[:200]
+
+
+def _words(term: str) -> list[str]:
+    return _WORD_RE.findall(term.casefold())
+
+
+def _fts_match_expression(words: list[str], scope: str) -> str:
+    expression = " ".join(f'"{word}"*' for word in words)
+    column_filter = _FTS_COLUMN_FILTER[scope]
+    return f"{column_filter} : ({expression})" if column_filter else expression
+
+
+def _tsquery(words: list[str], scope: str):
+    weights = _TSQUERY_WEIGHTS[scope]
+    return func.to_tsquery(
+        literal_column("'english'::regconfig"),
+        " & ".join(f"{word}:*{weights}" for word in words),
+    )
+
+
+def _identifier_match(term: str, scope: str):
+    pattern = f"%{term}%"
+    return [getattr(Opportunity, name).ilike(pattern) for name in _IDENTIFIER_COLUMNS[scope]]
+
+
+def _ilike_match(term: str, scope: str):
+    pattern = f"%{term}%"
+    return or_(*(getattr(Opportunity, name).ilike(pattern) for name in _ILIKE_COLUMNS[scope]))
+
+
+def opportunity_search_filter(db: Session, search_term: str, *, scope: str = SCOPE_FEED):
+    """Return a WHERE clause for ``search_term``, or None for an empty search."""
+    term = normalize_search_term(search_term)
+    if not term:
+        return None
+    words = _words(term)
+    backend = search_backend(db)
+    if backend == BACKEND_ILIKE or not words:
+        return _ilike_match(term, scope)
+    if backend == BACKEND_POSTGRES:
+        text_match = _search_vector.op("@@")(_tsquery(words, scope))
+    else:
+        text_match = Opportunity.id.in_(
+            select(_fts.c.rowid).where(_fts_ref.op("MATCH")(_fts_match_expression(words, scope)))
+        )
+    return or_(text_match, *_identifier_match(term, scope))
+
+
+def apply_opportunity_search(query, search_term: str, *, scope: str = SCOPE_FEED):
+    """Filter an ``Opportunity`` query to rows matching ``search_term``."""
+    clause = opportunity_search_filter(query.session, search_term, scope=scope)
+    return query if clause is None else query.filter(clause)
+
+
+def opportunity_search_rank(db: Session, search_term: str, *, scope: str = SCOPE_FEED) -> Any:
+    """Return an ascending sort key for relevance; best matches sort first.
+
+    Rows matched only by an identifier substring rank after text matches on
+    the index backends.
+    """
+    term = normalize_search_term(search_term)
+    words = _words(term)
+    backend = search_backend(db)
+    if backend == BACKEND_ILIKE or not words:
+        pattern = f"%{term}%"
+        return case(
+            (Opportunity.title.ilike(pattern), 0),
+            (Opportunity.agency.ilike(pattern), 1),
+            else_=2,
+        )
+    if backend == BACKEND_POSTGRES:
+        rank = -func.ts_rank_cd(_search_vector, _tsquery(words, scope))
+    else:
+        rank = (
+            select(func.bm25(_fts_ref, *_BM25_WEIGHTS))
+            .where(_fts.c.rowid == Opportunity.id)
+            .where(_fts_ref.op("MATCH")(_fts_match_expression(words, scope)))
+            .scalar_subquery()
+        )
+    return func.coalesce(rank, 0)
@@ -24,6 +24,7 @@ from ..models import (
     OpportunityNote,
     OpportunityPursuitLaneMatch,
     OpportunityUpdateEvent,
+    OpportunityVoteSummary,
     OrgProfile,
     Organization,
     OrganizationMembership,
@@ -32,6 +33,7 @@ from ..models import (
     PursuitLaneAssignment,
     SamSourceConfig,
     User,
+    UserFeedState,
     UserOpportunity,
     Vote,
     Workspace,
@@ -564,6 +566,19 @@ def delete_test_organization(
                 OpportunityNote.user_id.in_(users_to_delete or {-1}),
             )
         ).delete(synchronize_session=False)
+        db.query(UserFeedState).filter(
+            or_(
+                UserFeedState.organization_id == org.id,
+                UserFeedState.opportunity_id.in_(opportunity_ids or {-1}),
+                UserFeedState.user_id.in_(users_to_delete or {-1}),
+            )
+        ).delete(synchronize_session=False)
+        db.query(OpportunityVoteSummary).filter(
+            or_(
+                OpportunityVoteSummary.organization_id == org.id,
+                OpportunityVoteSummary.opportunity_id.in_(opportunity_ids or {-1}),
+            )
+        ).delete(synchronize_session=False)
         db.query(UserOpportunity).filter(
             or_(
                 UserOpportunity.organization_id == org.id,
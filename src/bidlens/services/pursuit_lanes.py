@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
 import re
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session, load_only
 
 from ..models import Opportunity, OpportunityPursuitLaneMatch, PursuitLane, PursuitLaneAssignment
 from .agency_display import agency_presentation
-from .account_aliases import resolve_account_display_name
+from .account_aliases import opportunity_account_display
 
 
+LANE_MATCH_CHUNK_SIZE = 500
+
 BROAD_DESCRIPTION_TERMS = {
     "analysis",
     "data",
@@ -46,20 +52,28 @@ def _is_naics_term(term: str) -> bool:
     return bool(re.fullmatch(r"\d{2,6}", str(term or "").strip()))
 
 
-def _term_pattern(term: str) -> re.Pattern[str]:
+def _term_pattern_source(term: str) -> str:
     words = [re.escape(part) for part in re.split(r"\s+", str(term or "").strip()) if part]
     pattern = r"[\W_]+".join(words)
     if not pattern:
         pattern = re.escape(str(term or "").strip())
     prefix = r"(?<![a-z0-9])" if re.match(r"^[a-z0-9]", str(term or "").strip(), re.I) else ""
     suffix = r"(?![a-z0-9])" if re.search(r"[a-z0-9]$", str(term or "").strip(), re.I) else ""
-    return re.compile(f"{prefix}{pattern}{suffix}", re.IGNORECASE)
+    return f"{prefix}{pattern}{suffix}"
+
+
+def _term_pattern(term: str) -> re.Pattern[str]:
+    return re.compile(_term_pattern_source(term), re.IGNORECASE)
+
+
+def _normalized_match_text(haystack: str | None) -> str:
+    return re.sub(r"\s+", " ", str(haystack)) if haystack else ""
 
 
 def _text_matches(haystack: str | None, needles: list[str]) -> list[str]:
     if not haystack or not needles:
         return []
-    text = re.sub(r"\s+", " ", str(haystack))
+    text = _normalized_match_text(haystack)
     return [needle for needle in needles if _term_pattern(needle).search(text)]
 
 
@@ -67,10 +81,16 @@ def _match_reasons(haystack: str | None, needles: list[str], label: str) -> list
     return [f"{label} matched {needle}" for needle in _text_matches(haystack, needles)]
 
 
+def _naics_values(opp_naics: str | None) -> list[str]:
+    if not opp_naics:
+        return []
+    return [part.strip() for part in re.split(r"[\s,;]+", str(opp_naics)) if part.strip()]
+
+
 def _naics_reasons(opp_naics: str | None, lane_naics: list[str]) -> list[str]:
     if not opp_naics or not lane_naics:
         return []
-    opp_values = [part.strip() for part in re.split(r"[\s,;]+", str(opp_naics)) if part.strip()]
+    opp_values = _naics_values(opp_naics)
     reasons: list[str] = []
     for wanted in lane_naics:
         wanted_lower = wanted.lower()
@@ -104,13 +124,10 @@ def lane_match_terms(lane: PursuitLane) -> list[str]:
     return terms
 
 
-def match_lane_to_opportunity(lane: PursuitLane, opportunity: Opportunity) -> list[str]:
-    terms = lane_match_terms(lane)
-    naics_terms = [term for term in terms if _is_naics_term(term)]
-    text_terms = [term for term in terms if not _is_naics_term(term)]
+def _agency_match_text(opportunity: Opportunity) -> str:
     agency = agency_presentation(opportunity.agency)
-    resolved_agency = resolve_account_display_name(opportunity.agency)
-    agency_text = " ".join(
+    resolved_agency = opportunity_account_display(opportunity).display
+    return " ".join(
         part
         for part in [
             opportunity.agency,
@@ -121,7 +138,10 @@ def match_lane_to_opportunity(lane: PursuitLane, opportunity: Opportunity) -> li
         ]
         if part
     )
-    description_text = " ".join(
+
+
+def _description_match_text(opportunity: Opportunity) -> str:
+    return " ".join(
         part
         for part in [
             opportunity.description,
@@ -129,6 +149,14 @@ def match_lane_to_opportunity(lane: PursuitLane, opportunity: Opportunity) -> li
         ]
         if part
     )
+
+
+def match_lane_to_opportunity(lane: PursuitLane, opportunity: Opportunity) -> list[str]:
+    terms = lane_match_terms(lane)
+    naics_terms = [term for term in terms if _is_naics_term(term)]
+    text_terms = [term for term in terms if not _is_naics_term(term)]
+    agency_text = _agency_match_text(opportunity)
+    description_text = _description_match_text(opportunity)
     primary_reasons = (
         _match_reasons(opportunity.title, text_terms, "Title")
         + _match_reasons(agency_text, text_terms, "Agency")
@@ -160,85 +188,345 @@ def _description_only_match_is_strong(matched_terms: list[str]) -> bool:
     return bool(re.search(r"\s", term)) or len(re.sub(r"[^a-z0-9]", "", term)) >= 7
 
 
-def refresh_lane_matches(db: Session, organization_id: int, lane: PursuitLane) -> int:
-    db.query(OpportunityPursuitLaneMatch).filter(
-        OpportunityPursuitLaneMatch.organization_id == organization_id,
-        OpportunityPursuitLaneMatch.pursuit_lane_id == lane.id,
-    ).delete(synchronize_session=False)
+class _TermScanner:
+    """Find every term that occurs in a text with one combined regex pass.
 
-    if not lane.is_active:
-        return 0
+    The combined pattern is a zero-width lookahead over all term patterns, so
+    every candidate position is tried and overlapping terms are still found:
+    the engine reports the first alternative that matches at a position and
+    only the later alternatives need an anchored re-check there. Terms that
+    start on a word boundary are gated behind that boundary, which lets the
+    scan skip mid-word positions cheaply.
+    """
 
-    opportunities = (
-        db.query(Opportunity)
-        .filter(Opportunity.organization_id == organization_id)
-        .all()
-    )
-    matched_count = 0
-    for opportunity in opportunities:
-        reasons = match_lane_to_opportunity(lane, opportunity)
-        if not reasons:
-            continue
-        db.add(
-            OpportunityPursuitLaneMatch(
-                organization_id=organization_id,
-                opportunity_id=opportunity.id,
-                pursuit_lane_id=lane.id,
-                matched_reasons=reasons,
+    _WORD_START = r"(?<![a-z0-9])(?=[a-z0-9])"
+
+    def __init__(self, sources: list[str]):
+        word_sources = [source for source in sources if source.startswith(r"(?<![a-z0-9])")]
+        other_sources = [source for source in sources if not source.startswith(r"(?<![a-z0-9])")]
+        self.sources = word_sources + other_sources
+        self._patterns = [re.compile(source, re.IGNORECASE) for source in self.sources]
+        branches = []
+        if word_sources:
+            branches.append(self._WORD_START + "(?=" + "|".join(f"({source})" for source in word_sources) + ")")
+        if other_sources:
+            branches.append("(?=" + "|".join(f"({source})" for source in other_sources) + ")")
+        self._combined = re.compile("|".join(branches), re.IGNORECASE) if branches else None
+
+    def matched_sources(self, text: str) -> set[str]:
+        if not text or self._combined is None:
+            return set()
+        found: set[int] = set()
+        for match in self._combined.finditer(text):
+            first = match.lastindex - 1
+            found.add(first)
+            position = match.start()
+            for index in range(first + 1, len(self._patterns)):
+                if index not in found and self._patterns[index].match(text, position):
+                    found.add(index)
+        return {self.sources[index] for index in found}
+
+
+class CompiledLaneMatcher:
+    """Match opportunities against a fixed set of lanes.
+
+    Produces the same reasons as ``match_lane_to_opportunity`` for each lane,
+    but compiles the term patterns once and scans each opportunity field a
+    single time for all lanes.
+    """
+
+    def __init__(self, lane_terms: tuple[tuple[int, tuple[str, ...]], ...]):
+        self._lanes: list[tuple[int, list[str], list[tuple[str, str]]]] = []
+        sources: dict[str, None] = {}
+        for lane_id, terms in lane_terms:
+            naics_terms = [term for term in terms if _is_naics_term(term)]
+            text_terms = [
+                (term, _term_pattern_source(term))
+                for term in terms
+                if not _is_naics_term(term)
+            ]
+            for _, source in text_terms:
+                sources.setdefault(source)
+            self._lanes.append((lane_id, naics_terms, text_terms))
+        self._scanner = _TermScanner(list(sources))
+
+    def match(
+        self,
+        opportunity: Opportunity,
+        *,
+        agency_hits_by_agency: dict[str | None, set[str]] | None = None,
+    ) -> list[tuple[int, list[str]]]:
+        """Return ``(lane_id, matched_reasons)`` for each lane the opportunity matches.
+
+        ``agency_hits_by_agency`` lets a caller matching many opportunities
+        resolve and scan each distinct agency once.
+        """
+        if not self._lanes:
+            return []
+        scan = self._scanner.matched_sources
+        title_hits = scan(_normalized_match_text(opportunity.title))
+        if agency_hits_by_agency is None:
+            agency_hits = scan(_normalized_match_text(_agency_match_text(opportunity)))
+        else:
+            agency_hits = agency_hits_by_agency.get(opportunity.agency)
+            if agency_hits is None:
+                agency_hits = scan(_normalized_match_text(_agency_match_text(opportunity)))
+                agency_hits_by_agency[opportunity.agency] = agency_hits
+        naics_title_hits = scan(_normalized_match_text(opportunity.naics_title))
+        set_aside_hits = scan(_normalized_match_text(opportunity.set_aside))
+        description_hits = scan(_normalized_match_text(_description_match_text(opportunity)))
+        naics_values = [value.lower() for value in _naics_values(opportunity.naics)]
+
+        results: list[tuple[int, list[str]]] = []
+        for lane_id, naics_terms, text_terms in self._lanes:
+            primary_reasons = (
+                [f"Title matched {term}" for term, source in text_terms if source in title_hits]
+                + [f"Agency matched {term}" for term, source in text_terms if source in agency_hits]
+                + [
+                    f"NAICS matched {term}"
+                    for term in naics_terms
+                    if any(value.startswith(term.lower()) for value in naics_values)
+                ]
+                + [f"NAICS title matched {term}" for term, source in text_terms if source in naics_title_hits]
+                + [f"Set-aside matched {term}" for term, source in text_terms if source in set_aside_hits]
             )
-        )
-        matched_count += 1
-    return matched_count
+            description_matches = [term for term, source in text_terms if source in description_hits]
+            description_reasons = [f"Description matched {term}" for term in description_matches]
+            if primary_reasons:
+                results.append((lane_id, primary_reasons + description_reasons))
+            elif _description_only_match_is_strong(description_matches):
+                results.append((lane_id, description_reasons))
+        return results
 
 
-def refresh_opportunity_lane_matches(db: Session, organization_id: int, opportunity: Opportunity) -> int:
-    db.query(OpportunityPursuitLaneMatch).filter(
-        OpportunityPursuitLaneMatch.organization_id == organization_id,
-        OpportunityPursuitLaneMatch.opportunity_id == opportunity.id,
-    ).delete(synchronize_session=False)
+@lru_cache(maxsize=64)
+def _compiled_lane_matcher(lane_terms: tuple[tuple[int, tuple[str, ...]], ...]) -> CompiledLaneMatcher:
+    return CompiledLaneMatcher(lane_terms)
 
-    lanes = (
+
+def compiled_lane_matcher(lanes: list[PursuitLane]) -> CompiledLaneMatcher:
+    """Return a cached matcher for the lanes' current match terms.
+
+    The cache is keyed by each lane's id and terms, so editing, adding,
+    deactivating, or deleting a lane produces a new matcher on the next call
+    in every process without explicit invalidation.
+    """
+    return _compiled_lane_matcher(
+        tuple((lane.id, tuple(lane_match_terms(lane))) for lane in lanes)
+    )
+
+
+def _active_lanes(db: Session, organization_id: int) -> list[PursuitLane]:
+    return (
         db.query(PursuitLane)
         .filter(
             PursuitLane.organization_id == organization_id,
             PursuitLane.is_active.is_(True),
         )
+        .order_by(PursuitLane.id.asc())
         .all()
     )
-    matched_count = 0
-    for lane in lanes:
-        reasons = match_lane_to_opportunity(lane, opportunity)
-        if not reasons:
-            continue
-        db.add(
-            OpportunityPursuitLaneMatch(
-                organization_id=organization_id,
-                opportunity_id=opportunity.id,
-                pursuit_lane_id=lane.id,
-                matched_reasons=reasons,
-            )
+
+
+@dataclass(frozen=True)
+class LaneMatchSync:
+    """Row-level outcome of reconciling stored lane matches with the matcher."""
+
+    added: int = 0
+    removed: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def matched(self) -> int:
+        return self.added + self.updated + self.unchanged
+
+    def __add__(self, other: LaneMatchSync) -> LaneMatchSync:
+        return LaneMatchSync(
+            added=self.added + other.added,
+            removed=self.removed + other.removed,
+            updated=self.updated + other.updated,
+            unchanged=self.unchanged + other.unchanged,
         )
-        matched_count += 1
-    return matched_count
 
 
-def refresh_org_lane_matches(db: Session, organization_id: int) -> int:
-    db.query(OpportunityPursuitLaneMatch).filter(
+_MATCH_TEXT_COLUMNS = (
+    Opportunity.id,
+    Opportunity.title,
+    Opportunity.agency,
+    Opportunity.naics,
+    Opportunity.naics_title,
+    Opportunity.set_aside,
+    Opportunity.description,
+    Opportunity.description_text,
+)
+
+
+def _sync_lane_match_chunk(
+    db: Session,
+    organization_id: int,
+    matcher: CompiledLaneMatcher,
+    opportunities: list[Opportunity],
+    *,
+    lane_id: int | None = None,
+    agency_hits_by_agency: dict[str | None, set[str]] | None = None,
+) -> LaneMatchSync:
+    """Reconcile stored matches for one chunk of opportunities.
+
+    Only rows whose presence or reasons changed are written. ``lane_id``
+    limits the comparison to a single lane; otherwise every stored match for
+    the chunk is in scope, so rows for inactive or deleted lanes are removed.
+    """
+    if not opportunities:
+        return LaneMatchSync()
+    desired: dict[tuple[int, int], list[str]] = {}
+    for opportunity in opportunities:
+        for matched_lane_id, reasons in matcher.match(
+            opportunity,
+            agency_hits_by_agency=agency_hits_by_agency,
+        ):
+            desired[(opportunity.id, matched_lane_id)] = reasons
+
+    stored = select(
+        OpportunityPursuitLaneMatch.id,
+        OpportunityPursuitLaneMatch.opportunity_id,
+        OpportunityPursuitLaneMatch.pursuit_lane_id,
+        OpportunityPursuitLaneMatch.matched_reasons,
+    ).where(
         OpportunityPursuitLaneMatch.organization_id == organization_id,
-    ).delete(synchronize_session=False)
+        OpportunityPursuitLaneMatch.opportunity_id.in_([opportunity.id for opportunity in opportunities]),
+    )
+    if lane_id is not None:
+        stored = stored.where(OpportunityPursuitLaneMatch.pursuit_lane_id == lane_id)
+
+    removed_ids: list[int] = []
+    updates: list[dict] = []
+    unchanged = 0
+    for row_id, opportunity_id, stored_lane_id, stored_reasons in db.execute(stored):
+        reasons = desired.pop((opportunity_id, stored_lane_id), None)
+        if reasons is None:
+            removed_ids.append(row_id)
+        elif list(stored_reasons or []) != reasons:
+            updates.append({"id": row_id, "matched_reasons": reasons})
+        else:
+            unchanged += 1
+
+    if removed_ids:
+        db.query(OpportunityPursuitLaneMatch).filter(
+            OpportunityPursuitLaneMatch.id.in_(removed_ids),
+        ).delete(synchronize_session=False)
+    if updates:
+        db.execute(update(OpportunityPursuitLaneMatch), updates)
+    if desired:
+        db.execute(
+            insert(OpportunityPursuitLaneMatch),
+            [
+                {
+                    "organization_id": organization_id,
+                    "opportunity_id": opportunity_id,
+                    "pursuit_lane_id": matched_lane_id,
+                    "matched_reasons": reasons,
+                }
+                for (opportunity_id, matched_lane_id), reasons in desired.items()
+            ],
+        )
+    return LaneMatchSync(
+        added=len(desired),
+        removed=len(removed_ids),
+        updated=len(updates),
+        unchanged=unchanged,
+    )
 
-    lanes = (
-        db.query(PursuitLane)
-        .filter(
-            PursuitLane.organization_id == organization_id,
-            PursuitLane.is_active.is_(True),
+
+def _sync_org_lane_matches(
+    db: Session,
+    organization_id: int,
+    matcher: CompiledLaneMatcher,
+    *,
+    lane_id: int | None = None,
+) -> LaneMatchSync:
+    """Stream the organization's opportunities and reconcile them in chunks."""
+    query = (
+        select(Opportunity)
+        .options(load_only(*_MATCH_TEXT_COLUMNS))
+        .where(Opportunity.organization_id == organization_id)
+        .order_by(Opportunity.id.asc())
+        .execution_options(yield_per=LANE_MATCH_CHUNK_SIZE)
+    )
+    result = LaneMatchSync()
+    agency_hits_by_agency: dict[str | None, set[str]] = {}
+    for chunk in db.execute(query).scalars().partitions():
+        result += _sync_lane_match_chunk(
+            db,
+            organization_id,
+            matcher,
+            list(chunk),
+            lane_id=lane_id,
+            agency_hits_by_agency=agency_hits_by_agency,
         )
-        .all()
+    return result
+
+
+def _chunks(opportunities: Iterable[Opportunity]) -> Iterable[list[Opportunity]]:
+    chunk: list[Opportunity] = []
+    for opportunity in opportunities:
+        chunk.append(opportunity)
+        if len(chunk) >= LANE_MATCH_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def refresh_lane_matches(db: Session, organization_id: int, lane: PursuitLane) -> LaneMatchSync:
+    if not lane.is_active:
+        removed = db.query(OpportunityPursuitLaneMatch).filter(
+            OpportunityPursuitLaneMatch.organization_id == organization_id,
+            OpportunityPursuitLaneMatch.pursuit_lane_id == lane.id,
+        ).delete(synchronize_session=False)
+        return LaneMatchSync(removed=removed or 0)
+
+    return _sync_org_lane_matches(
+        db,
+        organization_id,
+        compiled_lane_matcher([lane]),
+        lane_id=lane.id,
     )
-    total = 0
-    for lane in lanes:
-        total += refresh_lane_matches(db, organization_id, lane)
-    return total
+
+
+def refresh_opportunity_lane_matches(
+    db: Session,
+    organization_id: int,
+    opportunity: Opportunity,
+) -> LaneMatchSync:
+    return refresh_opportunities_lane_matches(db, organization_id, [opportunity])
+
+
+def refresh_opportunities_lane_matches(
+    db: Session,
+    organization_id: int,
+    opportunities: list[Opportunity],
+) -> LaneMatchSync:
+    """Refresh matches for a batch of opportunities, loading lanes once."""
+    if not opportunities:
+        return LaneMatchSync()
+    matcher = compiled_lane_matcher(_active_lanes(db, organization_id))
+    result = LaneMatchSync()
+    agency_hits_by_agency: dict[str | None, set[str]] = {}
+    for chunk in _chunks(opportunities):
+        result += _sync_lane_match_chunk(
+            db,
+            organization_id,
+            matcher,
+            chunk,
+            agency_hits_by_agency=agency_hits_by_agency,
+        )
+    return result
+
+
+def refresh_org_lane_matches(db: Session, organization_id: int) -> LaneMatchSync:
+    matcher = compiled_lane_matcher(_active_lanes(db, organization_id))
+    return _sync_org_lane_matches(db, organization_id, matcher)
 
 
 def user_my_lanes(db: Session, *, organization_id: int, user_id: int) -> list[PursuitLane]:
@@ -256,6 +544,34 @@ def user_my_lanes(db: Session, *, organization_id: int, user_id: int) -> list[Pu
     )
 
 
+def users_my_lanes(
+    db: Session,
+    *,
+    organization_id: int,
+    user_ids: Iterable[int],
+) -> dict[int, list[PursuitLane]]:
+    """``user_my_lanes`` for several users of one organization in one query."""
+    user_ids = list(user_ids)
+    lanes_by_user: dict[int, list[PursuitLane]] = {user_id: [] for user_id in user_ids}
+    if not user_ids:
+        return lanes_by_user
+    rows = (
+        db.query(PursuitLaneAssignment.user_id, PursuitLane)
+        .join(PursuitLane, PursuitLane.id == PursuitLaneAssignment.pursuit_lane_id)
+        .filter(
+            PursuitLaneAssignment.organization_id == organization_id,
+            PursuitLaneAssignment.user_id.in_(user_ids),
+            PursuitLane.organization_id == organization_id,
+            PursuitLane.is_active.is_(True),
+        )
+        .order_by(PursuitLane.name.asc(), PursuitLane.id.asc())
+        .all()
+    )
+    for user_id, lane in rows:
+        lanes_by_user[user_id].append(lane)
+    return lanes_by_user
+
+
 def set_user_my_lanes(
     db: Session,
     *,
@@ -0,0 +1,241 @@
+"""Keyset pagination for the Feed, My Shortlist, and Triage queues.
+
+A queue page is read by seeking past the sort key of the previous page's
+edge row instead of ``OFFSET``, so deep pages cost the same as the first one.
+The edge key travels in an opaque URL cursor. The routes cache result totals
+in ``fragment_cache`` rather than running a ``COUNT(*)`` on every page view.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Sequence
+
+from sqlalchemy import String, and_, false, literal, or_, type_coerce
+from sqlalchemy.types import NullType, TypeDecorator
+
+from ..models import Opportunity
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a queue ordering.
+
+    ``nulls_first`` places NULLs before every value in the forward order;
+    otherwise they sort last regardless of direction.
+    """
+
+    expression: Any
+    descending: bool = False
+    nullable: bool = True
+    nulls_first: bool = False
+
+
+@dataclass
+class QueuePage:
+    rows: list
+    page: int
+    has_next: bool
+    has_prev: bool
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+def order_by_clauses(keys: Sequence[SortKey], *, reverse: bool = False) -> list:
+    clauses = []
+    for key in keys:
+        descending = key.descending != reverse
+        if key.nullable:
+            nulls_first = key.nulls_first != reverse
+            null_rank = key.expression.is_(None)
+            clauses.append(null_rank.desc() if nulls_first else null_rank.asc())
+        clauses.append(key.expression.desc() if descending else key.expression.asc())
+    return clauses
+
+
+class _StoredValue(TypeDecorator):
+    """Bind a value exactly as the database returned it, skipping column types.
+
+    SQLite keeps timestamps as text and a ``CURRENT_TIMESTAMP`` default is
+    formatted differently from a bound ``datetime``; re-binding through the
+    column's type would make equal keys compare unequal.
+    """
+
+    impl = String
+    cache_ok = True
+
+
+def _stored(value):
+    return literal(value, _StoredValue())
+
+
+def _equal(key: SortKey, value):
+    return key.expression.is_(None) if value is None else key.expression == _stored(value)
+
+
+def _beyond(key: SortKey, value, *, reverse: bool):
+    """Rows strictly after ``value`` on ``key`` in the (possibly reversed) order."""
+    descending = key.descending != reverse
+    nulls_first = key.nulls_first != reverse
+    if value is None:
+        return key.expression.is_not(None) if nulls_first else false()
+    clause = key.expression < _stored(value) if descending else key.expression > _stored(value)
+    if key.nullable and not nulls_first:
+        clause = or_(clause, key.expression.is_(None))
+    return clause
+
+
+def seek_filter(keys: Sequence[SortKey], values: Sequence[Any], *, reverse: bool = False):
+    """WHERE clause for rows after ``values`` (before them when ``reverse``)."""
+    branches = []
+    for index, key in enumerate(keys):
+        prefix = [_equal(keys[i], values[i]) for i in range(index)]
+        branches.append(and_(*prefix, _beyond(key, values[index], reverse=reverse)))
+    return or_(*branches)
+
+
+def _encode_value(value):
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        raise ValueError("unknown cursor value")
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    raise ValueError("unknown cursor value")
+
+
+def encode_cursor(values: Sequence[Any], *, page: int, ordering: str) -> str:
+    payload = {"o": ordering, "p": page, "k": [_encode_value(value) for value in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str | None, *, ordering: str, key_count: int) -> tuple[list, int] | None:
+    """Return ``(values, page)``, or None for a missing, stale, or malformed cursor."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        if payload.get("o") != ordering:
+            return None
+        values = [_decode_value(value) for value in payload["k"]]
+        page = int(payload["p"])
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+    if len(values) != key_count or page < 1:
+        return None
+    return values, page
+
+
+def _row_opportunity_id(row) -> int:
+    return row.id if isinstance(row, Opportunity) else row[0].id
+
+
+def _edge_values(query, keys: Sequence[SortKey], rows: list) -> dict[int, list]:
+    """Read the sort key of the first and last row through the page's own query."""
+    edge_ids = {_row_opportunity_id(rows[0]), _row_opportunity_id(rows[-1])}
+    expressions = [type_coerce(key.expression, NullType()) for key in keys]
+    values: dict[int, list] = {}
+    for row in (
+        query.order_by(None)
+        .with_entities(Opportunity.id, *expressions)
+        .filter(Opportunity.id.in_(edge_ids))
+        .all()
+    ):
+        values.setdefault(row[0], list(row[1:]))
+    return values
+
+
+def keyset_page(
+    query,
+    keys: Sequence[SortKey],
+    *,
+    ordering: str,
+    page_size: int,
+    after: str | None = None,
+    before: str | None = None,
+) -> QueuePage | None:
+    """Read the page after cursor ``after`` (or before ``before``).
+
+    Without a cursor this is the first page. ``query`` must already be ordered
+    by ``order_by_clauses(keys)``. Returns None when the cursor is unusable so
+    the caller can fall back to a page number.
+    """
+    cursor = after or before
+    decoded = decode_cursor(cursor, ordering=ordering, key_count=len(keys))
+    if cursor and decoded is None:
+        return None
+    page_query = query
+    page = 1
+    reverse = False
+    if decoded is not None:
+        values, page = decoded
+        reverse = not after
+        page_query = page_query.filter(seek_filter(keys, values, reverse=reverse))
+        if reverse:
+            page_query = page_query.order_by(None).order_by(*order_by_clauses(keys, reverse=True))
+
+    rows = list(page_query.limit(page_size + 1).all())
+    more = len(rows) > page_size
+    rows = rows[:page_size]
+    if reverse:
+        if not more:
+            # Walked back to the start of the queue; read it as page one so the
+            # page is full even if rows left the queue in the meantime.
+            return keyset_page(query, keys, ordering=ordering, page_size=page_size)
+        rows.reverse()
+        has_next, has_prev = True, True
+    else:
+        has_next, has_prev = more, page > 1
+
+    return _with_cursors(
+        QueuePage(rows=rows, page=page, has_next=has_next, has_prev=has_prev), query, keys, ordering=ordering
+    )
+
+
+def offset_page(
+    query,
+    *,
+    page: int,
+    page_size: int,
+    keys: Sequence[SortKey] | None = None,
+    ordering: str = "",
+) -> QueuePage:
+    """Read a numbered page for orderings without a stable key, or old links.
+
+    With ``keys`` the page still carries cursors, so moving on from it seeks.
+    """
+    rows = list(query.offset((page - 1) * page_size).limit(page_size + 1).all())
+    result = QueuePage(rows=rows[:page_size], page=page, has_next=len(rows) > page_size, has_prev=page > 1)
+    return _with_cursors(result, query, keys, ordering=ordering) if keys else result
+
+
+def _with_cursors(result: QueuePage, query, keys: Sequence[SortKey], *, ordering: str) -> QueuePage:
+    rows = result.rows
+    if not rows or not (result.has_next or result.has_prev):
+        return result
+    edges = _edge_values(query, keys, rows)
+    first = edges.get(_row_opportunity_id(rows[0]))
+    last = edges.get(_row_opportunity_id(rows[-1]))
+    if result.has_next and last is not None:
+        result.next_cursor = encode_cursor(last, page=result.page + 1, ordering=ordering)
+    if result.has_prev and first is not None:
+        result.prev_cursor = encode_cursor(first, page=max(1, result.page - 1), ordering=ordering)
+    return result
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import datetime as dt
+import logging
 from typing import Any
 
 from sqlalchemy.orm import Session
 
-from ..ingest_sam import ingest_sam
+from ..ingest_sam import ingest_sam, sam_ingest_in_progress
 from ..models import SamSourceConfig
+from .ingest_leases import IngestLeaseBusy
 from .ingestion_runs import record_source_activity
 from .job_runs import sanitize_error_message
+from .sam_search_cache import SamSearchCache
 from .sam_source_config import ingest_kwargs
 
 
+logger = logging.getLogger(__name__)
+
+
 def sam_busy_payload(*, organization_id: int) -> dict[str, Any]:
     return {
         "status": "busy",
@@ -47,6 +53,7 @@ def execute_sam_source_pull(
     run_type: str,
     manual_pull: bool,
     enrich_descriptions: bool = False,
+    search_cache: SamSearchCache | None = None,
 ) -> dict[str, Any]:
     return ingest_sam(
         db,
@@ -56,6 +63,7 @@ def execute_sam_source_pull(
         saved_search_name=config.name,
         run_type=run_type,
         source_config_id=config.id,
+        search_cache=search_cache,
         **ingest_kwargs(config),
     )
 
@@ -191,3 +199,139 @@ def record_sam_failure_activity(
         result=result,
         run_type=run_type,
     )
+
+
+def record_missing_sam_source_config(
+    db: Session,
+    *,
+    organization_id: int,
+    user_id: int | None,
+    search_id: int | None,
+) -> dict[str, Any]:
+    return record_sam_noop_activity(
+        db,
+        organization_id=organization_id,
+        user_id=user_id,
+        reason="missing_sam_source_config",
+        message=(
+            "The selected SAM.gov saved search was not found."
+            if search_id is not None
+            else "Configure a SAM.gov saved search before running a pull."
+        ),
+    )
+
+
+def run_manual_sam_pull(
+    db: Session,
+    *,
+    organization_id: int,
+    user_id: int | None,
+    search_id: int | None = None,
+) -> tuple[int, dict[str, Any], dict[str, str]]:
+    """Run an admin "Pull now" and return ``(status_code, payload, headers)``.
+
+    Shared by the synchronous route and the source-pull worker so both record
+    the same pull history and produce the same response payload.
+    """
+    if sam_ingest_in_progress(db, organization_id):
+        return 409, sam_busy_payload(organization_id=organization_id), {}
+
+    config = find_sam_source_config(db, organization_id=organization_id, search_id=search_id)
+    if not config:
+        result = record_missing_sam_source_config(
+            db,
+            organization_id=organization_id,
+            user_id=user_id,
+            search_id=search_id,
+        )
+        return 400, result, {}
+
+    try:
+        result = execute_sam_source_pull(
+            db,
+            organization_id=organization_id,
+            config=config,
+            run_type="Manual",
+            manual_pull=True,
+            enrich_descriptions=False,
+        )
+    except IngestLeaseBusy as exc:
+        logger.info("sam_pull_busy organization_id=%s holder=%s", organization_id, exc.holder)
+        return 409, sam_busy_payload(organization_id=organization_id), {}
+
+    rate_limited_results = [item for item in result.get("results", []) if item.get("error_type") == "rate_limited"]
+    sam_unavailable_results = [item for item in result.get("results", []) if item.get("error_type") == "sam_unavailable"]
+    stopped_due_to_rate_limit = bool(result.get("stopped_due_to_rate_limit"))
+    all_rate_limited = (
+        bool(rate_limited_results)
+        and result.get("status") == "rate_limited"
+        and result.get("inserted", 0) == 0
+        and result.get("updated", 0) == 0
+        and result.get("skipped", 0) == 0
+        and result.get("filtered", 0) == 0
+    )
+
+    retry_after_seconds = result.get("retry_after_seconds")
+    retry_after = result.get("retry_after")
+    for item in rate_limited_results:
+        seconds = item.get("retry_after_seconds")
+        if seconds is not None and (retry_after_seconds is None or seconds > retry_after_seconds):
+            retry_after_seconds = seconds
+            retry_after = item.get("retry_after") or retry_after
+        elif retry_after is None and item.get("retry_after"):
+            retry_after = item.get("retry_after")
+
+    retry_after_display_value = retry_after_display(retry_after, retry_after_seconds)
+    retry_after_header = retry_after_header_value(retry_after, retry_after_seconds)
+    result["retry_after"] = retry_after_display_value
+    result["retry_after_seconds"] = retry_after_seconds
+    result["failed_naics"] = failed_naics(rate_limited_results or sam_unavailable_results)
+    result["organization_id"] = organization_id
+
+    if result.get("status") == "paused_rate_limit":
+        retry_hint = f" Retry after: {retry_after_display_value}." if retry_after_display_value else ""
+        result["message"] = f"Paused — SAM quota exceeded.{retry_hint}"
+        headers = {"Retry-After": retry_after_header} if retry_after_header else {}
+        record_sam_source_activity(db, organization_id=organization_id, user_id=user_id, result=result)
+        return 200, result, headers
+    if sam_unavailable_results:
+        if result.get("status") == "failed":
+            result["message"] = "SAM.gov is temporarily unavailable. Try again later."
+        else:
+            result["message"] = (
+                f"Pull partially completed: {result['inserted']} inserted, {result['updated']} updated, "
+                f"{result['skipped']} skipped, {result['filtered']} filtered, {result['errors']} errors. "
+                "SAM.gov is temporarily unavailable. Try again later."
+            )
+        record_sam_source_activity(db, organization_id=organization_id, user_id=user_id, result=result)
+        return (503 if result.get("status") == "failed" else 200), result, {}
+    elif all_rate_limited:
+        retry_hint = f" Try again after {retry_after_display_value}." if retry_after_display_value else " Try again later."
+        result["status"] = "rate_limited"
+        result["message"] = f"SAM.gov quota exceeded.{retry_hint}"
+        headers = {"Retry-After": retry_after_header} if retry_after_header else {}
+        record_sam_source_activity(db, organization_id=organization_id, user_id=user_id, result=result)
+        return 429, result, headers
+    elif rate_limited_results:
+        wait_hint = f" Try again after {retry_after_display_value}." if retry_after_display_value else ""
+        if stopped_due_to_rate_limit:
+            result["message"] = (
+                f"Pull stopped after SAM.gov quota exceeded: {result['inserted']} inserted, {result['updated']} updated, "
+                f"{result['skipped']} skipped, {result['filtered']} filtered, {result['errors']} errors.{wait_hint}"
+            )
+        else:
+            result["message"] = (
+                f"Pull partially completed: {result['inserted']} inserted, {result['updated']} updated, "
+                f"{result['skipped']} skipped, {result['filtered']} filtered, {result['errors']} errors."
+                f" SAM.gov rate limited one or more NAICS pulls.{wait_hint}"
+            )
+        record_sam_source_activity(db, organization_id=organization_id, user_id=user_id, result=result)
+        return 200, result, {}
+    else:
+        result["message"] = (
+            f"Pull completed with {result['inserted']} inserted, {result['updated']} updated, "
+            f"{result['skipped']} skipped, {result['filtered']} filtered, {result['errors']} errors, "
+            f"{result.get('pages_pulled', 0)} pages pulled, {result.get('records_seen', 0)} records seen."
+        )
+        record_sam_source_activity(db, organization_id=organization_id, user_id=user_id, result=result)
+        return 200, result, {}
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session
+
+from ..config import SAM_SEARCH_CACHE_MAX_BYTES, SAM_SEARCH_CACHE_TTL_SECONDS
+from ..models import SamSearchCacheEntry
+
+
+logger = logging.getLogger(__name__)
+
+# SAM pages are always requested at this size so configs with different
+# max_records still share pages; the cache trims to the caller's limit.
+SAM_SEARCH_PAGE_SIZE = 100
+
+# Fills of different pages rarely share a stripe; the lock count stays fixed
+# however many pages a run touches.
+_KEY_LOCK_STRIPES = 64
+
+
+def _utcnow() -> dt.datetime:
+    return dt.datetime.now(dt.timezone.utc)
+
+
+def _aware(value: dt.datetime) -> dt.datetime:
+    return value if value.tzinfo else value.replace(tzinfo=dt.timezone.utc)
+
+
+def _date_value(value: dt.date | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def normalized_search_params(
+    *,
+    naics: str,
+    posted_from: dt.date,
+    posted_to: dt.date,
+    response_deadline_from: dt.date | None = None,
+    response_deadline_to: dt.date | None = None,
+    organization_name: str | None = None,
+    procurement_types: list[str] | None = None,
+    limit: int = SAM_SEARCH_PAGE_SIZE,
+    offset: int = 0,
+) -> dict[str, Any]:
+    """Return the tenant-independent identity of one SAM search page."""
+    return {
+        "naics": str(naics).strip(),
+        "posted_from": _date_value(posted_from),
+        "posted_to": _date_value(posted_to),
+        "response_deadline_from": _date_value(response_deadline_from),
+        "response_deadline_to": _date_value(response_deadline_to),
+        "organization_name": (organization_name or "").strip() or None,
+        "procurement_types": sorted({str(code).strip().lower() for code in procurement_types or [] if code}),
+        "limit": int(limit),
+        "offset": int(offset),
+    }
+
+
+def search_cache_key(params: dict[str, Any]) -> str:
+    encoded = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _payload_bytes(payload: dict[str, Any]) -> int:
+    return len(json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def _trim_payload(payload: dict[str, Any], limit: int) -> dict[str, Any]:
+    for key in ("opportunitiesData", "opportunities"):
+        records = payload.get(key)
+        if isinstance(records, list) and len(records) > limit:
+            return {**payload, key: records[:limit]}
+    return payload
+
+
+@dataclass
+class SamSearchCache:
+    """Read-through cache for raw SAM search pages.
+
+    Pages live in ``sam_search_cache_entries`` for ``ttl_seconds`` so every
+    tenant and process reads the same copy. They are written in a short
+    session of their own, so a tenant ingest that rolls back keeps the pages
+    it fetched. The object also memoizes pages it
+    has served, up to ``max_bytes`` with the least recently served evicted
+    first, so a job-scoped instance rarely fetches a page twice in one run
+    even if the shared entry expires mid-run. Organizations
+    pulled in parallel may share an instance: a page is fetched by the first
+    caller while the others wait for it.
+    """
+
+    ttl_seconds: int = SAM_SEARCH_CACHE_TTL_SECONDS
+    max_bytes: int = SAM_SEARCH_CACHE_MAX_BYTES
+    hits: int = 0
+    misses: int = 0
+    _pages: OrderedDict[str, tuple[dict[str, Any], int]] = field(default_factory=OrderedDict, repr=False)
+    _page_bytes: int = field(default=0, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _key_locks: tuple[threading.Lock, ...] = field(
+        default_factory=lambda: tuple(threading.Lock() for _ in range(_KEY_LOCK_STRIPES)),
+        repr=False,
+        compare=False,
+    )
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def stats(self) -> dict[str, int]:
+        return {"search_cache_hits": self.hits, "search_cache_misses": self.misses}
+
+    def search(
+        self,
+        db: Session,
+        fetch: Callable[..., dict[str, Any]],
+        *,
+        limit: int = SAM_SEARCH_PAGE_SIZE,
+        offset: int = 0,
+        allow_rate_limit_wait: bool = True,
+        **search_params: Any,
+    ) -> dict[str, Any]:
+        """Return one SAM search page, calling ``fetch`` only on a miss."""
+        payload, _hit = self.search_page(
+            db, fetch, limit=limit, offset=offset, allow_rate_limit_wait=allow_rate_limit_wait, **search_params
+        )
+        return payload
+
+    def search_page(
+        self,
+        db: Session,
+        fetch: Callable[..., dict[str, Any]],
+        *,
+        limit: int = SAM_SEARCH_PAGE_SIZE,
+        offset: int = 0,
+        allow_rate_limit_wait: bool = True,
+        **search_params: Any,
+    ) -> tuple[dict[str, Any], bool]:
+        """Like ``search``, plus whether this call was served from the cache.
+
+        Callers sharing one instance count their own hits from the flag;
+        ``hits``/``misses`` are totals across every caller.
+        """
+        if not self.enabled:
+            payload = fetch(limit=limit, offset=offset, allow_rate_limit_wait=allow_rate_limit_wait, **search_params)
+            return payload, False
+
+        # Widen partial pages that start on a page boundary so they share the
+        # full page other configs request; anything else is cached as-is.
+        fetch_limit = SAM_SEARCH_PAGE_SIZE if limit < SAM_SEARCH_PAGE_SIZE and offset % SAM_SEARCH_PAGE_SIZE == 0 else limit
+        params = normalized_search_params(limit=fetch_limit, offset=offset, **search_params)
+        key = search_cache_key(params)
+
+        with self._key_lock(key):
+            payload = self._recall(key)
+            if payload is None:
+                payload = self._read(db, key)
+            if payload is not None:
+                with self._lock:
+                    self.hits += 1
+                self._remember(key, payload, _payload_bytes(payload))
+                logger.info("SAM search cache hit naics=%s offset=%s key=%s", params["naics"], offset, key[:12])
+                return _trim_payload(payload, limit), True
+
+            with self._lock:
+                self.misses += 1
+            payload = fetch(limit=fetch_limit, offset=offset, allow_rate_limit_wait=allow_rate_limit_wait, **search_params)
+            size_bytes = _payload_bytes(payload)
+            self._remember(key, payload, size_bytes)
+            self._write(db, key, params, payload, size_bytes)
+            return _trim_payload(payload, limit), False
+
+    def _recall(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            memo = self._pages.get(key)
+            if memo is None:
+                return None
+            self._pages.move_to_end(key)
+            return memo[0]
+
+    def _remember(self, key: str, payload: dict[str, Any], size_bytes: int) -> None:
+        with self._lock:
+            previous = self._pages.pop(key, None)
+            if previous is not None:
+                self._page_bytes -= previous[1]
+            if size_bytes > self.max_bytes:
+                return
+            self._pages[key] = (payload, size_bytes)
+            self._page_bytes += size_bytes
+            while self._page_bytes > self.max_bytes:
+                _evicted_key, (_payload, evicted_bytes) = self._pages.popitem(last=False)
+                self._page_bytes -= evicted_bytes
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        return self._key_locks[int(key[:8], 16) % len(self._key_locks)]
+
+    def _read(self, db: Session, key: str) -> dict[str, Any] | None:
+        now = _utcnow()
+        entry = (
+            db.query(SamSearchCacheEntry)
+            .filter(SamSearchCacheEntry.cache_key == key)
+            .one_or_none()
+        )
+        if entry is None or _aware(entry.expires_at) <= now:
+            return None
+        entry.hit_count = (entry.hit_count or 0) + 1
+        entry.last_accessed_at = now
+        return entry.payload
+
+    def _write(
+        self,
+        db: Session,
+        key: str,
+        params: dict[str, Any],
+        payload: dict[str, Any],
+        size_bytes: int,
+    ) -> None:
+        now = _utcnow()
+        with Session(bind=db.get_bind()) as cache_db:
+            try:
+                entry = (
+                    cache_db.query(SamSearchCacheEntry)
+                    .filter(SamSearchCacheEntry.cache_key == key)
+                    .one_or_none()
+                )
+                if entry is None:
+                    entry = SamSearchCacheEntry(cache_key=key)
+                    cache_db.add(entry)
+                entry.request_params = params
+                entry.payload = payload
+                entry.size_bytes = size_bytes
+                entry.fetched_at = now
+                entry.expires_at = now + dt.timedelta(seconds=self.ttl_seconds)
+                entry.last_accessed_at = now
+                cache_db.flush()
+                prune_sam_search_cache(cache_db, max_bytes=self.max_bytes, now=now)
+                cache_db.commit()
+            except IntegrityError:
+                # Another process cached the same page first; its copy is as good.
+                cache_db.rollback()
+                logger.info("SAM search cache entry already written key=%s", key[:12])
+            except OperationalError as exc:
+                # The page is still served from this run's memo; only sharing it is lost.
+                cache_db.rollback()
+                logger.warning("SAM search cache write skipped key=%s error=%s", key[:12], exc)
+
+
+def prune_sam_search_cache(
+    db: Session,
+    *,
+    max_bytes: int = SAM_SEARCH_CACHE_MAX_BYTES,
+    now: dt.datetime | None = None,
+) -> int:
+    """Drop expired pages, then least recently read pages beyond ``max_bytes``."""
+    now = now or _utcnow()
+    removed = (
+        db.query(SamSearchCacheEntry)
+        .filter(SamSearchCacheEntry.expires_at <= now)
+        .delete(synchronize_session=False)
+    )
+    total_bytes = int(db.query(func.coalesce(func.sum(SamSearchCacheEntry.size_bytes), 0)).scalar() or 0)
+    if total_bytes <= max_bytes:
+        return removed
+
+    evict_ids: list[int] = []
+    for entry_id, size_bytes in (
+        db.query(SamSearchCacheEntry.id, SamSearchCacheEntry.size_bytes)
+        .order_by(SamSearchCacheEntry.last_accessed_at.asc(), SamSearchCacheEntry.id.asc())
+    ):
+        if total_bytes <= max_bytes:
+            break
+        evict_ids.append(entry_id)
+        total_bytes -= int(size_bytes or 0)
+    if evict_ids:
+        removed += (
+            db.query(SamSearchCacheEntry)
+            .filter(SamSearchCacheEntry.id.in_(evict_ids))
+            .delete(synchronize_session=False)
+        )
+    return removed
@@ -20,7 +20,7 @@ from .opportunity_history import (
     EVENT_GRANTS_SYNOPSIS_VERSION,
     EVENT_SOURCE_UPDATED,
 )
-from .account_aliases import resolve_account_display_name
+from .account_aliases import opportunity_account_display
 
 
 OFFICIAL_EVENT_TYPES = (
@@ -91,7 +91,7 @@ def shortlist_recent_activity(
             "opportunity": {
                 "id": opportunity.id,
                 "title": opportunity.title,
-                "agency": resolve_account_display_name(opportunity.agency),
+                "agency": opportunity_account_display(opportunity).display,
                 "due_date": _date_label(opportunity.response_deadline),
                 "url": f"/opportunity/{opportunity.id}?return_to=shortlist",
             },
@@ -0,0 +1,488 @@
+"""Database-backed queue for manual "Pull now" source runs.
+
+Routes enqueue a ``SourcePullJob`` and return immediately. A worker process
+(``python -m bidlens.jobs.run_source_pull_worker``) claims queued jobs with a
+lease, renews the lease from a heartbeat thread while the pull runs, and
+retries retryable outcomes with exponential backoff.
+"""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable
+import uuid
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from .. import config
+from ..database import SessionLocal
+from ..models import IngestionRun, SourcePullJob
+from .grants_pulls import run_manual_grants_pull
+from .job_runs import sanitize_error_message
+from .sam_pulls import run_manual_sam_pull
+
+
+logger = logging.getLogger(__name__)
+
+SOURCE_SAM = "sam.gov"
+SOURCE_GRANTS = "grants.gov"
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_COMPLETED = "completed"
+JOB_STATUS_FAILED = "failed"
+ACTIVE_JOB_STATUSES = (JOB_STATUS_QUEUED, JOB_STATUS_RUNNING)
+
+# Outcomes worth another attempt: another pull held the ingest lock, or the
+# upstream source was briefly unavailable. Quota errors are not retried here;
+# SAM pulls already resume from their checkpoint on the next run.
+RETRYABLE_STATUS_CODES = frozenset({409, 503})
+MAX_RETRY_DELAY_SECONDS = 3600
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _aware(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def retry_delay_seconds(attempts: int, *, base_seconds: int | None = None) -> int:
+    base = config.SOURCE_PULL_JOB_RETRY_BASE_SECONDS if base_seconds is None else base_seconds
+    return min(MAX_RETRY_DELAY_SECONDS, base * 2 ** max(0, attempts - 1))
+
+
+def _run_sam(db: Session, job: SourcePullJob) -> tuple[int, dict[str, Any], dict[str, str]]:
+    return run_manual_sam_pull(
+        db,
+        organization_id=job.organization_id,
+        user_id=job.user_id,
+        search_id=(job.params_json or {}).get("search_id"),
+    )
+
+
+def _run_grants(db: Session, job: SourcePullJob) -> tuple[int, dict[str, Any], dict[str, str]]:
+    return run_manual_grants_pull(db, organization_id=job.organization_id, user_id=job.user_id)
+
+
+SOURCE_PULL_RUNNERS: dict[str, Callable[[Session, SourcePullJob], tuple[int, dict[str, Any], dict[str, str]]]] = {
+    SOURCE_SAM: _run_sam,
+    SOURCE_GRANTS: _run_grants,
+}
+
+
+def enqueue_source_pull(
+    db: Session,
+    *,
+    organization_id: int,
+    user_id: int | None,
+    source: str,
+    params: dict[str, Any] | None = None,
+    now: datetime | None = None,
+) -> SourcePullJob:
+    """Queue a pull, reusing an active job for the same workspace and source."""
+    if source not in SOURCE_PULL_RUNNERS:
+        raise ValueError(f"Unsupported source pull: {source!r}")
+    params = dict(params or {})
+    active = (
+        db.query(SourcePullJob)
+        .filter(
+            SourcePullJob.organization_id == organization_id,
+            SourcePullJob.source == source,
+            SourcePullJob.status.in_(ACTIVE_JOB_STATUSES),
+        )
+        .order_by(SourcePullJob.id.asc())
+        .all()
+    )
+    for job in active:
+        if (job.params_json or {}) == params:
+            return job
+
+    now = now or _utcnow()
+    job = SourcePullJob(
+        organization_id=organization_id,
+        user_id=user_id,
+        source=source,
+        params_json=params,
+        status=JOB_STATUS_QUEUED,
+        attempts=0,
+        max_attempts=max(1, config.SOURCE_PULL_JOB_MAX_ATTEMPTS),
+        available_at=now,
+        created_at=now,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def claim_next_source_pull(
+    db: Session,
+    *,
+    worker_id: str,
+    lease_seconds: int | None = None,
+    now: datetime | None = None,
+) -> SourcePullJob | None:
+    """Lease the next runnable job, including jobs whose worker stopped heartbeating.
+
+    The claim is a conditional UPDATE on the job's current status and attempt
+    count, so two workers racing for the same row cannot both win.
+    """
+    lease_seconds = config.SOURCE_PULL_JOB_LEASE_SECONDS if lease_seconds is None else lease_seconds
+    while True:
+        now = now or _utcnow()
+        candidate = (
+            db.query(SourcePullJob)
+            .filter(
+                or_(
+                    and_(SourcePullJob.status == JOB_STATUS_QUEUED, SourcePullJob.available_at <= now),
+                    and_(SourcePullJob.status == JOB_STATUS_RUNNING, SourcePullJob.lease_expires_at < now),
+                )
+            )
+            .order_by(SourcePullJob.available_at.asc(), SourcePullJob.id.asc())
+            .first()
+        )
+        if candidate is None:
+            return None
+
+        if candidate.status == JOB_STATUS_RUNNING and candidate.attempts >= candidate.max_attempts:
+            expired = (
+                db.query(SourcePullJob)
+                .filter(
+                    SourcePullJob.id == candidate.id,
+                    SourcePullJob.status == JOB_STATUS_RUNNING,
+                    SourcePullJob.attempts == candidate.attempts,
+                )
+                .update(
+                    {
+                        "status": JOB_STATUS_FAILED,
+                        "lease_owner": None,
+                        "lease_expires_at": None,
+                        "finished_at": now,
+                        "error_type": "LeaseExpired",
+                        "error_message": "The worker running this pull stopped heartbeating.",
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            if expired:
+                logger.warning("source_pull_job_lease_expired job_id=%s attempts=%s", candidate.id, candidate.attempts)
+            continue
+
+        claimed = (
+            db.query(SourcePullJob)
+            .filter(
+                SourcePullJob.id == candidate.id,
+                SourcePullJob.status == candidate.status,
+                SourcePullJob.attempts == candidate.attempts,
+            )
+            .update(
+                {
+                    "status": JOB_STATUS_RUNNING,
+                    "attempts": candidate.attempts + 1,
+                    "lease_owner": worker_id,
+                    "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                    "heartbeat_at": now,
+                    "started_at": now,
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if claimed:
+            job = db.get(SourcePullJob, candidate.id)
+            db.refresh(job)
+            return job
+
+
+def heartbeat_source_pull(
+    db: Session,
+    job_id: int,
+    *,
+    worker_id: str,
+    lease_seconds: int | None = None,
+    now: datetime | None = None,
+) -> bool:
+    """Extend the lease if ``worker_id`` still owns it; return False if it was lost."""
+    lease_seconds = config.SOURCE_PULL_JOB_LEASE_SECONDS if lease_seconds is None else lease_seconds
+    now = now or _utcnow()
+    renewed = (
+        db.query(SourcePullJob)
+        .filter(
+            SourcePullJob.id == job_id,
+            SourcePullJob.status == JOB_STATUS_RUNNING,
+            SourcePullJob.lease_owner == worker_id,
+        )
+        .update(
+            {"heartbeat_at": now, "lease_expires_at": now + timedelta(seconds=lease_seconds)},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return bool(renewed)
+
+
+class _LeaseHeartbeat:
+    """Renew a job lease from a background thread with its own session."""
+
+    def __init__(
+        self,
+        job_id: int,
+        *,
+        worker_id: str,
+        lease_seconds: int,
+        session_factory: Callable[[], Session],
+    ):
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.session_factory = session_factory
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"source-pull-heartbeat-{job_id}", daemon=True)
+
+    def _run(self) -> None:
+        interval = max(1.0, self.lease_seconds / 3)
+        while not self._stop.wait(interval):
+            try:
+                with self.session_factory() as db:
+                    if not heartbeat_source_pull(
+                        db,
+                        self.job_id,
+                        worker_id=self.worker_id,
+                        lease_seconds=self.lease_seconds,
+                    ):
+                        logger.warning("source_pull_job_lease_lost job_id=%s worker=%s", self.job_id, self.worker_id)
+                        return
+            except Exception:
+                logger.exception("source_pull_job_heartbeat_failed job_id=%s", self.job_id)
+
+    def __enter__(self) -> _LeaseHeartbeat:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+
+def _finish_job(
+    db: Session,
+    job: SourcePullJob,
+    *,
+    worker_id: str,
+    values: dict[str, Any],
+) -> bool:
+    """Write the outcome only if this worker still owns the lease."""
+    updated = (
+        db.query(SourcePullJob)
+        .filter(
+            SourcePullJob.id == job.id,
+            SourcePullJob.status == JOB_STATUS_RUNNING,
+            SourcePullJob.lease_owner == worker_id,
+        )
+        .update(values, synchronize_session=False)
+    )
+    db.commit()
+    db.refresh(job)
+    return bool(updated)
+
+
+def run_source_pull_job(
+    db: Session,
+    job: SourcePullJob,
+    *,
+    worker_id: str,
+    lease_seconds: int | None = None,
+    session_factory: Callable[[], Session] | None = SessionLocal,
+) -> SourcePullJob:
+    """Run a claimed job and record completion, a scheduled retry, or failure."""
+    lease_seconds = config.SOURCE_PULL_JOB_LEASE_SECONDS if lease_seconds is None else lease_seconds
+    runner = SOURCE_PULL_RUNNERS[job.source]
+    heartbeat = (
+        _LeaseHeartbeat(job.id, worker_id=worker_id, lease_seconds=lease_seconds, session_factory=session_factory)
+        if session_factory is not None
+        else None
+    )
+    error: Exception | None = None
+    status_code: int | None = None
+    payload: dict[str, Any] | None = None
+    try:
+        with heartbeat or nullcontext():
+            status_code, payload, _headers = runner(db, job)
+    except Exception as exc:
+        db.rollback()
+        error = exc
+        logger.exception("source_pull_job_failed job_id=%s source=%s", job.id, job.source)
+
+    now = _utcnow()
+    retryable = error is not None or status_code in RETRYABLE_STATUS_CODES
+    if retryable and job.attempts < job.max_attempts:
+        delay = retry_delay_seconds(job.attempts)
+        values = {
+            "status": JOB_STATUS_QUEUED,
+            "available_at": now + timedelta(seconds=delay),
+            "lease_owner": None,
+            "lease_expires_at": None,
+            "response_status_code": status_code,
+            "result_json": payload,
+            "error_type": type(error).__name__ if error else None,
+            "error_message": sanitize_error_message(str(error)) if error else None,
+        }
+        logger.info("source_pull_job_retry job_id=%s attempts=%s delay=%s", job.id, job.attempts, delay)
+    elif error is not None:
+        values = {
+            "status": JOB_STATUS_FAILED,
+            "lease_owner": None,
+            "lease_expires_at": None,
+            "finished_at": now,
+            "error_type": type(error).__name__,
+            "error_message": sanitize_error_message(str(error)) or type(error).__name__,
+        }
+    elif retryable:
+        # The source stayed busy or unavailable for every attempt, so the pull
+        # never happened.
+        values = {
+            "status": JOB_STATUS_FAILED,
+            "lease_owner": None,
+            "lease_expires_at": None,
+            "finished_at": now,
+            "response_status_code": status_code,
+            "result_json": payload,
+            "error_type": "RetriesExhausted",
+            "error_message": sanitize_error_message((payload or {}).get("message")) or f"HTTP {status_code}",
+        }
+    else:
+        values = {
+            "status": JOB_STATUS_COMPLETED,
+            "lease_owner": None,
+            "lease_expires_at": None,
+            "finished_at": now,
+            "response_status_code": status_code,
+            "result_json": payload,
+            "ingestion_run_id": (payload or {}).get("run_id"),
+            "error_type": None,
+            "error_message": None,
+        }
+    _finish_job(db, job, worker_id=worker_id, values=values)
+    return job
+
+
+def run_source_pull_worker(
+    *,
+    worker_id: str | None = None,
+    once: bool = False,
+    max_jobs: int | None = None,
+    poll_seconds: float | None = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """Claim and run queued pulls until stopped; return the number of jobs run.
+
+    With ``once=True`` the worker drains the currently runnable jobs and
+    returns instead of polling.
+    """
+    worker_id = worker_id or default_worker_id()
+    poll_seconds = config.SOURCE_PULL_WORKER_POLL_SECONDS if poll_seconds is None else poll_seconds
+    processed = 0
+    while max_jobs is None or processed < max_jobs:
+        with session_factory() as db:
+            job = claim_next_source_pull(db, worker_id=worker_id)
+            if job is not None:
+                logger.info("source_pull_job_claimed job_id=%s source=%s worker=%s", job.id, job.source, worker_id)
+                run_source_pull_job(db, job, worker_id=worker_id, session_factory=session_factory)
+                processed += 1
+                continue
+        if once:
+            break
+        sleep(poll_seconds)
+    return processed
+
+
+def _progress_run(db: Session, job: SourcePullJob) -> IngestionRun | None:
+    if job.ingestion_run_id:
+        return db.get(IngestionRun, job.ingestion_run_id)
+    if job.status != JOB_STATUS_RUNNING or job.source != SOURCE_SAM:
+        return None
+    search_id = (job.params_json or {}).get("search_id")
+    query = db.query(IngestionRun).filter(
+        IngestionRun.source == SOURCE_SAM,
+        IngestionRun.organization_id == job.organization_id,
+        IngestionRun.status == "running",
+    )
+    if search_id is not None:
+        query = query.filter(IngestionRun.source_config_id == search_id)
+    return query.order_by(IngestionRun.id.desc()).first()
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    value = _aware(value)
+    return value.isoformat() if value else None
+
+
+def source_pull_job_payload(db: Session, job: SourcePullJob, *, status_url: str | None = None) -> dict[str, Any]:
+    """Serialize a job for the enqueue response and the polling endpoint."""
+    run = _progress_run(db, job)
+    progress = None
+    if run is not None:
+        progress = {
+            "run_id": run.id,
+            "status": run.status,
+            "records_seen": run.processed_count or 0,
+            "inserted": run.created_count or 0,
+            "updated": run.updated_count or 0,
+            "unchanged": run.unchanged_count or 0,
+            "skipped": run.skipped_count or 0,
+            "errors": run.error_count or 0,
+            "checkpoint": run.checkpoint_json,
+        }
+    return {
+        "job_id": job.id,
+        "source": job.source,
+        "status": job.status,
+        "done": job.status in (JOB_STATUS_COMPLETED, JOB_STATUS_FAILED),
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts,
+        "created_at": _isoformat(job.created_at),
+        "started_at": _isoformat(job.started_at),
+        "finished_at": _isoformat(job.finished_at),
+        "available_at": _isoformat(job.available_at),
+        "status_url": status_url,
+        "response_status_code": job.response_status_code,
+        "result": job.result_json,
+        "error_type": job.error_type,
+        "error_message": job.error_message,
+        "progress": progress,
+    }
+
+
+def find_source_pull_job(
+    db: Session,
+    *,
+    job_id: int,
+    organization_id: int,
+    source: str,
+) -> SourcePullJob | None:
+    return (
+        db.query(SourcePullJob)
+        .filter(
+            SourcePullJob.id == job_id,
+            SourcePullJob.organization_id == organization_id,
+            SourcePullJob.source == source,
+        )
+        .first()
+    )
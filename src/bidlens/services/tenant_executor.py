@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass
+import datetime as dt
+import logging
+import threading
+from typing import Callable, Iterable, Sequence
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from .. import config
+from ..models import JobRun
+from .job_runs import JOB_STATUS_FAILED
+
+
+logger = logging.getLogger(__name__)
+
+UPSTREAM_SAM = "sam"
+UPSTREAM_GRANTS_GOV = "grants_gov"
+UPSTREAM_RESEND = "resend"
+
+_UPSTREAM_LIMITS = {
+    UPSTREAM_SAM: "JOB_SAM_CONCURRENCY",
+    UPSTREAM_GRANTS_GOV: "JOB_GRANTS_GOV_CONCURRENCY",
+    UPSTREAM_RESEND: "JOB_RESEND_CONCURRENCY",
+}
+_SLOTS: dict[tuple[str, int], threading.BoundedSemaphore] = {}
+_SLOTS_LOCK = threading.Lock()
+_OUTPUT = threading.local()
+
+
+@dataclass(frozen=True)
+class TenantTask:
+    """One organization's share of a scheduled job.
+
+    ``run`` opens and closes its own session and returns the JobRun status it
+    recorded. ``upstream`` names the external API the work calls, if any.
+    """
+
+    organization_id: int
+    run: Callable[[], str]
+    upstream: str | None = None
+
+
+def _slot(name: str, limit: int) -> threading.BoundedSemaphore:
+    """Process-wide slots, so jobs running side by side share one cap."""
+    limit = max(1, limit)
+    with _SLOTS_LOCK:
+        slot = _SLOTS.get((name, limit))
+        if slot is None:
+            slot = _SLOTS[(name, limit)] = threading.BoundedSemaphore(limit)
+        return slot
+
+
+def tenant_print(message: str) -> None:
+    """Print a job line, holding it back while a tenant runs on a worker thread."""
+    lines = getattr(_OUTPUT, "lines", None)
+    if lines is None:
+        print(message, flush=True)
+    else:
+        lines.append(message)
+
+
+def tenant_workers(db: Session, max_workers: int | None = None) -> int:
+    """How many organizations a job may process at once.
+
+    SQLite serializes writers, so it runs one organization at a time unless
+    the caller asks for more explicitly.
+    """
+    if max_workers is not None:
+        return max(1, max_workers)
+    if db.get_bind().dialect.name == "sqlite":
+        return 1
+    return max(1, config.JOB_TENANT_CONCURRENCY)
+
+
+def fair_tenant_order(db: Session, organization_ids: Iterable[int], *, job_type: str) -> list[int]:
+    """Order organizations so the ones that waited longest last time go first.
+
+    Organizations without a previous ``job_type`` run come first, then those
+    whose last run started latest, since they spent the longest in the queue.
+    Ties keep organization id order.
+    """
+    organization_ids = list(dict.fromkeys(organization_ids))
+    if not organization_ids:
+        return []
+    last_started = dict(
+        db.query(JobRun.organization_id, func.max(JobRun.started_at))
+        .filter(JobRun.job_type == job_type, JobRun.organization_id.in_(organization_ids))
+        .group_by(JobRun.organization_id)
+        .all()
+    )
+    never_run = [organization_id for organization_id in organization_ids if last_started.get(organization_id) is None]
+    ran = [organization_id for organization_id in organization_ids if last_started.get(organization_id) is not None]
+    ran.sort(key=lambda organization_id: (_naive(last_started[organization_id]), -organization_id), reverse=True)
+    return never_run + ran
+
+
+def _naive(value: dt.datetime) -> dt.datetime:
+    return value.replace(tzinfo=None) if value.tzinfo else value
+
+
+def _run_task(task: TenantTask, *, buffered: bool) -> tuple[str, list[str]]:
+    lines: list[str] = []
+    if buffered:
+        _OUTPUT.lines = lines
+    try:
+        # Wait for the upstream first so a queued tenant never holds a global
+        # slot another job's tenant could use.
+        upstream_limit = getattr(config, _UPSTREAM_LIMITS[task.upstream]) if task.upstream else None
+        with _slot(task.upstream, upstream_limit) if task.upstream else nullcontext():
+            with _slot("tenant", config.JOB_TENANT_CONCURRENCY):
+                status = task.run()
+    except Exception:
+        # Tenant work records its own failures; this only keeps one escaped
+        # error from stopping the other organizations.
+        logger.exception("Scheduled job failed for organization %s", task.organization_id)
+        status = JOB_STATUS_FAILED
+    finally:
+        if buffered:
+            _OUTPUT.lines = None
+    return status, lines
+
+
+def run_tenant_tasks(tasks: Sequence[TenantTask], *, max_workers: int = 1) -> Counter[str]:
+    """Run each organization's task and count the statuses they return.
+
+    Tasks start in the order given. With more than one worker each
+    organization's output is printed in one block as it finishes.
+    """
+    status_counts: Counter[str] = Counter()
+    if max_workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            status, _ = _run_task(task, buffered=False)
+            status_counts[status] += 1
+        return status_counts
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(tasks)),
+        thread_name_prefix="bidlens-tenant",
+    ) as executor:
+        futures = [executor.submit(_run_task, task, buffered=True) for task in tasks]
+        for future in as_completed(futures):
+            status, lines = future.result()
+            for line in lines:
+                print(line, flush=True)
+            status_counts[status] += 1
+    return status_counts
@@ -0,0 +1,198 @@
+"""Cached per-user request context: workspace, role, and sidebar counts.
+
+Every authenticated page needs the user's current workspace, role, triage
+settings and the two sidebar counts before the route runs. The values are
+resolved once per request (kept on ``request.state``) and reused across
+requests from a short in-process cache keyed by engine, user, and the
+requested ``org_id``.
+
+Entries are dropped when a committed ORM write touches a vote, outcome,
+opportunity qualification, membership, invitation, organization, profile,
+or user that feeds them; mapper events record the affected organizations
+and users on the session and the cache is invalidated after commit. Bulk
+``Query.update``/``delete`` calls bypass mapper events and rely on the TTL,
+or on an explicit ``user_context_cache.invalidate`` call.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Hashable, Iterable
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, object_session
+
+from . import config
+
+_PENDING_KEY = "user_context_invalidations"
+
+
+@dataclass(frozen=True)
+class UserContext:
+    organization_id: int
+    organization_name: str
+    organization_is_live: bool
+    role: str
+    triage_enabled: bool
+    triage_unreviewed_count: int
+    past_due_outcome_count: int
+
+    def apply(self, user):
+        user.current_organization_id = self.organization_id
+        user.current_organization_name = self.organization_name
+        user.current_organization_is_live = self.organization_is_live
+        user.current_role = self.role
+        user.triage_enabled = self.triage_enabled
+        user.triage_unreviewed_count = self.triage_unreviewed_count
+        user.past_due_outcome_count = self.past_due_outcome_count
+        return user
+
+
+class UserContextCache:
+    """Per-process TTL cache of ``UserContext`` values, one map per engine.
+
+    ``generation`` advances on every invalidation; a value computed while an
+    invalidation happened is not stored, so a commit racing a page render
+    cannot leave stale context behind.
+    """
+
+    def __init__(self, ttl_seconds: float | None = None, max_entries: int = 4096):
+        self._ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "weakref.WeakKeyDictionary[Engine, OrderedDict]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        return config.USER_CONTEXT_CACHE_SECONDS if self._ttl_seconds is None else self._ttl_seconds
+
+    def get(self, engine: Engine, key: Hashable):
+        with self._lock:
+            entries = self._entries.get(engine)
+            entry = entries.get(key) if entries is not None else None
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if monotonic() - stored_at >= self.ttl_seconds:
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+            return value
+
+    def set(self, engine: Engine, key: Hashable, value, *, generation: int | None = None) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            entries = self._entries.setdefault(engine, OrderedDict())
+            entries[key] = (monotonic(), value)
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        *,
+        organization_ids: Iterable[int] = (),
+        user_ids: Iterable[int] = (),
+        everything: bool = False,
+    ) -> None:
+        """Drop entries for the given organizations or users, on every engine."""
+        organization_ids = set(organization_ids)
+        user_ids = set(user_ids)
+        with self._lock:
+            self.generation += 1
+            for entries in self._entries.values():
+                if everything:
+                    entries.clear()
+                    continue
+                for key in [
+                    key
+                    for key, (_stored_at, value) in entries.items()
+                    if key[0] in user_ids
+                    or getattr(value, "organization_id", None) in organization_ids
+                ]:
+                    del entries[key]
+
+    def clear(self) -> None:
+        self.invalidate(everything=True)
+
+
+user_context_cache = UserContextCache()
+
+
+def _pending(session: Session) -> dict:
+    return session.info.setdefault(_PENDING_KEY, {"organizations": set(), "users": set(), "everything": False})
+
+
+def _record(target, *, organization_attr: str | None, user_attr: str | None, everything: bool = False) -> None:
+    session = object_session(target)
+    if session is None:
+        user_context_cache.invalidate(everything=True)
+        return
+    pending = _pending(session)
+    if everything:
+        pending["everything"] = True
+    if organization_attr and getattr(target, organization_attr, None) is not None:
+        pending["organizations"].add(getattr(target, organization_attr))
+    if user_attr and getattr(target, user_attr, None) is not None:
+        pending["users"].add(getattr(target, user_attr))
+
+
+def _apply_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    user_context_cache.invalidate(
+        organization_ids=pending["organizations"],
+        user_ids=pending["users"],
+        everything=pending["everything"],
+    )
+
+
+def _discard_pending(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def install_user_context_invalidation(
+    watched: Iterable[tuple[type, str | None, str | None, tuple[str, ...] | None]],
+    *,
+    structural: Iterable[type] = (),
+) -> None:
+    """Invalidate cached context when rows behind it change.
+
+    ``watched`` holds ``(class, organization_attr, user_attr, columns)``;
+    updates only count when one of ``columns`` changed (any column when
+    None). Any write to a ``structural`` class can change which workspace
+    anyone resolves to and clears the whole cache.
+    """
+
+    def _listeners(organization_attr, user_attr, columns, everything):
+        def _changed(_mapper, _connection, target) -> None:
+            _record(target, organization_attr=organization_attr, user_attr=user_attr, everything=everything)
+
+        def _updated(mapper, connection, target) -> None:
+            state = inspect(target)
+            if columns is None or any(state.attrs[name].history.has_changes() for name in columns):
+                _changed(mapper, connection, target)
+
+        return _changed, _updated
+
+    specs = [(model_class, None, None, None, True) for model_class in structural]
+    specs += [(*spec, False) for spec in watched]
+    for model_class, organization_attr, user_attr, columns, everything in specs:
+        _changed, _updated = _listeners(organization_attr, user_attr, columns, everything)
+        event.listen(model_class, "after_insert", _changed)
+        event.listen(model_class, "after_delete", _changed)
+        event.listen(model_class, "after_update", _updated)
+
+    event.listen(Session, "after_commit", _apply_pending)
+    event.listen(Session, "after_soft_rollback", _discard_pending)
@@ -0,0 +1,128 @@
+"""Maintenance of ``opportunity_vote_summaries``, the per-opportunity vote rollup.
+
+Feed rows, opportunity detail, the Shortlist, and CSV exports all show the
+team's Interested/Not Interested counts, who signalled what, and when the last
+signal changed. Keeping one row per opportunity lets those screens read the
+rollup directly instead of grouping ``votes`` on every render.
+
+Rows are refreshed by mapper events on ``Vote``, on the flushing connection,
+so the rollup commits or rolls back with the vote that caused it. Bulk
+``Query.update``/``delete`` calls bypass mapper events; callers that use them
+must delete or rebuild the affected rows.
+"""
+
+from __future__ import annotations
+
+from itertools import groupby
+
+from sqlalchemy import JSON, DateTime, Integer, column, delete, event, func, select, table, update
+
+VOTE_SUMMARY_TABLE = "opportunity_vote_summaries"
+
+_summaries = table(
+    VOTE_SUMMARY_TABLE,
+    column("organization_id", Integer),
+    column("opportunity_id", Integer),
+    column("pursue_count", Integer),
+    column("pass_count", Integer),
+    column("last_activity_at", DateTime(timezone=True)),
+    column("interested_user_ids", JSON),
+    column("passed_user_ids", JSON),
+    column("updated_at", DateTime(timezone=True)),
+)
+_votes = table(
+    "votes",
+    column("org_id", Integer),
+    column("opp_id", Integer),
+    column("user_id", Integer),
+    column("vote"),
+    column("updated_at", DateTime(timezone=True)),
+)
+
+
+def _summary_values(vote_rows) -> dict:
+    """Fold one opportunity's ``votes`` rows into summary column values."""
+    interested = sorted({row.user_id for row in vote_rows if row.vote == "PURSUE"})
+    passed = sorted({row.user_id for row in vote_rows if row.vote == "PASS"})
+    activity = [row.updated_at for row in vote_rows if row.updated_at is not None]
+    return {
+        "organization_id": vote_rows[0].org_id,
+        "pursue_count": len(interested),
+        "pass_count": len(passed),
+        "last_activity_at": max(activity) if activity else None,
+        "interested_user_ids": interested,
+        "passed_user_ids": passed,
+    }
+
+
+def _vote_rows(opportunity_ids=None, organization_id: int | None = None):
+    query = select(_votes.c.org_id, _votes.c.opp_id, _votes.c.user_id, _votes.c.vote, _votes.c.updated_at)
+    if opportunity_ids is not None:
+        query = query.where(_votes.c.opp_id.in_(opportunity_ids))
+    if organization_id is not None:
+        query = query.where(_votes.c.org_id == organization_id)
+    return query.order_by(_votes.c.opp_id, _votes.c.user_id)
+
+
+def refresh_vote_summary(connection, opportunity_id: int) -> None:
+    """Recompute one opportunity's summary row from ``votes``."""
+    vote_rows = connection.execute(_vote_rows([opportunity_id])).all()
+    key_clause = _summaries.c.opportunity_id == opportunity_id
+    if not vote_rows:
+        connection.execute(delete(_summaries).where(key_clause))
+        return
+
+    values = {**_summary_values(vote_rows), "updated_at": func.now()}
+    row = {"opportunity_id": opportunity_id, **values}
+    dialect_name = connection.dialect.name
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        if not connection.execute(update(_summaries).where(key_clause).values(**values)).rowcount:
+            connection.execute(_summaries.insert().values(**row))
+        return
+    connection.execute(
+        insert(_summaries)
+        .values(**row)
+        .on_conflict_do_update(index_elements=["opportunity_id"], set_=values)
+    )
+
+
+def rebuild_vote_summaries(connection, *, organization_id: int | None = None) -> int:
+    """Rebuild the rollup from ``votes``.
+
+    Scoped to one organization when ``organization_id`` is given. Returns the
+    number of rows written; the caller owns the transaction.
+    """
+    clear = delete(_summaries)
+    if organization_id is not None:
+        clear = clear.where(_summaries.c.organization_id == organization_id)
+    connection.execute(clear)
+
+    written = 0
+    batch: list[dict] = []
+    insert_rows = _summaries.insert().values(updated_at=func.now())
+    result = connection.execute(_vote_rows(organization_id=organization_id))
+    for opportunity_id, rows in groupby(result, key=lambda row: row.opp_id):
+        batch.append({"opportunity_id": opportunity_id, **_summary_values(list(rows))})
+        if len(batch) >= 500:
+            connection.execute(insert_rows, batch)
+            written += len(batch)
+            batch = []
+    if batch:
+        connection.execute(insert_rows, batch)
+        written += len(batch)
+    return written
+
+
+def install_vote_summary_sync(vote_class) -> None:
+    """Keep ``opportunity_vote_summaries`` in step with ORM writes to votes."""
+
+    def _vote_changed(_mapper, connection, target) -> None:
+        refresh_vote_summary(connection, target.opp_id)
+
+    # Every vote update moves ``updated_at`` and so the last-activity time.
+    for event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(vote_class, event_name, _vote_changed)
@@ -114,14 +114,17 @@ class AccountAliasPresentationIntegrationTests(unittest.TestCase):
         self.assertIn("opportunity.agency_display = account_display", route_source)
         self.assertIn("opportunity.agency_display", detail_template)
         self.assertIn('"Account",\n        "Source Account",', route_source)
-        self.assertIn("resolve_account_display_name(opp.agency),\n            opp.agency or \"\",", route_source)
+        self.assertIn("account.display,\n            opp.agency or \"\",", route_source)
 
     def test_phase_one_does_not_change_sql_sort_search_or_feed_rules(self):
         route_source = Path("src/bidlens/routes/opportunities.py").read_text()
+        search_source = Path("src/bidlens/services/opportunity_search.py").read_text()
+        search_index_source = Path("src/bidlens/search_index.py").read_text()
         feed_query_source = Path("src/bidlens/services/feed_queries.py").read_text()
 
         self.assertIn('"agency": func.lower(Opportunity.agency)', route_source)
-        self.assertIn("Opportunity.agency.ilike(pattern)", route_source)
+        self.assertIn("getattr(Opportunity, name).ilike(pattern)", search_source)
+        self.assertIn("coalesce(agency, '')", search_index_source)
         self.assertIn("Opportunity.agency.ilike(f\"%{agency}%\")", feed_query_source)
 
 
@@ -0,0 +1,137 @@
+import io
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from bidlens import account_display
+from bidlens.account_display import backfill_account_display
+from bidlens.cli import main
+from bidlens.database import Base
+from bidlens.models import Opportunity, Organization
+from bidlens.services.account_aliases import (
+    account_alias_revision,
+    account_display_parts,
+    clear_account_alias_cache,
+    opportunity_account_display,
+)
+
+
+class AccountDisplayTests(unittest.TestCase):
+    def setUp(self):
+        clear_account_alias_cache()
+        self.directory = TemporaryDirectory()
+        self.alias_path = Path(self.directory.name) / "aliases.csv"
+        self._write_aliases("Dept of Examples,Example Department")
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.db = self.session_factory()
+        self.org = Organization(name="Accounts", slug="accounts")
+        self.db.add(self.org)
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+        self.directory.cleanup()
+        clear_account_alias_cache()
+
+    def _write_aliases(self, *rows):
+        self.alias_path.write_text("Alias,Display\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    def _aliases(self):
+        return patch("bidlens.config.ACCOUNT_ALIAS_FILE_PATH", self.alias_path)
+
+    def _opportunity(self, agency, record_id=None):
+        opportunity = Opportunity(
+            organization_id=self.org.id,
+            source="sam",
+            source_record_id=record_id or agency,
+            title="Account display",
+            agency=agency,
+            opportunity_type="Solicitation",
+            posted_date=date.today(),
+            response_deadline=date.today() + timedelta(days=30),
+        )
+        self.db.add(opportunity)
+        self.db.commit()
+        return opportunity
+
+    def test_writes_persist_resolved_account_columns(self):
+        with self._aliases():
+            opportunity = self._opportunity("DEPT OF EXAMPLES.FIELD_OFFICE")
+            self.assertEqual(opportunity.account_display, "Field Office")
+            self.assertEqual((opportunity.parent_agency, opportunity.sub_agency), ("Field Office", None))
+            self.assertEqual(opportunity.account_display_revision, account_alias_revision())
+
+            opportunity.agency = "Dept of Examples"
+            self.db.commit()
+            self.assertEqual(opportunity.account_display, "Example Department")
+            self.assertEqual(opportunity_account_display(opportunity).display, "Example Department")
+
+    def test_memo_and_backfill_follow_alias_file_revisions(self):
+        with self._aliases():
+            opportunity = self._opportunity("Dept of Examples")
+            first_revision = account_alias_revision()
+            self.assertIs(account_display_parts("Dept of Examples"), account_display_parts("Dept of Examples"))
+
+            self._write_aliases("Dept of Examples,Renamed Department")
+            clear_account_alias_cache()
+            self.assertNotEqual(account_alias_revision(), first_revision)
+            # Until the backfill runs, readers resolve stale rows themselves.
+            self.assertEqual(opportunity_account_display(opportunity).display, "Renamed Department")
+            self.assertEqual(opportunity.account_display, "Example Department")
+
+            output = io.StringIO()
+            self.assertEqual(main(["backfill-account-display"], session_factory=self.session_factory, output=output), 0)
+            self.assertIn("rows=1", output.getvalue())
+            self.db.expire_all()
+            self.assertEqual(opportunity.account_display, "Renamed Department")
+            self.assertEqual(opportunity.account_display_revision, account_alias_revision())
+
+            output = io.StringIO()
+            main(["backfill-account-display"], session_factory=self.session_factory, output=output)
+            self.assertIn("rows=0", output.getvalue())
+
+    def test_backfill_commits_each_batch_and_resumes_after_a_failure(self):
+        with self._aliases():
+            agencies = ["Dept of Examples", "Other Agency"] * 3
+            opportunities = [self._opportunity(agency, f"batch-{index}") for index, agency in enumerate(agencies)]
+            self._write_aliases("Dept of Examples,Renamed Department")
+            clear_account_alias_cache()
+
+            resolve = account_display.account_display_columns
+            calls = []
+
+            def fail_in_the_second_batch(agency):
+                calls.append(agency)
+                if len(calls) > 2:
+                    raise RuntimeError("alias lookup failed")
+                return resolve(agency)
+
+            with patch.object(account_display, "account_display_columns", fail_in_the_second_batch):
+                with self.assertRaises(RuntimeError):
+                    backfill_account_display(self.db, batch_size=2)
+            self.db.rollback()
+            self.db.expire_all()
+            # Each agency is resolved once per batch, and the first batch stays written.
+            self.assertEqual(sorted(calls[:2]), ["Dept of Examples", "Other Agency"])
+            self.assertEqual(
+                [opportunity.account_display for opportunity in opportunities[:3]],
+                ["Renamed Department", "Other Agency", "Example Department"],
+            )
+
+            self.assertEqual(backfill_account_display(self.db, batch_size=2), 4)
+            self.db.expire_all()
+            self.assertEqual({opportunity.account_display_revision for opportunity in opportunities}, {account_alias_revision()})
+            self.assertEqual(opportunities[4].account_display, "Renamed Department")
+            self.assertEqual(backfill_account_display(self.db, batch_size=2), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -69,9 +69,9 @@ class AdminOpportunityControlsTests(unittest.TestCase):
         self.assertNotIn("opp-card--selected", self.styles)
 
     def test_admin_filter_parameters_are_supported_by_routes_and_export(self):
-        self.assertIn("async def feed(", self.routes)
+        self.assertIn("def feed(", self.routes)
         self.assertIn("sources: str | None = None", self.routes)
-        self.assertIn("async def triage_queue(", self.routes)
+        self.assertIn("def triage_queue(", self.routes)
         self.assertIn("lane_id: str | None = None", self.routes)
         self.assertIn('if view == "triage" and not _is_admin(user):', self.routes)
         self.assertIn('elif view == "triage":', self.routes)
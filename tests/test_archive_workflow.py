@@ -1,4 +1,3 @@
-import asyncio
 import unittest
 from contextlib import ExitStack
 from datetime import date, timedelta
@@ -247,12 +246,10 @@ class FeedRouteArchiveTests(unittest.TestCase):
         with ExitStack() as stack:
             entered_patches = [stack.enter_context(item) for item in patches]
             feed_query = entered_patches[1]
-            asyncio.run(
-                opportunities.feed(
-                    request=MagicMock(),
-                    show_passed="1",
-                    db=db,
-                )
+            opportunities.feed(
+                request=MagicMock(),
+                show_passed="1",
+                db=db,
             )
 
         feed_query.assert_called_once_with(
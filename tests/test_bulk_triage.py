@@ -8,6 +8,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from bidlens.database import Base
+from bidlens.fragment_cache import FragmentCache, MemoryFragmentStore
 from bidlens.models import Opportunity, Organization
 from bidlens.routes import api
 
@@ -79,6 +80,27 @@ class BulkTriageTests(unittest.TestCase):
             {"rejected"},
         )
 
+    def test_triage_actions_drop_cached_queue_totals(self):
+        cache = FragmentCache(MemoryFragmentStore(), ttl_seconds=60)
+
+        def cached_total():
+            unreviewed = self.db.query(Opportunity).filter(Opportunity.qualification_status == "unreviewed")
+            return cache.get_or_compute(
+                self.db,
+                "queue_result_count",
+                organization_id=self.org.id,
+                user_id=self.user.id,
+                compute=unreviewed.count,
+            )
+
+        with patch.object(api, "fragment_cache", cache):
+            self.assertEqual(cached_total(), 2)
+            self._bulk_action([self.opportunities[0].id], "qualify")
+            self.assertEqual(cached_total(), 1)
+            with patch.object(api, "require_admin", return_value=self.user):
+                api.qualify_opportunity(self.opportunities[1].id, MagicMock(), self.db)
+            self.assertEqual(cached_total(), 0)
+
     def test_bulk_action_rejects_records_no_longer_awaiting_triage(self):
         opportunity = self.opportunities[0]
         opportunity.qualification_status = "qualified"
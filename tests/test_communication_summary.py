@@ -249,7 +249,7 @@ class CommunicationSummaryRedirectTests(unittest.IsolatedAsyncioTestCase):
             patch.object(opportunity_routes, "_workspace_for_user", return_value=workspace),
             patch.object(opportunity_routes, "generate_and_save_summary", side_effect=effect),
         ):
-            return await opportunity_routes.generate_opportunity_communication_summary(
+            return opportunity_routes.generate_opportunity_communication_summary(
                 request=request, opp_id=42, csrf_token="valid", return_to_context="shortlist", db=SimpleNamespace(rollback=lambda: None)
             )
 
@@ -272,7 +272,7 @@ class CommunicationSummaryRedirectTests(unittest.IsolatedAsyncioTestCase):
             patch.object(opportunity_routes, "_workspace_for_user", return_value=SimpleNamespace(id=3)),
             patch.object(opportunity_routes, "generate_and_save_summary"),
         ):
-            response = await opportunity_routes.generate_opportunity_communication_summary(
+            response = opportunity_routes.generate_opportunity_communication_summary(
                 request=SimpleNamespace(), opp_id=42, csrf_token="valid",
                 return_to_context="feed", return_tab="overview",
                 db=SimpleNamespace(rollback=lambda: None),
@@ -1,4 +1,3 @@
-import asyncio
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
@@ -72,7 +71,7 @@ class CompanyProfileTests(unittest.TestCase):
             patch("bidlens.routes.company_profile.templates.TemplateResponse", return_value={"ok": True}) as response,
             patch("bidlens.routes.company_profile.get_sidebar", return_value={}),
         ):
-            asyncio.run(company_profile_page(self._request(**query), self.db))
+            company_profile_page(self._request(**query), self.db)
         return response.call_args.args[1]
 
     def test_upsert_updates_existing_active_profile(self):
@@ -114,14 +113,14 @@ class CompanyProfileTests(unittest.TestCase):
 
     def test_admin_save_redirects_to_profile(self):
         with patch("bidlens.routes.company_profile.get_current_user", return_value=self.user):
-            response = asyncio.run(company_profile_save(
+            response = company_profile_save(
                 self._request(),
                 website_url="https://profile.example.com",
                 uei="PROFILEUEI12",
                 cage_code="1PROF",
                 duns="123123123",
                 db=self.db,
-            ))
+            )
         self.assertEqual(response.status_code, 303)
         self.assertEqual(response.headers["location"], f"/company-profile?org_id={self.org.id}&saved=1")
 
@@ -146,7 +145,7 @@ class CompanyProfileTests(unittest.TestCase):
             patch("bidlens.routes.company_profile.get_current_user", return_value=self.user),
             patch("bidlens.routes.company_profile.get_sidebar", return_value={}),
         ):
-            response = asyncio.run(company_profile_page(request, self.db))
+            response = company_profile_page(request, self.db)
         html = response.body.decode("utf-8")
         self.assertIn("Profile Org", html)
         self.assertIn("Organization Profile", html)
@@ -248,7 +247,7 @@ class CompanyProfileTests(unittest.TestCase):
     def test_admin_can_create_update_and_delete_resource(self):
         request = self._request(org_id=self.org.id)
         with patch("bidlens.routes.company_profile.get_current_user", return_value=self.user):
-            response = asyncio.run(organization_resource_create(
+            response = organization_resource_create(
                 request,
                 title="Proposal Library",
                 description="Reusable materials",
@@ -256,13 +255,13 @@ class CompanyProfileTests(unittest.TestCase):
                 link_url="https://example.com/library",
                 note_content="",
                 db=self.db,
-            ))
+            )
         resource = self.db.query(OrganizationResource).one()
         self.assertEqual(response.status_code, 303)
         self.assertEqual(resource.organization_id, self.org.id)
 
         with patch("bidlens.routes.company_profile.get_current_user", return_value=self.user):
-            asyncio.run(organization_resource_update(
+            organization_resource_update(
                 resource.id,
                 request,
                 title="Proposal Playbook",
@@ -271,13 +270,13 @@ class CompanyProfileTests(unittest.TestCase):
                 link_url="",
                 note_content="Use the current review workflow.",
                 db=self.db,
-            ))
+            )
         self.db.refresh(resource)
         self.assertEqual(resource.resource_type, "note")
         self.assertIsNone(resource.link_url)
 
         with patch("bidlens.routes.company_profile.get_current_user", return_value=self.user):
-            asyncio.run(organization_resource_delete(resource.id, request, db=self.db))
+            organization_resource_delete(resource.id, request, db=self.db)
         self.assertEqual(self.db.query(OrganizationResource).count(), 0)
 
     def test_member_cannot_edit_profile_or_resources(self):
@@ -290,28 +289,28 @@ class CompanyProfileTests(unittest.TestCase):
         request = self._request(org_id=self.org.id)
         with patch("bidlens.routes.company_profile.get_current_user", return_value=member):
             with self.assertRaises(HTTPException) as save_error:
-                asyncio.run(company_profile_save(request, website_url="", db=self.db))
+                company_profile_save(request, website_url="", db=self.db)
             with self.assertRaises(HTTPException) as resource_error:
-                asyncio.run(organization_resource_create(
+                organization_resource_create(
                     request,
                     title="Forbidden",
                     resource_type="note",
                     note_content="No access",
                     db=self.db,
-                ))
+                )
         self.assertEqual(save_error.exception.status_code, 403)
         self.assertEqual(resource_error.exception.status_code, 403)
 
     def test_resource_validation_rejects_unsafe_link(self):
         with patch("bidlens.routes.company_profile.get_current_user", return_value=self.user):
             with self.assertRaises(HTTPException) as error:
-                asyncio.run(organization_resource_create(
+                organization_resource_create(
                     self._request(),
                     title="Unsafe",
                     resource_type="link",
                     link_url="javascript:alert(1)",
                     db=self.db,
-                ))
+                )
         self.assertEqual(error.exception.status_code, 422)
 
 
@@ -1,4 +1,3 @@
-import asyncio
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
@@ -40,7 +39,7 @@ class ConnectSourcesTests(unittest.TestCase):
         request = SimpleNamespace(query_params={})
 
         with patch("bidlens.routes.connect_sources.require_admin", return_value=self.admin):
-            response = asyncio.run(save_connect_sam(
+            response = save_connect_sam(
                 request,
                 search_name="Primary SAM.gov Search",
                 naics_codes="541611\n541990",
@@ -49,7 +48,7 @@ class ConnectSourcesTests(unittest.TestCase):
                 posted_days_back="30",
                 max_records="100",
                 db=self.db,
-            ))
+            )
 
         config = self.db.query(SamSourceConfig).filter(SamSourceConfig.organization_id == self.org.id).one()
         event = (
@@ -71,7 +70,7 @@ class ConnectSourcesTests(unittest.TestCase):
         request = SimpleNamespace(query_params={})
 
         with patch("bidlens.routes.connect_sources.require_admin", return_value=self.admin):
-            response = asyncio.run(enable_grants_source(request, db=self.db))
+            response = enable_grants_source(request, db=self.db)
 
         events = (
             self.db.query(Event)
@@ -103,7 +102,7 @@ class ConnectSourcesTests(unittest.TestCase):
         request = SimpleNamespace(query_params={})
 
         with patch("bidlens.routes.connect_sources.require_admin", return_value=self.admin):
-            response = asyncio.run(enable_grants_source(request, db=self.db))
+            response = enable_grants_source(request, db=self.db)
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(response.headers["location"], f"/opportunity-discovery?org_id={self.org.id}&saved=grants#grants-gov")
@@ -112,8 +111,8 @@ class ConnectSourcesTests(unittest.TestCase):
         request = SimpleNamespace(query_params={})
 
         with patch("bidlens.routes.connect_sources.require_admin", return_value=self.admin):
-            asyncio.run(enable_grants_source(request, db=self.db))
-            asyncio.run(enable_grants_source(request, db=self.db))
+            enable_grants_source(request, db=self.db)
+            enable_grants_source(request, db=self.db)
 
         count = (
             self.db.query(Event)
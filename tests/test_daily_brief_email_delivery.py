@@ -2,7 +2,7 @@ import datetime as dt
 import io
 import unittest
 from contextlib import redirect_stdout
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -18,10 +18,20 @@ from bidlens.models import (
     OpportunityPursuitLaneMatch,
     PursuitLane,
     User,
+    UserFeedState,
     Workspace,
 )
+from bidlens.query_metrics import count_queries
 from bidlens.services import operational_jobs
-from bidlens.services.email_delivery import EmailSendResult
+from bidlens.services.daily_brief_emails import current_feed_summaries
+from bidlens.services.email_delivery import (
+    EmailDeliveryError,
+    EmailDispatcher,
+    EmailMessage,
+    EmailSendResult,
+    RateLimiter,
+    ResendEmailSender,
+)
 from bidlens.services.job_runs import (
     JOB_STATUS_FAILED,
     JOB_STATUS_PARTIAL_SUCCESS,
@@ -352,6 +362,151 @@ class DailyBriefEmailDeliveryTests(unittest.TestCase):
         self.assertEqual(len(retry_sender.messages), 1)
         self.assertEqual(retry_sender.messages[0].to_email, "first@example.com")
 
+    def test_workspace_feed_summaries_come_from_one_grouped_query(self):
+        first = self._user("first@example.com", name="First")
+        second = self._user("second@example.com", name="Second")
+        health = self._lane("Health")
+        deadline = dt.date.today() + dt.timedelta(days=30)
+        voted = self._feed_opportunity("Health Voted", lane=health)
+        self._feed_opportunity("Health Open", lane=health)
+        self._feed_opportunity("Unmatched Open")
+        for opportunity in self.db.query(Opportunity).all():
+            opportunity.response_deadline = deadline
+        self.db.add(UserFeedState(
+            organization_id=self.org.id,
+            opportunity_id=voted.id,
+            user_id=first.id,
+            vote="PASS",
+        ))
+        self.db.commit()
+        organization_id, user_ids = self.org.id, [first.id, second.id]
+
+        with count_queries() as queries:
+            summaries = current_feed_summaries(self.db, organization_id=organization_id, user_ids=user_ids)
+
+        self.assertEqual(queries.count, 2)
+        self.assertEqual(summaries[first.id], (2, [
+            {"id": health.id, "name": "Health", "count": 1},
+            {"id": None, "name": "Unassigned", "count": 1},
+        ]))
+        self.assertEqual(summaries[second.id], (3, [
+            {"id": health.id, "name": "Health", "count": 2},
+            {"id": None, "name": "Unassigned", "count": 1},
+        ]))
+
+    def test_each_delivery_is_sent_under_its_own_idempotency_key(self):
+        users = [self._user(f"member-{index}@example.com") for index in range(3)]
+        for user in users:
+            self._snapshot(user)
+        sender = FakeSender()
+
+        operational_jobs.run_daily_brief_emails_job(
+            session_factory=self.Session,
+            snapshot_date=self.snapshot_date,
+            email_sender=sender,
+        )
+
+        deliveries = {row.recipient_email: row.id for row in self.db.query(DailyBriefEmailDelivery).all()}
+        self.assertEqual(
+            sorted(message.idempotency_key for message in sender.messages),
+            sorted(f"daily-brief-email/{delivery_id}" for delivery_id in deliveries.values()),
+        )
+        for message in sender.messages:
+            self.assertEqual(message.idempotency_key, f"daily-brief-email/{deliveries[message.to_email]}")
+
+
+class DailyBriefEmailDispatchTests(unittest.TestCase):
+    def _messages(self, count):
+        return [
+            EmailMessage(
+                to_email=f"member-{index}@example.com",
+                subject="Daily Brief",
+                html_body="<p>Brief</p>",
+                text_body="Brief",
+                idempotency_key=f"daily-brief-email/{index}",
+            )
+            for index in range(count)
+        ]
+
+    def test_transient_failures_are_retried_with_the_same_idempotency_key(self):
+        attempts = []
+
+        class FlakySender:
+            provider = "fake"
+
+            def send(self, message):
+                attempts.append(message.idempotency_key)
+                if len(attempts) == 1:
+                    raise EmailDeliveryError("rate limited", retryable=True, retry_after_seconds=2)
+                if message.to_email == "member-1@example.com":
+                    raise EmailDeliveryError("Resend rejected email: invalid recipient")
+                return EmailSendResult(provider="fake", message_id=message.idempotency_key)
+
+        sleeps = []
+        dispatcher = EmailDispatcher(FlakySender(), max_workers=1, rate_per_second=0, sleep=sleeps.append)
+
+        outcomes = dict(dispatcher.dispatch(self._messages(2)))
+
+        self.assertEqual(attempts, ["daily-brief-email/0", "daily-brief-email/0", "daily-brief-email/1"])
+        self.assertEqual(sleeps, [2])
+        self.assertEqual(outcomes[0].message_id, "daily-brief-email/0")
+        self.assertIsInstance(outcomes[1], EmailDeliveryError)
+
+    def test_batchable_messages_share_provider_batches_across_workers(self):
+        class BatchSender(FakeSender):
+            max_batch_size = 100
+
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def send_batch(self, messages, *, idempotency_key=None):
+                self.batches.append((len(messages), idempotency_key))
+                return [EmailSendResult(provider=self.provider, message_id=message.to_email) for message in messages]
+
+        sender = BatchSender()
+        dispatcher = EmailDispatcher(sender, max_workers=3, rate_per_second=0, batch_size=2)
+
+        outcomes = dict(dispatcher.dispatch(self._messages(5), batchable=[True, True, True, False, True]))
+
+        self.assertEqual({index: result.message_id for index, result in outcomes.items()}, {
+            0: "member-0@example.com",
+            1: "member-1@example.com",
+            2: "member-2@example.com",
+            3: "msg-1",
+            4: "member-4@example.com",
+        })
+        self.assertEqual([message.to_email for message in sender.messages], ["member-3@example.com"])
+        self.assertEqual(sorted(size for size, _ in sender.batches), [2, 2])
+        self.assertTrue(all(key and key.startswith("batch-") for _, key in sender.batches))
+
+    def test_rate_limiter_spaces_requests_across_threads(self):
+        now = [0.0]
+        sleeps = []
+        limiter = RateLimiter(4, clock=lambda: now[0], sleep=sleeps.append)
+
+        for _ in range(3):
+            limiter.wait()
+
+        self.assertEqual(sleeps, [0.25, 0.5])
+
+    def test_resend_sender_reuses_its_session_and_flags_retryable_errors(self):
+        sender = ResendEmailSender(api_key="re_test", from_email="brief@example.com")
+        accepted = Mock(status_code=200, headers={})
+        accepted.json.return_value = {"id": "email-1"}
+        throttled = Mock(status_code=429, headers={"retry-after": "3"})
+        throttled.json.return_value = {"message": "Too many requests"}
+        message = self._messages(1)[0]
+
+        with patch.object(sender.session, "post", side_effect=[accepted, throttled]) as post:
+            self.assertEqual(sender.send(message).message_id, "email-1")
+            with self.assertRaises(EmailDeliveryError) as raised:
+                sender.send(message)
+
+        self.assertTrue(raised.exception.retryable)
+        self.assertEqual(raised.exception.retry_after_seconds, 3)
+        self.assertEqual(post.call_args.kwargs["headers"]["Idempotency-Key"], "daily-brief-email/0")
+
 
 class DailyBriefEmailCommandTests(unittest.TestCase):
     def test_cli_exits_zero_when_operational_job_succeeds(self):
@@ -1,5 +1,7 @@
 import datetime as dt
+import json
 import unittest
+from unittest.mock import patch
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -17,11 +19,19 @@ from bidlens.models import (
     PursuitLane,
     PursuitLaneAssignment,
     User,
+    UserFeedState,
     Vote,
     Workspace,
 )
-from bidlens.services.daily_snapshot import create_daily_snapshot
-from scripts.generate_daily_snapshots import format_snapshot, seed_qa_scenario
+from bidlens.query_metrics import count_queries
+from bidlens.services.daily_snapshot import (
+    build_organization_sections,
+    build_snapshot_payload,
+    build_user_snapshot_payloads,
+    create_daily_snapshot,
+)
+from scripts import generate_daily_snapshots
+from scripts.generate_daily_snapshots import cleanup_qa_data, format_snapshot, seed_qa_scenario
 
 
 class DailySnapshotTests(unittest.TestCase):
@@ -389,6 +399,65 @@ class DailySnapshotTests(unittest.TestCase):
             [item["source_record_id"] for item in user_payload["new_opportunities"]],
         )
 
+    def test_batched_user_payloads_match_single_user_payloads(self):
+        snapshot_date = dt.date(2026, 7, 8)
+        first = self._opportunity("BATCH-A", dt.datetime(2026, 7, 7, 9, 0))
+        second = self._opportunity("BATCH-B", dt.datetime(2026, 7, 7, 10, 0))
+        lane = PursuitLane(organization_id=self.org.id, name="Batch Lane")
+        self.db.add(lane)
+        self.db.flush()
+        self.db.add_all([
+            PursuitLaneAssignment(organization_id=self.org.id, pursuit_lane_id=lane.id, user_id=self.member.id),
+            OpportunityPursuitLaneMatch(organization_id=self.org.id, opportunity_id=first.id, pursuit_lane_id=lane.id),
+            Vote(
+                org_id=self.org.id,
+                user_id=self.user.id,
+                opp_id=first.id,
+                vote="PURSUE",
+                updated_at=dt.datetime(2026, 7, 7, 11, 0),
+            ),
+            Vote(
+                org_id=self.org.id,
+                user_id=self.member.id,
+                opp_id=second.id,
+                vote="PASS",
+                updated_at=dt.datetime(2026, 7, 7, 12, 0),
+            ),
+            Event(
+                org_id=self.org.id,
+                user_id=self.member.id,
+                opp_id=first.id,
+                event_type="vote_cast",
+                ui_version="v1",
+                ts=dt.datetime(2026, 7, 7, 13, 0),
+                payload={"vote": "PURSUE", "requested_vote": "PURSUE", "toggled_off": False},
+            ),
+        ])
+        self.db.commit()
+        user_ids = [self.user.id, self.member.id]
+
+        sections = build_organization_sections(self.db, workspace=self.workspace, snapshot_date=snapshot_date)
+        with count_queries() as single_user_queries:
+            build_user_snapshot_payloads(self.db, sections, user_ids=[self.member.id])
+        with count_queries() as batch_queries:
+            payloads = build_user_snapshot_payloads(self.db, sections, user_ids=user_ids)
+
+        self.assertEqual(batch_queries.count, single_user_queries.count)
+        for user_id in user_ids:
+            single = build_snapshot_payload(
+                self.db,
+                workspace=self.workspace,
+                user_id=user_id,
+                snapshot_date=snapshot_date,
+            )
+            self.assertEqual(json.dumps(payloads[user_id]), json.dumps(single))
+        self.assertEqual(payloads[self.member.id]["my_lane_context"][0]["new_opportunity_count"], 1)
+        self.assertEqual(
+            [item["source_record_id"] for item in payloads[self.member.id]["new_feed_opportunities"]],
+            ["BATCH-A"],
+        )
+        self.assertEqual(payloads[self.user.id]["team_signals"][0]["user"]["id"], self.member.id)
+
     def test_updated_opportunities_are_deduplicated_by_opportunity(self):
         snapshot_date = dt.date(2026, 7, 8)
         opportunity = self._opportunity("UPDATED-ONCE", dt.datetime(2026, 7, 6, 9, 0))
@@ -649,6 +718,48 @@ class DailySnapshotTests(unittest.TestCase):
         self.assertEqual(len(payload["interested_activity"]), 1)
         self.assertEqual(len(payload["team_signals"]), 1)
 
+    def test_reseeding_qa_opportunities_clears_their_content_fingerprint(self):
+        snapshot_date = dt.date(2026, 7, 8)
+
+        def seed():
+            seed_qa_scenario(
+                self.db,
+                scenario="multiple-signals",
+                snapshot_date=snapshot_date,
+                workspace_id=self.workspace.id,
+                user_email=self.user.email,
+            )
+
+        seed()
+        qa_opportunities = self.db.query(Opportunity).filter(Opportunity.source == "daily_snapshot_qa").all()
+        for opportunity in qa_opportunities:
+            opportunity.content_fingerprint = "observed"
+        self.db.commit()
+
+        seed()
+
+        self.db.expire_all()
+        self.assertEqual({opportunity.content_fingerprint for opportunity in qa_opportunities}, {None})
+
+    def test_qa_cleanup_removes_feed_state_with_the_seeded_votes(self):
+        snapshot_date = dt.date(2026, 7, 8)
+        seed_qa_scenario(
+            self.db,
+            scenario="multiple-signals",
+            snapshot_date=snapshot_date,
+            workspace_id=self.workspace.id,
+            user_email=self.user.email,
+        )
+        self.assertGreater(self.db.query(UserFeedState).count(), 0)
+
+        with patch.object(generate_daily_snapshots, "SessionLocal", sessionmaker(bind=self.engine)):
+            self.assertEqual(cleanup_qa_data(snapshot_date=snapshot_date, workspace_id=self.workspace.id), 0)
+
+        self.db.expire_all()
+        self.assertEqual(self.db.query(Vote).count(), 0)
+        self.assertEqual(self.db.query(UserFeedState).count(), 0)
+        self.assertEqual(self.db.query(Opportunity).count(), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,61 @@
+import asyncio
+import inspect
+import time
+import unittest
+
+from bidlens.event_loop import LoopLagMonitor, configure_threadpool
+from bidlens.routes import (
+    admin,
+    api,
+    auth,
+    company_profile,
+    connect_sources,
+    grants,
+    home,
+    imports,
+    integrations,
+    opportunities,
+    opportunity_intake,
+    platform,
+    pursuit_lanes,
+    sam,
+    settings,
+)
+
+
+class EventLoopTests(unittest.TestCase):
+    def test_route_handlers_run_in_the_threadpool(self):
+        modules = (
+            admin, api, auth, company_profile, connect_sources, grants, home, imports, integrations,
+            opportunities, opportunity_intake, platform, pursuit_lanes, sam, settings,
+        )
+        async_handlers = [
+            f"{module.__name__}.{route.endpoint.__name__}"
+            for module in modules
+            for route in module.router.routes
+            if inspect.iscoroutinefunction(route.endpoint)
+        ]
+        self.assertEqual(async_handlers, [])
+
+    def test_monitor_reports_requests_in_flight_when_the_loop_is_blocked(self):
+        monitor = LoopLagMonitor(threshold_ms=50, interval_seconds=0.01)
+
+        async def scenario():
+            monitor.start()
+            with monitor.track("GET /feed"):
+                await asyncio.sleep(0.02)
+                time.sleep(0.12)
+                await asyncio.sleep(0.03)
+            await monitor.stop()
+            return configure_threadpool(7)
+
+        with self.assertLogs("bidlens.event_loop", level="WARNING") as logs:
+            threadpool_size = asyncio.run(scenario())
+
+        self.assertEqual(threadpool_size, 7)
+        self.assertIn("requests in flight: GET /feed", logs.output[0])
+        self.assertFalse(LoopLagMonitor(threshold_ms=0).check(1000))
+
+
+if __name__ == "__main__":
+    unittest.main()
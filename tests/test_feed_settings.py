@@ -1,4 +1,3 @@
-import asyncio
 from datetime import date
 import json
 from pathlib import Path
@@ -10,9 +9,24 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from bidlens.database import Base
-from bidlens.models import Opportunity, Organization, OrganizationMembership, OrgProfile, PursuitLane, User
+from bidlens.models import (
+    Opportunity,
+    OpportunityPursuitLaneMatch,
+    Organization,
+    OrganizationMembership,
+    OrgProfile,
+    PursuitLane,
+    User,
+)
 from bidlens.routes import pursuit_lanes, settings
-from bidlens.services.pursuit_lanes import lane_match_terms, match_lane_to_opportunity
+from bidlens.services.pursuit_lanes import (
+    LaneMatchSync,
+    compiled_lane_matcher,
+    lane_match_terms,
+    match_lane_to_opportunity,
+    refresh_lane_matches,
+    refresh_org_lane_matches,
+)
 
 
 class FeedSettingsTests(unittest.TestCase):
@@ -58,7 +72,7 @@ class FeedSettingsTests(unittest.TestCase):
             patch.object(settings, "require_user", return_value=self.admin),
             patch.object(settings.templates, "TemplateResponse", return_value={"ok": True}) as response,
         ):
-            result = asyncio.run(settings.settings_page(self._request(), self.db))
+            result = settings.settings_page(self._request(), self.db)
 
         self.assertEqual(result, {"ok": True})
         self.assertEqual(response.call_args.args[0], "pursuit_lanes.html")
@@ -199,7 +213,7 @@ class FeedSettingsTests(unittest.TestCase):
         self.db.add(profile)
         self.db.commit()
         with patch.object(settings, "require_user", return_value=self.admin):
-            response = asyncio.run(settings.settings_save(
+            response = settings.settings_save(
                 self._request(),
                 include_keywords="research",
                 exclude_keywords="construction",
@@ -212,7 +226,7 @@ class FeedSettingsTests(unittest.TestCase):
                 digest_time_local=None,
                 triage_enabled="1",
                 db=self.db,
-            ))
+            )
         self.db.refresh(profile)
         self.assertEqual(response.status_code, 303)
         self.assertTrue(profile.triage_enabled)
@@ -226,7 +240,7 @@ class FeedSettingsTests(unittest.TestCase):
         self.db.commit()
 
         with patch.object(settings, "require_user", return_value=self.admin):
-            response = asyncio.run(settings.settings_save(
+            response = settings.settings_save(
                 self._request(headers={"x-requested-with": "fetch"}),
                 include_keywords="",
                 exclude_keywords="",
@@ -239,7 +253,7 @@ class FeedSettingsTests(unittest.TestCase):
                 digest_time_local=None,
                 triage_enabled="1",
                 db=self.db,
-            ))
+            )
 
         payload = json.loads(response.body)
         self.assertTrue(payload["ok"])
@@ -247,21 +261,21 @@ class FeedSettingsTests(unittest.TestCase):
 
     def test_legacy_pursuit_lanes_route_redirects_to_feed_settings(self):
         with patch.object(pursuit_lanes, "require_user", return_value=self.admin):
-            response = asyncio.run(pursuit_lanes.pursuit_lanes_page(
+            response = pursuit_lanes.pursuit_lanes_page(
                 self._request("/pursuit-lanes"), self.db
-            ))
+            )
         self.assertEqual(response.status_code, 303)
         self.assertEqual(response.headers["location"], f"/settings?org_id={self.org.id}")
 
     def test_lane_creation_remains_workspace_scoped_and_returns_to_feed_settings(self):
         with patch.object(pursuit_lanes, "require_user", return_value=self.admin):
-            response = asyncio.run(pursuit_lanes.create_pursuit_lane(
+            response = pursuit_lanes.create_pursuit_lane(
                 self._request("/pursuit-lanes"),
                 name="Federal Health",
                 match_terms="HHS, 541611, health, Small Business",
                 is_active="1",
                 db=self.db,
-            ))
+            )
         lane = self.db.query(PursuitLane).one()
         self.assertEqual(lane.organization_id, self.org.id)
         self.assertEqual(lane.keywords, ["HHS", "541611", "health", "Small Business"])
@@ -273,13 +287,13 @@ class FeedSettingsTests(unittest.TestCase):
 
     def test_lane_creation_returns_json_for_in_place_updates(self):
         with patch.object(pursuit_lanes, "require_user", return_value=self.admin):
-            response = asyncio.run(pursuit_lanes.create_pursuit_lane(
+            response = pursuit_lanes.create_pursuit_lane(
                 self._request("/pursuit-lanes", headers={"x-requested-with": "fetch"}),
                 name="Federal Health",
                 match_terms="HHS, health",
                 is_active="1",
                 db=self.db,
-            ))
+            )
 
         payload = json.loads(response.body)
         self.assertTrue(payload["ok"])
@@ -308,14 +322,14 @@ class FeedSettingsTests(unittest.TestCase):
         self.db.commit()
 
         with patch.object(pursuit_lanes, "require_user", return_value=self.admin):
-            response = asyncio.run(pursuit_lanes.update_pursuit_lane(
+            response = pursuit_lanes.update_pursuit_lane(
                 self._request(f"/pursuit-lanes/{lane.id}"),
                 lane_id=lane.id,
                 name="Updated",
                 match_terms="HHS, 541611, health, Small Business",
                 is_active="1",
                 db=self.db,
-            ))
+            )
         self.db.refresh(lane)
         self.db.refresh(other_lane)
 
@@ -343,14 +357,14 @@ class FeedSettingsTests(unittest.TestCase):
         self.db.commit()
 
         with patch.object(pursuit_lanes, "require_user", return_value=self.admin):
-            response = asyncio.run(pursuit_lanes.update_pursuit_lane(
+            response = pursuit_lanes.update_pursuit_lane(
                 self._request(f"/pursuit-lanes/{lane.id}", headers={"x-requested-with": "fetch"}),
                 lane_id=lane.id,
                 name="Updated",
                 match_terms="CMS",
                 is_active=None,
                 db=self.db,
-            ))
+            )
 
         payload = json.loads(response.body)
         self.assertTrue(payload["ok"])
@@ -372,14 +386,14 @@ class FeedSettingsTests(unittest.TestCase):
         self.db.commit()
 
         with patch.object(pursuit_lanes, "require_user", return_value=self.admin):
-            response = asyncio.run(pursuit_lanes.update_pursuit_lane(
+            response = pursuit_lanes.update_pursuit_lane(
                 self._request(f"/pursuit-lanes/{lane.id}"),
                 lane_id=lane.id,
                 name="Active Lane",
                 match_terms="health",
                 is_active=None,
                 db=self.db,
-            ))
+            )
         self.db.refresh(lane)
 
         self.assertFalse(lane.is_active)
@@ -406,11 +420,11 @@ class FeedSettingsTests(unittest.TestCase):
         self.db.commit()
 
         with patch.object(pursuit_lanes, "require_user", return_value=self.admin):
-            response = asyncio.run(pursuit_lanes.delete_pursuit_lane(
+            response = pursuit_lanes.delete_pursuit_lane(
                 self._request(f"/pursuit-lanes/{lane.id}/delete"),
                 lane_id=lane.id,
                 db=self.db,
-            ))
+            )
 
         remaining = self.db.query(PursuitLane).order_by(PursuitLane.id).all()
         self.assertEqual([lane.name for lane in remaining], ["Keep Me"])
@@ -429,11 +443,11 @@ class FeedSettingsTests(unittest.TestCase):
         self.db.commit()
 
         with patch.object(pursuit_lanes, "require_user", return_value=self.admin):
-            response = asyncio.run(pursuit_lanes.delete_pursuit_lane(
+            response = pursuit_lanes.delete_pursuit_lane(
                 self._request(f"/pursuit-lanes/{lane.id}/delete", headers={"x-requested-with": "fetch"}),
                 lane_id=lane.id,
                 db=self.db,
-            ))
+            )
 
         payload = json.loads(response.body)
         self.assertTrue(payload["ok"])
@@ -582,6 +596,99 @@ class FeedSettingsTests(unittest.TestCase):
             {"Description matched research", "Description matched evaluation"},
         )
 
+    def test_compiled_lane_matcher_reproduces_per_lane_reasons(self):
+        lanes = [
+            PursuitLane(id=1, organization_id=self.org.id, name="Health", keywords=["health", "behavioral health"]),
+            PursuitLane(id=2, organization_id=self.org.id, name="Research", keywords=["research", "evaluation"]),
+            PursuitLane(id=3, organization_id=self.org.id, name="Set-aside", keywords=["8(a)", "Small Business", "5416"]),
+            PursuitLane(id=4, organization_id=self.org.id, name="Policy", keywords=["Under Secretary", "HEALTH"]),
+        ]
+        opportunities = [
+            Opportunity(
+                id=1,
+                organization_id=self.org.id,
+                title="Behavioral  health outreach",
+                agency="69A350 OSDBU",
+                naics="541611, 541720",
+                set_aside="8(a) Small Business",
+                description="Program research and evaluation.",
+            ),
+            Opportunity(
+                id=2,
+                organization_id=self.org.id,
+                title="Healthcare operations platform",
+                agency="Centers for Medicare and Medicaid Services",
+                description="Assess the health of the retail market.",
+            ),
+        ]
+        matcher = compiled_lane_matcher(lanes)
+
+        for opportunity in opportunities:
+            expected = [
+                (lane.id, reasons)
+                for lane in lanes
+                if (reasons := match_lane_to_opportunity(lane, opportunity))
+            ]
+            self.assertEqual(matcher.match(opportunity), expected)
+        self.assertIn(
+            "Title matched behavioral health",
+            dict(matcher.match(opportunities[0]))[1],
+        )
+
+    def test_compiled_lane_matcher_is_rebuilt_when_lane_terms_change(self):
+        lane = PursuitLane(id=1, organization_id=self.org.id, name="Health", keywords=["health"])
+        matcher = compiled_lane_matcher([lane])
+
+        self.assertIs(compiled_lane_matcher([lane]), matcher)
+        lane.keywords = ["housing"]
+        self.assertIsNot(compiled_lane_matcher([lane]), matcher)
+
+    def test_lane_match_refresh_only_writes_changed_rows(self):
+        health = PursuitLane(organization_id=self.org.id, name="Health", keywords=["health"], is_active=True)
+        housing = PursuitLane(organization_id=self.org.id, name="Housing", keywords=["housing"], is_active=True)
+        inactive = PursuitLane(organization_id=self.org.id, name="Off", keywords=["health"], is_active=False)
+        self.db.add_all([
+            health,
+            housing,
+            inactive,
+            Opportunity(
+                organization_id=self.org.id,
+                source="manual_import",
+                source_record_id="refresh-1",
+                title="Public health and housing services",
+                agency="County Office",
+                opportunity_type="RFP",
+                posted_date=date(2026, 7, 1),
+                response_deadline=date(2026, 8, 1),
+            ),
+        ])
+        self.db.commit()
+
+        self.assertEqual(
+            refresh_org_lane_matches(self.db, self.org.id),
+            LaneMatchSync(added=2),
+        )
+        self.db.commit()
+        housing_row_id = (
+            self.db.query(OpportunityPursuitLaneMatch.id)
+            .filter(OpportunityPursuitLaneMatch.pursuit_lane_id == housing.id)
+            .scalar()
+        )
+        self.assertEqual(
+            refresh_org_lane_matches(self.db, self.org.id),
+            LaneMatchSync(unchanged=2),
+        )
+
+        health.keywords = ["public health"]
+        self.assertEqual(refresh_lane_matches(self.db, self.org.id, health), LaneMatchSync(updated=1))
+        health.keywords = ["transit"]
+        self.assertEqual(refresh_lane_matches(self.db, self.org.id, health), LaneMatchSync(removed=1))
+        self.db.commit()
+
+        matches = self.db.query(OpportunityPursuitLaneMatch).all()
+        self.assertEqual([(match.id, match.pursuit_lane_id) for match in matches], [(housing_row_id, housing.id)])
+        self.assertEqual(matches[0].matched_reasons, ["Title matched housing"])
+
 
 if __name__ == "__main__":
     unittest.main()
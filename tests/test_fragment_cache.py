@@ -0,0 +1,170 @@
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from bidlens import fragment_cache as fragment_cache_module
+from bidlens.database import Base
+from bidlens.fragment_cache import (
+    FragmentCache,
+    FragmentCacheError,
+    MemoryFragmentStore,
+    SqliteFragmentStore,
+    configured_fragment_store,
+    fragment_cache,
+)
+from bidlens.models import Opportunity, Organization, User
+from bidlens.query_metrics import count_queries
+from bidlens.routes import opportunities as opportunity_routes
+from bidlens.services import cast_vote, transition_state
+from bidlens.state_machine import OppState
+
+
+class SidebarFragmentCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.org = Organization(name="Fragments", slug="fragments")
+        self.db.add(self.org)
+        self.db.flush()
+        self.user = User(email="fragments@example.com", name="Fragments", organization_id=self.org.id)
+        self.db.add(self.user)
+        self.db.flush()
+        self.opps = [
+            Opportunity(
+                organization_id=self.org.id,
+                source="sam",
+                source_record_id=f"fragment-{index}",
+                title=f"Fragment {index}",
+                agency="Test Agency",
+                opportunity_type="Solicitation",
+                posted_date=date.today(),
+                response_deadline=date.today() + timedelta(days=5 + index),
+                qualification_status="qualified",
+            )
+            for index in range(2)
+        ]
+        self.db.add_all(self.opps)
+        self.db.commit()
+        self.user.current_organization_id = self.org.id
+        self.user.current_role = "member"
+        fragment_cache.clear()
+        self.addCleanup(fragment_cache.clear)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _sidebar_ids(self, key="my_shortlisted"):
+        return [item.id for item in opportunity_routes.get_sidebar(self.db, self.user)[key]]
+
+    def test_sidebar_is_reused_until_the_user_votes_or_an_opportunity_moves(self):
+        first, second = self.opps
+        cast_vote(self.db, org_id=self.org.id, user_id=self.user.id, opp_id=first.id, vote="PURSUE")
+        self.assertEqual(self._sidebar_ids(), [first.id])
+
+        with count_queries() as queries:
+            sidebar = opportunity_routes.get_sidebar(self.db, self.user)
+        self.assertEqual(queries.count, 0)
+        self.assertEqual(sidebar["my_shortlisted"][0].days_until_due, 5)
+        self.assertEqual(sidebar["my_shortlisted"][0].title, "Fragment 0")
+        self.assertEqual(fragment_cache.stats()["sidebar"], {"hits": 1, "misses": 1})
+
+        cast_vote(self.db, org_id=self.org.id, user_id=self.user.id, opp_id=second.id, vote="PURSUE")
+        self.assertEqual(self._sidebar_ids(), [second.id, first.id])
+
+        second.decision_state = OppState.SHORTLISTED.value
+        self.db.commit()
+        transition_state(
+            self.db, org_id=self.org.id, user_id=self.user.id, opp_id=second.id, to_state=OppState.ARCHIVED,
+        )
+        self.assertEqual(self._sidebar_ids(), [first.id])
+        self.assertEqual(fragment_cache.stats()["sidebar"], {"hits": 1, "misses": 3})
+
+    def test_watch_toggle_invalidates_the_users_following_list(self):
+        self.assertEqual(self._sidebar_ids("following"), [])
+
+        with patch.object(opportunity_routes, "require_user", return_value=self.user):
+            opportunity_routes.toggle_watch(SimpleNamespace(headers={}), self.opps[1].id, db=self.db)
+
+        self.assertEqual(self._sidebar_ids("following"), [self.opps[1].id])
+
+    def test_queue_counts_are_cached_per_tab(self):
+        cast_vote(self.db, org_id=self.org.id, user_id=self.user.id, opp_id=self.opps[0].id, vote="PASS")
+        expected = {"new": 1, "my_interested": 0, "passed": 1}
+        self.assertEqual(opportunity_routes._queue_counts(self.db, self.user, "all"), expected)
+
+        with count_queries() as queries:
+            self.assertEqual(opportunity_routes._queue_counts(self.db, self.user, "all"), expected)
+        self.assertEqual(queries.count, 0)
+
+        with patch.object(fragment_cache_module.config, "FRAGMENT_CACHE_SECONDS", 0):
+            with count_queries() as queries:
+                opportunity_routes._queue_counts(self.db, self.user, "all")
+        self.assertGreater(queries.count, 0)
+
+
+class FragmentStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        self.db = sessionmaker(bind=self.engine)()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def test_value_computed_across_an_invalidation_is_not_served(self):
+        cache = FragmentCache(MemoryFragmentStore(), ttl_seconds=60)
+
+        def compute_while_user_votes():
+            cache.invalidate_user(self.db, organization_id=1, user_id=2)
+            return "stale"
+
+        cache.get_or_compute(self.db, "sidebar", organization_id=1, user_id=2, compute=compute_while_user_votes)
+        value = cache.get_or_compute(self.db, "sidebar", organization_id=1, user_id=2, compute=lambda: "fresh")
+
+        self.assertEqual(value, "fresh")
+        self.assertEqual(cache.stats(), {"sidebar": {"hits": 0, "misses": 2}})
+
+    def test_sqlite_store_shares_fragments_and_invalidations_between_workers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "fragments.sqlite3"
+            worker_a = FragmentCache(SqliteFragmentStore(path), ttl_seconds=60)
+            worker_b = FragmentCache(SqliteFragmentStore(path), ttl_seconds=60)
+            fragment = {"my_shortlisted": [{"id": 7, "response_deadline": "2026-09-01"}]}
+
+            worker_a.get_or_compute(self.db, "sidebar", organization_id=1, user_id=2, compute=lambda: fragment)
+            self.assertEqual(
+                worker_b.get_or_compute(self.db, "sidebar", organization_id=1, user_id=2, compute=lambda: None),
+                fragment,
+            )
+
+            worker_a.invalidate_organization(self.db, 1)
+            self.assertEqual(
+                worker_b.get_or_compute(self.db, "sidebar", organization_id=1, user_id=2, compute=lambda: "recomputed"),
+                "recomputed",
+            )
+            self.assertEqual(worker_b.stats()["sidebar"], {"hits": 1, "misses": 1})
+
+    def test_first_use_resolves_the_configured_store(self):
+        cache = FragmentCache(ttl_seconds=60)
+        with patch.object(fragment_cache_module.config, "FRAGMENT_CACHE_BACKEND", "memory"):
+            value = cache.get_or_compute(self.db, "sidebar", organization_id=1, user_id=2, compute=lambda: 3)
+
+        self.assertEqual(value, 3)
+        self.assertIsInstance(cache.store, MemoryFragmentStore)
+
+    def test_unknown_backend_is_rejected(self):
+        with patch.object(fragment_cache_module.config, "FRAGMENT_CACHE_BACKEND", "redis"):
+            with self.assertRaises(FragmentCacheError):
+                configured_fragment_store()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,3 @@
-import asyncio
 from datetime import datetime, timedelta
 import unittest
 from unittest.mock import MagicMock, patch
@@ -80,15 +79,13 @@ class GovWinIntegrationRouteTests(unittest.TestCase):
             "_admin_or_redirect",
             return_value=(self.user, None),
         ):
-            return asyncio.run(
-                integrations.save_govwin_configuration(
-                    request=MagicMock(),
-                    client_id="client",
-                    client_secret="secret",
-                    username="user",
-                    password="password",
-                    db=self.db,
-                )
+            return integrations.save_govwin_configuration(
+                request=MagicMock(),
+                client_id="client",
+                client_secret="secret",
+                username="user",
+                password="password",
+                db=self.db,
             )
 
     def test_configuration_save_stores_only_encrypted_credentials(self):
@@ -115,8 +112,8 @@ class GovWinIntegrationRouteTests(unittest.TestCase):
             "_admin_or_redirect",
             return_value=(self.user, None),
         ):
-            asyncio.run(integrations.run_govwin_sync(request=MagicMock(), db=self.db))
-            asyncio.run(integrations.run_govwin_sync(request=MagicMock(), db=self.db))
+            integrations.run_govwin_sync(request=MagicMock(), db=self.db)
+            integrations.run_govwin_sync(request=MagicMock(), db=self.db)
 
         opportunities = (
             self.db.query(Opportunity)
@@ -0,0 +1,171 @@
+import datetime as dt
+import threading
+import unittest
+from unittest.mock import patch
+
+import requests
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from bidlens.database import Base
+from bidlens.models import Opportunity, Organization, User
+from bidlens.query_metrics import count_queries, install_query_counter
+from bidlens.services import cast_vote
+from bidlens.services.grants_detail_queue import (
+    GrantsDetailQueue,
+    grants_detail_queue,
+    install_grants_detail_prewarm,
+    needs_grants_gov_detail,
+)
+
+
+def _detail(record_id: str) -> dict:
+    return {
+        "data": {
+            "id": record_id,
+            "title": "Queued grant",
+            "agencyName": "Test Agency",
+            "openDate": "08/01/2026",
+            "closeDate": "09/01/2026",
+            "synopsis": {"synopsisDesc": "Full synopsis from the detail lookup."},
+        },
+    }
+
+
+class GrantsDetailQueueTests(unittest.TestCase):
+    def setUp(self):
+        # Lookups run on queue worker threads against the same in-memory database.
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+        )
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.db = self.session_factory()
+        self.org = Organization(name="Grants Queue", slug="grants-queue")
+        self.db.add(self.org)
+        self.db.flush()
+        self.opportunity = self._grant("queued-grant")
+        self.db.commit()
+        self.queue = GrantsDetailQueue(session_factory=self.session_factory, max_workers=2, failure_ttl_seconds=60)
+
+    def tearDown(self):
+        self.queue.shutdown()
+        self.db.close()
+        self.engine.dispose()
+
+    def _grant(self, record_id: str, **overrides) -> Opportunity:
+        values = {
+            "organization_id": self.org.id,
+            "source": "grants_gov",
+            "source_record_id": record_id,
+            "title": "Queued grant",
+            "agency": "Test Agency",
+            "opportunity_type": "Funding Opportunity",
+            "posted_date": dt.date(2026, 8, 1),
+            "response_deadline": dt.date(2026, 9, 1),
+            "raw_source_payload": {"id": record_id, "title": "Queued grant", "openDate": "08/01/2026"},
+            **overrides,
+        }
+        opportunity = Opportunity(**values)
+        self.db.add(opportunity)
+        self.db.flush()
+        return opportunity
+
+    @patch("bidlens.ingest_grants_gov.fetch_opportunity_detail")
+    def test_concurrent_views_share_one_lookup_and_store_the_detail(self, fetch_detail):
+        release = threading.Event()
+
+        def slow_detail(record_id):
+            release.wait(5)
+            return _detail(record_id)
+
+        fetch_detail.side_effect = slow_detail
+        self.queue.start()
+
+        self.assertTrue(self.queue.enqueue(self.opportunity.id))
+        self.assertTrue(self.queue.enqueue(self.opportunity.id))
+        self.assertTrue(self.queue.is_pending(self.opportunity.id))
+        release.set()
+        self.queue.join(timeout=5)
+
+        fetch_detail.assert_called_once_with("queued-grant")
+        self.assertFalse(self.queue.is_pending(self.opportunity.id))
+        self.db.expire_all()
+        self.assertFalse(needs_grants_gov_detail(self.opportunity, description=self.opportunity.description))
+        self.assertIn("Full synopsis", self.opportunity.description)
+
+    @patch("bidlens.ingest_grants_gov.fetch_opportunity_detail")
+    def test_failed_lookup_is_not_retried_until_the_ttl_passes(self, fetch_detail):
+        fetch_detail.side_effect = requests.Timeout("slow upstream")
+        self.queue.start()
+
+        self.assertTrue(self.queue.enqueue(self.opportunity.id))
+        self.queue.join(timeout=5)
+
+        self.assertTrue(self.queue.recently_failed(self.opportunity.id))
+        self.assertFalse(self.queue.enqueue(self.opportunity.id))
+        self.assertEqual(fetch_detail.call_count, 1)
+
+        self.queue.clear()
+        fetch_detail.side_effect = _detail
+        self.assertTrue(self.queue.enqueue(self.opportunity.id))
+        self.queue.join(timeout=5)
+        self.assertEqual(fetch_detail.call_count, 2)
+        self.assertFalse(self.queue.recently_failed(self.opportunity.id))
+
+    @patch("bidlens.ingest_grants_gov.fetch_opportunity_detail")
+    def test_stopped_queue_queues_nothing(self, fetch_detail):
+        self.assertFalse(self.queue.enqueue(self.opportunity.id))
+        self.assertFalse(self.queue.is_pending(self.opportunity.id))
+        fetch_detail.assert_not_called()
+
+    @patch("bidlens.ingest_grants_gov.fetch_opportunity_detail")
+    def test_qualified_and_interested_grants_are_prewarmed_after_commit(self, fetch_detail):
+        fetch_detail.side_effect = _detail
+        user = User(email="reviewer@example.com", organization_id=self.org.id)
+        self.db.add(user)
+        install_grants_detail_prewarm()
+        # Qualified while the queue is stopped, so only the vote can queue it.
+        self.opportunity.qualification_status = "qualified"
+        self.db.commit()
+        grants_detail_queue.start()
+        self.addCleanup(grants_detail_queue.clear)
+        self.addCleanup(grants_detail_queue.shutdown)
+
+        rolled_back = self._grant("rolled-back-grant", qualification_status="qualified")
+        self.db.rollback()
+        self.assertIsNone(self.db.get(Opportunity, rolled_back.id))
+
+        self._grant("qualified-grant", qualification_status="qualified")
+        self.db.commit()
+        grants_detail_queue.join(timeout=5)
+        cast_vote(self.db, org_id=self.org.id, user_id=user.id, opp_id=self.opportunity.id, vote="PURSUE")
+        grants_detail_queue.join(timeout=5)
+
+        self.assertEqual(
+            sorted(call.args[0] for call in fetch_detail.call_args_list),
+            ["qualified-grant", "queued-grant"],
+        )
+
+    @patch("bidlens.ingest_grants_gov.fetch_opportunity_detail")
+    def test_prewarm_candidates_are_picked_before_the_commit(self, fetch_detail):
+        fetch_detail.side_effect = _detail
+        install_query_counter()
+        install_grants_detail_prewarm()
+        grants_detail_queue.start()
+        self.addCleanup(grants_detail_queue.clear)
+        self.addCleanup(grants_detail_queue.shutdown)
+
+        self.opportunity.qualification_status = "qualified"
+        self.db.flush()
+        with count_queries() as counter:
+            self.db.commit()
+        grants_detail_queue.join(timeout=5)
+
+        self.assertEqual(counter.count, 0)
+        self.assertEqual([call.args[0] for call in fetch_detail.call_args_list], ["queued-grant"])
+
+
+if __name__ == "__main__":
+    unittest.main()
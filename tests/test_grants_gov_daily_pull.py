@@ -1,4 +1,5 @@
 import datetime as dt
+import time
 import unittest
 from unittest.mock import Mock, patch
 
@@ -218,6 +219,56 @@ class GrantsGovDailyPullTests(unittest.TestCase):
         self.assertEqual(fetch_detail.call_count, 3)
         self.assertEqual(self.db.query(Opportunity).count(), 3)
 
+    @patch("bidlens.ingest_grants_gov.fetch_opportunity_detail")
+    @patch("bidlens.ingest_grants_gov.search_recent_opportunities")
+    def test_details_are_fetched_concurrently_and_applied_in_search_order(self, search, fetch_detail):
+        records = [self._record(f"grant-order-{index}", f"Ordered grant {index}") for index in range(6)]
+        search.return_value = {"data": {"hitCount": len(records), "oppHits": records}}
+
+        def detail(source_record_id):
+            index = int(source_record_id.rsplit("-", 1)[1])
+            time.sleep(0.01 * (6 - index))
+            return {"data": {"id": source_record_id, "description": f"Detail for {index}"}}
+
+        fetch_detail.side_effect = detail
+
+        result = ingest_grants_gov(self.db, organization_id=self.org.id)
+
+        self.assertEqual(result["created"], 6)
+        self.assertEqual(
+            [item["source_record_id"] for item in result["_record_details"]],
+            [record["id"] for record in records],
+        )
+        descriptions = {
+            opportunity.source_record_id: opportunity.raw_source_payload.get("description")
+            for opportunity in self.db.query(Opportunity).all()
+        }
+        self.assertEqual(descriptions["grant-order-0"], "Detail for 0")
+        self.assertEqual(descriptions["grant-order-5"], "Detail for 5")
+
+    @patch("bidlens.ingest_grants_gov.fetch_opportunity_detail")
+    @patch("bidlens.ingest_grants_gov.search_recent_opportunities")
+    def test_unchanged_search_hits_reuse_the_stored_detail(self, search, fetch_detail):
+        steady = self._record("grant-steady", "Steady grant")
+        moving = self._record("grant-moving", "Moving grant")
+        search.return_value = {"data": {"hitCount": 2, "oppHits": [steady, moving]}}
+        fetch_detail.side_effect = lambda source_record_id: {
+            "data": {"id": source_record_id, "description": f"Detail {source_record_id}"},
+        }
+        ingest_grants_gov(self.db, organization_id=self.org.id)
+        fetch_detail.reset_mock()
+
+        moved = {**moving, "closeDate": "09/15/2026"}
+        search.return_value = {"data": {"hitCount": 2, "oppHits": [dict(steady), moved]}}
+        result = ingest_grants_gov(self.db, organization_id=self.org.id)
+
+        fetch_detail.assert_called_once_with("grant-moving")
+        self.assertEqual(result["details_reused"], 1)
+        self.assertEqual(result["unchanged"], 1)
+        self.assertEqual(result["updated"], 1)
+        steady_row = self.db.query(Opportunity).filter_by(source_record_id="grant-steady").one()
+        self.assertEqual(steady_row.raw_source_payload["description"], "Detail grant-steady")
+
     @patch("bidlens.ingest_grants_gov.fetch_opportunity_detail")
     @patch("bidlens.ingest_grants_gov.search_recent_opportunities")
     def test_zero_result_day_is_recorded_as_no_records(self, search, fetch_detail):
@@ -63,13 +63,19 @@ class GrantsSchedulerTests(unittest.TestCase):
         return SimpleNamespace(query_params={"org_id": str(self.enabled_org_id)})
 
     def test_grants_scheduler_delegates_to_standalone_job_orchestration(self):
-        with patch("bidlens.scheduler.run_grants_ingest_job", return_value=0) as run_job:
+        with (
+            patch("bidlens.scheduler.SessionLocal", self.Session),
+            patch("bidlens.scheduler.run_grants_ingest_job", return_value=0) as run_job,
+        ):
             scheduler.run_grants_ingest()
 
         run_job.assert_called_once_with()
 
     def test_sam_scheduler_delegates_to_standalone_job_orchestration(self):
-        with patch("bidlens.scheduler.run_sam_ingest_job", return_value=0) as run_job:
+        with (
+            patch("bidlens.scheduler.SessionLocal", self.Session),
+            patch("bidlens.scheduler.run_sam_ingest_job", return_value=0) as run_job,
+        ):
             scheduler.run_sam_ingest()
 
         run_job.assert_called_once_with()
@@ -87,11 +93,12 @@ class GrantsSchedulerTests(unittest.TestCase):
             returned = scheduler.start_scheduler()
 
         self.assertIs(returned, fake_scheduler)
-        self.assertEqual(fake_scheduler.add_job.call_count, 3)
+        self.assertEqual(fake_scheduler.add_job.call_count, 4)
         scheduled_functions = [call.args[0] for call in fake_scheduler.add_job.call_args_list]
         self.assertIn(scheduler.run_sam_ingest, scheduled_functions)
         self.assertIn(scheduler.run_grants_ingest, scheduled_functions)
         self.assertIn(scheduler.run_outlook_conversation_sync, scheduled_functions)
+        self.assertIn(scheduler.run_account_display_backfill_job, scheduled_functions)
         fake_scheduler.start.assert_called_once()
 
 
@@ -1,3 +1,4 @@
+import json
 import unittest
 from datetime import datetime, timezone
 from types import SimpleNamespace
@@ -193,8 +194,29 @@ class GUTSGenerationEndpointTests(unittest.TestCase):
             opportunity_id=180,
             requesting_user=user,
             active_organization_id=9,
+            force_regenerate=False,
         )
 
+    def test_queued_endpoint_returns_the_generation_id_immediately(self):
+        user = SimpleNamespace(id=4, organization_id=9, current_organization_id=9)
+        service = MagicMock()
+        service.enqueue.return_value = SimpleNamespace(
+            id=21, opportunity_id=180, status="pending", requested_at=None, started_at=None,
+            completed_at=None, failure_category=None, failure_stage=None, safe_error_message=None,
+        )
+        with (
+            patch("bidlens.routes.api.require_user", return_value=user),
+            patch("bidlens.routes.api.OpportunityKnowledgeBriefService", return_value=service),
+            patch("bidlens.routes.api.config.GUTS_GENERATION_QUEUE_ENABLED", True),
+        ):
+            response = generate_guts(180, MagicMock(), MagicMock())
+
+        self.assertEqual(response.status_code, 202)
+        payload = json.loads(response.body)
+        self.assertEqual((payload["generation_id"], payload["stage"]), (21, "queued"))
+        self.assertEqual(payload["status_url"], "/api/opps/180/guts-generations/21")
+        service.generate.assert_not_called()
+
     def test_endpoint_returns_only_safe_service_failure(self):
         user = SimpleNamespace(id=4, organization_id=9, current_organization_id=9)
         service = MagicMock()
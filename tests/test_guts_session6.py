@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 import datetime as dt
 import unittest
 from unittest.mock import patch
@@ -14,7 +15,8 @@ from bidlens.models import (
 from bidlens.services.opportunity_knowledge_brief import (
     GUTSModelCallResult, GUTSModelError, GUTSServiceError, GenerationStatus,
     OpportunityKnowledgeBriefCompiler, OpportunityKnowledgeBriefService,
-    create_pending_generation, get_latest_successful_generation,
+    claim_next_pending_generation, create_pending_generation, generation_stage,
+    generation_status_payload, get_latest_successful_generation, run_guts_generation_worker,
 )
 from bidlens.services.opportunity_knowledge_brief.contracts import (
     AttributionActor, EvidenceAuthor, EvidenceCollectionResult, EvidenceSource,
@@ -72,6 +74,15 @@ class Collector:
     def collect(self, **kwargs): return self.result
 
 
+class StageRecordingCollector(Collector):
+    def __init__(self, result, db):
+        super().__init__(result); self.db = db; self.stages = []
+    def collect(self, **kwargs):
+        generation = self.db.query(OpportunityKnowledgeBriefGeneration).one()
+        self.stages.append(generation_stage(generation))
+        return self.result
+
+
 class FailingCollector:
     def collect(self, **kwargs):
         raise RuntimeError("PRIVATE SOURCE CONTENT")
@@ -148,11 +159,11 @@ class GUTSSession6Tests(unittest.TestCase):
     def service(self, **kwargs):
         return OpportunityKnowledgeBriefService(self.db, compiler=self.compiler(**kwargs))
 
-    def generate(self, service=None):
+    def generate(self, service=None, **kwargs):
         with patch("bidlens.services.opportunity_knowledge_brief.service.config.GUTS_ENABLED", True):
             return (service or self.service()).generate(
                 opportunity_id=self.opportunity.id, requesting_user=self.member,
-                active_organization_id=self.org.id,
+                active_organization_id=self.org.id, **kwargs,
             )
 
     def test_current_state_only_success_persists_complete_graph_and_metadata(self):
@@ -348,5 +359,96 @@ class GUTSSession6Tests(unittest.TestCase):
         self.assertNotEqual(second.manifest_hash, third.manifest_hash)
 
 
+    def test_identical_manifest_reuses_validated_output_unless_forced(self):
+        model = FakeModelClient(model_output(self.opportunity.id))
+        model.model = "guts-test"
+        first = self.generate(self.service(model=model))
+        reused = self.generate(self.service(model=model))
+
+        self.assertEqual(model.calls, 1)
+        self.assertEqual(reused.status, GenerationStatus.SUCCEEDED)
+        self.assertEqual(reused.manifest_hash, first.manifest_hash)
+        self.assertEqual(reused.output_json, first.output_json)
+        self.assertEqual(
+            [(item.statement_key, item.text, [link.brief_source.source_id for link in item.source_links]) for item in reused.statements],
+            [(item.statement_key, item.text, [link.brief_source.source_id for link in item.source_links]) for item in first.statements],
+        )
+        self.assertEqual({source.source_id for source in reused.sources}, {source.source_id for source in first.sources})
+        self.assertEqual((reused.model, reused.total_tokens, reused.model_ms), ("guts-test", 0, 0))
+        self.assertEqual(reused.statistics_json["reused_generation_id"], first.id)
+        self.assertEqual(reused.statistics_json["reuse_saved_total_tokens"], 130)
+        self.assertEqual(reused.statistics_json["reuse_saved_model_ms"], first.model_ms + first.validation_ms)
+
+        again = self.generate(self.service(model=model))
+        self.assertEqual(model.calls, 1)
+        self.assertEqual(again.statistics_json["reused_generation_id"], first.id)
+
+        forced = self.generate(self.service(model=model), force_regenerate=True)
+        self.assertEqual(model.calls, 2)
+        self.assertEqual(forced.total_tokens, 130)
+        self.assertNotIn("reused_generation_id", forced.statistics_json)
+
+    def test_a_different_model_does_not_reuse_output(self):
+        model = FakeModelClient(model_output(self.opportunity.id))
+        model.model = "guts-test"
+        self.generate(self.service(model=model))
+        other = FakeModelClient(model_output(self.opportunity.id))
+        other.model = "guts-other"
+
+        self.generate(self.service(model=other))
+
+        self.assertEqual(other.calls, 1)
+
+    def enqueue(self, user=None, **kwargs):
+        with patch("bidlens.services.opportunity_knowledge_brief.service.config.GUTS_ENABLED", True):
+            return self.service().enqueue(
+                opportunity_id=self.opportunity.id, requesting_user=user or self.member,
+                active_organization_id=self.org.id, **kwargs,
+            )
+
+    def run_worker(self, service):
+        with patch("bidlens.services.opportunity_knowledge_brief.service.config.GUTS_ENABLED", True):
+            return run_guts_generation_worker(
+                once=True, session_factory=lambda: nullcontext(self.db),
+                service_factory=lambda db: service,
+            )
+
+    def test_queued_requests_collapse_and_the_worker_reports_progress(self):
+        queued = self.enqueue(force_regenerate=True)
+        self.assertEqual(queued.status, GenerationStatus.PENDING)
+        self.assertEqual(self.enqueue().id, queued.id)
+        self.assertTrue(queued.force_regenerate)
+        payload = generation_status_payload(queued, status_url="/status")
+        self.assertEqual((payload["stage"], payload["done"], payload["status_url"]), ("queued", False, "/status"))
+
+        official = StageRecordingCollector(empty_official(), self.db)
+        service = OpportunityKnowledgeBriefService(self.db, compiler=self.compiler())
+        service.compiler.official_collector = official
+        self.assertEqual(self.run_worker(service), 1)
+
+        self.assertEqual(official.stages, ["official_evidence"])
+        self.db.refresh(queued)
+        self.assertEqual(queued.status, GenerationStatus.SUCCEEDED)
+        self.assertEqual(generation_status_payload(queued)["stage"], "complete")
+        self.assertIsNone(claim_next_pending_generation(self.db))
+        self.assertEqual(self.run_worker(service), 0)
+
+    def test_worker_rechecks_access_and_expires_stale_queued_generations(self):
+        queued = self.enqueue()
+        self.db.query(Vote).delete(); self.db.commit()
+        self.assertEqual(self.run_worker(self.service()), 1)
+        self.db.refresh(queued)
+        self.assertEqual((queued.status, queued.failure_category), ("failed", "shortlist_required"))
+        self.assertEqual(generation_status_payload(queued)["stage"], "authorization")
+
+        self.db.add(Vote(org_id=self.org.id, opp_id=self.opportunity.id, user_id=self.member.id, vote="PURSUE"))
+        self.db.commit()
+        stale = self.enqueue()
+        stale.requested_at = dt.datetime.now(UTC) - dt.timedelta(seconds=1000); self.db.commit()
+        self.assertEqual(self.run_worker(self.service()), 0)
+        self.db.refresh(stale)
+        self.assertEqual(stale.failure_category, "stale_attempt")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,4 @@
 import datetime as dt
-import asyncio
 import unittest
 from types import SimpleNamespace
 from unittest.mock import patch
@@ -901,7 +900,7 @@ class HomeContextTests(unittest.TestCase):
             patch("bidlens.routes.home.attach_request_user_context", return_value=member),
             patch("bidlens.routes.home.templates.TemplateResponse", return_value={"ok": True}) as template_response,
         ):
-            response = asyncio.run(home_page(SimpleNamespace(), self.db))
+            response = home_page(SimpleNamespace(), self.db)
 
         self.assertEqual(response, {"ok": True})
         template_response.assert_called_once()
@@ -916,7 +915,7 @@ class HomeContextTests(unittest.TestCase):
             patch("bidlens.routes.home.get_current_user", return_value=self.admin),
             patch("bidlens.routes.home.attach_request_user_context", return_value=self.admin),
         ):
-            response = asyncio.run(home_page(SimpleNamespace(), self.db))
+            response = home_page(SimpleNamespace(), self.db)
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(response.headers["location"], f"/organization-setup?org_id={self.org.id}")
@@ -927,7 +926,7 @@ class HomeContextTests(unittest.TestCase):
         setattr(self.admin, "current_organization_is_live", False)
 
         with patch("bidlens.routes.opportunities.require_user", return_value=self.admin):
-            response = asyncio.run(opportunities.feed(SimpleNamespace(), db=self.db))
+            response = opportunities.feed(SimpleNamespace(), db=self.db)
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(response.headers["location"], f"/organization-setup?org_id={self.org.id}")
@@ -941,7 +940,7 @@ class HomeContextTests(unittest.TestCase):
             patch("bidlens.routes.home.attach_request_user_context", return_value=self.admin),
             patch("bidlens.routes.home.templates.TemplateResponse", return_value={"ok": True}) as template_response,
         ):
-            response = asyncio.run(organization_setup_page(SimpleNamespace(), self.db))
+            response = organization_setup_page(SimpleNamespace(), self.db)
 
         self.assertEqual(response, {"ok": True})
         template_response.assert_called_once()
@@ -960,7 +959,7 @@ class HomeContextTests(unittest.TestCase):
             patch("bidlens.routes.home.get_current_user", return_value=self.admin),
             patch("bidlens.routes.home.attach_request_user_context", return_value=self.admin),
         ):
-            response = asyncio.run(organization_setup_page(SimpleNamespace(), self.db))
+            response = organization_setup_page(SimpleNamespace(), self.db)
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(response.headers["location"], f"/home?org_id={self.org.id}")
@@ -975,7 +974,7 @@ class HomeContextTests(unittest.TestCase):
             patch("bidlens.routes.home.get_current_user", return_value=self.admin),
             patch("bidlens.routes.home.attach_request_user_context", return_value=self.admin),
         ):
-            response = asyncio.run(go_live(SimpleNamespace(), self.db))
+            response = go_live(SimpleNamespace(), self.db)
 
         self.db.refresh(self.org)
         event = (
@@ -0,0 +1,178 @@
+import datetime as dt
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from bidlens import scheduler
+from bidlens.database import Base
+from bidlens.ingest_grants_gov import ingest_grants_gov
+from bidlens.ingest_sam import ingest_sam, sam_ingest_in_progress
+from bidlens.models import IngestLease, Organization, SamSourceConfig
+from bidlens.services.grants_pulls import run_manual_grants_pull
+from bidlens.services.ingest_leases import (
+    BACKEND_ROW,
+    GRANTS_INGEST_LEASE,
+    SAM_INGEST_LEASE,
+    IngestLeaseBusy,
+    acquire_ingest_lease,
+    ingest_lease,
+    ingest_lease_held,
+    ingest_lease_status,
+    lease_slots,
+    organization_lease,
+)
+from bidlens.services.sam_pulls import run_manual_sam_pull
+
+
+class IngestLeaseTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+        self.db = self.Session()
+        self.org = Organization(name="Lease Org", slug="lease-org")
+        self.db.add(self.org)
+        self.db.commit()
+        self.start = dt.datetime(2026, 7, 1, 12, 0, tzinfo=dt.timezone.utc)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def test_row_lease_blocks_other_owners_until_released_or_expired(self):
+        lease = acquire_ingest_lease(self.db, SAM_INGEST_LEASE, owner="web-1", ttl_seconds=60, now=self.start)
+
+        self.assertEqual(lease.backend, BACKEND_ROW)
+        self.assertIsNone(
+            acquire_ingest_lease(self.db, SAM_INGEST_LEASE, owner="cron", now=self.start + dt.timedelta(seconds=30))
+        )
+        status = ingest_lease_status(self.db, SAM_INGEST_LEASE, now=self.start + dt.timedelta(seconds=30))
+        self.assertTrue(status["held"])
+        self.assertEqual(status["owner"], "web-1")
+
+        self.assertTrue(lease.heartbeat(self.db, now=self.start + dt.timedelta(seconds=50)))
+        self.assertIsNone(
+            acquire_ingest_lease(self.db, SAM_INGEST_LEASE, owner="cron", now=self.start + dt.timedelta(seconds=90))
+        )
+
+        taken_over = acquire_ingest_lease(
+            self.db, SAM_INGEST_LEASE, owner="cron", now=self.start + dt.timedelta(seconds=111)
+        )
+        self.assertIsNotNone(taken_over)
+        self.assertFalse(lease.heartbeat(self.db, now=self.start + dt.timedelta(seconds=112)))
+
+        taken_over.release(self.db, now=self.start + dt.timedelta(seconds=120))
+        self.assertFalse(ingest_lease_held(self.db, SAM_INGEST_LEASE, now=self.start + dt.timedelta(seconds=121)))
+        self.assertIsNotNone(
+            acquire_ingest_lease(self.db, SAM_INGEST_LEASE, owner="web-2", now=self.start + dt.timedelta(seconds=121))
+        )
+
+    def test_failed_block_rolls_back_pending_work_and_releases(self):
+        with self.assertRaises(ValueError):
+            with ingest_lease(self.db, GRANTS_INGEST_LEASE, busy_message="busy"):
+                self.db.add(Organization(name="Half Written", slug="half-written"))
+                self.db.flush()
+                raise ValueError("boom")
+
+        self.assertEqual(self.db.query(Organization).filter_by(slug="half-written").count(), 0)
+        self.assertFalse(ingest_lease_held(self.db, GRANTS_INGEST_LEASE))
+        self.assertIsNotNone(self.db.query(IngestLease).filter_by(name=GRANTS_INGEST_LEASE).one().released_at)
+
+    def test_sam_and_grants_ingests_report_busy_while_another_process_holds_the_lease(self):
+        config = SamSourceConfig(
+            organization_id=self.org.id,
+            name="Held search",
+            naics_codes=["541611"],
+            keywords=[],
+            agencies=[],
+            set_asides=[],
+            notice_types=["Solicitation"],
+        )
+        self.db.add(config)
+        self.db.commit()
+        acquire_ingest_lease(self.db, organization_lease(SAM_INGEST_LEASE, self.org.id), owner="other-node:123")
+        acquire_ingest_lease(self.db, organization_lease(GRANTS_INGEST_LEASE, self.org.id), owner="other-node:123")
+
+        self.assertTrue(sam_ingest_in_progress(self.db, self.org.id))
+        with patch("bidlens.ingest_sam.pull_sam_into_db") as pull:
+            with self.assertRaises(IngestLeaseBusy) as raised:
+                ingest_sam(self.db, organization_id=self.org.id, naics_list=["541611"])
+            status_code, payload, _headers = run_manual_sam_pull(
+                self.db, organization_id=self.org.id, user_id=None, search_id=config.id
+            )
+        pull.assert_not_called()
+        self.assertEqual(raised.exception.holder["owner"], "other-node:123")
+        self.assertEqual((status_code, payload["status"]), (409, "busy"))
+
+        with patch("bidlens.ingest_grants_gov.search_recent_opportunities") as search:
+            with self.assertRaises(IngestLeaseBusy):
+                ingest_grants_gov(self.db, organization_id=self.org.id)
+            status_code, payload, _headers = run_manual_grants_pull(
+                self.db, organization_id=self.org.id, user_id=None
+            )
+        search.assert_not_called()
+        self.assertEqual((status_code, payload["status"]), (409, "busy"))
+
+    def test_sam_ingest_releases_lease_when_finished(self):
+        with patch("bidlens.ingest_sam.pull_sam_into_db") as pull:
+            pull.return_value = {"_record_details": []}
+            ingest_sam(self.db, organization_id=self.org.id, naics_list=["541611"])
+
+        self.assertFalse(sam_ingest_in_progress(self.db, self.org.id))
+        self.assertIsNotNone(acquire_ingest_lease(self.db, organization_lease(SAM_INGEST_LEASE, self.org.id)))
+
+    def test_another_organizations_pull_does_not_hold_the_lease(self):
+        other = Organization(name="Other Lease Org", slug="other-lease-org")
+        self.db.add(other)
+        self.db.commit()
+        acquire_ingest_lease(self.db, organization_lease(SAM_INGEST_LEASE, other.id), owner="other-node:123")
+
+        self.assertFalse(sam_ingest_in_progress(self.db, self.org.id))
+        with patch("bidlens.ingest_sam.pull_sam_into_db") as pull:
+            pull.return_value = {"_record_details": []}
+            ingest_sam(self.db, organization_id=self.org.id, naics_list=["541611"])
+        pull.assert_called()
+        self.assertTrue(sam_ingest_in_progress(self.db, other.id))
+
+    def test_sam_slots_cap_pulls_across_organizations_and_processes(self):
+        other = Organization(name="Slot Org", slug="slot-org")
+        self.db.add(other)
+        self.db.commit()
+        first_slot, second_slot = lease_slots(SAM_INGEST_LEASE, 2)
+        acquire_ingest_lease(self.db, first_slot, owner="cron:1")
+
+        with patch("bidlens.ingest_sam.pull_sam_into_db") as pull, patch("bidlens.ingest_sam.config.JOB_SAM_CONCURRENCY", 1):
+            with self.assertRaises(IngestLeaseBusy):
+                ingest_sam(self.db, organization_id=self.org.id, naics_list=["541611"])
+        pull.assert_not_called()
+        self.assertFalse(ingest_lease_held(self.db, organization_lease(SAM_INGEST_LEASE, self.org.id)))
+
+        def pull_while_holding_the_second_slot(*args, **kwargs):
+            self.assertTrue(ingest_lease_held(self.db, second_slot))
+            return {"_record_details": []}
+
+        with (
+            patch("bidlens.ingest_sam.pull_sam_into_db", side_effect=pull_while_holding_the_second_slot) as pull,
+            patch("bidlens.ingest_sam.config.JOB_SAM_CONCURRENCY", 2),
+        ):
+            ingest_sam(self.db, organization_id=other.id, naics_list=["541611"])
+        pull.assert_called()
+        self.assertFalse(ingest_lease_held(self.db, second_slot))
+        self.assertTrue(ingest_lease_held(self.db, first_slot))
+
+    def test_scheduled_job_is_skipped_while_another_scheduler_holds_it(self):
+        acquire_ingest_lease(self.db, scheduler.SAM_INGEST_JOB_LEASE, owner="web-2")
+
+        with (
+            patch("bidlens.scheduler.SessionLocal", self.Session),
+            patch("bidlens.scheduler.run_sam_ingest_job", return_value=0) as run_job,
+        ):
+            scheduler.run_sam_ingest()
+
+        run_job.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,3 @@
-import asyncio
 import unittest
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -35,7 +34,7 @@ class ManualOpportunityImportTests(unittest.TestCase):
         admin = SimpleNamespace(id=1, organization_id=self.org.id, current_organization_id=self.org.id, current_role="admin")
 
         with patch.object(imports, "require_admin", return_value=admin):
-            response = asyncio.run(imports.manual_import_template(_Request(), db=MagicMock()))
+            response = imports.manual_import_template(_Request(), db=MagicMock())
 
         body = response.body.decode("utf-8")
         self.assertEqual(response.media_type, "text/csv")
@@ -24,6 +24,13 @@ from bidlens.services.market_activity import (
 )
 
 
+def _streamed_text(response):
+    async def read():
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    return asyncio.run(read())
+
+
 class MarketActivityAggregationTests(unittest.TestCase):
     def setUp(self):
         self.engine = create_engine("sqlite:///:memory:")
@@ -301,7 +308,7 @@ class MarketActivityAggregationTests(unittest.TestCase):
         with patch("bidlens.routes.imports.require_admin", return_value=user), patch(
             "bidlens.routes.imports.get_sidebar", return_value={}
         ):
-            response = asyncio.run(imports.market_activity_page(request, db=self.db))
+            response = imports.market_activity_page(request, db=self.db)
         html = response.body.decode()
         self.assertIn('<option value="1_year" selected>Last 1 Year</option>', html)
         self.assertIn('<option value="naics" selected>NAICS</option>', html)
@@ -342,7 +349,7 @@ class MarketActivityAggregationTests(unittest.TestCase):
         with patch("bidlens.routes.imports.require_admin", return_value=user), patch(
             "bidlens.routes.imports.get_sidebar", return_value={}
         ):
-            response = asyncio.run(imports.market_activity_page(request, db=self.db))
+            response = imports.market_activity_page(request, db=self.db)
         html = response.body.decode()
         self.assertIn('<option value="account" selected>Account</option>', html)
         self.assertNotIn('<option value="account_type">', html)
@@ -375,8 +382,8 @@ class MarketActivityAggregationTests(unittest.TestCase):
             current_role="admin",
         )
         with patch("bidlens.routes.imports.require_admin", return_value=user):
-            response = asyncio.run(imports.market_activity_export(request, db=self.db))
-        rows = list(csv.reader(io.StringIO(response.body.decode())))
+            response = imports.market_activity_export(request, db=self.db)
+        rows = list(csv.reader(io.StringIO(_streamed_text(response))))
         self.assertEqual(rows[0], ["Account", "Imported", "Qualified", "Shortlisted"])
         self.assertEqual(rows[1][0], "Agency A")
         self.assertEqual(len(rows), 16)
@@ -415,9 +422,9 @@ class MarketActivityAggregationTests(unittest.TestCase):
         )
 
         with patch("bidlens.routes.imports.require_admin", return_value=user):
-            response = asyncio.run(imports.market_activity_export(request, db=self.db))
+            response = imports.market_activity_export(request, db=self.db)
 
-        csv_rows = list(csv.reader(io.StringIO(response.body.decode())))
+        csv_rows = list(csv.reader(io.StringIO(_streamed_text(response))))
         self.assertEqual(len(dashboard["rows"]), 1)
         self.assertEqual(csv_rows[1], [dashboard["rows"][0]["label"], "2", "2", "1"])
 
@@ -455,7 +462,7 @@ class MarketActivityRouteAccessTests(unittest.TestCase):
             "bidlens.routes.imports.attach_request_user_context", return_value=member
         ):
             with self.assertRaises(HTTPException) as raised:
-                asyncio.run(imports.market_activity_page(request, db=MagicMock()))
+                imports.market_activity_page(request, db=MagicMock())
         self.assertEqual(raised.exception.status_code, 403)
         self.assertEqual(raised.exception.detail, "Only Workspace Admins can view Analytics.")
 
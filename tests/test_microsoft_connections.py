@@ -1,5 +1,4 @@
 import base64
-import asyncio
 import datetime as dt
 import json
 from types import SimpleNamespace
@@ -357,7 +356,7 @@ class MicrosoftConnectionTests(unittest.TestCase):
             "server": ("testserver", 80),
         })
 
-        response = asyncio.run(integrations.microsoft_connection_page(request, self.db))
+        response = integrations.microsoft_connection_page(request, self.db)
         html = response.body.decode()
 
         self.assertEqual(response.status_code, 200)
@@ -1,4 +1,3 @@
-import asyncio
 import base64
 import json
 from types import SimpleNamespace
@@ -246,13 +245,13 @@ class MicrosoftWorkspaceConfigurationTests(unittest.TestCase):
             "query_string": b"",
         })
 
-        response = asyncio.run(integrations.configure_microsoft_connection_mode(
+        response = integrations.configure_microsoft_connection_mode(
             request,
             mode="organization",
             external_tenant_id="tenant-a",
             tenant_display_name="Managed",
             db=self.db,
-        ))
+        )
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(response.headers["location"], "/")
@@ -272,13 +271,13 @@ class MicrosoftWorkspaceConfigurationTests(unittest.TestCase):
             "query_string": b"",
         })
 
-        response = asyncio.run(integrations.configure_microsoft_connection_mode(
+        response = integrations.configure_microsoft_connection_mode(
             request,
             mode="organization",
             external_tenant_id="tenant-a",
             tenant_display_name="Managed Tenant",
             db=self.db,
-        ))
+        )
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(response.headers["location"], "/integrations/microsoft?mode_saved=1")
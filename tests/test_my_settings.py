@@ -1,4 +1,3 @@
-import asyncio
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
@@ -59,7 +58,7 @@ class MySettingsTests(unittest.TestCase):
             patch.object(settings, "require_user", return_value=self.user),
             patch.object(settings.templates, "TemplateResponse", return_value={"ok": True}) as response,
         ):
-            result = asyncio.run(settings.my_settings_page(self._request(), self.db))
+            result = settings.my_settings_page(self._request(), self.db)
 
         self.assertEqual(result, {"ok": True})
         context = response.call_args.args[1]
@@ -70,23 +69,23 @@ class MySettingsTests(unittest.TestCase):
 
     def test_daily_brief_preference_updates_existing_user_field(self):
         with patch.object(settings, "require_user", return_value=self.user):
-            disabled = asyncio.run(settings.save_daily_brief_settings(
+            disabled = settings.save_daily_brief_settings(
                 self._request("org_id=1"), daily_brief_email_enabled=None, db=self.db
-            ))
+            )
             self.assertTrue(self.user.daily_brief_email_opted_out)
             self.assertEqual(disabled.headers["location"], "/my-settings?org_id=1&saved=daily-brief")
 
-            asyncio.run(settings.save_daily_brief_settings(
+            settings.save_daily_brief_settings(
                 self._request(), daily_brief_email_enabled="1", db=self.db
-            ))
+            )
             self.assertFalse(self.user.daily_brief_email_opted_out)
 
     def test_daily_brief_async_save_returns_json_without_redirect(self):
         request = self._request(headers={"x-requested-with": "fetch"})
         with patch.object(settings, "require_user", return_value=self.user):
-            response = asyncio.run(settings.save_daily_brief_settings(
+            response = settings.save_daily_brief_settings(
                 request, daily_brief_email_enabled=None, db=self.db
-            ))
+            )
 
         self.assertEqual(response.status_code, 200)
         self.assertNotIn("location", response.headers)
@@ -132,17 +131,17 @@ class MySettingsTests(unittest.TestCase):
 
     def test_lane_save_returns_to_consolidated_page(self):
         with patch.object(settings, "require_user", return_value=self.user):
-            response = asyncio.run(settings.save_my_lanes_settings(
+            response = settings.save_my_lanes_settings(
                 self._request(), lane_ids=[self.lane.id], db=self.db
-            ))
+            )
         self.assertEqual(response.headers["location"], "/my-settings?saved=lanes")
 
     def test_lane_async_save_returns_json_without_redirect(self):
         request = self._request(headers={"x-requested-with": "fetch"})
         with patch.object(settings, "require_user", return_value=self.user):
-            response = asyncio.run(settings.save_my_lanes_settings(
+            response = settings.save_my_lanes_settings(
                 request, lane_ids=[self.lane.id], db=self.db
-            ))
+            )
 
         self.assertEqual(response.status_code, 200)
         self.assertNotIn("location", response.headers)
@@ -1,4 +1,3 @@
-import asyncio
 from datetime import datetime
 import unittest
 from types import SimpleNamespace
@@ -386,10 +385,10 @@ class NavigationShellTests(unittest.TestCase):
 
         user = self._user(role="admin")
         with patch.object(settings, "require_user", return_value=user):
-            response = asyncio.run(settings.administration_page(
+            response = settings.administration_page(
                 _Request("/administration", query="org_id=7"),
                 db=MagicMock(),
-            ))
+            )
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(response.headers["location"], "/company-profile?org_id=7")
@@ -1,5 +1,8 @@
 import datetime as dt
 import io
+import tempfile
+import threading
+import time
 import unittest
 from contextlib import redirect_stdout
 from unittest.mock import patch
@@ -11,6 +14,7 @@ from bidlens.database import Base
 from bidlens.models import (
     DailySnapshot,
     GrantsSourceConfig,
+    IngestLease,
     IngestionRun,
     JobRun,
     Organization,
@@ -19,7 +23,7 @@ from bidlens.models import (
     User,
     Workspace,
 )
-from bidlens.services import operational_jobs
+from bidlens.services import operational_jobs, tenant_executor
 from bidlens.services.job_runs import (
     JOB_STATUS_FAILED,
     JOB_STATUS_PARTIAL_SUCCESS,
@@ -30,6 +34,7 @@ from bidlens.services.job_runs import (
     JOB_TYPE_GRANTS_INGEST,
     JOB_TYPE_SAM_INGEST,
 )
+from bidlens.services.tenant_executor import fair_tenant_order
 
 
 class TrackingSession(Session):
@@ -330,6 +335,10 @@ class OperationalJobTests(unittest.TestCase):
         self.assertEqual(run.details_json["users_eligible"], 2)
         self.assertEqual(run.details_json["already_existed"], 1)
         self.assertEqual(run.details_json["snapshots_created"], 1)
+        self.assertEqual(
+            set(run.details_json["phase_timings_ms"]),
+            {"organization", "user_overlays", "persist"},
+        )
 
     def test_daily_snapshots_partial_failure(self):
         self._workspace_with_users(self.org_id, 2)
@@ -366,6 +375,113 @@ class OperationalJobTests(unittest.TestCase):
         self.assertEqual(run.status, JOB_STATUS_SKIPPED)
         self.assertEqual(run.details_json["users_eligible"], 0)
 
+    def test_fair_tenant_order_starts_organizations_that_waited_longest(self):
+        third = Organization(name="Third Job Org", slug="third-job-org", is_live=True)
+        self.db.add(third)
+        self.db.flush()
+        started = dt.datetime(2026, 7, 13, 6, 0)
+        self.db.add_all([
+            JobRun(organization_id=self.org_id, job_type=JOB_TYPE_GRANTS_INGEST, status=JOB_STATUS_SUCCESS, started_at=started),
+            JobRun(organization_id=self.other_org_id, job_type=JOB_TYPE_GRANTS_INGEST, status=JOB_STATUS_SUCCESS, started_at=started + dt.timedelta(minutes=5)),
+            JobRun(organization_id=third.id, job_type=JOB_TYPE_SAM_INGEST, status=JOB_STATUS_SUCCESS, started_at=started),
+        ])
+        self.db.commit()
+
+        order = fair_tenant_order(self.db, [self.org_id, self.other_org_id, third.id], job_type=JOB_TYPE_GRANTS_INGEST)
+
+        self.assertEqual(order, [third.id, self.other_org_id, self.org_id])
+
+
+class ParallelOperationalJobTests(unittest.TestCase):
+    """Jobs run against a file database so worker threads share its rows."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.engine = create_engine(f"sqlite:///{directory.name}/jobs.sqlite3")
+        self.addCleanup(self.engine.dispose)
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+        self.db = self.Session()
+        self.addCleanup(self.db.close)
+        organizations = [Organization(name=f"Parallel {index}", slug=f"parallel-{index}", is_live=True) for index in range(4)]
+        self.db.add_all(organizations)
+        self.db.flush()
+        self.org_ids = [organization.id for organization in organizations]
+        self.db.add_all([
+            GrantsSourceConfig(organization_id=organization_id, enabled=True, posted_days_back=7, rows=25)
+            for organization_id in self.org_ids
+        ])
+        self.db.commit()
+
+    def test_grants_job_runs_organizations_in_parallel_under_the_upstream_cap(self):
+        lock = threading.Lock()
+        in_flight = {"now": 0, "peak": 0}
+
+        def ingest(db, *, organization_id, **kwargs):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            if organization_id == self.org_ids[1]:
+                raise RuntimeError("token=secret")
+            return {"status": "success", "received": 1, "created": 1, "updated": 0, "errors": 0, "message": "ok"}
+
+        output = io.StringIO()
+        with (
+            patch.object(tenant_executor.config, "JOB_GRANTS_GOV_CONCURRENCY", 2),
+            patch("bidlens.services.operational_jobs.ingest_grants_gov", side_effect=ingest),
+            redirect_stdout(output),
+        ):
+            exit_code = operational_jobs.run_grants_ingest_job(session_factory=self.Session, max_workers=4)
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(in_flight["peak"], 2)
+        statuses = dict(self.db.query(JobRun.organization_id, JobRun.status).filter(JobRun.job_type == JOB_TYPE_GRANTS_INGEST))
+        self.assertEqual(statuses, {
+            self.org_ids[0]: JOB_STATUS_SUCCESS,
+            self.org_ids[1]: JOB_STATUS_FAILED,
+            self.org_ids[2]: JOB_STATUS_SUCCESS,
+            self.org_ids[3]: JOB_STATUS_SUCCESS,
+        })
+        lines = output.getvalue().splitlines()
+        self.assertIn("Organizations processed: 4; Success: 3; Paused: 0; Skipped: 0; Partial success: 0; Failed: 1", lines)
+        self.assertNotIn("secret", output.getvalue())
+        # Each organization's lines are printed together, not interleaved.
+        for organization_id in self.org_ids:
+            start = lines.index(f"Organization {organization_id}")
+            self.assertTrue(lines[start + 1].startswith("JobRun "))
+            self.assertTrue(lines[start + 2].startswith(("Status: ", f"Organization {organization_id} failed")))
+
+    def test_parallel_grants_pulls_take_their_own_ingest_leases(self):
+        lock = threading.Lock()
+        in_flight = {"now": 0, "peak": 0}
+
+        def pull(db, *, organization_id, **kwargs):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            return {"status": "success", "received": 1, "created": 1, "updated": 0, "errors": 0, "message": "ok"}
+
+        # Only the fetch is faked; each pull still goes through ingest_grants_gov's lease.
+        with (
+            patch.object(tenant_executor.config, "JOB_GRANTS_GOV_CONCURRENCY", 2),
+            patch("bidlens.ingest_grants_gov._ingest_grants_gov", side_effect=pull),
+            redirect_stdout(io.StringIO()),
+        ):
+            exit_code = operational_jobs.run_grants_ingest_job(session_factory=self.Session, max_workers=4)
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(in_flight["peak"], 2)
+        statuses = dict(self.db.query(JobRun.organization_id, JobRun.status).filter(JobRun.job_type == JOB_TYPE_GRANTS_INGEST))
+        self.assertEqual(statuses, {organization_id: JOB_STATUS_SUCCESS for organization_id in self.org_ids})
+        self.assertEqual(self.db.query(IngestLease).filter(IngestLease.released_at.is_(None)).count(), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
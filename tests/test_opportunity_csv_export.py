@@ -0,0 +1,136 @@
+import asyncio
+import csv
+import io
+import unittest
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from bidlens.database import Base
+from bidlens.models import Opportunity, Organization, OrganizationMembership, User, UserOpportunity
+from bidlens.query_metrics import count_queries
+from bidlens.routes import opportunities as opportunity_routes
+from bidlens.services import cast_vote
+
+
+def _streamed_rows(response):
+    async def read():
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    return list(csv.reader(io.StringIO(asyncio.run(read()))))
+
+
+class OpportunityCsvExportTests(unittest.TestCase):
+    def setUp(self):
+        # Starlette reads the export generator from a worker thread.
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+        )
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.org = Organization(name="Export Org", slug="export-org")
+        self.db.add(self.org)
+        self.db.flush()
+        self.user = User(email="exporter@example.com", name="Exporter", organization_id=self.org.id)
+        self.teammate = User(email="teammate@example.com", name="Teammate", organization_id=self.org.id)
+        self.db.add_all([self.user, self.teammate])
+        self.db.flush()
+        self.db.add_all([
+            OrganizationMembership(organization_id=self.org.id, user_id=self.user.id, role="admin"),
+            OrganizationMembership(organization_id=self.org.id, user_id=self.teammate.id, role="member"),
+        ])
+        today = date.today()
+        self.opps = []
+        for index in range(5):
+            opp = Opportunity(
+                organization_id=self.org.id,
+                source="sam",
+                source_record_id=f"export-{index}",
+                title=f"Export {index}",
+                agency="Test Agency",
+                opportunity_type="Solicitation",
+                posted_date=today,
+                response_deadline=today + timedelta(days=10 - index),
+                qualification_status="qualified",
+                upserted_at=datetime(2026, 6, 1 + index),
+            )
+            self.db.add(opp)
+            self.opps.append(opp)
+        self.db.commit()
+        cast_vote(self.db, org_id=self.org.id, user_id=self.teammate.id, opp_id=self.opps[0].id, vote="PURSUE")
+        self.db.add(UserOpportunity(
+            organization_id=self.org.id,
+            user_id=self.user.id,
+            opportunity_id=self.opps[1].id,
+            watched=True,
+            notes="Call the CO",
+        ))
+        self.db.commit()
+        self.request_user = self.db.get(User, self.user.id)
+        self.request_user.current_organization_id = self.org.id
+        self.request_user.current_role = "admin"
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _export(self, **params):
+        with (
+            patch.object(opportunity_routes, "require_user", return_value=self.request_user),
+            patch.object(opportunity_routes.config, "CSV_EXPORT_BATCH_SIZE", 2),
+        ):
+            response = opportunity_routes.export_opportunities_csv(SimpleNamespace(), db=self.db, **params)
+            self.assertIsInstance(response, StreamingResponse)
+            with count_queries() as queries:
+                rows = _streamed_rows(response)
+        return rows, queries.count
+
+    def test_feed_export_streams_sql_ordered_rows_with_batched_enrichment(self):
+        rows, query_count = self._export(view="feed", sort="due", direction="asc")
+
+        header, body = rows[0], rows[1:]
+        self.assertEqual(header[:3], ["BidLens ID", "DB ID", "Title"])
+        self.assertEqual([row[2] for row in body], ["Export 4", "Export 3", "Export 2", "Export 1", "Export 0"])
+        by_title = {row[2]: dict(zip(header, row)) for row in body}
+        self.assertEqual(by_title["Export 0"]["Interested Count"], "1")
+        self.assertEqual(by_title["Export 0"]["Users Who Are Interested"], "Teammate")
+        self.assertEqual(by_title["Export 1"]["Watched"], "Yes")
+        self.assertEqual(by_title["Export 1"]["Notes"], "Call the CO")
+        self.assertEqual(by_title["Export 2"]["Days Until Due"], "8")
+        # Three batches of ids, each enriched with a fixed number of queries.
+        self.assertLessEqual(query_count, 1 + 3 * 4)
+
+        rows, _ = self._export(view="feed", sort="imported", direction="asc")
+        self.assertEqual([row[2] for row in rows[1:]], ["Export 0", "Export 1", "Export 2", "Export 3", "Export 4"])
+
+    def test_shortlist_sorts_run_in_sql(self):
+        cast_vote(self.db, org_id=self.org.id, user_id=self.user.id, opp_id=self.opps[3].id, vote="PURSUE")
+        cast_vote(self.db, org_id=self.org.id, user_id=self.user.id, opp_id=self.opps[0].id, vote="PURSUE")
+
+        for sort, expected in (
+            ("pursue", ["Export 0", "Export 3"]),
+            ("deadline", ["Export 3", "Export 0"]),
+        ):
+            with self.subTest(sort=sort):
+                rows, _ = self._export(view="shortlist", sort=sort)
+                self.assertEqual([row[2] for row in rows[1:]], expected)
+        rows, _ = self._export(view="shortlist", sort="activity")
+        self.assertEqual(sorted(row[2] for row in rows[1:]), ["Export 0", "Export 3"])
+
+    def test_triage_export_reads_plain_opportunity_rows(self):
+        self.opps[3].qualification_status = "unreviewed"
+        self.db.commit()
+
+        rows, _ = self._export(view="triage")
+
+        self.assertEqual([row[2] for row in rows[1:]], ["Export 3"])
+        self.assertEqual(rows[1][rows[0].index("Watched")], "No")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,3 @@
-import asyncio
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
@@ -26,7 +25,7 @@ class OpportunityDiscoveryNavigationTests(unittest.TestCase):
 
     def test_legacy_govwin_import_get_redirects_to_manual_import_section(self):
         with patch.object(imports, "require_admin", return_value=self._admin()):
-            response = asyncio.run(imports.govwin_import_page(_Request("/imports/govwin"), db=MagicMock()))
+            response = imports.govwin_import_page(_Request("/imports/govwin"), db=MagicMock())
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(
@@ -36,10 +35,10 @@ class OpportunityDiscoveryNavigationTests(unittest.TestCase):
 
     def test_legacy_connect_sources_get_redirects_to_opportunity_discovery(self):
         with patch.object(connect_sources, "require_admin", return_value=self._admin()):
-            response = asyncio.run(connect_sources.connect_sources_page(
+            response = connect_sources.connect_sources_page(
                 _Request("/connect-sources"),
                 db=MagicMock(),
-            ))
+            )
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(response.headers["location"], "/opportunity-discovery?org_id=7")
@@ -51,7 +50,7 @@ class OpportunityDiscoveryNavigationTests(unittest.TestCase):
             side_effect=HTTPException(status_code=403, detail="admin only"),
         ):
             with self.assertRaises(HTTPException) as raised:
-                asyncio.run(imports.govwin_import_page(_Request("/imports/govwin"), db=MagicMock()))
+                imports.govwin_import_page(_Request("/imports/govwin"), db=MagicMock())
 
         self.assertEqual(raised.exception.status_code, 403)
 
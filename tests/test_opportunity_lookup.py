@@ -1,4 +1,3 @@
-import asyncio
 import datetime as dt
 import unittest
 from unittest.mock import patch
@@ -64,12 +63,12 @@ class OpportunityLookupTests(unittest.TestCase):
 
     def _lookup(self, query: str):
         with patch("bidlens.routes.imports.require_admin", return_value=self.admin):
-            return asyncio.run(imports.opportunity_lookup_page(
+            return imports.opportunity_lookup_page(
                 request=self._request(f"q={query}".encode()),
                 q=query,
                 page=1,
                 db=self.db,
-            ))
+            )
 
     def test_lookup_searches_identifying_fields_and_respects_tenancy(self):
         expected = self._opportunity(
@@ -7,11 +7,11 @@ from sqlalchemy.orm import sessionmaker
 
 from bidlens.database import Base
 from bidlens.ingest_grants_gov import upsert_grants_gov_opportunity
-from bidlens.ingest_sam import upsert_opportunity
+from bidlens.ingest_sam import upsert_opportunities, upsert_opportunity
 from bidlens.models import Opportunity, OpportunityHistoryEvent, OpportunityUpdateEvent, Organization, User, Vote
 from bidlens.services.opportunity_history import EVENT_SOURCE_UPDATED
 from bidlens.services.govwin_import import upsert_govwin_opportunity
-from bidlens.services.opportunity_monitor import apply_source_update
+from bidlens.services.opportunity_monitor import apply_source_update, source_fingerprint
 
 
 class OpportunityMonitorTests(unittest.TestCase):
@@ -188,6 +188,109 @@ class OpportunityMonitorTests(unittest.TestCase):
         history = self.db.query(OpportunityHistoryEvent).one()
         self.assertEqual([recipient.user_id for recipient in history.recipients], [interested.id])
 
+    def test_batched_sam_upsert_matches_per_record_outcomes(self):
+        unchanged = self._opportunity(source_record_id="notice-1")
+        changed = self._opportunity(source_record_id="notice-2")
+        interested = User(email="batch-monitor@example.com", organization_id=self.org.id)
+        self.db.add(interested)
+        self.db.flush()
+        self.db.add(Vote(org_id=self.org.id, opp_id=changed.id, user_id=interested.id, vote="PURSUE"))
+        self.db.commit()
+        previous_updated_at = unchanged.updated_at
+
+        def record(source_record_id, **overrides):
+            values = {
+                "source": "sam",
+                "source_record_id": source_record_id,
+                "sam_notice_id": source_record_id,
+                "title": "Original title",
+                "agency": "Original agency",
+                "opportunity_type": "Solicitation",
+                "posted_date": dt.date(2026, 6, 1),
+                "response_deadline": dt.date(2026, 7, 1),
+            }
+            values.update(overrides)
+            return values
+
+        audits = [{} for _ in range(4)]
+        statuses = upsert_opportunities(
+            self.db,
+            self.org.id,
+            [
+                record("notice-1"),
+                record("notice-2", title="Changed title"),
+                record("notice-3"),
+                record("notice-3", title="Repeated in page"),
+            ],
+            audits=audits,
+        )
+        self.db.commit()
+
+        self.assertEqual(statuses, ["unchanged", "updated", "inserted", "updated"])
+        self.assertEqual(audits[0]["matched_opportunity_id"], unchanged.id)
+        self.assertEqual(audits[1]["changed_fields"]["title"]["after"], "Changed title")
+        inserted = self.db.query(Opportunity).filter(Opportunity.source_record_id == "notice-3").one()
+        self.assertEqual(audits[2]["matched_opportunity_id"], inserted.id)
+        self.assertEqual(inserted.title, "Repeated in page")
+        self.assertEqual(self.db.query(OpportunityUpdateEvent).count(), 2)
+        source_updates = (
+            self.db.query(OpportunityHistoryEvent)
+            .filter(OpportunityHistoryEvent.event_type == EVENT_SOURCE_UPDATED)
+            .order_by(OpportunityHistoryEvent.id)
+            .all()
+        )
+        self.assertEqual([event.opportunity_id for event in source_updates], [changed.id, inserted.id])
+        self.assertEqual([recipient.user_id for recipient in source_updates[0].recipients], [interested.id])
+        self.db.refresh(unchanged)
+        self.assertEqual(unchanged.updated_at, previous_updated_at)
+        self.assertGreater(unchanged.last_seen_at, dt.datetime(2026, 6, 1))
+
+    def test_matching_fingerprint_skips_field_compare_and_marks_page_seen(self):
+        existing = self._opportunity(source_record_id="notice-1")
+        self._opportunity(source_record_id="notice-2")
+        self.db.commit()
+        previous_updated_at = existing.updated_at
+        records = [
+            {
+                "source": "sam",
+                "source_record_id": source_record_id,
+                "sam_notice_id": source_record_id,
+                "title": "Original  title",
+                "agency": "Original agency",
+                "opportunity_type": "Solicitation",
+                "posted_date": dt.date(2026, 6, 1),
+                "response_deadline": dt.date(2026, 7, 1),
+                "raw_source_payload": {"revision": 2},
+            }
+            for source_record_id in ("notice-1", "notice-2")
+        ]
+
+        # No stored fingerprint yet: compared field by field, then recorded.
+        self.assertEqual(upsert_opportunities(self.db, self.org.id, records), ["unchanged", "unchanged"])
+        self.db.commit()
+        self.assertEqual(existing.content_fingerprint, source_fingerprint(records[0]))
+
+        org_id, existing_id = self.org.id, existing.id
+        self.db.expunge_all()
+        with patch("bidlens.services.opportunity_monitor.detect_source_changes") as detect:
+            audits = [{}, {}]
+            statuses = upsert_opportunities(self.db, org_id, records, audits=audits)
+            self.db.commit()
+        detect.assert_not_called()
+
+        self.assertEqual(statuses, ["unchanged", "unchanged"])
+        self.assertEqual(audits[0]["matched_opportunity_id"], existing_id)
+        self.assertEqual(len(self.db.identity_map), 0)
+        reloaded = self.db.get(Opportunity, existing_id)
+        self.assertEqual(reloaded.updated_at, previous_updated_at)
+        self.assertGreater(reloaded.last_seen_at, dt.datetime(2026, 6, 1))
+        self.assertEqual(reloaded.raw_source_payload, {"revision": 1})
+
+        changed = dict(records[0], title="Changed title")
+        self.assertEqual(upsert_opportunities(self.db, org_id, [changed]), ["updated"])
+        self.assertEqual(reloaded.title, "Changed title")
+        self.assertEqual(reloaded.content_fingerprint, source_fingerprint(changed))
+
     @patch("bidlens.services.opportunity_monitor.SalesforceService")
     def test_linked_change_records_successful_salesforce_sync(self, service_class):
         opportunity = self._opportunity(salesforce_opportunity_id="006TEST")
@@ -0,0 +1,129 @@
+import datetime as dt
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from bidlens.database import Base
+from bidlens.models import Opportunity, Organization
+from bidlens.routes import opportunities as opportunity_routes
+from bidlens.search_index import TRIGRAM_COLUMNS
+from bidlens.services import opportunity_search
+from bidlens.services.opportunity_search import (
+    BACKEND_ILIKE,
+    BACKEND_POSTGRES,
+    BACKEND_SQLITE_FTS,
+    SCOPE_FEED,
+    SCOPE_LOOKUP,
+    apply_opportunity_search,
+    opportunity_search_filter,
+    opportunity_search_rank,
+    search_backend,
+)
+
+
+class OpportunitySearchTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.org = Organization(name="Search Org", slug="search-org")
+        self.db.add(self.org)
+        self.db.flush()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _opportunity(self, source_record_id, **overrides):
+        values = {
+            "organization_id": self.org.id,
+            "source": "sam",
+            "source_record_id": source_record_id,
+            "title": "Facilities support",
+            "agency": "General Services Administration",
+            "opportunity_type": "Solicitation",
+            "posted_date": dt.date(2026, 6, 1),
+            "response_deadline": dt.date(2026, 7, 1),
+            "upserted_at": dt.datetime(2026, 6, 1),
+        }
+        values.update(overrides)
+        opportunity = Opportunity(**values)
+        self.db.add(opportunity)
+        self.db.flush()
+        return opportunity
+
+    def _search_ids(self, term, **kwargs):
+        query = apply_opportunity_search(
+            self.db.query(Opportunity).filter(Opportunity.organization_id == self.org.id), term, **kwargs
+        )
+        return [row.id for row in query.order_by(opportunity_search_rank(self.db, term, **kwargs), Opportunity.id)]
+
+    def test_fts_index_is_maintained_and_ranks_title_matches_first(self):
+        self.assertEqual(search_backend(self.db), BACKEND_SQLITE_FTS)
+        body_only = self._opportunity(
+            "body-only",
+            description_text="Includes behavioral health counseling for veterans.",
+        )
+        title_match = self._opportunity("title-match", title="Behavioral Health Services")
+        identifier = self._opportunity("id-row", solicitation_number="W912-26-R-0042")
+        self.db.commit()
+
+        self.assertEqual(self._search_ids("behavioral health"), [title_match.id, body_only.id])
+        self.assertEqual(self._search_ids("behav"), [title_match.id, body_only.id])
+        # Identifier fragments still match as substrings.
+        self.assertEqual(self._search_ids("26-R-004"), [identifier.id])
+
+        self.db.query(Opportunity).filter(Opportunity.id == body_only.id).update(
+            {Opportunity.description_text: "Janitorial services."}, synchronize_session=False
+        )
+        self.db.delete(title_match)
+        self.db.commit()
+        self.assertEqual(self._search_ids("behavioral"), [])
+        self.assertEqual(self._search_ids("janitorial"), [body_only.id])
+
+        # Lookup only searches titles, agencies and identifiers.
+        self.assertEqual(self._search_ids("janitorial", scope=SCOPE_LOOKUP), [])
+
+    def test_ilike_setting_keeps_the_substring_scan(self):
+        partial = self._opportunity("partial", title="Software modernization")
+        self.db.commit()
+
+        with patch.object(opportunity_search.config, "OPPORTUNITY_SEARCH_BACKEND", "ilike"):
+            self.assertEqual(search_backend(self.db), BACKEND_ILIKE)
+            self.assertEqual(self._search_ids("ware"), [partial.id])
+        self.assertEqual(self._search_ids("ware"), [])
+
+    def test_feed_sort_defaults_to_relevance_only_while_searching(self):
+        self.assertEqual(opportunity_routes._normalize_feed_sort("", search_term="health"), "relevance")
+        self.assertEqual(opportunity_routes._normalize_feed_sort("due", search_term="health"), "due")
+        self.assertEqual(opportunity_routes._normalize_feed_sort("relevance"), "imported")
+        self.assertEqual(opportunity_routes._normalize_feed_sort(""), "imported")
+
+    def test_postgres_backend_compiles_to_tsvector_match(self):
+        with patch.object(opportunity_search, "search_backend", return_value=BACKEND_POSTGRES):
+            clause = opportunity_search_filter(self.db, "Health IT", scope=SCOPE_LOOKUP)
+            rank = opportunity_search_rank(self.db, "Health IT")
+
+        sql = str(clause.compile(dialect=postgresql.dialect()))
+        self.assertIn("opportunities.search_vector @@ to_tsquery('english'::regconfig", sql)
+        self.assertEqual(clause.compile(dialect=postgresql.dialect()).params["to_tsquery_1"], "health:*AB & it:*AB")
+        self.assertIn("ts_rank_cd(opportunities.search_vector", str(rank.compile(dialect=postgresql.dialect())))
+
+    def test_substring_arms_only_use_trigram_indexed_columns(self):
+        naics = self._opportunity("naics-row", naics="541611")
+        self.db.commit()
+        # NAICS prefixes match through the text index, not a substring scan.
+        self.assertEqual(self._search_ids("5416"), [naics.id])
+
+        for scope in (SCOPE_FEED, SCOPE_LOOKUP):
+            with patch.object(opportunity_search, "search_backend", return_value=BACKEND_POSTGRES):
+                clause = opportunity_search_filter(self.db, "5416", scope=scope)
+            substring_columns = {arm.left.name for arm in clause.clauses[1:]}
+            self.assertLessEqual(substring_columns, set(TRIGRAM_COLUMNS), scope)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,4 @@
 import unittest
-import asyncio
 from datetime import date, datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -340,7 +339,7 @@ class SortingRouteFlowTests(unittest.TestCase):
             patch.object(opportunity_routes, "user_my_lanes", return_value=[]),
             patch.object(opportunity_routes.templates, "TemplateResponse", side_effect=render),
         ):
-            asyncio.run(route(request=MagicMock(), sort=requested_sort, db=db))
+            route(request=MagicMock(), sort=requested_sort, db=db)
 
         self.assertEqual(captured["sort"], expected_sort)
         self.assertEqual(captured["context"]["sort"], expected_sort)
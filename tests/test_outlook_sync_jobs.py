@@ -115,7 +115,13 @@ class OutlookSyncOperationalJobTests(unittest.TestCase):
 
 class OutlookSchedulerRegistrationTests(unittest.TestCase):
     def test_outlook_job_delegates_to_operational_wrapper(self):
-        with patch("bidlens.scheduler.run_outlook_conversation_sync_job", return_value={"workspaces_synced": 0}) as run_job:
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        self.addCleanup(engine.dispose)
+        with (
+            patch("bidlens.scheduler.SessionLocal", sessionmaker(bind=engine)),
+            patch("bidlens.scheduler.run_outlook_conversation_sync_job", return_value={"workspaces_synced": 0}) as run_job,
+        ):
             result = scheduler.run_outlook_conversation_sync()
         self.assertEqual(result, {"workspaces_synced": 0})
         run_job.assert_called_once_with()
@@ -1,4 +1,3 @@
-import asyncio
 import os
 import unittest
 from types import SimpleNamespace
@@ -226,11 +225,11 @@ class PlatformProvisioningTests(unittest.TestCase):
             base_url="https://bidlens.test",
         )
 
-        response = asyncio.run(platform_routes.accept_invitation(
+        response = platform_routes.accept_invitation(
             result.invitation.token,
             SimpleNamespace(),
             db=self.db,
-        ))
+        )
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(
@@ -249,11 +248,11 @@ class PlatformProvisioningTests(unittest.TestCase):
             base_url="https://bidlens.test",
         )
 
-        response = asyncio.run(auth_routes.login(
+        response = auth_routes.login(
             SimpleNamespace(),
             email=result.owner.email,
             db=self.db,
-        ))
+        )
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(
@@ -281,11 +280,11 @@ class PlatformProvisioningTests(unittest.TestCase):
         ))
         self.db.commit()
 
-        response = asyncio.run(auth_routes.login(
+        response = auth_routes.login(
             SimpleNamespace(),
             email=admin.email,
             db=self.db,
-        ))
+        )
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(
@@ -306,11 +305,11 @@ class PlatformProvisioningTests(unittest.TestCase):
         result.organization.is_live = True
         self.db.commit()
 
-        response = asyncio.run(auth_routes.login(
+        response = auth_routes.login(
             SimpleNamespace(),
             email=result.owner.email,
             db=self.db,
-        ))
+        )
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(
@@ -386,11 +385,11 @@ class PlatformProvisioningTests(unittest.TestCase):
         )
         self.assertEqual(membership.role, "admin")
 
-        response = asyncio.run(auth_routes.login(
+        response = auth_routes.login(
             SimpleNamespace(),
             email="  OWNER@ACME.TEST  ",
             db=self.db,
-        ))
+        )
         self.assertEqual(
             response.headers["location"],
             f"/organization-setup?org_id={result.organization.id}",
@@ -600,11 +599,11 @@ class PlatformProvisioningTests(unittest.TestCase):
             self.assertEqual(result.membership.role, "admin")
             self.assertFalse(is_platform_admin_email(result.owner.email))
 
-            response = asyncio.run(auth_routes.login(
+            response = auth_routes.login(
                 SimpleNamespace(),
                 email=result.owner.email,
                 db=self.db,
-            ))
+            )
 
             self.assertEqual(response.status_code, 303)
             self.assertEqual(
@@ -631,16 +630,16 @@ class PlatformProvisioningTests(unittest.TestCase):
                 base_url="https://bidlens.test",
             )
 
-            platform_response = asyncio.run(auth_routes.login(
+            platform_response = auth_routes.login(
                 SimpleNamespace(),
                 email="josh@joshlaven.com",
                 db=self.db,
-            ))
-            workspace_response = asyncio.run(auth_routes.login(
+            )
+            workspace_response = auth_routes.login(
                 SimpleNamespace(),
                 email="joshuatlaven@gmail.com",
                 db=self.db,
-            ))
+            )
 
             self.assertEqual(platform_response.headers["location"], "/platform")
             self.assertEqual(
@@ -723,11 +722,11 @@ class PlatformProvisioningTests(unittest.TestCase):
         self.assertEqual(diagnostics[0]["workspace_organization_ids"], [provisioned.id])
 
     def test_normal_login_does_not_self_provision_customer_organization(self):
-        response = asyncio.run(auth_routes.login(
+        response = auth_routes.login(
             SimpleNamespace(),
             email="newperson@notprovisioned.test",
             db=self.db,
-        ))
+        )
 
         self.assertEqual(response.status_code, 403)
         self.assertEqual(self.db.query(Organization).count(), 0)
@@ -790,11 +789,11 @@ class PlatformProvisioningTests(unittest.TestCase):
 
         with patch("bidlens.routes.platform.get_current_user", return_value=result.owner):
             with self.assertRaises(HTTPException) as raised:
-                asyncio.run(platform_routes.platform_organization_detail(
+                platform_routes.platform_organization_detail(
                     result.organization.id,
                     self._request(),
                     db=self.db,
-                ))
+                )
 
         self.assertEqual(raised.exception.status_code, 404)
 
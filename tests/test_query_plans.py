@@ -0,0 +1,221 @@
+import datetime as dt
+import random
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from bidlens import fragment_cache
+from bidlens.database import Base
+from bidlens.models import (
+    Opportunity,
+    OpportunityHistoryEvent,
+    Organization,
+    User,
+    UserFeedState,
+    UserOpportunity,
+    Vote,
+)
+from bidlens.routes import opportunities as opportunity_routes
+from bidlens.services.daily_snapshot import _acted_new_feed_ids, _new_feed_candidates
+from bidlens.services.feed_queries import feed_awaiting_review_query
+from bidlens.vote_summary import rebuild_vote_summaries
+
+ORGANIZATIONS = 10
+USERS_PER_ORGANIZATION = 5
+OPPORTUNITIES = 20_000
+HOT_TABLES = (
+    "opportunities",
+    "votes",
+    "user_feed_states",
+    "user_opportunities",
+    "opportunity_history_events",
+    "opportunity_vote_summaries",
+)
+
+
+class HotPathQueryPlanTests(unittest.TestCase):
+    """EXPLAIN the Feed hot paths against a large synthetic tenant mix.
+
+    A query that falls back to a full table scan on one of ``HOT_TABLES`` fails
+    here instead of surfacing as a slow page in production.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_engine("sqlite://")
+        Base.metadata.create_all(cls.engine)
+        cls.session_factory = sessionmaker(bind=cls.engine)
+        rng = random.Random(19)
+        today = dt.date.today()
+        now = dt.datetime.utcnow()
+        with cls.session_factory() as db:
+            organizations = [Organization(name=f"Plan Org {index}", slug=f"plan-org-{index}") for index in range(ORGANIZATIONS)]
+            db.add_all(organizations)
+            db.flush()
+            org_ids = [organization.id for organization in organizations]
+            users = [
+                User(email=f"planner-{org_id}-{index}@example.com", organization_id=org_id)
+                for org_id in org_ids
+                for index in range(USERS_PER_ORGANIZATION)
+            ]
+            db.add_all(users)
+            db.flush()
+            users_by_org: dict[int, list[int]] = {}
+            for user in users:
+                users_by_org.setdefault(user.organization_id, []).append(user.id)
+
+            db.execute(insert(Opportunity), [
+                {
+                    "organization_id": org_ids[index % ORGANIZATIONS],
+                    "source": "sam",
+                    "source_record_id": f"plan-{index}",
+                    "title": f"Plan opportunity {index}",
+                    "agency": "Test Agency",
+                    "opportunity_type": "Solicitation",
+                    "posted_date": today,
+                    "response_deadline": today + dt.timedelta(days=rng.randint(-60, 120)),
+                    "qualification_status": rng.choice(("qualified", "qualified", "unreviewed", "disqualified")),
+                    "decision_state": "ARCHIVED" if rng.random() < 0.1 else "INBOX",
+                    "created_at": now - dt.timedelta(hours=rng.randint(0, 24 * 90)),
+                }
+                for index in range(OPPORTUNITIES)
+            ])
+            votes, feed_states, follows, history = [], [], [], []
+            for opportunity_id, org_id in db.query(Opportunity.id, Opportunity.organization_id).all():
+                for user_id in users_by_org[org_id]:
+                    roll = rng.random()
+                    if roll < 0.15:
+                        vote = "PURSUE" if roll < 0.05 else "PASS"
+                        votes.append({"org_id": org_id, "opp_id": opportunity_id, "user_id": user_id, "vote": vote})
+                        feed_states.append({
+                            "organization_id": org_id, "opportunity_id": opportunity_id, "user_id": user_id,
+                            "vote": vote, "watched": False,
+                        })
+                    elif roll > 0.99:
+                        follows.append({
+                            "organization_id": org_id, "opportunity_id": opportunity_id, "user_id": user_id, "watched": True,
+                        })
+                for _ in range(rng.randint(0, 3)):
+                    history.append({
+                        "organization_id": org_id,
+                        "opportunity_id": opportunity_id,
+                        "event_type": rng.choice(("source_updated", "qualified", "imported")),
+                        "occurred_at": now - dt.timedelta(hours=rng.randint(0, 24 * 30)),
+                    })
+            db.execute(insert(Vote), votes)
+            db.execute(insert(UserFeedState), feed_states)
+            db.execute(insert(UserOpportunity), follows)
+            db.execute(insert(OpportunityHistoryEvent), history)
+            rebuild_vote_summaries(db.connection())
+            db.commit()
+            db.execute(text("ANALYZE"))
+            db.commit()
+            cls.org_id = org_ids[3]
+            cls.user_id = users_by_org[cls.org_id][0]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def setUp(self):
+        # Plan the queries themselves, not cached sidebar/count fragments.
+        fragment_ttl = patch.object(fragment_cache.config, "FRAGMENT_CACHE_SECONDS", 0)
+        fragment_ttl.start()
+        self.addCleanup(fragment_ttl.stop)
+        self.db = self.session_factory()
+        self.user = self.db.get(User, self.user_id)
+        self.user.current_organization_id = self.org_id
+        self.user.current_role = "member"
+
+    def tearDown(self):
+        self.db.close()
+
+    def _plans(self, run) -> list[str]:
+        """Run ``run`` and return the EXPLAIN QUERY PLAN lines of its SELECTs."""
+        statements = []
+
+        def capture(_conn, _cursor, statement, parameters, _context, _executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        event.listen(self.engine, "before_cursor_execute", capture)
+        try:
+            run()
+        finally:
+            event.remove(self.engine, "before_cursor_execute", capture)
+        self.assertTrue(statements)
+        connection = self.db.connection()
+        return [
+            row[-1]
+            for statement, parameters in statements
+            for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        ]
+
+    def assertNoHotTableScan(self, plans: list[str]) -> None:
+        scans = [line for line in plans if line.startswith("SCAN ") and line.split()[1] in HOT_TABLES]
+        self.assertEqual(scans, [], "\n".join(plans))
+
+    def assertUsesIndex(self, plans: list[str], index_name: str) -> None:
+        self.assertTrue(any(index_name in line for line in plans), "\n".join(plans))
+
+    def _feed_rows(self):
+        return (
+            feed_awaiting_review_query(self.db, organization_id=self.org_id, user_id=self.user_id)
+            .order_by(Opportunity.response_deadline.asc(), Opportunity.id.asc())
+            .limit(25)
+            .all()
+        )
+
+    def test_feed_awaiting_review_query_uses_the_partial_feed_index(self):
+        plans = self._plans(self._feed_rows)
+
+        self.assertNoHotTableScan(plans)
+        self.assertUsesIndex(plans, "ix_opportunities_org_feed_deadline")
+        self.assertUsesIndex(plans, "user_feed_states")
+
+    def test_queue_and_triage_counts_search_by_organization(self):
+        plans = self._plans(lambda: opportunity_routes._queue_counts(self.db, self.user, "all"))
+        self.assertNoHotTableScan(plans)
+        self.assertTrue(
+            any(line.startswith("SEARCH opportunities USING") and "ix_opportunities_org_" in line for line in plans),
+            "\n".join(plans),
+        )
+
+        plans = self._plans(lambda: opportunity_routes._triage_counts(self.db, self.user))
+        self.assertNoHotTableScan(plans)
+        self.assertUsesIndex(plans, "ix_opportunities_org_qualification_upserted")
+
+    def test_sidebar_reads_the_users_votes_through_the_composite_index(self):
+        plans = self._plans(lambda: opportunity_routes.get_sidebar(self.db, self.user))
+
+        self.assertNoHotTableScan(plans)
+        self.assertUsesIndex(plans, "ix_votes_org_user_vote")
+
+    def test_enrich_opps_reads_history_through_the_composite_index(self):
+        rows = self._feed_rows()
+
+        plans = self._plans(lambda: opportunity_routes._enrich_opps(rows, self.db, self.user))
+
+        self.assertNoHotTableScan(plans)
+        self.assertUsesIndex(plans, "ix_opportunity_history_events_org_opp_type_occurred")
+
+    def test_daily_snapshot_new_feed_window_searches_by_creation_time(self):
+        now = dt.datetime.utcnow()
+
+        window = {"organization_id": self.org_id, "start_at": now - dt.timedelta(days=1), "end_before": now}
+
+        def new_feed():
+            _new_feed_candidates(self.db, **window)
+            _acted_new_feed_ids(self.db, user_ids=[self.user_id], **window)
+
+        plans = self._plans(new_feed)
+
+        self.assertNoHotTableScan(plans)
+        self.assertUsesIndex(plans, "ix_opportunities_org_created")
+        self.assertUsesIndex(plans, "ix_votes_org_user_vote")
+
+
+if __name__ == "__main__":
+    unittest.main()
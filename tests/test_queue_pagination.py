@@ -1,11 +1,13 @@
 import unittest
 from datetime import date, datetime, timedelta
 from types import SimpleNamespace
+from unittest.mock import patch
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from bidlens.database import Base
+from bidlens.fragment_cache import FragmentCache, MemoryFragmentStore
 from bidlens.models import Opportunity, Organization, Vote
 from bidlens.routes.opportunities import (
     FEED_PAGE_SIZE,
@@ -16,7 +18,10 @@ from bidlens.routes.opportunities import (
     _my_shortlist_query,
     _normalize_triage_source_filters,
     _pagination_values,
+    _queue_page,
 )
+from bidlens.routes import opportunities as opportunity_routes
+from bidlens.services.queue_pagination import decode_cursor
 
 
 class QueuePaginationTests(unittest.TestCase):
@@ -173,6 +178,100 @@ class QueuePaginationTests(unittest.TestCase):
         self.assertEqual(_apply_triage_source_filter(base, "").count(), 0)
         self.assertEqual(_apply_triage_source_filter(base, None).count(), 3)
 
+    def _ordered_feed(self, sort, direction):
+        return _apply_feed_ordering(
+            _feed_query(self.db, self.user, "solicitations"),
+            sort=sort,
+            direction=direction,
+            organization_id=self.org.id,
+        )
+
+    def test_cursor_pages_walk_every_sort_forward_and_back(self):
+        agencies = ["army", "Army", "NAVY", "navy", "Air Force"]
+        for index in range(13):
+            opportunity = self._opportunity(
+                "sam",
+                f"rec-{index}",
+                None if index % 5 == 0 else datetime(2026, 6, 1 + index % 3),
+            )
+            opportunity.agency = agencies[index % len(agencies)]
+            opportunity.title = f"Title {index % 4}"
+            opportunity.response_deadline = date.today() + timedelta(days=10 + index % 2)
+            self.db.add(opportunity)
+        self.db.commit()
+
+        for sort in ("imported", "due", "agency", "title", "lane"):
+            for direction in ("asc", "desc"):
+                with self.subTest(sort=sort, direction=direction):
+                    query = self._ordered_feed(sort, direction)
+                    expected = [row[0].id for row in query.all()]
+                    page_kwargs = dict(
+                        sort=sort, direction=direction, organization_id=self.org.id,
+                        page=1, page_size=5, user_id=self.user.id, count_key=("test", sort, direction),
+                    )
+                    pages = []
+                    after = ""
+                    while True:
+                        queue_page, result_count, total_pages = _queue_page(query, after=after, **page_kwargs)
+                        pages.append((queue_page, [row[0].id for row in queue_page.rows]))
+                        if not queue_page.next_cursor:
+                            break
+                        after = queue_page.next_cursor
+                    self.assertEqual([opp_id for _page, ids in pages for opp_id in ids], expected)
+                    self.assertEqual([page.page for page, _ids in pages], [1, 2, 3])
+                    self.assertEqual((result_count, total_pages), (13, 3))
+
+                    before = pages[-1][0].prev_cursor
+                    for previous, ids in reversed(pages[:-1]):
+                        queue_page, _count, _pages = _queue_page(query, before=before, **page_kwargs)
+                        self.assertEqual([row[0].id for row in queue_page.rows], ids)
+                        self.assertEqual(queue_page.page, previous.page)
+                        before = queue_page.prev_cursor
+                    self.assertIsNone(before)
+
+    def test_counts_are_cached_until_invalidated_and_legacy_page_links_still_work(self):
+        self.db.add_all(
+            self._opportunity("sam", f"rec-{index}", datetime(2026, 6, 1) + timedelta(minutes=index))
+            for index in range(FEED_PAGE_SIZE + 3)
+        )
+        self.db.commit()
+        query = self._ordered_feed("imported", "desc")
+        expected = [row[0].id for row in query.all()]
+
+        cache = FragmentCache(MemoryFragmentStore())
+        with patch.object(opportunity_routes, "fragment_cache", cache):
+            first, count, total_pages = _queue_page(
+                query, sort="imported", direction="desc", organization_id=self.org.id,
+                page=1, page_size=FEED_PAGE_SIZE, user_id=self.user.id, count_key=("feed",),
+            )
+            self.assertEqual((count, total_pages), (FEED_PAGE_SIZE + 3, 2))
+            self.assertEqual(decode_cursor(first.next_cursor, ordering="imported:desc", key_count=2)[1], 2)
+
+            self.db.delete(self.db.get(Opportunity, expected[0]))
+            self.db.commit()
+            legacy, count, _pages = _queue_page(
+                query, sort="imported", direction="desc", organization_id=self.org.id,
+                page=2, page_size=FEED_PAGE_SIZE, user_id=self.user.id, count_key=("feed",),
+            )
+            # The cached total is reused; the page itself is read live.
+            self.assertEqual(count, FEED_PAGE_SIZE + 3)
+            self.assertEqual([row[0].id for row in legacy.rows], expected[FEED_PAGE_SIZE + 1:])
+            self.assertIsNotNone(legacy.prev_cursor)
+
+            tampered, _count, _pages = _queue_page(
+                query, sort="imported", direction="desc", organization_id=self.org.id,
+                page=1, page_size=FEED_PAGE_SIZE, user_id=self.user.id, count_key=("feed",), after="not-a-cursor",
+            )
+            self.assertEqual([row[0].id for row in tampered.rows], expected[1:FEED_PAGE_SIZE + 1])
+
+            # A vote, watch, state change or ingest drops the cached total.
+            cache.invalidate_user(self.db, organization_id=self.org.id, user_id=self.user.id)
+            _legacy, count, _pages = _queue_page(
+                query, sort="imported", direction="desc", organization_id=self.org.id,
+                page=2, page_size=FEED_PAGE_SIZE, user_id=self.user.id, count_key=("feed",),
+            )
+            self.assertEqual(count, FEED_PAGE_SIZE + 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,3 @@
-import asyncio
 from datetime import datetime, timedelta, timezone
 import hashlib
 from pathlib import Path
@@ -310,10 +309,10 @@ class SalesforceConfigurationTests(unittest.TestCase):
         with patch.object(integrations, "SalesforceService", return_value=service) as service_class, patch.object(
             integrations, "_admin_or_redirect", return_value=(self.admin, None)
         ):
-            response = asyncio.run(integrations.validate_salesforce_setup(
+            response = integrations.validate_salesforce_setup(
                 SimpleNamespace(query_params={"org_id": str(self.org_a.id)}),
                 self.db,
-            ))
+            )
 
         self.assertEqual(response.status_code, 200)
         service_class.assert_called_once_with(db=self.db, workspace_id=self.org_a.id)
@@ -531,10 +530,10 @@ class SalesforceConfigurationTests(unittest.TestCase):
         with patch.object(integrations, "get_current_user", return_value=self.member), patch.object(
             integrations, "attach_request_user_context", return_value=self.member
         ):
-            response = asyncio.run(integrations.validate_salesforce_setup(
+            response = integrations.validate_salesforce_setup(
                 SimpleNamespace(query_params={"org_id": str(self.org_a.id)}),
                 self.db,
-            ))
+            )
 
         self.assertEqual(response.status_code, 303)
 
@@ -590,7 +589,7 @@ class SalesforceConfigurationTests(unittest.TestCase):
         self.db.add(opportunity)
         self.db.commit()
         with patch.object(integrations, "_admin_or_redirect", return_value=(self.admin, None)):
-            response = asyncio.run(integrations.disconnect_salesforce(SimpleNamespace(), self.db))
+            response = integrations.disconnect_salesforce(SimpleNamespace(), self.db)
         self.assertEqual(response.status_code, 303)
         self.assertIsNone(connection.encrypted_access_token)
         self.assertIsNone(connection.encrypted_refresh_token)
@@ -0,0 +1,144 @@
+import datetime as dt
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+import requests
+
+from bidlens.sam_client import SamClient, SamRateLimitError, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+def _response(status_code=200, *, json_payload=None, headers=None, text=""):
+    response = Mock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = text
+    response.url = "https://api.sam.gov/opportunities/v2/search"
+    if json_payload is None:
+        response.json.side_effect = ValueError("no json")
+    else:
+        response.json.return_value = json_payload
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_bucket_spaces_requests_and_pause_holds_everyone_back(self):
+        clock = FakeClock()
+        bucket = TokenBucket(2, capacity=2, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(3)]
+        self.assertEqual(waits, [0.0, 0.0, 0.5])
+
+        bucket.pause(10)
+        self.assertEqual(bucket.acquire(), 10.0)
+        self.assertAlmostEqual(clock.now, 10.5)
+
+
+class SamClientTests(unittest.TestCase):
+    def _client(self, session, clock=None, **kwargs):
+        clock = clock or FakeClock()
+        return SamClient(
+            api_key="test-key",
+            requests_per_second=kwargs.pop("requests_per_second", 1000),
+            burst=kwargs.pop("burst", 1000),
+            session=session,
+            clock=clock,
+            sleep=clock.sleep,
+            **kwargs,
+        )
+
+    def _search(self, client, **kwargs):
+        return client.search_opportunities(
+            naics="541611",
+            posted_from=dt.date(2026, 6, 1),
+            posted_to=dt.date(2026, 6, 30),
+            **kwargs,
+        )
+
+    def test_search_reuses_pooled_session_and_waits_out_retry_after(self):
+        clock = FakeClock()
+        session = Mock()
+        session.get.side_effect = [
+            _response(429, json_payload={"message": "slow down"}, headers={"Retry-After": "3"}),
+            _response(200, json_payload={"opportunitiesData": [], "totalRecords": 0}),
+        ]
+        client = self._client(session, clock)
+
+        payload = self._search(client)
+
+        self.assertEqual(payload["totalRecords"], 0)
+        self.assertEqual(session.get.call_count, 2)
+        self.assertEqual(clock.sleeps, [3.0])
+
+    def test_next_access_time_blocks_api_calls_until_quota_resets(self):
+        clock = FakeClock()
+        next_access = (dt.datetime.now(dt.timezone.utc) + dt.timedelta(hours=2)).strftime("%Y-%b-%d %H:%M:%S+0000 UTC")
+        session = Mock()
+        session.get.return_value = _response(
+            429,
+            json_payload={"description": "Quota exceeded", "nextAccessTime": next_access},
+        )
+        client = self._client(session, clock)
+
+        with self.assertRaises(SamRateLimitError) as first:
+            self._search(client, allow_rate_limit_wait=False)
+        with self.assertRaises(SamRateLimitError) as second:
+            client.fetch_notice_description("https://api.sam.gov/prod/opportunities/v1/noticedesc?noticeid=abc")
+
+        self.assertEqual(session.get.call_count, 1)
+        self.assertEqual(first.exception.retry_after, next_access)
+        self.assertGreater(second.exception.retry_after_seconds, 7000)
+        self.assertEqual(second.exception.retry_after, next_access)
+
+    def test_descriptions_resolve_in_parallel_in_input_order_within_the_in_flight_cap(self):
+        lock = threading.Lock()
+        state = {"in_flight": 0, "peak": 0}
+
+        def get(url, **_kwargs):
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(0.02)
+            with lock:
+                state["in_flight"] -= 1
+            notice = url.split("noticeid=")[1].split("&")[0]
+            if notice == "n3":
+                return _response(429, json_payload={"message": "slow down"}, headers={"Retry-After": "1"})
+            return _response(200, json_payload={"description": f"Description {notice}"}, headers={"Content-Type": "application/json"})
+
+        session = Mock()
+        session.get.side_effect = get
+        client = SamClient(api_key="test-key", requests_per_second=1000, burst=1000, max_in_flight=3, session=session)
+        notices = [(f"https://api.sam.gov/prod/opportunities/v1/noticedesc?noticeid=n{index}", None) for index in range(8)]
+
+        outcomes = client.resolve_notice_descriptions(notices)
+
+        self.assertEqual(
+            [description for description, _error in outcomes],
+            [f"Description n{index}" if index != 3 else None for index in range(8)],
+        )
+        self.assertIsInstance(outcomes[3][1], SamRateLimitError)
+        self.assertLessEqual(state["peak"], 3)
+        self.assertGreater(state["peak"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+import datetime as dt
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from bidlens.database import Base
+from bidlens.ingest_sam import pull_sam_into_db
+from bidlens.models import Opportunity, Organization, SamSearchCacheEntry
+from bidlens.services.sam_search_cache import (
+    SamSearchCache,
+    _payload_bytes,
+    prune_sam_search_cache,
+)
+
+
+def _record(record_id):
+    today = dt.date.today()
+    return {
+        "noticeId": record_id,
+        "title": f"Opportunity {record_id}",
+        "department": "HHS",
+        "type": "Solicitation",
+        "postedDate": today.isoformat(),
+        "responseDeadLine": (today + dt.timedelta(days=30)).isoformat(),
+        "uiLink": f"https://sam.gov/opp/{record_id}",
+    }
+
+
+class SamSearchCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.org = Organization(name="Cache Org", slug="cache-org")
+        self.other_org = Organization(name="Other Cache Org", slug="other-cache-org")
+        self.db.add_all([self.org, self.other_org])
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    @patch("bidlens.ingest_sam.search_opportunities")
+    def test_tenants_watching_the_same_naics_share_one_fetch(self, search_opportunities):
+        search_opportunities.return_value = {
+            "totalRecords": 2,
+            "opportunitiesData": [_record("shared-1"), _record("shared-2")],
+        }
+
+        first = pull_sam_into_db(self.db, organization_id=self.org.id, naics="541611")
+        second = pull_sam_into_db(
+            self.db,
+            organization_id=self.other_org.id,
+            naics="541611",
+            max_records=1,
+            search_cache=SamSearchCache(),
+        )
+
+        self.assertEqual(search_opportunities.call_count, 1)
+        self.assertEqual(search_opportunities.call_args.kwargs["limit"], 100)
+        self.assertEqual(first["search_cache_hits"], 0)
+        self.assertEqual(first["inserted"], 2)
+        self.assertEqual(second["search_cache_hits"], 1)
+        self.assertEqual(second["inserted"], 1)
+        self.assertEqual(
+            self.db.query(Opportunity).filter(Opportunity.organization_id == self.other_org.id).count(),
+            1,
+        )
+        entry = self.db.query(SamSearchCacheEntry).one()
+        self.assertEqual(entry.hit_count, 1)
+        self.assertNotIn("api_key", entry.request_params)
+
+    @patch("bidlens.ingest_sam.search_opportunities")
+    def test_expired_pages_are_fetched_again(self, search_opportunities):
+        search_opportunities.return_value = {"totalRecords": 1, "opportunitiesData": [_record("fresh")]}
+        pull_sam_into_db(self.db, organization_id=self.org.id, naics="541611")
+        self.db.query(SamSearchCacheEntry).update(
+            {SamSearchCacheEntry.expires_at: dt.datetime.now(dt.timezone.utc) - dt.timedelta(seconds=1)}
+        )
+        self.db.commit()
+
+        result = pull_sam_into_db(self.db, organization_id=self.org.id, naics="541611")
+
+        self.assertEqual(search_opportunities.call_count, 2)
+        self.assertEqual(result["search_cache_hits"], 0)
+
+    def test_disabled_cache_always_fetches(self):
+        calls = []
+
+        def fetch(**kwargs):
+            calls.append(kwargs)
+            return {"opportunitiesData": []}
+
+        cache = SamSearchCache(ttl_seconds=0)
+        for _ in range(2):
+            cache.search(
+                self.db,
+                fetch,
+                naics="541611",
+                posted_from=dt.date(2026, 7, 1),
+                posted_to=dt.date(2026, 7, 8),
+                limit=10,
+            )
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0]["limit"], 10)
+        self.assertEqual(self.db.query(SamSearchCacheEntry).count(), 0)
+
+    def test_organizations_pulled_in_parallel_wait_for_one_fetch(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        engine = create_engine(f"sqlite:///{directory.name}/cache.sqlite3")
+        self.addCleanup(engine.dispose)
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        calls = []
+
+        def fetch(**kwargs):
+            calls.append(kwargs)
+            time.sleep(0.05)
+            return {"opportunitiesData": [_record("parallel")]}
+
+        cache = SamSearchCache()
+        served_from_cache = []
+
+        def pull():
+            with Session() as db:
+                _payload, hit = cache.search_page(
+                    db, fetch, naics="541611", posted_from=dt.date(2026, 7, 1), posted_to=dt.date(2026, 7, 8)
+                )
+                served_from_cache.append(hit)
+                db.commit()
+
+        threads = [threading.Thread(target=pull) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(served_from_cache), [False, True, True, True])
+        self.assertEqual(cache.stats(), {"search_cache_hits": 3, "search_cache_misses": 1})
+
+    def test_fetched_pages_survive_a_tenant_rollback(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        engine = create_engine(f"sqlite:///{directory.name}/cache.sqlite3")
+        self.addCleanup(engine.dispose)
+
+        # Real transactions (pysqlite otherwise commits on SAVEPOINT release),
+        # with WAL so the tenant's open read does not block the cache writer.
+        @event.listens_for(engine, "connect")
+        def _connect(dbapi_connection, _record):
+            dbapi_connection.isolation_level = None
+            dbapi_connection.execute("PRAGMA journal_mode=WAL")
+
+        @event.listens_for(engine, "begin")
+        def _begin(connection):
+            connection.exec_driver_sql("BEGIN")
+
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+
+        with Session() as db:
+            SamSearchCache().search(
+                db,
+                lambda **kwargs: {"opportunitiesData": [_record("kept")]},
+                naics="541611",
+                posted_from=dt.date(2026, 7, 1),
+                posted_to=dt.date(2026, 7, 8),
+            )
+            db.rollback()
+
+        with Session() as db:
+            entry = db.query(SamSearchCacheEntry).one()
+        self.assertEqual(entry.payload["opportunitiesData"][0]["noticeId"], "kept")
+
+    def test_prune_evicts_expired_then_least_recently_read_pages(self):
+        now = dt.datetime.now(dt.timezone.utc)
+        self.db.add_all([
+            SamSearchCacheEntry(
+                cache_key="expired",
+                payload={},
+                size_bytes=10,
+                expires_at=now - dt.timedelta(minutes=1),
+                last_accessed_at=now,
+            ),
+            SamSearchCacheEntry(
+                cache_key="stale-read",
+                payload={},
+                size_bytes=60,
+                expires_at=now + dt.timedelta(hours=1),
+                last_accessed_at=now - dt.timedelta(minutes=30),
+            ),
+            SamSearchCacheEntry(
+                cache_key="recent-read",
+                payload={},
+                size_bytes=60,
+                expires_at=now + dt.timedelta(hours=1),
+                last_accessed_at=now,
+            ),
+        ])
+        self.db.commit()
+
+        removed = prune_sam_search_cache(self.db, max_bytes=100, now=now)
+
+        self.assertEqual(removed, 2)
+        self.assertEqual(
+            [entry.cache_key for entry in self.db.query(SamSearchCacheEntry).all()],
+            ["recent-read"],
+        )
+
+    def test_run_memo_evicts_least_recently_served_pages_beyond_max_bytes(self):
+        calls = []
+
+        def fetch(**kwargs):
+            calls.append(kwargs["naics"])
+            return {"opportunitiesData": [_record(kwargs["naics"])]}
+
+        page_bytes = _payload_bytes(fetch(naics="000000"))
+        calls.clear()
+        cache = SamSearchCache(max_bytes=page_bytes * 2 + page_bytes // 2)
+        with patch.object(cache, "_read", return_value=None):
+            for naics in ("111111", "222222", "111111", "333333", "111111", "222222"):
+                cache.search(self.db, fetch, naics=naics, posted_from=dt.date(2026, 7, 1), posted_to=dt.date(2026, 7, 8))
+
+        self.assertEqual(calls, ["111111", "222222", "333333", "222222"])
+        self.assertEqual(len(cache._pages), 2)
+        self.assertLessEqual(cache._page_bytes, cache.max_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
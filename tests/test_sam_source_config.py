@@ -1,4 +1,3 @@
-import asyncio
 import datetime as dt
 import unittest
 from unittest.mock import patch
@@ -23,6 +22,7 @@ from bidlens.models import (
     User,
 )
 from bidlens.routes import imports, sam
+from bidlens.services import sam_pulls
 from bidlens.sam_client import SamRateLimitError
 from bidlens.services.sam_source_config import (
     SamConfigValidationError,
@@ -418,7 +418,7 @@ class SamSourceConfigurationTests(unittest.TestCase):
         request = self._request(query_string=f"org_id={self.org.id}".encode())
         setattr(self.admin, "current_organization_id", self.org.id)
         with patch("bidlens.routes.imports.require_admin", return_value=self.admin):
-            response = asyncio.run(imports.save_sam_source_config(
+            response = imports.save_sam_source_config(
                 request=request,
                 config_id="",
                 search_name="Federal health",
@@ -433,7 +433,7 @@ class SamSourceConfigurationTests(unittest.TestCase):
                 active_only="1",
                 max_records="100",
                 db=self.db,
-            ))
+            )
 
         config = self.db.query(SamSourceConfig).one()
         self.assertEqual(config.organization_id, self.org.id)
@@ -526,7 +526,7 @@ class SamSourceConfigurationTests(unittest.TestCase):
             "message": "Pull completed.",
         }
 
-        sam.record_sam_source_activity(
+        sam_pulls.record_sam_source_activity(
             self.db,
             organization_id=self.org.id,
             user_id=self.admin.id,
@@ -1,4 +1,3 @@
-import asyncio
 import unittest
 from types import SimpleNamespace
 from unittest.mock import patch
@@ -41,7 +40,7 @@ class FeedRulesOnboardingTests(unittest.TestCase):
 
     def test_pre_live_feed_rules_save_records_completion_and_stays_on_settings(self):
         with patch("bidlens.routes.settings.require_user", return_value=self.admin):
-            response = asyncio.run(settings_save(
+            response = settings_save(
                 self._request(),
                 include_keywords="research",
                 exclude_keywords="construction",
@@ -54,7 +53,7 @@ class FeedRulesOnboardingTests(unittest.TestCase):
                 digest_time_local="07:00",
                 triage_enabled="1",
                 db=self.db,
-            ))
+            )
 
         event = (
             self.db.query(Event)
@@ -70,7 +69,7 @@ class FeedRulesOnboardingTests(unittest.TestCase):
         self.db.commit()
 
         with patch("bidlens.routes.settings.require_user", return_value=self.admin):
-            response = asyncio.run(settings_save(
+            response = settings_save(
                 self._request(),
                 include_keywords="research",
                 exclude_keywords="",
@@ -83,7 +82,7 @@ class FeedRulesOnboardingTests(unittest.TestCase):
                 digest_time_local="07:00",
                 triage_enabled=None,
                 db=self.db,
-            ))
+            )
 
         self.assertEqual(response.status_code, 303)
         self.assertEqual(response.headers["location"], f"/settings?org_id={self.org.id}&saved=1")
@@ -0,0 +1,224 @@
+import datetime as dt
+import json
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from bidlens.database import Base
+from bidlens.models import (
+    IngestionRun,
+    Organization,
+    OrganizationMembership,
+    SamSourceConfig,
+    SourcePullJob,
+    User,
+)
+from bidlens.routes import grants, sam
+from bidlens.services import source_pull_jobs
+from bidlens.services.source_pull_jobs import (
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    SOURCE_GRANTS,
+    SOURCE_SAM,
+    claim_next_source_pull,
+    enqueue_source_pull,
+    run_source_pull_job,
+    run_source_pull_worker,
+    source_pull_job_payload,
+)
+
+
+class SourcePullJobTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+        self.db = self.Session()
+        self.org = Organization(name="Pull Queue Org", slug="pull-queue-org")
+        self.db.add(self.org)
+        self.db.flush()
+        self.admin = User(email="queue-admin@example.com", organization_id=self.org.id)
+        self.db.add(self.admin)
+        self.db.flush()
+        self.db.add(OrganizationMembership(organization_id=self.org.id, user_id=self.admin.id, role="admin"))
+        self.config = SamSourceConfig(
+            organization_id=self.org.id,
+            name="Federal health",
+            naics_codes=["541611"],
+            keywords=[],
+            agencies=[],
+            set_asides=[],
+            notice_types=["Solicitation"],
+        )
+        self.db.add(self.config)
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    @staticmethod
+    def _request(path):
+        return Request({"type": "http", "method": "POST", "path": path, "query_string": b"", "headers": []})
+
+    def _runner(self, *outcomes):
+        calls = []
+        remaining = list(outcomes)
+
+        def runner(db, job):
+            calls.append(job.id)
+            outcome = remaining.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        return runner, calls
+
+    def test_queue_mode_routes_enqueue_and_return_job_immediately(self):
+        with (
+            patch.object(sam.app_config, "SOURCE_PULL_QUEUE_ENABLED", True),
+            patch.object(grants.config, "SOURCE_PULL_QUEUE_ENABLED", True),
+            patch("bidlens.routes.sam.current_org_id", return_value=self.org.id),
+            patch("bidlens.routes.grants.current_org_id", return_value=self.org.id),
+            patch("bidlens.services.sam_pulls.ingest_sam") as ingest,
+        ):
+            sam_response = sam.pull_now(self._request("/sam/pull-now"), user=self.admin, db=self.db)
+            repeat_response = sam.pull_now(self._request("/sam/pull-now"), user=self.admin, db=self.db)
+            grants_response = grants.pull_now(self._request("/grants/pull-now"), user=self.admin, db=self.db)
+
+        ingest.assert_not_called()
+        self.assertEqual(sam_response.status_code, 202)
+        sam_payload = json.loads(sam_response.body)
+        self.assertEqual(sam_payload["status"], JOB_STATUS_QUEUED)
+        self.assertEqual(sam_payload["status_url"], f"/sam/pull-jobs/{sam_payload['job_id']}")
+        self.assertEqual(json.loads(repeat_response.body)["job_id"], sam_payload["job_id"])
+        self.assertEqual(json.loads(grants_response.body)["status_url"], f"/grants/pull-jobs/{json.loads(grants_response.body)['job_id']}")
+        jobs = self.db.query(SourcePullJob).order_by(SourcePullJob.id).all()
+        self.assertEqual([(job.source, job.params_json) for job in jobs], [
+            (SOURCE_SAM, {"search_id": self.config.id}),
+            (SOURCE_GRANTS, {}),
+        ])
+
+    def test_worker_runs_job_and_status_endpoint_returns_route_payload(self):
+        job = enqueue_source_pull(
+            self.db,
+            organization_id=self.org.id,
+            user_id=self.admin.id,
+            source=SOURCE_SAM,
+            params={"search_id": self.config.id},
+        )
+        runner, calls = self._runner((200, {"status": "success", "run_id": None, "message": "Pull completed."}, {}))
+
+        with patch.dict(source_pull_jobs.SOURCE_PULL_RUNNERS, {SOURCE_SAM: runner}):
+            processed = run_source_pull_worker(worker_id="worker-a", once=True, session_factory=self.Session)
+
+        self.assertEqual(processed, 1)
+        self.assertEqual(calls, [job.id])
+        self.db.expire_all()
+        with patch("bidlens.routes.sam.current_org_id", return_value=self.org.id):
+            response = sam.pull_job_status(self._request(f"/sam/pull-jobs/{job.id}"), job.id, user=self.admin, db=self.db)
+        payload = json.loads(response.body)
+        self.assertEqual(payload["status"], JOB_STATUS_COMPLETED)
+        self.assertTrue(payload["done"])
+        self.assertEqual(payload["response_status_code"], 200)
+        self.assertEqual(payload["result"]["message"], "Pull completed.")
+
+    def test_failures_retry_with_backoff_until_attempts_are_exhausted(self):
+        start = dt.datetime(2026, 7, 1, 12, 0, tzinfo=dt.timezone.utc)
+        job = enqueue_source_pull(self.db, organization_id=self.org.id, user_id=None, source=SOURCE_GRANTS, now=start)
+        runner, calls = self._runner(
+            RuntimeError("boom"),
+            (503, {"status": "error", "message": "Grants.gov unavailable"}, {}),
+            RuntimeError("still down"),
+        )
+
+        with (
+            patch.dict(source_pull_jobs.SOURCE_PULL_RUNNERS, {SOURCE_GRANTS: runner}),
+            patch.object(source_pull_jobs, "_utcnow", return_value=start),
+        ):
+            claimed = claim_next_source_pull(self.db, worker_id="worker-a", now=start)
+            run_source_pull_job(self.db, claimed, worker_id="worker-a", session_factory=None)
+            self.assertEqual(job.status, JOB_STATUS_QUEUED)
+            self.assertEqual(job.error_type, "RuntimeError")
+            self.assertIsNone(claim_next_source_pull(self.db, worker_id="worker-a", now=start))
+
+            after_first_retry = start + dt.timedelta(seconds=60)
+            claimed = claim_next_source_pull(self.db, worker_id="worker-a", now=after_first_retry)
+            run_source_pull_job(self.db, claimed, worker_id="worker-a", session_factory=None)
+            self.assertEqual(job.status, JOB_STATUS_QUEUED)
+            self.assertEqual(job.response_status_code, 503)
+            self.assertIsNone(
+                claim_next_source_pull(self.db, worker_id="worker-a", now=start + dt.timedelta(seconds=119))
+            )
+
+            claimed = claim_next_source_pull(self.db, worker_id="worker-a", now=start + dt.timedelta(seconds=120))
+            run_source_pull_job(self.db, claimed, worker_id="worker-a", session_factory=None)
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(job.status, JOB_STATUS_FAILED)
+        self.assertEqual(job.attempts, 3)
+        self.assertEqual(job.error_message, "still down")
+
+    def test_busy_source_after_the_last_attempt_is_recorded_as_failed(self):
+        start = dt.datetime(2026, 7, 1, 12, 0, tzinfo=dt.timezone.utc)
+        job = enqueue_source_pull(self.db, organization_id=self.org.id, user_id=None, source=SOURCE_GRANTS, now=start)
+        job.max_attempts = 1
+        self.db.commit()
+        runner, _calls = self._runner((409, {"status": "error", "message": "A Grants.gov pull is already in progress."}, {}))
+
+        with patch.dict(source_pull_jobs.SOURCE_PULL_RUNNERS, {SOURCE_GRANTS: runner}):
+            claimed = claim_next_source_pull(self.db, worker_id="worker-a", now=start)
+            run_source_pull_job(self.db, claimed, worker_id="worker-a", session_factory=None)
+
+        self.assertEqual(job.status, JOB_STATUS_FAILED)
+        self.assertEqual(job.response_status_code, 409)
+        self.assertEqual(job.error_type, "RetriesExhausted")
+        self.assertEqual(job.error_message, "A Grants.gov pull is already in progress.")
+
+    def test_expired_lease_is_reclaimed_by_another_worker(self):
+        start = dt.datetime(2026, 7, 1, 12, 0, tzinfo=dt.timezone.utc)
+        job = enqueue_source_pull(self.db, organization_id=self.org.id, user_id=None, source=SOURCE_GRANTS, now=start)
+        claim_next_source_pull(self.db, worker_id="worker-a", lease_seconds=300, now=start)
+
+        self.assertIsNone(
+            claim_next_source_pull(self.db, worker_id="worker-b", now=start + dt.timedelta(seconds=299))
+        )
+        reclaimed = claim_next_source_pull(self.db, worker_id="worker-b", now=start + dt.timedelta(seconds=301))
+
+        self.assertEqual(reclaimed.id, job.id)
+        self.assertEqual(reclaimed.status, JOB_STATUS_RUNNING)
+        self.assertEqual(reclaimed.lease_owner, "worker-b")
+        self.assertEqual(reclaimed.attempts, 2)
+
+    def test_running_sam_job_reports_ingestion_checkpoint_progress(self):
+        job = enqueue_source_pull(
+            self.db,
+            organization_id=self.org.id,
+            user_id=None,
+            source=SOURCE_SAM,
+            params={"search_id": self.config.id},
+        )
+        claim_next_source_pull(self.db, worker_id="worker-a")
+        self.db.add(IngestionRun(
+            source="sam.gov",
+            organization_id=self.org.id,
+            source_config_id=self.config.id,
+            status="running",
+            processed_count=150,
+            checkpoint_json={"scope_index": 1, "scope_count": 3, "pages_pulled": 2},
+        ))
+        self.db.commit()
+
+        progress = source_pull_job_payload(self.db, job)["progress"]
+
+        self.assertEqual(progress["records_seen"], 150)
+        self.assertEqual(progress["checkpoint"]["scope_count"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
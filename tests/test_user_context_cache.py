@@ -0,0 +1,147 @@
+import asyncio
+import unittest
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+from starlette.responses import Response
+
+from bidlens import auth, middleware
+from bidlens.auth import attach_request_user_context, create_session, get_current_user
+from bidlens.config import SESSION_COOKIE_NAME
+from bidlens.database import Base
+from bidlens.models import Opportunity, Organization, OrganizationMembership, User
+from bidlens.query_metrics import count_queries
+from bidlens.user_context import user_context_cache
+
+
+def _session_cookie(user_id):
+    response = Response()
+    create_session(response, user_id)
+    cookie = response.headers["set-cookie"].split(";", 1)[0]
+    return cookie.split("=", 1)[1]
+
+
+def _request(path="/feed", *, cookie=None):
+    headers = []
+    if cookie:
+        headers.append((b"cookie", f"{SESSION_COOKIE_NAME}={cookie}".encode()))
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": headers})
+
+
+class UserContextCacheTests(unittest.TestCase):
+    def setUp(self):
+        user_context_cache.clear()
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.db = self.session_factory()
+        self.org = Organization(name="Context Org", slug="context-org")
+        self.db.add(self.org)
+        self.db.flush()
+        self.user = User(email="member@context.test", organization_id=self.org.id)
+        self.db.add(self.user)
+        self.db.flush()
+        self.membership = OrganizationMembership(organization_id=self.org.id, user_id=self.user.id, role="member")
+        self.opportunity = Opportunity(
+            organization_id=self.org.id,
+            source="sam",
+            source_record_id="context-1",
+            title="Unreviewed opportunity",
+            agency="Test Agency",
+            opportunity_type="Solicitation",
+            posted_date=date.today(),
+            response_deadline=date.today() + timedelta(days=30),
+            qualification_status="unreviewed",
+        )
+        self.db.add_all([self.membership, self.opportunity])
+        self.db.commit()
+        self.cookie = _session_cookie(self.user.id)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+        user_context_cache.clear()
+
+    def _page_load(self):
+        """Resolve the user the way a page route does; return ((role, triage count), query count)."""
+        db = self.session_factory()
+        try:
+            request = _request(cookie=self.cookie)
+            with count_queries() as queries:
+                user = get_current_user(request, db)
+                attach_request_user_context(request, db, user)
+            return (user.current_role, user.triage_unreviewed_count), queries.count
+        finally:
+            db.close()
+
+    def test_context_is_resolved_once_and_reused_until_a_relevant_commit(self):
+        first, cold_queries = self._page_load()
+        second, warm_queries = self._page_load()
+
+        self.assertEqual(first, ("member", 1))
+        self.assertEqual(second, first)
+        # A warm page load only reads the user row.
+        self.assertEqual(warm_queries, 1)
+        self.assertGreater(cold_queries, warm_queries)
+
+        self.opportunity.qualification_status = "qualified"
+        self.db.commit()
+        self.assertEqual(self._page_load()[0], ("member", 0))
+
+        self.membership.role = "admin"
+        self.db.commit()
+        self.assertEqual(self._page_load()[0], ("admin", 0))
+
+        # Uncommitted writes leave the cache alone.
+        self.opportunity.qualification_status = "unreviewed"
+        self.db.flush()
+        self.db.rollback()
+        self.assertEqual(self._page_load(), (("admin", 0), 1))
+
+        with patch.object(auth.config, "USER_CONTEXT_CACHE_SECONDS", 0):
+            user_context_cache.clear()
+            self.assertGreater(self._page_load()[1], warm_queries)
+
+    def test_middleware_skips_the_user_lookup_without_platform_admins(self):
+        request = _request(cookie=self.cookie)
+        with patch.object(middleware, "SessionLocal", self.session_factory):
+            with patch.dict("os.environ", {"PLATFORM_OWNER_EMAIL": "", "PLATFORM_ADMIN_EMAILS": ""}):
+                with count_queries() as queries:
+                    self.assertFalse(middleware._platform_owner_should_return_to_platform(request))
+                self.assertEqual(queries.count, 0)
+
+            with patch.dict("os.environ", {"PLATFORM_OWNER_EMAIL": self.user.email, "PLATFORM_ADMIN_EMAILS": ""}):
+                self.assertTrue(middleware._platform_owner_should_return_to_platform(request))
+                with count_queries() as queries:
+                    self.assertTrue(middleware._platform_owner_should_return_to_platform(_request(cookie=self.cookie)))
+                self.assertEqual(queries.count, 0)
+
+                # The session cookie decoded by the middleware is reused downstream.
+                self.assertEqual(request.state.session_user_id, self.user.id)
+                self.user.email = "renamed@context.test"
+                self.db.commit()
+                self.assertFalse(middleware._platform_owner_should_return_to_platform(_request(cookie=self.cookie)))
+
+    def test_middleware_looks_the_user_up_off_the_event_loop(self):
+        call_next = AsyncMock(return_value=Response())
+        with (
+            patch.object(middleware, "SessionLocal", self.session_factory),
+            patch.dict("os.environ", {"PLATFORM_OWNER_EMAIL": self.user.email, "PLATFORM_ADMIN_EMAILS": ""}),
+            patch.object(middleware, "run_in_threadpool", wraps=middleware.run_in_threadpool) as threadpool,
+        ):
+            # Warm the email cache here: the in-memory database stays on this thread.
+            self.assertTrue(middleware._platform_owner_should_return_to_platform(_request(cookie=self.cookie)))
+            response = asyncio.run(
+                middleware.ClientRedirectMiddleware(app=None)._dispatch(_request(cookie=self.cookie), call_next)
+            )
+
+        threadpool.assert_called_once_with(middleware._is_platform_owner, self.user.id)
+        call_next.assert_not_called()
+        self.assertIn(b'url=/platform"', response.body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import io
+import unittest
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from bidlens.cli import main
+from bidlens.database import Base
+from bidlens.feed_state import rebuild_feed_states
+from bidlens.models import Opportunity, Organization, User, UserFeedState, UserOpportunity, Vote
+from bidlens.services import cast_vote
+from bidlens.services.feed_queries import build_feed_query
+
+
+class UserFeedStateTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.db = self.session_factory()
+        self.org = Organization(name="Feed State", slug="feed-state")
+        self.db.add(self.org)
+        self.db.flush()
+        self.user = User(email="member@example.com", organization_id=self.org.id)
+        self.db.add(self.user)
+        self.db.flush()
+        self.opps = [
+            Opportunity(
+                organization_id=self.org.id,
+                source="sam",
+                source_record_id=f"state-{index}",
+                title=f"Opportunity {index}",
+                agency="Test Agency",
+                opportunity_type="Solicitation",
+                posted_date=date.today(),
+                response_deadline=date.today() + timedelta(days=30),
+                qualification_status="qualified",
+            )
+            for index in range(3)
+        ]
+        self.db.add_all(self.opps)
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _states(self):
+        return {
+            row.opportunity_id: (row.vote, row.watched)
+            for row in self.db.query(UserFeedState).filter(UserFeedState.user_id == self.user.id)
+        }
+
+    def _feed(self):
+        rows = build_feed_query(self.db, organization_id=self.org.id, user_id=self.user.id).all()
+        return {opp.id: bool(watched) for opp, watched in rows}
+
+    def _vote(self, opp, vote):
+        cast_vote(self.db, org_id=self.org.id, user_id=self.user.id, opp_id=opp.id, vote=vote)
+
+    def test_votes_and_watches_keep_projection_and_feed_in_step(self):
+        passed, shortlisted, watched = self.opps
+        self._vote(passed, "PASS")
+        self._vote(shortlisted, "PURSUE")
+        self.db.add(UserOpportunity(
+            organization_id=self.org.id, user_id=self.user.id, opportunity_id=watched.id, watched=True,
+        ))
+        self.db.commit()
+
+        self.assertEqual(
+            self._states(),
+            {passed.id: ("PASS", False), shortlisted.id: ("PURSUE", False), watched.id: (None, True)},
+        )
+        self.assertEqual(self._feed(), {watched.id: True})
+
+        # Toggling the PASS off returns the opportunity to the Feed.
+        self._vote(passed, "PASS")
+        watch = self.db.query(UserOpportunity).filter_by(opportunity_id=watched.id).one()
+        watch.watched = False
+        self.db.commit()
+        self.assertEqual(self._states(), {shortlisted.id: ("PURSUE", False)})
+        self.assertEqual(self._feed(), {passed.id: False, watched.id: False})
+
+        # A rolled-back vote leaves no projection behind.
+        self.db.add(Vote(org_id=self.org.id, user_id=self.user.id, opp_id=watched.id, vote="PASS"))
+        self.db.flush()
+        self.assertIn(watched.id, self._states())
+        self.db.rollback()
+        self.assertNotIn(watched.id, self._states())
+
+    def test_rebuild_command_restores_projection_from_votes_and_watches(self):
+        passed, shortlisted, unreviewed = self.opps
+        self._vote(passed, "PASS")
+        self._vote(shortlisted, "PURSUE")
+        expected = self._states()
+        self.db.query(UserFeedState).delete(synchronize_session=False)
+        self.db.commit()
+        self.assertEqual(len(self._feed()), 3)
+
+        output = io.StringIO()
+        status = main(["rebuild-feed-state"], session_factory=self.session_factory, output=output)
+
+        self.assertEqual(status, 0)
+        self.assertIn("rows=2", output.getvalue())
+        self.db.expire_all()
+        self.assertEqual(self._states(), expected)
+        self.assertEqual(self._feed(), {unreviewed.id: False})
+        # Rebuilding is idempotent and can be scoped to one organization.
+        self.assertEqual(rebuild_feed_states(self.db.connection(), organization_id=self.org.id), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
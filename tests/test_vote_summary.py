@@ -0,0 +1,112 @@
+import io
+import unittest
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from bidlens.cli import main
+from bidlens.database import Base
+from bidlens.models import Opportunity, OpportunityVoteSummary, Organization, User, Vote
+from bidlens.query_metrics import count_queries
+from bidlens.services import cast_vote, get_last_activity, get_vote_overview
+from bidlens.vote_summary import rebuild_vote_summaries
+
+
+class OpportunityVoteSummaryTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.db = self.session_factory()
+        self.org = Organization(name="Vote Summary", slug="vote-summary")
+        self.db.add(self.org)
+        self.db.flush()
+        self.users = [
+            User(email="ada@example.com", name="Ada", organization_id=self.org.id),
+            User(email="grace@example.com", name="Grace", organization_id=self.org.id),
+            User(email="linus@example.com", organization_id=self.org.id),
+        ]
+        self.db.add_all(self.users)
+        self.db.flush()
+        self.opps = [
+            Opportunity(
+                organization_id=self.org.id,
+                source="sam",
+                source_record_id=f"summary-{index}",
+                title=f"Opportunity {index}",
+                agency="Test Agency",
+                opportunity_type="Solicitation",
+                posted_date=date.today(),
+                response_deadline=date.today() + timedelta(days=30),
+                qualification_status="qualified",
+            )
+            for index in range(2)
+        ]
+        self.db.add_all(self.opps)
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _vote(self, user, opp, vote):
+        cast_vote(self.db, org_id=self.org.id, user_id=user.id, opp_id=opp.id, vote=vote)
+
+    def _overview(self):
+        return get_vote_overview(self.db, org_id=self.org.id, opp_ids=[opp.id for opp in self.opps])
+
+    def test_votes_keep_counts_and_names_in_step_without_reading_votes(self):
+        ada, grace, linus = self.users
+        first, second = self.opps
+        self._vote(ada, first, "PURSUE")
+        self._vote(grace, first, "PURSUE")
+        self._vote(linus, first, "PASS")
+        self._vote(linus, second, "PURSUE")
+
+        org_id, opp_ids = self.org.id, [first.id, second.id]
+        with count_queries() as queries:
+            counts, interested, passed = get_vote_overview(self.db, org_id=org_id, opp_ids=opp_ids)
+        self.assertEqual(queries.count, 2)
+        self.assertEqual(counts, {first.id: {"pursue": 2, "pass": 1}, second.id: {"pursue": 1, "pass": 0}})
+        self.assertEqual(interested, {first.id: ["Ada", "Grace"], second.id: ["linus@example.com"]})
+        self.assertEqual(passed, {first.id: ["linus@example.com"]})
+        self.assertEqual(set(get_last_activity(self.db, [first.id, second.id])), {first.id, second.id})
+
+        # Flipping and toggling votes update the rollup in the same commit.
+        self._vote(grace, first, "PASS")
+        self._vote(linus, second, "PURSUE")
+        counts, interested, passed = self._overview()
+        self.assertEqual(counts[first.id], {"pursue": 1, "pass": 2})
+        self.assertEqual(passed[first.id], ["Grace", "linus@example.com"])
+        self.assertEqual(counts[second.id], {"pursue": 0, "pass": 0})
+        self.assertNotIn(second.id, interested)
+
+        # A rolled-back vote leaves the rollup as it was.
+        self.db.add(Vote(org_id=self.org.id, user_id=ada.id, opp_id=second.id, vote="PASS"))
+        self.db.flush()
+        self.db.rollback()
+        self.assertEqual(self._overview()[0][second.id], {"pursue": 0, "pass": 0})
+
+    def test_rebuild_command_restores_rollup_from_votes(self):
+        ada, grace, _ = self.users
+        first, second = self.opps
+        self._vote(ada, first, "PURSUE")
+        self._vote(grace, second, "PASS")
+        expected = self._overview()
+        self.db.query(OpportunityVoteSummary).delete(synchronize_session=False)
+        self.db.commit()
+        self.assertEqual(self._overview(), ({}, {}, {}))
+
+        output = io.StringIO()
+        status = main(["rebuild-vote-summary"], session_factory=self.session_factory, output=output)
+
+        self.assertEqual(status, 0)
+        self.assertIn("rows=2", output.getvalue())
+        self.db.expire_all()
+        self.assertEqual(self._overview(), expected)
+        self.assertEqual(rebuild_vote_summaries(self.db.connection(), organization_id=self.org.id), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
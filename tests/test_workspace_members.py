@@ -1,4 +1,3 @@
-import asyncio
 import io
 import unittest
 from types import SimpleNamespace
@@ -80,12 +79,12 @@ class WorkspaceMembersTests(unittest.TestCase):
         request = self._request()
 
         with patch("bidlens.routes.admin._current_org_or_404", return_value=(self.admin, self.org)):
-            response = asyncio.run(bulk_create_organization_invitations(
+            response = bulk_create_organization_invitations(
                 self.org.id,
                 request,
                 csv_file=csv_upload,
                 db=self.db,
-            ))
+            )
 
         invites = self.db.query(WorkspaceInvitation).order_by(WorkspaceInvitation.email.asc()).all()
 